@@ -0,0 +1,64 @@
+"""Notify on appointment request changes
+
+Revision ID: 013
+Revises: 012
+Create Date: 2026-10-16 12:00:00.000000
+
+Adds triggers on appointment_requests and appointment_persons that send the
+affected request ID on the 'appointment_requests_changed' NOTIFY channel.
+The bot keeps an in-process mission index current from these notifications
+instead of re-reading all pending requests at the start of every session.
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa  # noqa: F401
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "013"
+down_revision: Union[str, None] = "012"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create NOTIFY triggers for appointment requests and persons."""
+    op.execute("""
+        CREATE OR REPLACE FUNCTION notify_appointment_request_changed()
+        RETURNS TRIGGER AS $$
+        DECLARE
+            changed_id BIGINT;
+        BEGIN
+            IF TG_TABLE_NAME = 'appointment_persons' THEN
+                changed_id := COALESCE(NEW.request_id, OLD.request_id);
+            ELSE
+                changed_id := COALESCE(NEW.id, OLD.id);
+            END IF;
+            PERFORM pg_notify('appointment_requests_changed', changed_id::text);
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+
+    op.execute("DROP TRIGGER IF EXISTS appointment_requests_notify ON appointment_requests")
+    op.execute("""
+        CREATE TRIGGER appointment_requests_notify
+        AFTER INSERT OR UPDATE OR DELETE ON appointment_requests
+        FOR EACH ROW EXECUTE FUNCTION notify_appointment_request_changed()
+    """)
+
+    op.execute("DROP TRIGGER IF EXISTS appointment_persons_notify ON appointment_persons")
+    op.execute("""
+        CREATE TRIGGER appointment_persons_notify
+        AFTER INSERT OR UPDATE OR DELETE ON appointment_persons
+        FOR EACH ROW EXECUTE FUNCTION notify_appointment_request_changed()
+    """)
+
+
+def downgrade() -> None:
+    """Drop NOTIFY triggers for appointment requests and persons."""
+    op.execute("DROP TRIGGER IF EXISTS appointment_persons_notify ON appointment_persons")
+    op.execute("DROP TRIGGER IF EXISTS appointment_requests_notify ON appointment_requests")
+    op.execute("DROP FUNCTION IF EXISTS notify_appointment_request_changed()")
@@ -0,0 +1,60 @@
+"""Notify on token blacklist changes
+
+Revision ID: 014
+Revises: 013
+Create Date: 2026-10-16 14:00:00.000000
+
+Adds a trigger on token_blacklist that publishes revocations on the
+'token_blacklist_changed' NOTIFY channel so every API worker can keep its
+in-memory blacklist authoritative without a database query per request.
+Payload is "<jti> <exp epoch>" for inserts/updates and "<jti>" when an
+unexpired token is deleted. Deletes of expired rows (periodic cleanup) are
+not published.
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa  # noqa: F401
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "014"
+down_revision: Union[str, None] = "013"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create NOTIFY trigger for token blacklist changes."""
+    op.execute("""
+        CREATE OR REPLACE FUNCTION notify_token_blacklist_changed()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            IF TG_OP = 'DELETE' THEN
+                IF OLD.exp > now() THEN
+                    PERFORM pg_notify('token_blacklist_changed', OLD.jti);
+                END IF;
+            ELSE
+                PERFORM pg_notify(
+                    'token_blacklist_changed',
+                    NEW.jti || ' ' || extract(epoch FROM NEW.exp)::text
+                );
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+
+    op.execute("DROP TRIGGER IF EXISTS token_blacklist_notify ON token_blacklist")
+    op.execute("""
+        CREATE TRIGGER token_blacklist_notify
+        AFTER INSERT OR UPDATE OR DELETE ON token_blacklist
+        FOR EACH ROW EXECUTE FUNCTION notify_token_blacklist_changed()
+    """)
+
+
+def downgrade() -> None:
+    """Drop NOTIFY trigger for token blacklist changes."""
+    op.execute("DROP TRIGGER IF EXISTS token_blacklist_notify ON token_blacklist")
+    op.execute("DROP FUNCTION IF EXISTS notify_token_blacklist_changed()")
@@ -0,0 +1,132 @@
+"""Hourly rollup of audit log counts
+
+Revision ID: 015
+Revises: 014
+Create Date: 2026-10-16 15:00:00.000000
+
+Adds audit_log_hourly, one row per (UTC hour, action) with total and failure
+counts, so /api/v1/audit/stats is answered in O(buckets) instead of scanning
+audit_log. Statement-level triggers with transition tables keep the rollup in
+step with audit_log: a batched COPY from the audit writer costs one
+aggregated upsert, and retention deletes decrement the affected buckets.
+Existing rows are backfilled.
+
+Also adds a partial index on failed entries so the rolling 24h failure count
+stays exact without scanning successes.
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa  # noqa: F401
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "015"
+down_revision: Union[str, None] = "014"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create audit_log_hourly, its maintenance triggers and backfill it."""
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS audit_log_hourly (
+            bucket TIMESTAMPTZ NOT NULL,
+            action TEXT NOT NULL,
+            total BIGINT NOT NULL DEFAULT 0,
+            failures BIGINT NOT NULL DEFAULT 0,
+            PRIMARY KEY (bucket, action)
+        )
+    """)
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION audit_log_hourly_insert()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            INSERT INTO audit_log_hourly AS h (bucket, action, total, failures)
+            SELECT
+                date_trunc('hour', COALESCE(created_at, now()) AT TIME ZONE 'UTC')
+                    AT TIME ZONE 'UTC',
+                action,
+                COUNT(*),
+                COUNT(*) FILTER (WHERE success IS FALSE)
+            FROM new_rows
+            GROUP BY 1, 2
+            ON CONFLICT (bucket, action) DO UPDATE
+            SET total = h.total + EXCLUDED.total,
+                failures = h.failures + EXCLUDED.failures;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION audit_log_hourly_delete()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            UPDATE audit_log_hourly AS h
+            SET total = h.total - d.total,
+                failures = h.failures - d.failures
+            FROM (
+                SELECT
+                    date_trunc('hour', COALESCE(created_at, now()) AT TIME ZONE 'UTC')
+                        AT TIME ZONE 'UTC' AS bucket,
+                    action,
+                    COUNT(*) AS total,
+                    COUNT(*) FILTER (WHERE success IS FALSE) AS failures
+                FROM old_rows
+                GROUP BY 1, 2
+            ) AS d
+            WHERE h.bucket = d.bucket AND h.action = d.action;
+
+            DELETE FROM audit_log_hourly WHERE total <= 0;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+
+    op.execute("DROP TRIGGER IF EXISTS audit_log_hourly_insert ON audit_log")
+    op.execute("""
+        CREATE TRIGGER audit_log_hourly_insert
+        AFTER INSERT ON audit_log
+        REFERENCING NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION audit_log_hourly_insert()
+    """)
+
+    op.execute("DROP TRIGGER IF EXISTS audit_log_hourly_delete ON audit_log")
+    op.execute("""
+        CREATE TRIGGER audit_log_hourly_delete
+        AFTER DELETE ON audit_log
+        REFERENCING OLD TABLE AS old_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION audit_log_hourly_delete()
+    """)
+
+    # Backfill from existing rows
+    op.execute("TRUNCATE audit_log_hourly")
+    op.execute("""
+        INSERT INTO audit_log_hourly (bucket, action, total, failures)
+        SELECT
+            date_trunc('hour', COALESCE(created_at, now()) AT TIME ZONE 'UTC')
+                AT TIME ZONE 'UTC',
+            action,
+            COUNT(*),
+            COUNT(*) FILTER (WHERE success IS FALSE)
+        FROM audit_log
+        GROUP BY 1, 2
+    """)
+
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_audit_log_failures_created_at
+        ON audit_log(created_at) WHERE success IS FALSE
+    """)
+
+
+def downgrade() -> None:
+    """Drop audit_log_hourly and its maintenance triggers."""
+    op.execute("DROP INDEX IF EXISTS idx_audit_log_failures_created_at")
+    op.execute("DROP TRIGGER IF EXISTS audit_log_hourly_delete ON audit_log")
+    op.execute("DROP TRIGGER IF EXISTS audit_log_hourly_insert ON audit_log")
+    op.execute("DROP FUNCTION IF EXISTS audit_log_hourly_delete()")
+    op.execute("DROP FUNCTION IF EXISTS audit_log_hourly_insert()")
+    op.execute("DROP TABLE IF EXISTS audit_log_hourly")
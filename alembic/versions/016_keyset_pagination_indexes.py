@@ -0,0 +1,45 @@
+"""Keyset pagination indexes
+
+Revision ID: 016
+Revises: 015
+Create Date: 2026-10-16 16:00:00.000000
+
+List endpoints page with keyset cursors on (created_at, id) newest first.
+These composite indexes turn every page, however deep, into an index range
+scan. appointment_history also gets a per-user variant because its listings
+are usually filtered by user.
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa  # noqa: F401
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "016"
+down_revision: Union[str, None] = "015"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_INDEXES = {
+    "idx_appointment_requests_keyset": "appointment_requests(created_at DESC, id DESC)",
+    "idx_audit_log_keyset": "audit_log(created_at DESC, id DESC)",
+    "idx_logs_keyset": "logs(created_at DESC, id DESC)",
+    "idx_appointment_history_keyset": "appointment_history(created_at DESC, id DESC)",
+    "idx_appointment_history_user_keyset": (
+        "appointment_history(user_id, created_at DESC, id DESC)"
+    ),
+}
+
+
+def upgrade() -> None:
+    """Create (created_at, id) indexes for keyset pagination."""
+    for name, definition in _INDEXES.items():
+        op.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {definition}")
+
+
+def downgrade() -> None:
+    """Drop keyset pagination indexes."""
+    for name in _INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {name}")
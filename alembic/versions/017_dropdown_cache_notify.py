@@ -0,0 +1,56 @@
+"""Notify on dropdown cache changes
+
+Revision ID: 017
+Revises: 016
+Create Date: 2026-10-16 18:00:00.000000
+
+Adds a trigger on vfs_dropdown_cache that sends the country code on the
+'dropdown_cache_changed' NOTIFY channel whenever a country's dropdown data
+or last_synced_at changes, or the row is deleted. API workers keep parsed
+dropdown indexes in memory and drop a country's entry on notification.
+Status-only updates (sync_status, error_message) are not published.
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa  # noqa: F401
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "017"
+down_revision: Union[str, None] = "016"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create NOTIFY trigger for dropdown cache changes."""
+    op.execute("""
+        CREATE OR REPLACE FUNCTION notify_dropdown_cache_changed()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            IF TG_OP = 'DELETE' THEN
+                PERFORM pg_notify('dropdown_cache_changed', OLD.country_code);
+            ELSIF TG_OP = 'INSERT'
+                OR NEW.dropdown_data IS DISTINCT FROM OLD.dropdown_data
+                OR NEW.last_synced_at IS DISTINCT FROM OLD.last_synced_at THEN
+                PERFORM pg_notify('dropdown_cache_changed', NEW.country_code);
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+
+    op.execute("DROP TRIGGER IF EXISTS vfs_dropdown_cache_notify ON vfs_dropdown_cache")
+    op.execute("""
+        CREATE TRIGGER vfs_dropdown_cache_notify
+        AFTER INSERT OR UPDATE OR DELETE ON vfs_dropdown_cache
+        FOR EACH ROW EXECUTE FUNCTION notify_dropdown_cache_changed()
+    """)
+
+
+def downgrade() -> None:
+    """Drop NOTIFY trigger for dropdown cache changes."""
+    op.execute("DROP TRIGGER IF EXISTS vfs_dropdown_cache_notify ON vfs_dropdown_cache")
+    op.execute("DROP FUNCTION IF EXISTS notify_dropdown_cache_changed()")
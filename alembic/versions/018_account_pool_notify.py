@@ -0,0 +1,60 @@
+"""Notify on account pool availability changes
+
+Revision ID: 018
+Revises: 017
+Create Date: 2026-10-16 21:30:00.000000
+
+Adds a trigger on vfs_account_pool that sends the account ID on the
+'account_pool_changed' NOTIFY channel whenever an account is added, or an
+update may have made it usable or moved its cooldown/quarantine expiry:
+releases, manual status resets and reactivation. Acquisitions (status set to
+'in_use') are not published. The bot waits on these notifications, plus a
+timer for the next expiry, instead of polling the pool.
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa  # noqa: F401
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "018"
+down_revision: Union[str, None] = "017"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create NOTIFY trigger for account pool availability changes."""
+    op.execute("""
+        CREATE OR REPLACE FUNCTION notify_account_pool_changed()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            IF NOT NEW.is_active OR NEW.status = 'in_use' THEN
+                RETURN NULL;
+            END IF;
+            IF TG_OP = 'INSERT'
+                OR NEW.status IS DISTINCT FROM OLD.status
+                OR NEW.cooldown_until IS DISTINCT FROM OLD.cooldown_until
+                OR NEW.quarantine_until IS DISTINCT FROM OLD.quarantine_until
+                OR NEW.is_active IS DISTINCT FROM OLD.is_active THEN
+                PERFORM pg_notify('account_pool_changed', NEW.id::text);
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+
+    op.execute("DROP TRIGGER IF EXISTS vfs_account_pool_notify ON vfs_account_pool")
+    op.execute("""
+        CREATE TRIGGER vfs_account_pool_notify
+        AFTER INSERT OR UPDATE ON vfs_account_pool
+        FOR EACH ROW EXECUTE FUNCTION notify_account_pool_changed()
+    """)
+
+
+def downgrade() -> None:
+    """Drop NOTIFY trigger for account pool availability changes."""
+    op.execute("DROP TRIGGER IF EXISTS vfs_account_pool_notify ON vfs_account_pool")
+    op.execute("DROP FUNCTION IF EXISTS notify_account_pool_changed()")
@@ -26,6 +26,8 @@ from .countries import (
 # Database and pools
 from .database import (
     Database,
+    NotifyChannels,
+    Pagination,
     Pools,
 )
 
@@ -39,7 +41,7 @@ from .locale import (
 )
 
 # Logging
-from .logging import LogEmoji
+from .logging import AuditLogConfig, LogEmoji
 
 # OTP
 from .otp import (
@@ -50,6 +52,7 @@ from .otp import (
 # Resilience-related
 from .resilience import (
     AccountPoolConfig,
+    BrowserPoolConfig,
     CircuitBreakerConfig,
     RateLimits,
     Retries,
@@ -84,6 +87,7 @@ __all__ = [
     "RateLimits",
     "CircuitBreakerConfig",
     "AccountPoolConfig",
+    "BrowserPoolConfig",
     # Security
     "Security",
     "ALLOWED_PERSONAL_DETAILS_FIELDS",
@@ -96,12 +100,15 @@ __all__ = [
     "BookingOTPSelectors",
     # Database
     "Database",
+    "NotifyChannels",
+    "Pagination",
     "Pools",
     # Locale
     "TURKISH_MONTHS",
     "DOUBLE_MATCH_PATTERNS",
     # Logging
     "LogEmoji",
+    "AuditLogConfig",
     # Error capture
     "ErrorCaptureConfig",
     # Countries
@@ -27,3 +27,22 @@ class Pools:
     HTTP_LIMIT_PER_HOST: Final[int] = 20
     DNS_CACHE_TTL: Final[int] = 120
     KEEPALIVE_TIMEOUT: Final[int] = 30
+
+
+class Pagination:
+    """Keyset pagination and NDJSON streaming for list endpoints."""
+
+    DEFAULT_LIMIT: Final[int] = 100
+    MAX_LIMIT: Final[int] = 1000
+    # Rows pulled per round-trip from a server-side cursor when streaming
+    STREAM_CHUNK_SIZE: Final[int] = 500
+    NEXT_CURSOR_HEADER: Final[str] = "X-Next-Cursor"
+
+
+class NotifyChannels:
+    """PostgreSQL LISTEN/NOTIFY channel names (kept in sync with Alembic triggers)."""
+
+    APPOINTMENT_REQUESTS: Final[str] = "appointment_requests_changed"
+    TOKEN_BLACKLIST: Final[str] = "token_blacklist_changed"
+    DROPDOWN_CACHE: Final[str] = "dropdown_cache_changed"
+    ACCOUNT_POOL: Final[str] = "account_pool_changed"
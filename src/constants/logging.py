@@ -26,3 +26,13 @@ class LogEmoji:
     BOT: Final[str] = "🤖"
     CALENDAR: Final[str] = "📅"
     PAYMENT: Final[str] = "💳"
+
+
+class AuditLogConfig:
+    """Batched audit log pipeline (AuditLogger.start())."""
+
+    QUEUE_SIZE: Final[int] = 10_000  # pending events before log() applies backpressure
+    BATCH_SIZE: Final[int] = 500  # events per flush
+    FLUSH_INTERVAL_SECONDS: Final[float] = 0.5  # max time an event waits for a full batch
+    ENQUEUE_TIMEOUT_SECONDS: Final[float] = 1.0  # backpressure wait before an event is dropped
+    DRAIN_TIMEOUT_SECONDS: Final[float] = 10.0
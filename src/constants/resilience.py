@@ -53,3 +53,21 @@ class AccountPoolConfig:
     MAX_FAILURES: Final[int] = 3
     MAX_CONCURRENT_MISSIONS: Final[int] = 5
     WAIT_FOR_ACCOUNT_TIMEOUT: Final[float] = 60.0  # seconds
+    MISSION_INDEX_RECONCILE_SECONDS: Final[int] = 300  # full reload to guard against drift
+    # Longest event-driven wait before re-checking availability (guards missed NOTIFYs)
+    AVAILABILITY_RECONCILE_SECONDS: Final[float] = 300.0
+    # Buffered account_usage_log writer (AccountUsageLogWriter)
+    USAGE_LOG_QUEUE_SIZE: Final[int] = 5_000  # pending entries before log() applies backpressure
+    USAGE_LOG_BATCH_SIZE: Final[int] = 200  # entries per COPY
+    USAGE_LOG_FLUSH_INTERVAL_SECONDS: Final[float] = 1.0  # max time an entry waits for a batch
+    USAGE_LOG_ENQUEUE_TIMEOUT_SECONDS: Final[float] = 1.0  # backpressure wait before dropping
+    USAGE_LOG_DRAIN_TIMEOUT_SECONDS: Final[float] = 10.0
+
+
+class BrowserPoolConfig:
+    """Shared Chromium pool serving isolated contexts to session missions."""
+
+    MAX_BROWSERS: Final[int] = 2
+    CONTEXTS_PER_BROWSER: Final[int] = 3  # MAX_BROWSERS * this >= MAX_CONCURRENT_MISSIONS
+    MAX_USES_PER_BROWSER: Final[int] = 50  # leases before the process is recycled
+    IDLE_TIMEOUT_MINUTES: Final[int] = 10
@@ -13,6 +13,9 @@ class Security:
     JWT_ALGORITHM: Final[str] = "HS384"
     JWT_EXPIRY_HOURS: Final[int] = 24
     PASSWORD_HASH_ROUNDS: Final[int] = 12
+    # bcrypt releases the GIL, so these threads verify in parallel off the event loop
+    PASSWORD_VERIFY_WORKERS: Final[int] = 4
+    PASSWORD_VERIFY_MAX_QUEUE: Final[int] = 32  # waiting verifications before 503
     MAX_LOGIN_ATTEMPTS: Final[int] = 5
     LOCKOUT_DURATION_MINUTES: Final[int] = 15
     SESSION_FILE_PERMISSIONS: Final[int] = 0o600
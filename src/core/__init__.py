@@ -1,11 +1,11 @@
-"""Core infrastructure module."""
+"""Core infrastructure module.
 
-from .auth import create_access_token, hash_password, verify_password, verify_token
-from .bot_controller import BotController
-from .config.config_loader import load_config
-from .config.config_validator import ConfigValidator
-from .config.config_version_checker import CURRENT_CONFIG_VERSION, check_config_version
-from .config.env_validator import EnvValidator
+Exceptions are imported eagerly; everything else loads on first access via
+_LAZY_MODULE_MAP, so importing a ``src.core.*`` submodule stays cheap.
+"""
+
+import importlib as _importlib
+from typing import TYPE_CHECKING, Any
 
 # Base exception; Login & Booking; Captcha; Slot checking; Session;
 # Network; Selector; Rate limiting; Circuit breaker; Configuration;
@@ -33,6 +33,7 @@ from .exceptions import (
     OTPError,
     OTPInvalidError,
     OTPTimeoutError,
+    PasswordVerifierBusyError,
     PaymentCardNotFoundError,
     PaymentError,
     PaymentFailedError,
@@ -54,27 +55,82 @@ from .exceptions import (
     VFSSessionExpiredError,
     VFSSlotNotFoundError,
 )
-from .infra.retry import (
-    get_captcha_retry,
-    get_login_retry,
-    get_network_retry,
-    get_rate_limit_retry,
-    get_slot_check_retry,
-    get_telegram_retry,
-)
-from .infra.shutdown import (
-    SHUTDOWN_TIMEOUT,
-    fast_emergency_cleanup,
-    get_shutdown_event,
-    graceful_shutdown,
-    graceful_shutdown_with_timeout,
-    safe_shutdown_cleanup,
-    set_shutdown_event,
-    setup_signal_handlers,
-)
-from .infra.startup import validate_environment, verify_critical_dependencies
-from .logger import setup_structured_logging
-from .security import APIKeyManager, generate_api_key, verify_api_key
+
+if TYPE_CHECKING:
+    from .auth import create_access_token as create_access_token
+    from .auth import hash_password as hash_password
+    from .auth import verify_password as verify_password
+    from .auth import verify_token as verify_token
+    from .bot_controller import BotController as BotController
+    from .config.config_loader import load_config as load_config
+    from .config.config_validator import ConfigValidator as ConfigValidator
+    from .config.config_version_checker import CURRENT_CONFIG_VERSION as CURRENT_CONFIG_VERSION
+    from .config.config_version_checker import check_config_version as check_config_version
+    from .config.env_validator import EnvValidator as EnvValidator
+    from .infra.retry import get_captcha_retry as get_captcha_retry
+    from .infra.retry import get_login_retry as get_login_retry
+    from .infra.retry import get_network_retry as get_network_retry
+    from .infra.retry import get_rate_limit_retry as get_rate_limit_retry
+    from .infra.retry import get_slot_check_retry as get_slot_check_retry
+    from .infra.retry import get_telegram_retry as get_telegram_retry
+    from .infra.shutdown import SHUTDOWN_TIMEOUT as SHUTDOWN_TIMEOUT
+    from .infra.shutdown import fast_emergency_cleanup as fast_emergency_cleanup
+    from .infra.shutdown import get_shutdown_event as get_shutdown_event
+    from .infra.shutdown import graceful_shutdown as graceful_shutdown
+    from .infra.shutdown import graceful_shutdown_with_timeout as graceful_shutdown_with_timeout
+    from .infra.shutdown import safe_shutdown_cleanup as safe_shutdown_cleanup
+    from .infra.shutdown import set_shutdown_event as set_shutdown_event
+    from .infra.shutdown import setup_signal_handlers as setup_signal_handlers
+    from .infra.startup import validate_environment as validate_environment
+    from .infra.startup import verify_critical_dependencies as verify_critical_dependencies
+    from .logger import setup_structured_logging as setup_structured_logging
+    from .security import APIKeyManager as APIKeyManager
+    from .security import generate_api_key as generate_api_key
+    from .security import verify_api_key as verify_api_key
+
+# Explicit lazy-loading map: name -> (module_path, attribute_name)
+_LAZY_MODULE_MAP = {
+    # Auth
+    "create_access_token": ("src.core.auth", "create_access_token"),
+    "hash_password": ("src.core.auth", "hash_password"),
+    "verify_password": ("src.core.auth", "verify_password"),
+    "verify_token": ("src.core.auth", "verify_token"),
+    # Bot controller
+    "BotController": ("src.core.bot_controller", "BotController"),
+    # Config
+    "load_config": ("src.core.config.config_loader", "load_config"),
+    "ConfigValidator": ("src.core.config.config_validator", "ConfigValidator"),
+    "CURRENT_CONFIG_VERSION": ("src.core.config.config_version_checker", "CURRENT_CONFIG_VERSION"),
+    "check_config_version": ("src.core.config.config_version_checker", "check_config_version"),
+    "EnvValidator": ("src.core.config.env_validator", "EnvValidator"),
+    # Retry strategies
+    "get_captcha_retry": ("src.core.infra.retry", "get_captcha_retry"),
+    "get_login_retry": ("src.core.infra.retry", "get_login_retry"),
+    "get_network_retry": ("src.core.infra.retry", "get_network_retry"),
+    "get_rate_limit_retry": ("src.core.infra.retry", "get_rate_limit_retry"),
+    "get_slot_check_retry": ("src.core.infra.retry", "get_slot_check_retry"),
+    "get_telegram_retry": ("src.core.infra.retry", "get_telegram_retry"),
+    # Shutdown
+    "SHUTDOWN_TIMEOUT": ("src.core.infra.shutdown", "SHUTDOWN_TIMEOUT"),
+    "fast_emergency_cleanup": ("src.core.infra.shutdown", "fast_emergency_cleanup"),
+    "get_shutdown_event": ("src.core.infra.shutdown", "get_shutdown_event"),
+    "graceful_shutdown": ("src.core.infra.shutdown", "graceful_shutdown"),
+    "graceful_shutdown_with_timeout": (
+        "src.core.infra.shutdown",
+        "graceful_shutdown_with_timeout",
+    ),
+    "safe_shutdown_cleanup": ("src.core.infra.shutdown", "safe_shutdown_cleanup"),
+    "set_shutdown_event": ("src.core.infra.shutdown", "set_shutdown_event"),
+    "setup_signal_handlers": ("src.core.infra.shutdown", "setup_signal_handlers"),
+    # Environment & startup
+    "validate_environment": ("src.core.infra.startup", "validate_environment"),
+    "verify_critical_dependencies": ("src.core.infra.startup", "verify_critical_dependencies"),
+    # Logging & security
+    "setup_structured_logging": ("src.core.logger", "setup_structured_logging"),
+    "APIKeyManager": ("src.core.security", "APIKeyManager"),
+    "generate_api_key": ("src.core.security", "generate_api_key"),
+    "verify_api_key": ("src.core.security", "verify_api_key"),
+}
 
 __all__ = [
     "load_config",
@@ -109,6 +165,7 @@ __all__ = [
     "InvalidCredentialsError",
     "TokenExpiredError",
     "InsufficientPermissionsError",
+    "PasswordVerifierBusyError",
     "VFSApiError",
     "VFSAuthenticationError",
     "VFSRateLimitError",
@@ -154,3 +211,15 @@ __all__ = [
     "check_config_version",
     "CURRENT_CONFIG_VERSION",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Lazy import with explicit mapping - importlib based."""
+    if name in _LAZY_MODULE_MAP:
+        module_path, attr_name = _LAZY_MODULE_MAP[name]
+        module = _importlib.import_module(module_path)
+        attr = getattr(module, attr_name)
+        # Cache in module globals to avoid repeated imports
+        globals()[name] = attr
+        return attr
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -33,8 +33,10 @@ from .password import (
     validate_admin_password_format,
     validate_password_complexity,
     validate_password_length,
+    verify_and_update_password,
     verify_password,
 )
+from .password_verifier import PasswordVerifier, get_password_verifier
 from .token_blacklist import (
     PersistentTokenBlacklist,
     TokenBlacklist,
@@ -76,5 +78,9 @@ __all__ = [
     "validate_password_complexity",
     "hash_password",
     "verify_password",
+    "verify_and_update_password",
     "validate_admin_password_format",
+    # Password verification pool
+    "PasswordVerifier",
+    "get_password_verifier",
 ]
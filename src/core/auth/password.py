@@ -2,7 +2,10 @@
 
 import os
 import re
+import threading
+from typing import Optional, Tuple
 
+from src.constants import Security
 from src.core.environment import Environment
 
 from ...core.exceptions import ValidationError
@@ -39,8 +42,13 @@ _pbcrypt._BcryptBackend._calc_checksum = _patched_calc_checksum
 # Now we can safely import and create the password context
 from passlib.context import CryptContext  # noqa: E402
 
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Password hashing; hashes below the configured cost are flagged for rehash on login
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__default_rounds=Security.PASSWORD_HASH_ROUNDS,
+    bcrypt__min_rounds=Security.PASSWORD_HASH_ROUNDS,
+)
 
 
 def _verify_bcrypt_patch():
@@ -63,7 +71,21 @@ def _verify_bcrypt_patch():
         ) from e
 
 
-_verify_bcrypt_patch()
+# The self-test costs two full bcrypt rounds, so it runs on first use rather than
+# at import time (which every process, including CLI tools, would pay)
+_bcrypt_patch_verified = False
+_bcrypt_patch_lock = threading.Lock()
+
+
+def _ensure_bcrypt_patch_verified() -> None:
+    """Run _verify_bcrypt_patch() once, before the first hash or verify."""
+    global _bcrypt_patch_verified
+    if _bcrypt_patch_verified:
+        return
+    with _bcrypt_patch_lock:
+        if not _bcrypt_patch_verified:
+            _verify_bcrypt_patch()
+            _bcrypt_patch_verified = True
 
 
 def _truncate_password(password: str) -> str:
@@ -169,6 +191,7 @@ def hash_password(password: str) -> str:
         ValidationError: If password exceeds maximum byte length
     """
     validate_password_length(password)  # Validate before hashing
+    _ensure_bcrypt_patch_verified()
     # Truncate for bcrypt (defensive - validation should prevent this case)
     truncated = _truncate_password(password)
     result = pwd_context.hash(truncated)
@@ -186,10 +209,33 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Returns:
         True if password matches
     """
+    _ensure_bcrypt_patch_verified()
     truncated = _truncate_password(plain_password)
     return bool(pwd_context.verify(truncated, hashed_password))
 
 
+def verify_and_update_password(
+    plain_password: str, hashed_password: str
+) -> Tuple[bool, Optional[str]]:
+    """
+    Verify a password and rehash it if the stored hash is outdated.
+
+    A hash is outdated when its bcrypt cost is below PASSWORD_HASH_ROUNDS or
+    it uses a deprecated scheme variant.
+
+    Args:
+        plain_password: Plain text password
+        hashed_password: Hashed password
+
+    Returns:
+        Tuple of (password matches, new hash to store or None)
+    """
+    _ensure_bcrypt_patch_verified()
+    truncated = _truncate_password(plain_password)
+    verified, new_hash = pwd_context.verify_and_update(truncated, hashed_password)
+    return bool(verified), new_hash
+
+
 def validate_admin_password_format() -> bool:
     """
     Validate that ADMIN_PASSWORD is in bcrypt hash format in production.
@@ -0,0 +1,144 @@
+"""Bounded bcrypt verification pool that keeps password checks off the event loop."""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional, Tuple, TypeVar
+
+from loguru import logger
+
+from src.constants import Security
+
+from ...core.exceptions import PasswordVerifierBusyError
+from .password import verify_and_update_password, verify_password
+
+T = TypeVar("T")
+
+
+class PasswordVerifier:
+    """
+    Run bcrypt verifications in a dedicated, size-capped thread pool.
+
+    A single verification burns tens to hundreds of milliseconds of CPU; run
+    inline it stalls every WebSocket, health check and request in the worker.
+    The bcrypt extension releases the GIL while hashing, so a small thread
+    pool verifies in parallel without the pickling overhead of processes.
+
+    At most ``max_workers + max_queue`` verifications are admitted at once;
+    beyond that callers get PasswordVerifierBusyError (503) immediately
+    rather than queueing behind a login burst.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = Security.PASSWORD_VERIFY_WORKERS,
+        max_queue: int = Security.PASSWORD_VERIFY_MAX_QUEUE,
+    ):
+        """
+        Initialize password verifier.
+
+        Args:
+            max_workers: Threads running bcrypt concurrently
+            max_queue: Verifications allowed to wait for a free thread
+        """
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="bcrypt-verify"
+        )
+        self._in_flight = 0
+
+    @property
+    def in_flight(self) -> int:
+        """Number of verifications running or waiting for a thread."""
+        return self._in_flight
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        """
+        Verify a password against its hash without blocking the event loop.
+
+        Args:
+            plain_password: Plain text password
+            hashed_password: Hashed password
+
+        Returns:
+            True if password matches
+
+        Raises:
+            PasswordVerifierBusyError: If the pool and its queue are full
+        """
+        return await self._run(verify_password, plain_password, hashed_password)
+
+    async def verify_and_update(
+        self, plain_password: str, hashed_password: str
+    ) -> Tuple[bool, Optional[str]]:
+        """
+        Verify a password and return a fresh hash if the stored one is outdated.
+
+        For callers that can persist the new hash; rehashing costs another
+        full bcrypt round at the current cost.
+
+        Args:
+            plain_password: Plain text password
+            hashed_password: Hashed password
+
+        Returns:
+            Tuple of (password matches, new hash to store or None)
+
+        Raises:
+            PasswordVerifierBusyError: If the pool and its queue are full
+        """
+        return await self._run(verify_and_update_password, plain_password, hashed_password)
+
+    async def _run(self, func: Callable[..., T], *args: Any) -> T:
+        """
+        Run a bcrypt call in the pool if there is room for it.
+
+        Args:
+            func: Blocking password function
+            *args: Arguments for func
+
+        Returns:
+            Result of func
+
+        Raises:
+            PasswordVerifierBusyError: If the pool and its queue are full
+        """
+        if self._in_flight >= self.max_workers + self.max_queue:
+            logger.warning(
+                f"Password verification pool saturated ({self._in_flight} in flight), "
+                "rejecting login"
+            )
+            raise PasswordVerifierBusyError()
+
+        self._in_flight += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, func, *args)
+        finally:
+            self._in_flight -= 1
+
+    def shutdown(self) -> None:
+        """Stop the pool, dropping verifications that have not started yet."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+# Global password verifier instance
+_password_verifier: Optional[PasswordVerifier] = None
+_password_verifier_lock = threading.Lock()
+
+
+def get_password_verifier() -> PasswordVerifier:
+    """
+    Get or create password verifier singleton.
+
+    Returns:
+        PasswordVerifier instance
+    """
+    global _password_verifier
+    if _password_verifier is not None:
+        return _password_verifier
+    with _password_verifier_lock:
+        if _password_verifier is None:
+            _password_verifier = PasswordVerifier()
+        return _password_verifier
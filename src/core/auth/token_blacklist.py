@@ -1,13 +1,15 @@
 """Token blacklist for JWT revocation."""
 
 import asyncio
+import heapq
 import threading
-from collections import OrderedDict
 from datetime import datetime, timezone
-from typing import Any, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from loguru import logger
 
+from src.constants import NotifyChannels
+
 # Import at module level to avoid repeated import overhead
 from src.repositories import TokenBlacklistRepository
 
@@ -16,8 +18,9 @@ class TokenBlacklist:
     """
     Thread-safe token blacklist for JWT revocation.
 
-    Uses OrderedDict for efficient memory management with automatic cleanup
-    of expired tokens.
+    Revoked tokens are kept in a dict (jti -> exp) for O(1) lookups, with a
+    min-heap of (exp, jti) so expired tokens are purged from the front in
+    amortised O(log n) instead of scanning the whole blacklist per request.
     """
 
     def __init__(self, max_size: int = 10000):
@@ -27,9 +30,12 @@ class TokenBlacklist:
         Args:
             max_size: Maximum number of tokens to keep in memory
         """
-        self._blacklist: OrderedDict[str, datetime] = OrderedDict()
+        self._blacklist: Dict[str, datetime] = {}
+        self._expiry_heap: List[Tuple[datetime, str]] = []
         self._lock = threading.Lock()
         self._max_size = max_size
+        # Set once a still-valid token has been evicted to enforce max_size
+        self._evicted = False
         self._cleanup_task: Optional[asyncio.Task] = None
         self._running = False
 
@@ -45,12 +51,13 @@ class TokenBlacklist:
             # Remove expired tokens first
             self._cleanup_expired()
 
-            # Add new token
             self._blacklist[jti] = exp
+            heapq.heappush(self._expiry_heap, (exp, jti))
 
-            # Enforce max size by removing oldest entries
+            # Enforce max size by dropping the tokens closest to expiry
             while len(self._blacklist) > self._max_size:
-                self._blacklist.popitem(last=False)
+                self._pop_soonest()
+                self._evicted = True
 
     def is_blacklisted(self, jti: str) -> bool:
         """
@@ -63,16 +70,45 @@ class TokenBlacklist:
             True if token is blacklisted
         """
         with self._lock:
-            # Cleanup expired tokens
-            self._cleanup_expired()
-            return jti in self._blacklist
+            exp = self._blacklist.get(jti)
+            if exp is None:
+                return False
+            if exp < datetime.now(timezone.utc):
+                self._cleanup_expired()
+                return False
+            return True
+
+    def _pop_soonest(self) -> None:
+        """Remove the token closest to expiry (must be called with lock held)."""
+        while self._expiry_heap:
+            exp, jti = heapq.heappop(self._expiry_heap)
+            # Skip stale heap entries left behind by re-added or removed tokens
+            if self._blacklist.get(jti) == exp:
+                del self._blacklist[jti]
+                return
 
     def _cleanup_expired(self) -> None:
         """Remove expired tokens from blacklist (must be called with lock held)."""
         now = datetime.now(timezone.utc)
-        expired_keys = [jti for jti, exp in self._blacklist.items() if exp < now]
-        for jti in expired_keys:
-            del self._blacklist[jti]
+        while self._expiry_heap and self._expiry_heap[0][0] < now:
+            exp, jti = heapq.heappop(self._expiry_heap)
+            if self._blacklist.get(jti) == exp:
+                del self._blacklist[jti]
+
+        # Stale entries only accumulate when tokens are re-added or discarded
+        if len(self._expiry_heap) > 2 * len(self._blacklist) + 64:
+            self._expiry_heap = [(exp, jti) for jti, exp in self._blacklist.items()]
+            heapq.heapify(self._expiry_heap)
+
+    def discard(self, jti: str) -> None:
+        """
+        Remove a token from the in-memory blacklist.
+
+        Args:
+            jti: JWT ID to remove
+        """
+        with self._lock:
+            self._blacklist.pop(jti, None)
 
     def size(self) -> int:
         """Get current blacklist size."""
@@ -102,6 +138,15 @@ class PersistentTokenBlacklist(TokenBlacklist):
     """
     Database-backed token blacklist for production environments.
     Falls back to memory if database unavailable.
+
+    Once load_from_database() has run and the worker is subscribed to the
+    token_blacklist_changed NOTIFY channel (Alembic revision 014), the
+    in-memory set is authoritative: revocations made by other workers arrive
+    as notifications, so a token that is not in memory is not revoked and
+    verify_token() needs no database round-trip. Until then, while the
+    LISTEN connection is down, or once it has been re-opened since the last
+    load (by this or any other consumer of the shared connection), misses are
+    confirmed against the database.
     """
 
     def __init__(self, db: Optional[Any] = None, max_size: int = 10000):
@@ -115,6 +160,26 @@ class PersistentTokenBlacklist(TokenBlacklist):
         super().__init__(max_size)
         self._db = db
         self._use_db = db is not None
+        self._loaded = False
+        self._listening = False
+        # LISTEN connection generation the in-memory set was loaded under
+        self._loaded_generation: Optional[int] = None
+
+    @property
+    def is_authoritative(self) -> bool:
+        """Whether a miss in memory means the token is not revoked."""
+        # Once a revoked token has been evicted, memory no longer holds every
+        # revocation, so misses must be confirmed against the database
+        # A different generation means the connection dropped after the load,
+        # so revocations sent meanwhile may be missing from memory
+        return (
+            self._loaded
+            and self._listening
+            and not self._evicted
+            and self._db is not None
+            and self._loaded_generation is not None
+            and self._db.notification_generation == self._loaded_generation
+        )
 
     async def add_async(self, jti: str, exp: datetime) -> None:
         """Add token to blacklist with database persistence."""
@@ -135,6 +200,10 @@ class PersistentTokenBlacklist(TokenBlacklist):
         if self.is_blacklisted(jti):
             return True
 
+        # Memory is kept current by notifications: a miss needs no query
+        if self.is_authoritative:
+            return False
+
         # Check database if available
         if self._use_db and self._db:
             try:
@@ -145,22 +214,82 @@ class PersistentTokenBlacklist(TokenBlacklist):
 
         return False
 
+    def _on_notification(self, payload: str) -> None:
+        """
+        Apply a revocation made by another worker.
+
+        Payload is "<jti> <exp epoch seconds>" for a revocation, or just
+        "<jti>" when an unexpired token is removed from the blacklist.
+        """
+        jti, _, exp = payload.partition(" ")
+        if not jti:
+            return
+        if not exp:
+            self.discard(jti)
+            return
+        try:
+            self.add(jti, datetime.fromtimestamp(float(exp), tz=timezone.utc))
+        except (ValueError, OverflowError):
+            logger.warning(f"Unexpected token blacklist notification payload: {payload!r}")
+
+    async def _subscribe(self) -> None:
+        """Subscribe to cross-worker revocation notifications (best effort)."""
+        if self._listening or not self._db:
+            return
+        try:
+            await self._db.listen(NotifyChannels.TOKEN_BLACKLIST, self._on_notification)
+            self._listening = True
+        except Exception as e:
+            logger.warning(
+                f"Token blacklist could not subscribe to notifications, "
+                f"cache misses will be checked against the database: {e}"
+            )
+
     async def load_from_database(self) -> int:
         """Load active blacklisted tokens from database on startup."""
         if not self._use_db or not self._db:
             return 0
 
+        # Subscribe before loading so no revocation falls between the two
+        await self._subscribe()
+        generation = self._db.notification_generation if self._listening else None
+
         try:
             repo = TokenBlacklistRepository(self._db)
             tokens = await repo.get_active()
             for jti, exp in tokens:
                 self.add(jti, exp)
+            self._loaded = True
+            self._loaded_generation = generation
             logger.info(f"Loaded {len(tokens)} blacklisted tokens from database")
             return len(tokens)
         except Exception as e:
             logger.error(f"Failed to load blacklist from database: {e}")
             return 0
 
+    async def _resync_if_disconnected(self) -> None:
+        """Re-open LISTEN if needed and reload after a lost connection (missed notifications)."""
+        if self._db is None or not self._loaded or not self._listening:
+            return
+        if self._db.notification_generation == self._loaded_generation:
+            return
+        try:
+            # Another consumer may already have re-opened the shared connection
+            if self._db.notifications_active or await self._db.ensure_listening():
+                await self.load_from_database()
+        except Exception as e:
+            logger.warning(f"Token blacklist resync failed: {e}")
+
+    async def close(self) -> None:
+        """Unsubscribe from revocation notifications."""
+        self.stop_cleanup_task()
+        if self._listening and self._db:
+            try:
+                await self._db.unlisten(NotifyChannels.TOKEN_BLACKLIST, self._on_notification)
+            except Exception as e:
+                logger.debug(f"Token blacklist unlisten failed: {e}")
+        self._listening = False
+
     async def start_cleanup_task(self, interval: int = 300) -> None:
         """
         Start background cleanup task for both memory and database.
@@ -183,6 +312,8 @@ class PersistentTokenBlacklist(TokenBlacklist):
                 self._cleanup_expired()
                 logger.debug(f"Token blacklist cleanup: {len(self._blacklist)} tokens remaining")
 
+            await self._resync_if_disconnected()
+
             # Database cleanup (every 6th interval ≈ 30 minutes)
             db_cleanup_counter += 1
             if db_cleanup_counter >= 6 and self._use_db and self._db:
@@ -282,6 +282,22 @@ class InsufficientPermissionsError(AuthenticationError):
         )
 
 
+class PasswordVerifierBusyError(VFSBotError):
+    """Raised when the password verification pool has no room for another request."""
+
+    def __init__(self, retry_after: int = 1):
+        self.retry_after = retry_after
+        super().__init__(
+            "Password verification is busy, please retry shortly",
+            recoverable=True,
+            details={"retry_after": retry_after},
+        )
+
+    def _get_http_status(self) -> int:
+        """Return 503 so clients back off instead of treating it as bad credentials."""
+        return 503
+
+
 # VFS API Errors
 class VFSApiError(VFSBotError):
     """Base class for VFS API-related errors."""
@@ -1,7 +1,7 @@
 """Infrastructure utilities module."""
 
 from .circuit_breaker import CircuitBreaker
-from .redis_manager import RedisManager
+from .redis_manager import AsyncRedisManager, RedisManager
 from .retry import (
     get_captcha_retry,
     get_login_retry,
@@ -26,6 +26,7 @@ from .startup_validator import log_security_warnings, validate_production_securi
 __all__ = [
     "CircuitBreaker",
     "RedisManager",
+    "AsyncRedisManager",
     "get_login_retry",
     "get_captcha_retry",
     "get_slot_check_retry",
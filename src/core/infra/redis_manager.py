@@ -10,6 +10,7 @@ from src.utils.masking import mask_database_url
 
 if TYPE_CHECKING:
     import redis as redis_module
+    import redis.asyncio as redis_asyncio
 
 
 class RedisManager:
@@ -152,3 +153,119 @@ class RedisManager:
                     logger.debug(f"RedisManager: error closing client during reset: {e}")
             cls._instance = None
             cls._initialized = False
+
+
+class AsyncRedisManager:
+    """
+    Singleton factory for the asyncio Redis client.
+
+    Hands out a ``redis.asyncio.Redis`` with its own connection pool so async
+    backends await Redis on the event loop instead of hopping to a worker
+    thread per command. Availability follows RedisManager: when its startup
+    PING fails, this returns None too and callers fall back to in-memory.
+
+    Example:
+        ```python
+        client = AsyncRedisManager.get_client()
+        if client is not None:
+            await client.ping()
+        ```
+    """
+
+    MAX_CONNECTIONS = 50
+
+    _instance: "Optional[redis_asyncio.Redis]" = None
+    _lock = threading.Lock()
+    _initialized = False
+
+    @classmethod
+    def get_client(cls) -> "Optional[redis_asyncio.Redis]":
+        """
+        Get shared asyncio Redis client instance.
+
+        Connections are opened lazily on the running event loop.
+
+        Returns:
+            Async Redis client instance, or None if unavailable
+        """
+        if cls._initialized:
+            return cls._instance
+
+        with cls._lock:
+            if cls._initialized:
+                return cls._instance
+
+            cls._instance = cls._create_client()
+            cls._initialized = True
+
+        return cls._instance
+
+    @classmethod
+    def _create_client(cls) -> "Optional[redis_asyncio.Redis]":
+        """
+        Create asyncio Redis client from REDIS_URL env var.
+
+        Returns:
+            Async Redis client, or None if Redis is not configured or unreachable
+        """
+        redis_url = os.getenv("REDIS_URL")
+        if not redis_url or RedisManager.get_client() is None:
+            return None
+
+        try:
+            import redis.asyncio as redis_asyncio
+
+            client: "redis_asyncio.Redis" = redis_asyncio.from_url(
+                redis_url,
+                decode_responses=True,
+                socket_connect_timeout=5,
+                socket_timeout=5,
+                retry_on_timeout=True,
+                health_check_interval=30,
+                max_connections=cls.MAX_CONNECTIONS,
+            )
+            logger.info(f"AsyncRedisManager ready: {mask_database_url(redis_url)}")
+            return client
+        except Exception as e:
+            logger.warning(
+                f"AsyncRedisManager: failed to create client "
+                f"({mask_database_url(redis_url)}): {e}. "
+                "Redis-dependent features will be disabled."
+            )
+            return None
+
+    @classmethod
+    async def health_check(cls) -> bool:
+        """
+        Perform a live health check against Redis.
+
+        Returns:
+            True if Redis responds to PING, False otherwise
+        """
+        client = cls.get_client()
+        if client is None:
+            return False
+        try:
+            await client.ping()
+            return True
+        except Exception as e:
+            logger.warning(f"AsyncRedisManager health check failed: {e}")
+            return False
+
+    @classmethod
+    async def close(cls) -> None:
+        """
+        Close the client and its connection pool.
+
+        The next call to get_client() creates a fresh client.
+        """
+        with cls._lock:
+            client = cls._instance
+            cls._instance = None
+            cls._initialized = False
+
+        if client is not None:
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.debug(f"AsyncRedisManager: error closing client: {e}")
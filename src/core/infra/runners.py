@@ -6,16 +6,12 @@ Handles different run modes: bot-only, web-only, and both.
 
 import asyncio
 import os
-from typing import Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
 from loguru import logger
 from typing_extensions import TypedDict
 
-from src.core.bot_controller import BotController
 from src.core.exceptions import ShutdownTimeoutError
-from src.models.database import Database
-from src.services.bot import VFSBot
-from src.services.notification.notification import NotificationService
 
 from .shutdown import (
     graceful_shutdown_with_timeout,
@@ -23,6 +19,12 @@ from .shutdown import (
     set_shutdown_event,
 )
 
+if TYPE_CHECKING:
+    # The bot stack (browser automation, notification channels) is only
+    # imported by the modes that run it, keeping web-only startup lean
+    from src.models.database import Database
+    from src.services.notification.notification import NotificationService
+
 
 class BotConfigDict(TypedDict, total=False):
     """Type hints for the bot configuration dictionary."""
@@ -62,7 +64,7 @@ def parse_safe_port(env_var: str = "UVICORN_PORT", default: int = 8000) -> int:
 
 
 async def _graceful_cleanup(
-    db: Optional[Database], notifier: Optional[NotificationService] = None
+    db: Optional["Database"], notifier: Optional["NotificationService"] = None
 ) -> None:
     """Execute graceful shutdown with timeout protection.
 
@@ -79,7 +81,7 @@ async def _graceful_cleanup(
         logger.error(f"Error during graceful shutdown: {e}")
 
 
-async def run_bot_mode(config: BotConfigDict, db: Optional[Database] = None) -> None:
+async def run_bot_mode(config: BotConfigDict, db: Optional["Database"] = None) -> None:
     """
     Run bot in automated mode.
 
@@ -87,6 +89,9 @@ async def run_bot_mode(config: BotConfigDict, db: Optional[Database] = None) ->
         config: Configuration dictionary
         db: Optional shared database instance
     """
+    from src.services.bot import VFSBot
+    from src.services.notification.notification import NotificationService
+
     logger.info("Starting VFS-Bot in automated mode...")
 
     # Create shutdown event
@@ -174,7 +179,7 @@ async def run_web_mode(
     config: BotConfigDict,
     start_cleanup: bool = True,
     start_backup: bool = True,
-    db: Optional[Database] = None,
+    db: Optional["Database"] = None,
     skip_shutdown: bool = False,
 ) -> None:
     """
@@ -283,6 +288,10 @@ async def run_both_mode(config: BotConfigDict) -> None:
     Args:
         config: Configuration dictionary
     """
+    from src.core.bot_controller import BotController
+    from src.services.bot import VFSBot
+    from src.services.notification.notification import NotificationService
+
     logger.info("Starting VFS-Bot in combined mode (bot + web)...")
 
     # Initialize shared database instance for both modes
@@ -261,6 +261,16 @@ async def safe_shutdown_cleanup(
     except Exception as e:
         logger.error(f"Error cleaning up OTP service: {e}")
 
+    # Flush write-behind selector learning metrics
+    try:
+        from src.selector.manager import close_selector_managers
+
+        await asyncio.wait_for(close_selector_managers(), timeout=5)
+    except asyncio.TimeoutError:
+        logger.warning("Selector metrics flush timed out after 5s")
+    except Exception as e:
+        logger.error(f"Error flushing selector metrics: {e}")
+
     # Close database with timeout protection
     if db_owned and db:
         try:
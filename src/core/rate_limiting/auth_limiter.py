@@ -8,7 +8,7 @@ from typing import Optional
 from loguru import logger
 
 from src.constants import RateLimits
-from src.core.infra.redis_manager import RedisManager
+from src.core.infra.redis_manager import AsyncRedisManager, RedisManager
 from src.utils.masking import mask_database_url
 
 from .backends import InMemoryBackend, RateLimiterBackend, RedisBackend
@@ -57,7 +57,7 @@ class AuthRateLimiter:
 
         if client is not None:
             logger.info("AuthRateLimiter using Redis backend")
-            return RedisBackend(client)
+            return RedisBackend(client, async_client=AsyncRedisManager.get_client())
 
         # If REDIS_URL was set but RedisManager couldn't connect, notify
         redis_url = os.getenv("REDIS_URL")
@@ -179,6 +179,24 @@ class AuthRateLimiter:
             identifier, self.max_attempts, self.window_seconds
         )
 
+    async def check_and_record_attempt_async(self, identifier: str) -> bool:
+        """
+        Async variant of check_and_record_attempt() for request handlers.
+
+        With the Redis backend this awaits the redis.asyncio client directly
+        instead of blocking the event loop on a synchronous round trip.
+
+        Args:
+            identifier: Unique identifier (e.g., username, IP address)
+
+        Returns:
+            True if rate limited (attempt NOT recorded),
+            False if allowed (attempt WAS recorded)
+        """
+        return await self._backend.check_and_record_attempt_async(
+            identifier, self.max_attempts, self.window_seconds
+        )
+
     def clear_attempts(self, identifier: str) -> None:
         """
         Clear all attempts for an identifier.
@@ -188,6 +206,15 @@ class AuthRateLimiter:
         """
         self._backend.clear_attempts(identifier)
 
+    async def clear_attempts_async(self, identifier: str) -> None:
+        """
+        Async variant of clear_attempts() for request handlers.
+
+        Args:
+            identifier: Unique identifier to clear
+        """
+        await self._backend.clear_attempts_async(identifier)
+
     def cleanup_stale_entries(self) -> int:
         """
         Remove all stale entries that have no attempts within the current window.
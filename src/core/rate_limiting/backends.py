@@ -1,12 +1,14 @@
 """Rate limiter backend implementations for authentication endpoints."""
 
+import asyncio
+import hashlib
 import threading
 import time
 import uuid
 from abc import ABC, abstractmethod
 from collections import defaultdict
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 # Lua script for atomic rate limiting (check + record in one operation)
 # KEYS[1] = rate limit key
@@ -39,6 +41,8 @@ redis.call('ZADD', key, now, attempt_id)
 redis.call('EXPIRE', key, window)
 return 0
 """
+# SHA1 Redis uses to cache the script, so async calls can EVALSHA without loading first
+_RATE_LIMIT_LUA_SHA = hashlib.sha1(_RATE_LIMIT_LUA_SCRIPT.encode()).hexdigest()
 
 
 class RateLimiterBackend(ABC):
@@ -88,6 +92,35 @@ class RateLimiterBackend(ABC):
         """
         pass
 
+    async def check_and_record_attempt_async(
+        self, identifier: str, max_attempts: int, window_seconds: int
+    ) -> bool:
+        """
+        Async variant of check_and_record_attempt() for use on the event loop.
+
+        The default runs the synchronous implementation inline, which suits
+        backends that never block on I/O.
+
+        Args:
+            identifier: Unique identifier (e.g., username, IP)
+            max_attempts: Maximum attempts allowed in window
+            window_seconds: Time window in seconds
+
+        Returns:
+            True if rate limited (attempt was NOT recorded),
+            False if allowed (attempt WAS recorded)
+        """
+        return self.check_and_record_attempt(identifier, max_attempts, window_seconds)
+
+    async def clear_attempts_async(self, identifier: str) -> None:
+        """
+        Async variant of clear_attempts() for use on the event loop.
+
+        Args:
+            identifier: Unique identifier to clear
+        """
+        self.clear_attempts(identifier)
+
     @property
     @abstractmethod
     def is_distributed(self) -> bool:
@@ -159,14 +192,17 @@ class InMemoryBackend(RateLimiterBackend):
 class RedisBackend(RateLimiterBackend):
     """Redis-based distributed rate limiter backend."""
 
-    def __init__(self, redis_client: Any):
+    def __init__(self, redis_client: Any, async_client: Optional[Any] = None):
         """
         Initialize Redis backend.
 
         Args:
             redis_client: Redis client instance
+            async_client: Optional redis.asyncio client used by the *_async methods
+                (see AsyncRedisManager); without it they run in a worker thread
         """
         self._redis = redis_client
+        self._async_redis = async_client
         # Register Lua script for atomic rate limiting
         self._rate_limit_script = self._redis.register_script(_RATE_LIMIT_LUA_SCRIPT)
 
@@ -200,6 +236,34 @@ class RedisBackend(RateLimiterBackend):
         )
         return bool(result)
 
+    async def check_and_record_attempt_async(
+        self, identifier: str, max_attempts: int, window_seconds: int
+    ) -> bool:
+        """Atomically check rate limit and record attempt without leaving the event loop."""
+        if self._async_redis is None:
+            return await asyncio.to_thread(
+                self.check_and_record_attempt, identifier, max_attempts, window_seconds
+            )
+
+        from redis.exceptions import NoScriptError
+
+        key = f"auth_rl:{identifier}"
+        args = [max_attempts, window_seconds, time.time(), str(uuid.uuid4())]
+        try:
+            result = await self._async_redis.evalsha(_RATE_LIMIT_LUA_SHA, 1, key, *args)
+        except NoScriptError:
+            # Script cache is empty (first call, restart or SCRIPT FLUSH): load and retry
+            await self._async_redis.script_load(_RATE_LIMIT_LUA_SCRIPT)
+            result = await self._async_redis.evalsha(_RATE_LIMIT_LUA_SHA, 1, key, *args)
+        return bool(result)
+
+    async def clear_attempts_async(self, identifier: str) -> None:
+        """Clear all attempts for an identifier without leaving the event loop."""
+        if self._async_redis is None:
+            await asyncio.to_thread(self.clear_attempts, identifier)
+            return
+        await self._async_redis.delete(f"auth_rl:{identifier}")
+
     @property
     def is_distributed(self) -> bool:
         """Check if backend uses distributed storage."""
@@ -11,6 +11,7 @@ from src.core.exceptions import (
     DatabaseNotConnectedError,
 )
 from src.models.db_connection import DatabaseConnectionManager
+from src.models.db_listener import DatabaseNotificationListener, NotificationCallback
 from src.models.db_state import DatabaseState
 
 __all__ = ["Database", "DatabaseState"]
@@ -40,6 +41,9 @@ class Database:
         self._consecutive_failures: int = 0
         self._max_failures_before_degraded: int = 3
 
+        # Dedicated LISTEN connection, created on first listen()
+        self._notification_listener: Optional[DatabaseNotificationListener] = None
+
     @property
     def pool(self) -> Optional[asyncpg.Pool]:
         """Get the connection pool from the connection manager."""
@@ -149,8 +153,59 @@ class Database:
 
     async def close(self) -> None:
         """Close database connection pool."""
+        if self._notification_listener is not None:
+            await self._notification_listener.close()
+            self._notification_listener = None
         await self._connection_manager.close()
 
+    @property
+    def notifications_active(self) -> bool:
+        """Whether the LISTEN connection is open and notifications are being received."""
+        return self._notification_listener is not None and self._notification_listener.is_connected
+
+    @property
+    def notification_generation(self) -> Optional[int]:
+        """Generation of the open LISTEN connection (None while disconnected)."""
+        if self._notification_listener is None:
+            return None
+        return self._notification_listener.generation
+
+    async def listen(self, channel: str, callback: NotificationCallback) -> None:
+        """
+        Subscribe to a PostgreSQL NOTIFY channel.
+
+        All channels share one dedicated connection outside the pool.
+
+        Args:
+            channel: Channel name
+            callback: Called with the notification payload on the event loop
+        """
+        if self._notification_listener is None:
+            self._notification_listener = DatabaseNotificationListener(self.database_url)
+        await self._notification_listener.add_listener(channel, callback)
+
+    async def unlisten(self, channel: str, callback: NotificationCallback) -> None:
+        """
+        Unsubscribe from a PostgreSQL NOTIFY channel.
+
+        Args:
+            channel: Channel name
+            callback: Callback previously passed to listen()
+        """
+        if self._notification_listener is not None:
+            await self._notification_listener.remove_listener(channel, callback)
+
+    async def ensure_listening(self) -> bool:
+        """
+        Re-open the LISTEN connection if it was lost.
+
+        Returns:
+            True if notifications are being received
+        """
+        if self._notification_listener is None:
+            return False
+        return await self._notification_listener.reconnect()
+
     async def __aenter__(self) -> "Database":
         """Async context manager entry."""
         await self.connect()
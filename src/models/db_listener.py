@@ -0,0 +1,163 @@
+"""PostgreSQL LISTEN/NOTIFY support on a dedicated connection."""
+
+import asyncio
+import itertools
+from typing import Any, Callable, Dict, List, Optional
+
+import asyncpg
+from loguru import logger
+
+from src.utils.masking import mask_database_url
+
+NotificationCallback = Callable[[str], None]
+
+# Process-wide, so a listener re-created after Database.close() never reuses a value
+_generations = itertools.count(1)
+
+
+class DatabaseNotificationListener:
+    """
+    Dispatch PostgreSQL notifications to in-process callbacks.
+
+    LISTEN registrations are bound to a session, so they cannot live on a pooled
+    connection that is handed back and recycled. This class keeps one dedicated
+    connection per process and fans each notification out to every callback
+    registered for its channel.
+
+    Notifications are best-effort: they are lost while the connection is down.
+    Consumers must treat them as invalidation hints and keep their own periodic
+    reconcile; ``is_connected`` tells them when hints cannot be trusted, and
+    ``generation`` tells them whether the connection was re-opened (possibly by
+    another consumer) since they last reconciled.
+    """
+
+    def __init__(self, database_url: str):
+        """
+        Initialize notification listener.
+
+        Args:
+            database_url: PostgreSQL connection URL
+        """
+        self.database_url = database_url
+        self._conn: Optional[asyncpg.Connection] = None
+        self._generation = 0
+        self._callbacks: Dict[str, List[NotificationCallback]] = {}
+        self._lock = asyncio.Lock()
+
+    @property
+    def is_connected(self) -> bool:
+        """Whether the dedicated LISTEN connection is currently open."""
+        return self._conn is not None and not self._conn.is_closed()
+
+    @property
+    def generation(self) -> Optional[int]:
+        """
+        Identifier of the open LISTEN connection, or None while disconnected.
+
+        A new value is assigned every time the connection is (re)opened, so a
+        consumer whose recorded generation differs may have missed notifications.
+        """
+        return self._generation if self.is_connected else None
+
+    async def _ensure_connected(self) -> asyncpg.Connection:
+        """Open the dedicated connection and re-subscribe channels if needed."""
+        if self._conn is not None and not self._conn.is_closed():
+            return self._conn
+
+        self._conn = await asyncpg.connect(self.database_url)
+        self._conn.add_termination_listener(self._on_termination)
+        for channel in self._callbacks:
+            await self._conn.add_listener(channel, self._dispatch)
+        self._generation = next(_generations)
+
+        logger.info(
+            f"Notification listener connected: {mask_database_url(self.database_url)} "
+            f"(channels: {list(self._callbacks.keys())})"
+        )
+        return self._conn
+
+    def _on_termination(self, connection: Any) -> None:
+        """Mark the listener disconnected when the server closes the connection."""
+        logger.warning("Notification listener connection terminated")
+        self._conn = None
+
+    def _dispatch(self, connection: Any, pid: int, channel: str, payload: str) -> None:
+        """Invoke all callbacks registered for a channel."""
+        for callback in list(self._callbacks.get(channel, [])):
+            try:
+                callback(payload)
+            except Exception as e:
+                logger.error(f"Notification callback failed on channel {channel}: {e}")
+
+    async def add_listener(self, channel: str, callback: NotificationCallback) -> None:
+        """
+        Subscribe a callback to a notification channel.
+
+        Args:
+            channel: Channel name passed to LISTEN
+            callback: Called synchronously with the notification payload
+        """
+        async with self._lock:
+            is_new_channel = channel not in self._callbacks
+            self._callbacks.setdefault(channel, []).append(callback)
+            try:
+                was_connected = self.is_connected
+                conn = await self._ensure_connected()
+                if is_new_channel and was_connected:
+                    await conn.add_listener(channel, self._dispatch)
+            except Exception:
+                self._callbacks[channel].remove(callback)
+                if not self._callbacks[channel]:
+                    del self._callbacks[channel]
+                raise
+
+    async def remove_listener(self, channel: str, callback: NotificationCallback) -> None:
+        """
+        Unsubscribe a callback from a notification channel.
+
+        Args:
+            channel: Channel name
+            callback: Previously registered callback
+        """
+        async with self._lock:
+            callbacks = self._callbacks.get(channel)
+            if not callbacks or callback not in callbacks:
+                return
+            callbacks.remove(callback)
+            if callbacks:
+                return
+
+            del self._callbacks[channel]
+            if self.is_connected and self._conn is not None:
+                try:
+                    await self._conn.remove_listener(channel, self._dispatch)
+                except Exception as e:
+                    logger.debug(f"Failed to UNLISTEN {channel}: {e}")
+
+    async def reconnect(self) -> bool:
+        """
+        Re-open the dedicated connection after it was lost.
+
+        Returns:
+            True if the listener is connected afterwards
+        """
+        async with self._lock:
+            if not self._callbacks:
+                return self.is_connected
+            try:
+                await self._ensure_connected()
+                return True
+            except Exception as e:
+                logger.warning(f"Notification listener reconnect failed: {e}")
+                return False
+
+    async def close(self) -> None:
+        """Close the dedicated connection and drop all subscriptions."""
+        async with self._lock:
+            self._callbacks.clear()
+            conn, self._conn = self._conn, None
+            if conn is not None and not conn.is_closed():
+                try:
+                    await conn.close()
+                except Exception as e:
+                    logger.debug(f"Error closing notification listener: {e}")
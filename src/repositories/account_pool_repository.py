@@ -11,6 +11,44 @@ from src.utils.encryption import decrypt_password, encrypt_password
 if TYPE_CHECKING:
     from src.models.database import Database
 
+# An account in cooldown or quarantine is usable again once that period has
+# expired; the status only records why it was set aside. A quarantine without
+# an expiry (set manually) keeps the account out until it is reset.
+_USABLE_ACCOUNT_CONDITION = """
+    is_active = TRUE
+    AND (
+        status = 'available'
+        OR (status = 'cooldown' AND cooldown_until IS NOT NULL)
+        OR (status = 'quarantine' AND quarantine_until IS NOT NULL)
+    )
+    AND (cooldown_until IS NULL OR cooldown_until <= NOW())
+    AND (quarantine_until IS NULL OR quarantine_until <= NOW())
+"""
+
+# When a set-aside account becomes usable: the later of its two expiries
+_ACCOUNT_EXPIRY = "GREATEST(cooldown_until, quarantine_until)"
+
+# Column order of account_usage_log rows written by AccountUsageLogWriter
+USAGE_LOG_COLUMNS = [
+    "account_id",
+    "mission_code",
+    "session_number",
+    "request_id",
+    "result",
+    "error_message",
+    "started_at",
+    "completed_at",
+]
+
+_PENDING_EXPIRY_CONDITION = f"""
+    is_active = TRUE
+    AND (
+        (status = 'cooldown' AND cooldown_until IS NOT NULL)
+        OR (status = 'quarantine' AND quarantine_until IS NOT NULL)
+    )
+    AND {_ACCOUNT_EXPIRY} > NOW()
+"""
+
 
 class AccountPoolRepository(BaseRepository):
     """Repository for VFS account pool operations."""
@@ -47,7 +85,7 @@ class AccountPoolRepository(BaseRepository):
         Get all available accounts (not in cooldown or quarantine).
 
         Returns accounts where:
-        - status = 'available'
+        - status = 'available', or 'cooldown'/'quarantine' with an expiry set
         - cooldown_until is NULL or in the past
         - quarantine_until is NULL or in the past
         - is_active = TRUE
@@ -58,16 +96,13 @@ class AccountPoolRepository(BaseRepository):
             List of account dictionaries with decrypted passwords
         """
         async with self.db.get_connection() as conn:
-            rows = await conn.fetch("""
+            rows = await conn.fetch(f"""
                 SELECT id, email, password, phone, status,
                        last_used_at, cooldown_until, quarantine_until,
                        consecutive_failures, total_uses, is_active,
                        created_at, updated_at
                 FROM vfs_account_pool
-                WHERE is_active = TRUE
-                  AND status = 'available'
-                  AND (cooldown_until IS NULL OR cooldown_until <= NOW())
-                  AND (quarantine_until IS NULL OR quarantine_until <= NOW())
+                WHERE {_USABLE_ACCOUNT_CONDITION}
                 ORDER BY last_used_at ASC NULLS FIRST
                 """)
 
@@ -84,6 +119,39 @@ class AccountPoolRepository(BaseRepository):
 
             return accounts
 
+    async def get_availability_summary(self) -> Dict[str, Any]:
+        """
+        Count available accounts and find the next cooldown expiry in one query.
+
+        Reads no password ciphertext, so the cost is independent of decryption.
+        Uses the same availability conditions as get_available_accounts() and
+        the same expiry as get_next_available_cooldown_time().
+
+        Returns:
+            Dictionary with 'available' (int) and 'next_cooldown_until'
+            (earliest future time a cooled-down or quarantined account
+            becomes usable, or None)
+        """
+        async with self.db.get_connection() as conn:
+            row = await conn.fetchrow(f"""
+                SELECT
+                    COUNT(*) FILTER (
+                        WHERE {_USABLE_ACCOUNT_CONDITION}
+                    ) as available,
+                    MIN({_ACCOUNT_EXPIRY}) FILTER (
+                        WHERE {_PENDING_EXPIRY_CONDITION}
+                    ) as next_cooldown_until
+                FROM vfs_account_pool
+                WHERE is_active = TRUE
+                """)
+
+            if row is None:
+                return {"available": 0, "next_cooldown_until": None}
+            return {
+                "available": row["available"] or 0,
+                "next_cooldown_until": row["next_cooldown_until"],
+            }
+
     async def get_account_by_id(
         self, account_id: int, decrypt: bool = True
     ) -> Optional[Dict[str, Any]]:
@@ -186,16 +254,13 @@ class AccountPoolRepository(BaseRepository):
         """
         async with self.db.get_connection() as conn:
             async with conn.transaction():
-                row = await conn.fetchrow("""
+                row = await conn.fetchrow(f"""
                     UPDATE vfs_account_pool
                     SET status = 'in_use',
                         last_used_at = NOW()
                     WHERE id = (
                         SELECT id FROM vfs_account_pool
-                        WHERE is_active = TRUE
-                          AND status = 'available'
-                          AND (cooldown_until IS NULL OR cooldown_until <= NOW())
-                          AND (quarantine_until IS NULL OR quarantine_until <= NOW())
+                        WHERE {_USABLE_ACCOUNT_CONDITION}
                         ORDER BY last_used_at ASC NULLS FIRST
                         LIMIT 1
                         FOR UPDATE SKIP LOCKED
@@ -224,6 +289,109 @@ class AccountPoolRepository(BaseRepository):
 
                 return account
 
+    async def acquire_available_accounts(self, limit: int) -> List[Dict[str, Any]]:
+        """
+        Atomically acquire up to ``limit`` available accounts in one statement.
+
+        Rows are claimed with FOR UPDATE SKIP LOCKED, as in
+        acquire_next_available_account(), so concurrent callers in any process
+        never receive the same account. Accounts whose password cannot be
+        decrypted are put back to 'available' and left out of the result.
+
+        Args:
+            limit: Maximum number of accounts to acquire
+
+        Returns:
+            Account dictionaries with decrypted passwords, least recently used first
+        """
+        if limit <= 0:
+            return []
+
+        async with self.db.get_connection() as conn:
+            async with conn.transaction():
+                rows = await conn.fetch(
+                    f"""
+                    WITH picked AS (
+                        SELECT id, last_used_at AS previous_used_at
+                        FROM vfs_account_pool
+                        WHERE {_USABLE_ACCOUNT_CONDITION}
+                        ORDER BY last_used_at ASC NULLS FIRST
+                        LIMIT $1
+                        FOR UPDATE SKIP LOCKED
+                    )
+                    UPDATE vfs_account_pool AS pool
+                    SET status = 'in_use',
+                        last_used_at = NOW()
+                    FROM picked
+                    WHERE pool.id = picked.id
+                    RETURNING pool.id, pool.email, pool.password, pool.phone, pool.status,
+                              pool.last_used_at, pool.cooldown_until, pool.quarantine_until,
+                              pool.consecutive_failures, pool.total_uses, pool.is_active,
+                              pool.created_at, pool.updated_at, picked.previous_used_at
+                    """,
+                    limit,
+                )
+
+                # RETURNING order is unspecified; restore the LRU order (NULLS FIRST)
+                ordered = sorted(
+                    (dict(row) for row in rows),
+                    key=lambda a: (
+                        a["previous_used_at"] is not None,
+                        a["previous_used_at"],
+                        a["id"],
+                    ),
+                )
+
+                accounts = []
+                undecryptable: List[int] = []
+                for account in ordered:
+                    del account["previous_used_at"]
+                    try:
+                        account["password"] = decrypt_password(account["password"])
+                    except Exception as e:
+                        logger.error(
+                            f"Failed to decrypt password for account {account['id']}: {e}"
+                        )
+                        undecryptable.append(account["id"])
+                        continue
+                    accounts.append(account)
+
+                if undecryptable:
+                    # Revert status since we can't use these accounts
+                    await conn.execute(
+                        """
+                        UPDATE vfs_account_pool SET status = 'available'
+                        WHERE id = ANY($1::bigint[])
+                        """,
+                        undecryptable,
+                    )
+
+                return accounts
+
+    async def return_unused_accounts(self, account_ids: List[int]) -> int:
+        """
+        Put acquired but unused accounts back to 'available'.
+
+        Unlike release_account(), no usage, cooldown or failure is recorded.
+
+        Args:
+            account_ids: IDs of accounts still marked 'in_use'
+
+        Returns:
+            Number of accounts returned
+        """
+        if not account_ids:
+            return 0
+        async with self.db.get_connection() as conn:
+            result = await conn.execute(
+                """
+                UPDATE vfs_account_pool SET status = 'available'
+                WHERE id = ANY($1::bigint[]) AND status = 'in_use'
+                """,
+                account_ids,
+            )
+        return int(result.split()[-1])
+
     async def mark_account_in_use(self, account_id: int) -> bool:
         """
         Mark account as in use.
@@ -271,28 +439,16 @@ class AccountPoolRepository(BaseRepository):
             if result_status in ("success", "no_slot"):
                 # Success or no slot - cooldown, reset failures
                 new_status = "cooldown"
-                consecutive_failures = 0
-                total_uses_increment = 1
+                failures_update: Optional[str] = "consecutive_failures = 0"
             elif result_status in ("login_fail", "error"):
-                # Increment failures, check for quarantine
-                row = await conn.fetchrow(
-                    "SELECT consecutive_failures FROM vfs_account_pool WHERE id = $1",
-                    account_id,
-                )
-                if row:
-                    current_failures = row["consecutive_failures"]
-                    consecutive_failures = current_failures + 1
-                    total_uses_increment = 1
-                    # Quarantine handled by caller via quarantine_until parameter
-                    new_status = "quarantine" if quarantine_until else "available"
-                else:
-                    logger.error(f"Account {account_id} not found for release")
-                    return False
+                # Increment failures in the UPDATE itself; quarantine is decided
+                # by the caller via quarantine_until (see release_failed_account())
+                new_status = "quarantine" if quarantine_until else "available"
+                failures_update = "consecutive_failures = consecutive_failures + 1"
             elif result_status == "banned":
                 # Banned - quarantine
                 new_status = "quarantine"
-                consecutive_failures = None  # Don't reset on ban
-                total_uses_increment = 1
+                failures_update = None  # Don't reset on ban
             else:
                 logger.error(f"Invalid result_status: {result_status}")
                 return False
@@ -300,15 +456,13 @@ class AccountPoolRepository(BaseRepository):
             # Update account
             update_parts = [
                 "status = $2",
-                "total_uses = total_uses + $3",
+                "total_uses = total_uses + 1",
             ]
-            params: List[Any] = [account_id, new_status, total_uses_increment]
-            param_idx = 4
+            params: List[Any] = [account_id, new_status]
+            param_idx = 3
 
-            if consecutive_failures is not None:
-                update_parts.append(f"consecutive_failures = ${param_idx}")
-                params.append(consecutive_failures)
-                param_idx += 1
+            if failures_update is not None:
+                update_parts.append(failures_update)
 
             if cooldown_until is not None:
                 update_parts.append(f"cooldown_until = ${param_idx}")
@@ -329,6 +483,59 @@ class AccountPoolRepository(BaseRepository):
             result = await conn.execute(query, *params)
             return bool(result == "UPDATE 1")
 
+    async def release_failed_account(
+        self,
+        account_id: int,
+        result_status: str,
+        max_failures: int,
+        quarantine_until: datetime,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Release an account after a failed mission in a single statement.
+
+        Increments consecutive_failures and, once it reaches ``max_failures``,
+        quarantines the account until ``quarantine_until``; otherwise the
+        account goes back to 'available'. The decision is made in the UPDATE,
+        so no prior read of the failure counter is needed.
+
+        Args:
+            account_id: Account ID
+            result_status: Result of the usage ('login_fail' or 'error')
+            max_failures: Consecutive failures that trigger quarantine
+            quarantine_until: Quarantine expiration if the threshold is reached
+
+        Returns:
+            Dictionary with the new status, consecutive_failures and
+            quarantine_until, or None if the account was not found
+        """
+        if result_status not in ("login_fail", "error"):
+            logger.error(f"Invalid result_status for failed release: {result_status}")
+            return None
+
+        async with self.db.get_connection() as conn:
+            # SET expressions see the row before the update, RETURNING the row after it
+            row = await conn.fetchrow(
+                """
+                UPDATE vfs_account_pool
+                SET consecutive_failures = consecutive_failures + 1,
+                    total_uses = total_uses + 1,
+                    status = CASE WHEN consecutive_failures + 1 >= $2
+                                  THEN 'quarantine' ELSE 'available' END,
+                    quarantine_until = CASE WHEN consecutive_failures + 1 >= $2
+                                            THEN $3 ELSE quarantine_until END
+                WHERE id = $1
+                RETURNING status, consecutive_failures, quarantine_until
+                """,
+                account_id,
+                max_failures,
+                quarantine_until,
+            )
+
+        if row is None:
+            logger.error(f"Account {account_id} not found for release")
+            return None
+        return dict(row)
+
     async def log_usage(
         self,
         account_id: int,
@@ -378,18 +585,16 @@ class AccountPoolRepository(BaseRepository):
 
     async def get_next_available_cooldown_time(self) -> Optional[datetime]:
         """
-        Get the earliest cooldown expiration time for accounts in cooldown.
+        Get the earliest time an account in cooldown or quarantine becomes usable.
 
         Returns:
-            Earliest cooldown_until timestamp, or None if no accounts in cooldown
+            Earliest future expiry, or None if no account is waiting on one
         """
         async with self.db.get_connection() as conn:
-            row = await conn.fetchrow("""
-                SELECT MIN(cooldown_until) as earliest_cooldown
+            row = await conn.fetchrow(f"""
+                SELECT MIN({_ACCOUNT_EXPIRY}) as earliest_cooldown
                 FROM vfs_account_pool
-                WHERE is_active = TRUE
-                  AND status = 'cooldown'
-                  AND cooldown_until > NOW()
+                WHERE {_PENDING_EXPIRY_CONDITION}
                 """)
             return row["earliest_cooldown"] if row and row["earliest_cooldown"] else None
 
@@ -401,18 +606,20 @@ class AccountPoolRepository(BaseRepository):
             Dictionary with pool statistics
         """
         async with self.db.get_connection() as conn:
-            row = await conn.fetchrow("""
+            row = await conn.fetchrow(f"""
                 SELECT
                     COUNT(*) FILTER (WHERE is_active = TRUE) as total_active,
                     COUNT(*) FILTER (
-                        WHERE is_active = TRUE AND status = 'available'
-                        AND (cooldown_until IS NULL OR cooldown_until <= NOW())
-                        AND (quarantine_until IS NULL OR quarantine_until <= NOW())
+                        WHERE {_USABLE_ACCOUNT_CONDITION}
                     ) as available,
                     COUNT(*) FILTER (WHERE is_active = TRUE AND status = 'in_use') as in_use,
-                    COUNT(*) FILTER (WHERE is_active = TRUE AND status = 'cooldown') as in_cooldown,
+                    COUNT(*) FILTER (
+                        WHERE is_active = TRUE AND status = 'cooldown'
+                        AND (cooldown_until IS NULL OR cooldown_until > NOW())
+                    ) as in_cooldown,
                     COUNT(*) FILTER (
                         WHERE is_active = TRUE AND status = 'quarantine'
+                        AND (quarantine_until IS NULL OR quarantine_until > NOW())
                     ) as quarantined,
                     AVG(total_uses) FILTER (WHERE is_active = TRUE) as avg_uses,
                     MAX(total_uses) FILTER (WHERE is_active = TRUE) as max_uses
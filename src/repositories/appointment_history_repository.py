@@ -1,7 +1,7 @@
 """Appointment history repository implementation."""
 
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, List, Optional, Tuple
 
 if TYPE_CHECKING:
     from src.models.database import Database
@@ -9,6 +9,7 @@ if TYPE_CHECKING:
 from loguru import logger
 
 from src.repositories.base import BaseRepository
+from src.utils.db_helpers import fetch_keyset_page, stream_keyset_rows
 
 
 class AppointmentHistory:
@@ -158,6 +159,83 @@ class AppointmentHistoryRepository(BaseRepository[AppointmentHistory]):
             rows = await conn.fetch(query, *params)
             return [self._dict_to_appointment_history(dict(row)) for row in rows]
 
+    @staticmethod
+    def _filtered_query(user_id: Optional[int], status: Optional[str]) -> Tuple[str, List[Any]]:
+        """
+        Build the filtered appointment_history SELECT used by keyset listings.
+
+        Args:
+            user_id: Optional filter by user ID
+            status: Optional status filter
+
+        Returns:
+            Tuple of (query ending in a WHERE clause, params)
+        """
+        query = "SELECT * FROM appointment_history WHERE 1=1"
+        params: List[Any] = []
+
+        if user_id is not None:
+            params.append(user_id)
+            query += f" AND user_id = ${len(params)}"
+        if status:
+            params.append(status)
+            query += f" AND status = ${len(params)}"
+
+        return query, params
+
+    async def get_page(
+        self,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        user_id: Optional[int] = None,
+        status: Optional[str] = None,
+    ) -> Tuple[List[AppointmentHistory], Optional[str]]:
+        """
+        Get one page of appointment history, newest first.
+
+        Args:
+            limit: Page size
+            cursor: Cursor returned with the previous page, or None for the first page
+            user_id: Optional filter by user ID
+            status: Optional status filter
+
+        Returns:
+            Tuple of (appointment history entities, cursor for the next page or None)
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        query, params = self._filtered_query(user_id, status)
+        async with self.db.get_connection() as conn:
+            rows, next_cursor = await fetch_keyset_page(conn, query, params, limit, cursor)
+            return [self._dict_to_appointment_history(dict(row)) for row in rows], next_cursor
+
+    async def stream(
+        self,
+        cursor: Optional[str] = None,
+        user_id: Optional[int] = None,
+        status: Optional[str] = None,
+    ) -> AsyncIterator[AppointmentHistory]:
+        """
+        Iterate all matching appointment history through a server-side cursor.
+
+        Args:
+            cursor: Optional cursor to resume after
+            user_id: Optional filter by user ID
+            status: Optional status filter
+
+        Yields:
+            Appointment history entities, newest first
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        query, params = self._filtered_query(user_id, status)
+        async with self.db.get_connection() as conn:
+            async for rows in stream_keyset_rows(conn, query, params, cursor):
+                for row in rows:
+                    yield self._dict_to_appointment_history(dict(row))
+
     async def create(self, data: Dict[str, Any]) -> int:
         """
         Create new appointment history record.
@@ -2,7 +2,7 @@
 
 import json
 from datetime import datetime, timedelta, timezone
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, List, Optional, Tuple
 
 if TYPE_CHECKING:
     from src.models.database import Database
@@ -11,6 +11,7 @@ from loguru import logger
 
 from src.core.exceptions import ValidationError
 from src.repositories.base import BaseRepository
+from src.utils.db_helpers import fetch_keyset_page, stream_keyset_rows
 from src.utils.validators import validate_email
 
 
@@ -96,6 +97,85 @@ class AppointmentRequestRepository(BaseRepository[AppointmentRequest]):
             persons=data.get("persons", []),
         )
 
+    @staticmethod
+    def _parse_request_row(request_row: Any) -> Dict[str, Any]:
+        """
+        Convert an appointment_requests row to a dictionary with decoded fields.
+
+        Args:
+            request_row: Database row from appointment_requests
+
+        Returns:
+            Request dictionary with parsed JSON fields and visa defaults
+        """
+        request = dict(request_row)
+
+        # Parse JSON fields
+        request["centres"] = json.loads(request["centres"])
+        request["preferred_dates"] = json.loads(request["preferred_dates"])
+
+        # Ensure visa fields have defaults for old records
+        if "visa_category" not in request or request["visa_category"] is None:
+            request["visa_category"] = ""
+        if "visa_subcategory" not in request or request["visa_subcategory"] is None:
+            request["visa_subcategory"] = ""
+
+        return request
+
+    async def _fetch_persons_by_request_ids(
+        self, conn: Any, request_ids: List[int]
+    ) -> Dict[int, List[Dict[str, Any]]]:
+        """
+        Fetch persons for many requests in a single query.
+
+        Args:
+            conn: Database connection
+            request_ids: Request IDs to load persons for
+
+        Returns:
+            Dictionary mapping request ID to its list of person dictionaries
+        """
+        persons_by_request: Dict[int, List[Dict[str, Any]]] = {
+            request_id: [] for request_id in request_ids
+        }
+        if not request_ids:
+            return persons_by_request
+
+        person_rows = await conn.fetch(
+            """
+            SELECT * FROM appointment_persons
+            WHERE request_id = ANY($1::bigint[])
+            ORDER BY request_id, id
+            """,
+            request_ids,
+        )
+        for row in person_rows:
+            person = dict(row)
+            persons_by_request.setdefault(person["request_id"], []).append(person)
+
+        return persons_by_request
+
+    async def _build_requests(self, conn: Any, request_rows: List[Any]) -> List[AppointmentRequest]:
+        """
+        Build AppointmentRequest entities with persons using one bulk person query.
+
+        Args:
+            conn: Database connection
+            request_rows: Rows from appointment_requests, in the desired order
+
+        Returns:
+            List of appointment request entities in the same order as request_rows
+        """
+        requests = [self._parse_request_row(row) for row in request_rows]
+        persons_by_request = await self._fetch_persons_by_request_ids(
+            conn, [request["id"] for request in requests]
+        )
+
+        for request in requests:
+            request["persons"] = persons_by_request.get(request["id"], [])
+
+        return [self._dict_to_appointment_request(request) for request in requests]
+
     async def get_by_id(self, id: int) -> Optional[AppointmentRequest]:
         """
         Get appointment request by ID.
@@ -115,17 +195,7 @@ class AppointmentRequestRepository(BaseRepository[AppointmentRequest]):
             if not request_row:
                 return None
 
-            request = dict(request_row)
-
-            # Parse JSON fields
-            request["centres"] = json.loads(request["centres"])
-            request["preferred_dates"] = json.loads(request["preferred_dates"])
-
-            # Ensure visa fields have defaults for old records
-            if "visa_category" not in request or request["visa_category"] is None:
-                request["visa_category"] = ""
-            if "visa_subcategory" not in request or request["visa_subcategory"] is None:
-                request["visa_subcategory"] = ""
+            request = self._parse_request_row(request_row)
 
             # Get persons
             person_rows = await conn.fetch(
@@ -135,12 +205,42 @@ class AppointmentRequestRepository(BaseRepository[AppointmentRequest]):
 
             return self._dict_to_appointment_request(request)
 
+    async def get_by_ids(self, ids: List[int]) -> List[AppointmentRequest]:
+        """
+        Get multiple appointment requests by ID with their persons.
+
+        Uses two queries regardless of how many IDs are requested, avoiding
+        the N+1 pattern of calling get_by_id() in a loop.
+
+        Args:
+            ids: Request IDs
+
+        Returns:
+            List of appointment request entities, newest first (missing IDs are skipped)
+        """
+        if not ids:
+            return []
+
+        async with self.db.get_connection() as conn:
+            request_rows = await conn.fetch(
+                """
+                SELECT * FROM appointment_requests
+                WHERE id = ANY($1::bigint[])
+                ORDER BY created_at DESC
+                """,
+                list(ids),
+            )
+            return await self._build_requests(conn, request_rows)
+
     async def get_all(
         self, limit: int = 100, status: Optional[str] = None
     ) -> List[AppointmentRequest]:
         """
         Get all appointment requests.
 
+        Persons for all returned requests are loaded with a single bulk query,
+        so the number of round-trips is constant in the number of requests.
+
         Args:
             limit: Maximum number of requests to return (not used by underlying method)
             status: Optional status filter
@@ -160,28 +260,72 @@ class AppointmentRequestRepository(BaseRepository[AppointmentRequest]):
                     "SELECT * FROM appointment_requests ORDER BY created_at DESC"
                 )
 
-            requests = []
+            return await self._build_requests(conn, request_rows)
 
-            for request_row in request_rows:
-                request = dict(request_row)
-                request["centres"] = json.loads(request["centres"])
-                request["preferred_dates"] = json.loads(request["preferred_dates"])
+    @staticmethod
+    def _filtered_query(status: Optional[str]) -> Tuple[str, List[Any]]:
+        """
+        Build the filtered appointment_requests SELECT used by keyset listings.
 
-                # Ensure visa fields have defaults for old records
-                if "visa_category" not in request or request["visa_category"] is None:
-                    request["visa_category"] = ""
-                if "visa_subcategory" not in request or request["visa_subcategory"] is None:
-                    request["visa_subcategory"] = ""
+        Args:
+            status: Optional status filter
 
-                # Get persons for this request
-                person_rows = await conn.fetch(
-                    "SELECT * FROM appointment_persons WHERE request_id = $1", request["id"]
-                )
-                request["persons"] = [dict(row) for row in person_rows]
+        Returns:
+            Tuple of (query ending in a WHERE clause, params)
+        """
+        if status:
+            return "SELECT * FROM appointment_requests WHERE status = $1", [status]
+        return "SELECT * FROM appointment_requests WHERE 1=1", []
 
-                requests.append(self._dict_to_appointment_request(request))
+    async def get_page(
+        self,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        status: Optional[str] = None,
+    ) -> Tuple[List[AppointmentRequest], Optional[str]]:
+        """
+        Get one page of appointment requests with their persons, newest first.
 
-            return requests
+        Args:
+            limit: Page size
+            cursor: Cursor returned with the previous page, or None for the first page
+            status: Optional status filter
+
+        Returns:
+            Tuple of (appointment request entities, cursor for the next page or None)
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        query, params = self._filtered_query(status)
+        async with self.db.get_connection() as conn:
+            request_rows, next_cursor = await fetch_keyset_page(conn, query, params, limit, cursor)
+            return await self._build_requests(conn, request_rows), next_cursor
+
+    async def stream(
+        self, cursor: Optional[str] = None, status: Optional[str] = None
+    ) -> AsyncIterator[AppointmentRequest]:
+        """
+        Iterate all matching appointment requests through a server-side cursor.
+
+        Persons are loaded with one bulk query per fetched chunk, so both
+        memory and round-trips stay bounded by the chunk size.
+
+        Args:
+            cursor: Optional cursor to resume after
+            status: Optional status filter
+
+        Yields:
+            Appointment request entities with persons, newest first
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        query, params = self._filtered_query(status)
+        async with self.db.get_connection() as conn:
+            async for request_rows in stream_keyset_rows(conn, query, params, cursor):
+                for request in await self._build_requests(conn, request_rows):
+                    yield request
 
     async def get_pending_for_user(self, user_id: int) -> Optional[AppointmentRequest]:
         """
@@ -237,25 +381,23 @@ class AppointmentRequestRepository(BaseRepository[AppointmentRequest]):
             user_email = user_row["email"]
 
             # Find all pending requests where any person matches user email
-            rows = await conn.fetch(
+            request_rows = await conn.fetch(
                 """
-                SELECT DISTINCT ar.id, ar.created_at FROM appointment_requests ar
-                JOIN appointment_persons ap ON ar.id = ap.request_id
-                WHERE ap.email = $1 AND ar.status = 'pending'
+                SELECT ar.* FROM appointment_requests ar
+                WHERE ar.status = 'pending'
+                  AND EXISTS (
+                      SELECT 1 FROM appointment_persons ap
+                      WHERE ap.request_id = ar.id AND ap.email = $1
+                  )
                 ORDER BY ar.created_at DESC
                 """,
                 user_email,
             )
-            if not rows:
+            if not request_rows:
                 return []
 
-            # Get full requests with persons
-            requests = []
-            for row in rows:
-                request = await self.get_by_id(row["id"])
-                if request:
-                    requests.append(request)
-            return requests
+            # Load persons for all matching requests in one query
+            return await self._build_requests(conn, request_rows)
 
     async def get_user_ids_with_pending_requests(self) -> set[int]:
         """
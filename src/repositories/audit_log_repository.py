@@ -1,7 +1,7 @@
 """Audit log repository implementation."""
 
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, List, Optional, Tuple
 
 if TYPE_CHECKING:
     from src.models.database import Database
@@ -9,6 +9,7 @@ if TYPE_CHECKING:
 from loguru import logger
 
 from src.repositories.base import BaseRepository
+from src.utils.db_helpers import fetch_keyset_page, stream_keyset_rows
 
 
 class AuditLogEntry:
@@ -135,6 +136,136 @@ class AuditLogRepository(BaseRepository[AuditLogEntry]):
             rows = await conn.fetch(query, *params)
             return [dict(row) for row in rows]
 
+    @staticmethod
+    def _filtered_query(
+        action: Optional[str], user_id: Optional[int], success: Optional[bool]
+    ) -> Tuple[str, List[Any]]:
+        """
+        Build the filtered audit_log SELECT used by keyset listings.
+
+        Args:
+            action: Optional filter by action type
+            user_id: Optional filter by user ID
+            success: Optional filter by success status
+
+        Returns:
+            Tuple of (query ending in a WHERE clause, params)
+        """
+        query = "SELECT * FROM audit_log WHERE 1=1"
+        params: List[Any] = []
+
+        if action:
+            params.append(action)
+            query += f" AND action = ${len(params)}"
+        if user_id is not None:
+            params.append(user_id)
+            query += f" AND user_id = ${len(params)}"
+        if success is not None:
+            params.append(success)
+            query += f" AND success = ${len(params)}"
+
+        return query, params
+
+    async def get_page(
+        self,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        action: Optional[str] = None,
+        user_id: Optional[int] = None,
+        success: Optional[bool] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Get one page of audit log entries, newest first.
+
+        Args:
+            limit: Page size
+            cursor: Cursor returned with the previous page, or None for the first page
+            action: Optional filter by action type
+            user_id: Optional filter by user ID
+            success: Optional filter by success status
+
+        Returns:
+            Tuple of (audit log dictionaries, cursor for the next page or None)
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        query, params = self._filtered_query(action, user_id, success)
+        async with self.db.get_connection() as conn:
+            rows, next_cursor = await fetch_keyset_page(conn, query, params, limit, cursor)
+            return [dict(row) for row in rows], next_cursor
+
+    async def stream(
+        self,
+        cursor: Optional[str] = None,
+        action: Optional[str] = None,
+        user_id: Optional[int] = None,
+        success: Optional[bool] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Iterate all matching audit log entries through a server-side cursor.
+
+        Args:
+            cursor: Optional cursor to resume after
+            action: Optional filter by action type
+            user_id: Optional filter by user ID
+            success: Optional filter by success status
+
+        Yields:
+            Audit log dictionaries, newest first
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        query, params = self._filtered_query(action, user_id, success)
+        async with self.db.get_connection() as conn:
+            async for rows in stream_keyset_rows(conn, query, params, cursor):
+                for row in rows:
+                    yield dict(row)
+
+    async def get_stats(self, since: Optional[datetime] = None) -> Dict[str, Any]:
+        """
+        Get aggregated audit statistics from the hourly rollup.
+
+        Counts come from audit_log_hourly (maintained by trigger), so the cost
+        grows with the number of hour buckets in range rather than with the
+        number of audit rows. ``since`` is applied at hour granularity.
+
+        Args:
+            since: Optional lower bound; None covers the whole log
+
+        Returns:
+            Dictionary with total, successes, by_action and recent_failures
+            (exact count of failures in the last 24 hours)
+        """
+        async with self.db.get_connection() as conn:
+            query = """
+                SELECT action, SUM(total)::BIGINT AS total, SUM(failures)::BIGINT AS failures
+                FROM audit_log_hourly
+            """
+            params: List[Any] = []
+            if since is not None:
+                query += " WHERE bucket >= date_trunc('hour', $1::timestamptz AT TIME ZONE 'UTC')"
+                query += " AT TIME ZONE 'UTC'"
+                params.append(since)
+            query += " GROUP BY action"
+
+            rows = await conn.fetch(query, *params)
+            recent_failures = await conn.fetchval("""
+                SELECT COUNT(*) FROM audit_log
+                WHERE success IS FALSE AND created_at >= NOW() - INTERVAL '24 hours'
+            """)
+
+        by_action = {row["action"]: int(row["total"]) for row in rows}
+        total = sum(by_action.values())
+        failures = sum(int(row["failures"]) for row in rows)
+        return {
+            "total": total,
+            "successes": total - failures,
+            "by_action": by_action,
+            "recent_failures": int(recent_failures or 0),
+        }
+
     async def create(self, data: Dict[str, Any]) -> int:
         """
         Create new audit log entry.
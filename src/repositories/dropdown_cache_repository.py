@@ -69,8 +69,13 @@ class DropdownCacheRepository(BaseRepository):
             if row is None:
                 return None
 
+            dropdown_data = row["dropdown_data"]
+            # asyncpg returns JSONB as text unless a codec is registered
+            if isinstance(dropdown_data, str):
+                dropdown_data = json.loads(dropdown_data)
+
             return {
-                "dropdown_data": row["dropdown_data"],
+                "dropdown_data": dropdown_data,
                 "last_synced_at": (
                     row["last_synced_at"].isoformat() if row["last_synced_at"] else None
                 ),
@@ -78,6 +83,29 @@ class DropdownCacheRepository(BaseRepository):
                 "error_message": row["error_message"],
             }
 
+    async def get_last_synced_at(self, country_code: str) -> Optional[str]:
+        """
+        Get when a country's dropdown data was last synced, without the data itself.
+
+        Used to check whether an in-process copy of the data is still current.
+
+        Args:
+            country_code: Country code (e.g., 'fra', 'nld')
+
+        Returns:
+            ISO timestamp, or None if the country is not cached or never synced
+        """
+        async with self.db.get_connection() as conn:
+            last_synced_at = await conn.fetchval(
+                """
+                SELECT last_synced_at
+                FROM vfs_dropdown_cache
+                WHERE country_code = $1
+                """,
+                country_code,
+            )
+            return last_synced_at.isoformat() if last_synced_at else None
+
     async def upsert_dropdown_data(
         self,
         country_code: str,
@@ -1,6 +1,6 @@
 """Log repository implementation."""
 
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, List, Optional, Tuple
 
 if TYPE_CHECKING:
     from src.models.database import Database
@@ -9,6 +9,7 @@ from loguru import logger
 
 from src.core.enums import LogLevel
 from src.repositories.base import BaseRepository
+from src.utils.db_helpers import fetch_keyset_page, stream_keyset_rows
 
 
 class LogEntry:
@@ -96,6 +97,46 @@ class LogRepository(BaseRepository[LogEntry]):
             rows = await conn.fetch("SELECT * FROM logs ORDER BY created_at DESC LIMIT $1", limit)
             return [self._row_to_log_entry(row) for row in rows]
 
+    async def get_page(
+        self, limit: int = 100, cursor: Optional[str] = None
+    ) -> Tuple[List[LogEntry], Optional[str]]:
+        """
+        Get one page of log entries, newest first.
+
+        Args:
+            limit: Page size
+            cursor: Cursor returned with the previous page, or None for the first page
+
+        Returns:
+            Tuple of (log entry entities, cursor for the next page or None)
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        async with self.db.get_connection() as conn:
+            rows, next_cursor = await fetch_keyset_page(
+                conn, "SELECT * FROM logs WHERE 1=1", [], limit, cursor
+            )
+            return [self._row_to_log_entry(row) for row in rows], next_cursor
+
+    async def stream(self, cursor: Optional[str] = None) -> AsyncIterator[LogEntry]:
+        """
+        Iterate all log entries through a server-side cursor.
+
+        Args:
+            cursor: Optional cursor to resume after
+
+        Yields:
+            Log entry entities, newest first
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        async with self.db.get_connection() as conn:
+            async for rows in stream_keyset_rows(conn, "SELECT * FROM logs WHERE 1=1", [], cursor):
+                for row in rows:
+                    yield self._row_to_log_entry(row)
+
     async def create(self, data: Dict[str, Any]) -> int:
         """
         Create new log entry.
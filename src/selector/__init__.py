@@ -8,13 +8,18 @@ This module consolidates all selector-related functionality including:
 
 from src.selector.ai_repair import AISelectorRepair
 from src.selector.learning import SelectorLearner
-from src.selector.manager import CountryAwareSelectorManager, get_selector_manager
+from src.selector.manager import (
+    CountryAwareSelectorManager,
+    close_selector_managers,
+    get_selector_manager,
+)
 from src.selector.self_healing import SelectorSelfHealing
 from src.selector.watcher import SelectorHealthCheck
 
 __all__ = [
     "CountryAwareSelectorManager",
     "get_selector_manager",
+    "close_selector_managers",
     "SelectorLearner",
     "SelectorHealthCheck",
     "AISelectorRepair",
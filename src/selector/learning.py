@@ -1,25 +1,54 @@
 """Adaptive selector learning system for auto-promotion and optimization."""
 
+import asyncio
 import json
+import os
+import tempfile
+import threading
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from loguru import logger
 
+# Write-behind defaults: flush at most every N seconds, or sooner after N changes
+DEFAULT_FLUSH_INTERVAL_SECONDS = 5.0
+DEFAULT_FLUSH_THRESHOLD = 100
+
 
 class SelectorLearner:
     """Track selector performance and auto-promote successful fallbacks."""
 
-    def __init__(self, metrics_file: str = "data/selector_metrics.json"):
+    def __init__(
+        self,
+        metrics_file: str = "data/selector_metrics.json",
+        write_behind: bool = False,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL_SECONDS,
+        flush_threshold: int = DEFAULT_FLUSH_THRESHOLD,
+    ):
         """
         Initialize selector learner.
 
         Args:
             metrics_file: Path to metrics JSON file
+            write_behind: If True, record_* only update memory and a background task
+                persists dirty metrics; if False, every record_* call saves synchronously
+            flush_interval: Seconds between background flushes (write-behind mode)
+            flush_threshold: Number of changes that triggers an early flush (write-behind mode)
         """
         self.metrics_file = Path(metrics_file)
         self.metrics: Dict[str, Any] = {}
+        self.write_behind = write_behind
+        self.flush_interval = flush_interval
+        self.flush_threshold = max(1, flush_threshold)
+
+        self._pending_changes = 0
+        self._flush_task: Optional[asyncio.Task] = None
+        self._flush_requested: Optional[asyncio.Event] = None
+        self._closing = False
+        # Serializes disk writes from the flusher thread and synchronous flush()
+        self._write_lock = threading.Lock()
+
         self._load_metrics()
         self._ensure_data_directory()
 
@@ -41,16 +70,121 @@ class SelectorLearner:
             logger.error(f"Failed to load metrics: {e}")
             self.metrics = {}
 
+    def _write_atomic(self, payload: str) -> None:
+        """
+        Write serialized metrics via temp file + rename.
+
+        Readers never observe a partially written file, and a crash mid-write
+        leaves the previous version intact.
+
+        Args:
+            payload: Serialized metrics JSON
+        """
+        with self._write_lock:
+            self._ensure_data_directory()
+            fd, tmp_path = tempfile.mkstemp(
+                dir=self.metrics_file.parent, prefix=f".{self.metrics_file.name}.", suffix=".tmp"
+            )
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    f.write(payload)
+                os.replace(tmp_path, self.metrics_file)
+            except BaseException:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+                raise
+
     def _save_metrics(self) -> None:
         """Save metrics to JSON file."""
         try:
-            self._ensure_data_directory()
-            with open(self.metrics_file, "w", encoding="utf-8") as f:
-                json.dump(self.metrics, f, indent=2)
+            self._write_atomic(json.dumps(self.metrics, indent=2))
+            self._pending_changes = 0
             logger.debug(f"Saved selector metrics to {self.metrics_file}")
         except Exception as e:
             logger.error(f"Failed to save metrics: {e}")
 
+    def _metrics_changed(self) -> None:
+        """Persist a change now, or mark it dirty for the background flusher."""
+        if not self.write_behind:
+            self._save_metrics()
+            return
+
+        self._pending_changes += 1
+        self._ensure_flusher()
+        if self._pending_changes >= self.flush_threshold and self._flush_requested:
+            self._flush_requested.set()
+
+    def _ensure_flusher(self) -> None:
+        """Start the background flush task on the running loop, if any."""
+        if self._closing:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop (sync caller): changes stay dirty until flush()
+            return
+        task = self._flush_task
+        if task is not None and not task.done() and task.get_loop() is loop:
+            return
+        # First use, or the previous flusher ended with (or belongs to) another loop
+        self._flush_requested = asyncio.Event()
+        self._flush_task = loop.create_task(
+            self._flush_loop(self._flush_requested),
+            name=f"selector_metrics_flush_{self.metrics_file.stem}",
+        )
+
+    async def _flush_loop(self, flush_requested: asyncio.Event) -> None:
+        """Coalesce dirty metrics and write them off the event loop thread."""
+        try:
+            while not self._closing:
+                try:
+                    await asyncio.wait_for(flush_requested.wait(), timeout=self.flush_interval)
+                except asyncio.TimeoutError:
+                    pass
+                flush_requested.clear()
+                await self.flush_async()
+        except asyncio.CancelledError:
+            # Task cancelled during shutdown: persist whatever is still dirty
+            self.flush()
+            raise
+
+    @property
+    def is_dirty(self) -> bool:
+        """Whether in-memory metrics have changes not yet written to disk."""
+        return self._pending_changes > 0
+
+    def flush(self) -> None:
+        """Synchronously write dirty metrics to disk (no-op when clean)."""
+        if self.is_dirty:
+            self._save_metrics()
+
+    async def flush_async(self) -> None:
+        """Write dirty metrics to disk in a worker thread (no-op when clean)."""
+        if not self.is_dirty:
+            return
+        # Serialize on the loop thread so the snapshot is consistent with memory
+        changes = self._pending_changes
+        payload = json.dumps(self.metrics, indent=2)
+        try:
+            await asyncio.to_thread(self._write_atomic, payload)
+            # Keep changes recorded while the write was in flight
+            self._pending_changes = max(0, self._pending_changes - changes)
+            logger.debug(f"Flushed {changes} selector metric change(s) to {self.metrics_file}")
+        except Exception as e:
+            logger.error(f"Failed to flush metrics: {e}")
+
+    async def close(self) -> None:
+        """Stop the background flusher and write any remaining changes once."""
+        self._closing = True
+        task, self._flush_task = self._flush_task, None
+        if task is not None and not task.done() and task.get_loop() is asyncio.get_running_loop():
+            if self._flush_requested is not None:
+                self._flush_requested.set()
+            await task
+        await self.flush_async()
+
     def _get_selector_metrics(self, selector_path: str) -> Dict[str, Any]:
         """
         Get or create metrics for a selector path.
@@ -113,7 +247,7 @@ class SelectorLearner:
                     fallback_stats["consecutive_success"] = 0  # Reset after promotion
 
         metrics["last_updated"] = datetime.now(timezone.utc).isoformat()
-        self._save_metrics()
+        self._metrics_changed()
 
     def record_failure(self, selector_path: str, selector_index: int) -> None:
         """
@@ -155,7 +289,7 @@ class SelectorLearner:
             fallback_stats["consecutive_success"] = 0  # Reset consecutive success
 
         metrics["last_updated"] = datetime.now(timezone.utc).isoformat()
-        self._save_metrics()
+        self._metrics_changed()
 
     def _find_best_fallback(self, metrics: Dict[str, Any]) -> Optional[int]:
         """
@@ -48,7 +48,8 @@ class CountryAwareSelectorManager:
             from src.selector.learning import SelectorLearner
 
             metrics_file = f"data/selector_metrics_{self.country_code}.json"
-            self.learner = SelectorLearner(metrics_file=metrics_file)
+            # Write-behind: selector lookups must not block the event loop on file I/O
+            self.learner = SelectorLearner(metrics_file=metrics_file, write_behind=True)
             logger.info(f"♻️ Adaptive selector learning enabled for country: {self.country_code}")
         except Exception as e:
             logger.warning(f"Failed to initialize selector learning: {e}")
@@ -568,6 +569,11 @@ class CountryAwareSelectorManager:
         logger.info("Reloading selectors...")
         self._load_selectors()
 
+    async def close(self) -> None:
+        """Flush pending learning metrics and stop the background flusher."""
+        if self.learner:
+            await self.learner.close()
+
     def _get_default_selectors(self) -> Dict[str, Any]:
         """Get default selectors as fallback."""
         return {
@@ -618,3 +624,12 @@ def get_selector_manager(country_code: str = "default") -> CountryAwareSelectorM
         logger.info(f"Created selector manager for country: {country_code}")
 
     return _selector_managers[country_code]
+
+
+async def close_selector_managers() -> None:
+    """Flush learning metrics for all selector managers (called on shutdown)."""
+    for country_code, manager in list(_selector_managers.items()):
+        try:
+            await manager.close()
+        except Exception as e:
+            logger.error(f"Failed to flush selector metrics for {country_code}: {e}")
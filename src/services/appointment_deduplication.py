@@ -177,22 +177,22 @@ class RedisDeduplicationBackend(DeduplicationBackend):
         Initialize Redis backend.
 
         Args:
-            redis_client: Redis client instance
+            redis_client: redis.asyncio client instance (see AsyncRedisManager)
         """
         self._redis = redis_client
 
     async def is_duplicate(self, key: str, ttl_seconds: int) -> bool:
         """Check if a key exists and is still valid."""
         redis_key = f"dedup:{key}"
-        # Redis GET returns None if key doesn't exist or is expired
-        exists = await asyncio.to_thread(self._redis.exists, redis_key)
+        # EXISTS returns 0 if key doesn't exist or is expired
+        exists = await self._redis.exists(redis_key)
         return bool(exists)
 
     async def mark_booked(self, key: str, ttl_seconds: int) -> None:
         """Mark a booking as completed."""
         redis_key = f"dedup:{key}"
         # Use SETEX for atomic set with expiration
-        await asyncio.to_thread(self._redis.setex, redis_key, ttl_seconds, "1")
+        await self._redis.setex(redis_key, ttl_seconds, "1")
 
     async def cleanup_expired(self, ttl_seconds: int) -> int:
         """
@@ -208,9 +208,7 @@ class RedisDeduplicationBackend(DeduplicationBackend):
         keys = []
         cursor = 0
         while True:
-            cursor, batch = await asyncio.to_thread(
-                self._redis.scan, cursor, match=pattern, count=100
-            )
+            cursor, batch = await self._redis.scan(cursor, match=pattern, count=100)
             keys.extend(batch)
             if cursor == 0:
                 break
@@ -228,9 +226,14 @@ class RedisDeduplicationBackend(DeduplicationBackend):
     async def clear(self) -> None:
         """Clear all cache entries."""
         keys = await self._scan_keys("dedup:*")
-        if keys:
-            await asyncio.to_thread(self._redis.delete, *keys)
-            logger.info(f"Cleared {len(keys)} deduplication cache entries")
+        if not keys:
+            return
+        # One DELETE per SCAN-sized chunk, sent in a single round trip
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for start in range(0, len(keys), 100):
+                pipe.delete(*keys[start : start + 100])
+            await pipe.execute()
+        logger.info(f"Cleared {len(keys)} deduplication cache entries")
 
     @property
     def is_distributed(self) -> bool:
@@ -274,14 +277,14 @@ class AppointmentDeduplication:
         """
         Auto-detect and initialize appropriate backend.
 
-        Uses RedisManager for a shared connection if available, falls back to in-memory.
+        Uses AsyncRedisManager for a shared connection if available, falls back to in-memory.
 
         Returns:
             DeduplicationBackend instance
         """
-        from src.core.infra.redis_manager import RedisManager
+        from src.core.infra.redis_manager import AsyncRedisManager
 
-        client = RedisManager.get_client()
+        client = AsyncRedisManager.get_client()
 
         if client is not None:
             logger.info("AppointmentDeduplication using Redis backend")
@@ -16,47 +16,71 @@ Public API:
 - ReservationBuilder: Reservation data structure builder
 - BookingExecutor: Booking execution and confirmation
 - MissionProcessor: Multi-mission appointment processing
+
+Components are imported on first access, so importing one submodule (or the
+package for a type) does not load Playwright and the whole booking stack.
 """
 
-from .auth_service import AuthService
-from .booking_executor import BookingExecutor
-from .booking_workflow import BookingWorkflow
-from .bot_loop_manager import BotLoopManager
-from .browser_manager import BrowserManager
-from .error_handler import ErrorHandler
-from .mission_processor import MissionProcessor
-from .reservation_builder import ReservationBuilder
-from .service_context import (
-    AntiDetectionContext,
-    AutomationServicesContext,
-    BotServiceContext,
-    BotServiceFactory,
-    CoreServicesContext,
-    WorkflowServicesContext,
-)
-from .slot_checker import SlotChecker, SlotCheckerDeps, SlotInfo
-from .types import PersonDict, ReservationDict
-from .vfs_bot import VFSBot
-
-__all__ = [
-    "VFSBot",
-    "BotLoopManager",
-    "BrowserManager",
-    "AuthService",
-    "BookingWorkflow",
-    "ReservationBuilder",
-    "BookingExecutor",
-    "MissionProcessor",
-    "SlotChecker",
-    "SlotCheckerDeps",
-    "SlotInfo",
-    "ErrorHandler",
-    "PersonDict",
-    "ReservationDict",
-    "AntiDetectionContext",
-    "CoreServicesContext",
-    "WorkflowServicesContext",
-    "AutomationServicesContext",
-    "BotServiceContext",
-    "BotServiceFactory",
-]
+import importlib as _importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .auth_service import AuthService as AuthService
+    from .booking_executor import BookingExecutor as BookingExecutor
+    from .booking_workflow import BookingWorkflow as BookingWorkflow
+    from .bot_loop_manager import BotLoopManager as BotLoopManager
+    from .browser_manager import BrowserManager as BrowserManager
+    from .error_handler import ErrorHandler as ErrorHandler
+    from .mission_processor import MissionProcessor as MissionProcessor
+    from .reservation_builder import ReservationBuilder as ReservationBuilder
+    from .service_context import AntiDetectionContext as AntiDetectionContext
+    from .service_context import AutomationServicesContext as AutomationServicesContext
+    from .service_context import BotServiceContext as BotServiceContext
+    from .service_context import BotServiceFactory as BotServiceFactory
+    from .service_context import CoreServicesContext as CoreServicesContext
+    from .service_context import WorkflowServicesContext as WorkflowServicesContext
+    from .slot_checker import SlotChecker as SlotChecker
+    from .slot_checker import SlotCheckerDeps as SlotCheckerDeps
+    from .slot_checker import SlotInfo as SlotInfo
+    from .types import PersonDict as PersonDict
+    from .types import ReservationDict as ReservationDict
+    from .vfs_bot import VFSBot as VFSBot
+
+# Explicit lazy-loading map: name -> (module_path, attribute_name)
+_LAZY_MODULE_MAP = {
+    "VFSBot": ("src.services.bot.vfs_bot", "VFSBot"),
+    "BotLoopManager": ("src.services.bot.bot_loop_manager", "BotLoopManager"),
+    "BrowserManager": ("src.services.bot.browser_manager", "BrowserManager"),
+    "AuthService": ("src.services.bot.auth_service", "AuthService"),
+    "BookingWorkflow": ("src.services.bot.booking_workflow", "BookingWorkflow"),
+    "ReservationBuilder": ("src.services.bot.reservation_builder", "ReservationBuilder"),
+    "BookingExecutor": ("src.services.bot.booking_executor", "BookingExecutor"),
+    "MissionProcessor": ("src.services.bot.mission_processor", "MissionProcessor"),
+    "SlotChecker": ("src.services.bot.slot_checker", "SlotChecker"),
+    "SlotCheckerDeps": ("src.services.bot.slot_checker", "SlotCheckerDeps"),
+    "SlotInfo": ("src.services.bot.slot_checker", "SlotInfo"),
+    "ErrorHandler": ("src.services.bot.error_handler", "ErrorHandler"),
+    "PersonDict": ("src.services.bot.types", "PersonDict"),
+    "ReservationDict": ("src.services.bot.types", "ReservationDict"),
+    "AntiDetectionContext": ("src.services.bot.service_context", "AntiDetectionContext"),
+    "CoreServicesContext": ("src.services.bot.service_context", "CoreServicesContext"),
+    "WorkflowServicesContext": ("src.services.bot.service_context", "WorkflowServicesContext"),
+    "AutomationServicesContext": ("src.services.bot.service_context", "AutomationServicesContext"),
+    "BotServiceContext": ("src.services.bot.service_context", "BotServiceContext"),
+    "BotServiceFactory": ("src.services.bot.service_context", "BotServiceFactory"),
+}
+
+# Auto-derive __all__ from _LAZY_MODULE_MAP to prevent manual sync issues
+__all__ = list(_LAZY_MODULE_MAP.keys())
+
+
+def __getattr__(name: str) -> Any:
+    """Lazy import with explicit mapping - importlib based."""
+    if name in _LAZY_MODULE_MAP:
+        module_path, attr_name = _LAZY_MODULE_MAP[name]
+        module = _importlib.import_module(module_path)
+        attr = getattr(module, attr_name)
+        # Cache in module globals to avoid repeated imports
+        globals()[name] = attr
+        return attr
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
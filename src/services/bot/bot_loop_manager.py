@@ -2,7 +2,7 @@
 
 import asyncio
 import random
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Coroutine, Optional
 
 from loguru import logger
 
@@ -58,7 +58,9 @@ class BotLoopManager:
         self._trigger_event = trigger_event
         self.running = True
 
-    async def _wait_or_shutdown(self, seconds: float) -> bool:
+    async def _wait_or_shutdown(
+        self, seconds: float, wake: Optional[Coroutine[Any, Any, Any]] = None
+    ) -> bool:
         """
         Wait for the specified duration or until shutdown/trigger is requested.
 
@@ -67,18 +69,24 @@ class BotLoopManager:
 
         Args:
             seconds: Number of seconds to wait
+            wake: Optional coroutine that also ends the wait when it completes
 
         Returns:
             True if shutdown was requested during wait, False on normal timeout or trigger
         """
         if self.shutdown_event.is_set():
+            if wake is not None:
+                asyncio.ensure_future(wake).cancel()
             return True
         shutdown_task = asyncio.create_task(self.shutdown_event.wait())
         trigger_task = asyncio.create_task(self._trigger_event.wait())
+        tasks = {shutdown_task, trigger_task}
+        if wake is not None:
+            tasks.add(asyncio.ensure_future(wake))
 
         try:
             done, pending = await asyncio.wait(
-                {shutdown_task, trigger_task},
+                tasks,
                 timeout=seconds,
                 return_when=asyncio.FIRST_COMPLETED,
             )
@@ -113,8 +121,8 @@ class BotLoopManager:
             # Timeout - normal completion
             return False
         except asyncio.CancelledError:
-            shutdown_task.cancel()
-            trigger_task.cancel()
+            for task in tasks:
+                task.cancel()
             raise
 
     async def _ensure_db_connection(self) -> bool:
@@ -207,13 +215,18 @@ class BotLoopManager:
         )
         return False
 
-    async def _wait_adaptive_interval(self) -> bool:
+    async def _wait_adaptive_interval(self, until_account_available: bool = False) -> bool:
         """
         Wait for adaptive interval before next check.
 
         Uses the adaptive scheduler to determine optimal wait time based on
         current system state and activity patterns.
 
+        Args:
+            until_account_available: End the wait early when the account pool
+                signals that an account became usable (only while the pool
+                receives change notifications, so the idle wait never polls)
+
         Returns:
             True if shutdown was requested during wait, False otherwise
         """
@@ -224,7 +237,10 @@ class BotLoopManager:
             f"({mode_info['description']}), "
             f"Waiting {check_interval}s before next check..."
         )
-        if await self._wait_or_shutdown(check_interval):
+        wake: Optional[Coroutine[Any, Any, bool]] = None
+        if until_account_available and self.account_pool.availability.is_listening:
+            wake = self.account_pool.wait_for_available_account(timeout=check_interval)
+        if await self._wait_or_shutdown(check_interval, wake=wake):
             logger.info("Shutdown requested during interval wait")
             return True
         return False
@@ -267,8 +283,9 @@ class BotLoopManager:
                         timeout=AccountPoolConfig.WAIT_FOR_ACCOUNT_TIMEOUT
                     )
                     if not wait_success:
-                        # Still no accounts - wait adaptive interval
-                        if await self._wait_adaptive_interval():
+                        # Still no accounts - wait adaptive interval, ending early
+                        # if a release or cooldown expiry frees one up
+                        if await self._wait_adaptive_interval(until_account_available=True):
                             break
                         continue
 
@@ -1,7 +1,7 @@
 """Browser lifecycle and context management for VFS automation."""
 
-from datetime import datetime
-from typing import TYPE_CHECKING, Any, Dict, Optional, Union, cast
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple, Union, cast
 
 from loguru import logger
 from playwright.async_api import Browser, BrowserContext, Page, Playwright, async_playwright
@@ -10,7 +10,7 @@ if TYPE_CHECKING:
     from ...core.infra.runners import BotConfigDict
 
 from ...utils.anti_detection.fingerprint_bypass import FingerprintBypass
-from ...utils.anti_detection.fingerprint_rotator import FingerprintRotator
+from ...utils.anti_detection.fingerprint_rotator import FingerprintProfile, FingerprintRotator
 from ...utils.anti_detection.stealth_config import StealthConfig
 from ...utils.security.header_manager import HeaderManager
 from ...utils.security.proxy_manager import ProxyManager
@@ -71,8 +71,15 @@ class BrowserManager:
         # Deferred rotation flag to prevent state loss during new_page()
         self._needs_rotation: bool = False
 
-    async def start(self) -> None:
-        """Launch browser and create context with anti-detection features."""
+    async def start(self, create_context: bool = True) -> None:
+        """
+        Launch browser and create context with anti-detection features.
+
+        Args:
+            create_context: Whether to create the default context. BrowserPool
+                skips it for shared browsers, which only serve per-mission
+                contexts from new_isolated_context().
+        """
         if self.browser is not None:
             logger.warning("Browser already started")
             return
@@ -81,32 +88,6 @@ class BrowserManager:
             # Start Playwright
             self.playwright = await async_playwright().start()
 
-            # Get proxy configuration if enabled
-            proxy_config = None
-            if self._anti_detection_enabled and self.proxy_manager and self.proxy_manager.enabled:
-                # Use sequential allocation for deterministic proxy assignment
-                allocated_proxy = self.proxy_manager.allocate_next()
-                if allocated_proxy:
-                    proxy_config = self.proxy_manager.get_playwright_proxy(proxy=allocated_proxy)
-                    if proxy_config:
-                        logger.info(f"Using proxy: {proxy_config['server']}")
-                else:
-                    logger.warning("No proxy allocated, continuing without proxy")
-
-            # Get User-Agent from fingerprint rotator or header manager or use default
-            user_agent = (
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                "Chrome/135.0.0.0 Safari/537.36"
-            )
-
-            if self._anti_detection_enabled and self._fingerprint_rotator:
-                # Use user agent from current fingerprint profile
-                profile = self._fingerprint_rotator.get_current_profile()
-                user_agent = profile.user_agent
-            elif self._anti_detection_enabled and self.header_manager:
-                user_agent = self.header_manager.get_user_agent()
-
             # Launch browser with anti-automation flags
             launch_options = {
                 "headless": self.config["bot"].get("headless", False),
@@ -115,38 +96,13 @@ class BrowserManager:
 
             self.browser = await self.playwright.chromium.launch(**launch_options)
 
-            # Create context with stealth settings
-            context_options: Dict[str, Any] = {
-                "viewport": {"width": 1920, "height": 1080},
-                "user_agent": user_agent,
-            }
-
-            # Use viewport from fingerprint profile if available
-            if self._anti_detection_enabled and self._fingerprint_rotator:
-                profile = self._fingerprint_rotator.get_current_profile()
-                context_options["viewport"] = {
-                    "width": profile.viewport_width,
-                    "height": profile.viewport_height,
-                }
-
-            if proxy_config:
-                context_options["proxy"] = proxy_config
-
-            self.context = await self.browser.new_context(**context_options)
-
-            # Apply stealth configuration if enabled
-            if self._anti_detection_enabled and self.config.get("anti_detection", {}).get(
-                "stealth_mode", True
-            ):
-                # Stealth will be applied per-page via StealthConfig
-                pass
-            else:
-                # Add basic stealth script for backwards compatibility
-                await self.context.add_init_script("""
-                    Object.defineProperty(navigator, 'webdriver', {
-                        get: () => undefined
-                    });
-                """)
+            if create_context:
+                profile = (
+                    self._fingerprint_rotator.get_current_profile()
+                    if self._anti_detection_enabled and self._fingerprint_rotator
+                    else None
+                )
+                self.context = await self._create_context(profile)
 
             logger.info("Browser started successfully")
         except Exception:
@@ -154,6 +110,110 @@ class BrowserManager:
             await self.close()
             raise
 
+    def _get_proxy_config(self) -> Optional[Dict[str, Any]]:
+        """
+        Allocate the next proxy from the proxy manager, if enabled.
+
+        Returns:
+            Playwright proxy settings, or None to connect directly
+        """
+        if not (self._anti_detection_enabled and self.proxy_manager and self.proxy_manager.enabled):
+            return None
+
+        # Use sequential allocation for deterministic proxy assignment
+        allocated_proxy = self.proxy_manager.allocate_next()
+        if not allocated_proxy:
+            logger.warning("No proxy allocated, continuing without proxy")
+            return None
+
+        proxy_config = self.proxy_manager.get_playwright_proxy(proxy=allocated_proxy)
+        if proxy_config:
+            logger.info(f"Using proxy: {proxy_config['server']}")
+        return proxy_config
+
+    async def _create_context(self, profile: Optional[FingerprintProfile]) -> BrowserContext:
+        """
+        Create a browser context with proxy, User-Agent and viewport applied.
+
+        Args:
+            profile: Fingerprint profile supplying User-Agent and viewport, if any
+
+        Returns:
+            New BrowserContext
+        """
+        if self.browser is None:
+            raise RuntimeError("Browser is not started. Call start() first.")
+
+        # Get User-Agent from fingerprint profile or header manager or use default
+        user_agent = (
+            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+            "AppleWebKit/537.36 (KHTML, like Gecko) "
+            "Chrome/135.0.0.0 Safari/537.36"
+        )
+        viewport = {"width": 1920, "height": 1080}
+
+        if profile:
+            user_agent = profile.user_agent
+            viewport = {"width": profile.viewport_width, "height": profile.viewport_height}
+        elif self._anti_detection_enabled and self.header_manager:
+            user_agent = self.header_manager.get_user_agent()
+
+        # Create context with stealth settings
+        context_options: Dict[str, Any] = {
+            "viewport": viewport,
+            "user_agent": user_agent,
+        }
+
+        proxy_config = self._get_proxy_config()
+        if proxy_config:
+            context_options["proxy"] = proxy_config
+
+        context = await self.browser.new_context(**context_options)
+
+        # Apply stealth configuration if enabled
+        if self._anti_detection_enabled and self.config.get("anti_detection", {}).get(
+            "stealth_mode", True
+        ):
+            # Stealth will be applied per-page via StealthConfig
+            pass
+        else:
+            # Add basic stealth script for backwards compatibility
+            await context.add_init_script("""
+                Object.defineProperty(navigator, 'webdriver', {
+                    get: () => undefined
+                });
+            """)
+
+        return context
+
+    async def new_isolated_context(self) -> Tuple[BrowserContext, Optional[FingerprintProfile]]:
+        """
+        Create a fresh context on the running browser for a single mission.
+
+        The context gets its own cookie jar, the next proxy from the pool and a
+        newly generated fingerprint profile, matching what a dedicated browser
+        per mission used to provide.
+
+        Returns:
+            Tuple of (context, fingerprint profile or None if rotation is disabled)
+        """
+        profile = None
+        if self._anti_detection_enabled and self._fingerprint_rotator:
+            profile = self._fingerprint_rotator.rotate()
+
+        context = await self._create_context(profile)
+        self._last_activity = datetime.now(timezone.utc)
+        return context, profile
+
+    def is_healthy(self) -> bool:
+        """
+        Check that the browser process is still connected.
+
+        Returns:
+            True if the browser is running and connected, False otherwise
+        """
+        return self.browser is not None and self.browser.is_connected()
+
     async def close(self) -> None:
         """Clean up browser resources."""
         errors = []
@@ -220,29 +280,48 @@ class BrowserManager:
 
         page = await self.context.new_page()
 
-        # Track activity
-        from datetime import timezone
+        # Pass current profile to fingerprint bypass if rotator is enabled
+        profile = (
+            self._fingerprint_rotator.get_current_profile() if self._fingerprint_rotator else None
+        )
+        await self.apply_anti_detection(
+            page,
+            profile,
+            apply_stealth=apply_stealth,
+            apply_fingerprint_bypass=apply_fingerprint_bypass,
+        )
+
+        return page
 
+    async def apply_anti_detection(
+        self,
+        page: Page,
+        profile: Optional[FingerprintProfile],
+        apply_stealth: bool = True,
+        apply_fingerprint_bypass: bool = True,
+    ) -> None:
+        """
+        Apply stealth and fingerprint bypass scripts to a page, if enabled.
+
+        Args:
+            page: Page to prepare
+            profile: Fingerprint profile the page's context was created with
+            apply_stealth: Whether to apply stealth configuration
+            apply_fingerprint_bypass: Whether to apply fingerprint bypass
+        """
         self._last_activity = datetime.now(timezone.utc)
 
-        # Apply anti-detection features if enabled
-        if self._anti_detection_enabled:
-            anti_config = self.config.get("anti_detection", {})
+        if not self._anti_detection_enabled:
+            return
 
-            if apply_stealth and anti_config.get("stealth_mode", True):
-                stealth_languages = anti_config.get("stealth_languages", None)
-                await StealthConfig.apply_stealth(page, languages=stealth_languages)
+        anti_config = self.config.get("anti_detection", {})
 
-            if apply_fingerprint_bypass and anti_config.get("fingerprint_bypass", True):
-                # Pass current profile to fingerprint bypass if rotator is enabled
-                profile = (
-                    self._fingerprint_rotator.get_current_profile()
-                    if self._fingerprint_rotator
-                    else None
-                )
-                await FingerprintBypass.apply_all(page, profile=profile)
+        if apply_stealth and anti_config.get("stealth_mode", True):
+            stealth_languages = anti_config.get("stealth_languages", None)
+            await StealthConfig.apply_stealth(page, languages=stealth_languages)
 
-        return page
+        if apply_fingerprint_bypass and anti_config.get("fingerprint_bypass", True):
+            await FingerprintBypass.apply_all(page, profile=profile)
 
     async def clear_session_data(self) -> None:
         """Clear all cookies, local storage, and session storage."""
@@ -1,13 +1,99 @@
 """Browser pool for managing multiple concurrent browser sessions."""
 
 import asyncio
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
 from loguru import logger
+from playwright.async_api import BrowserContext, Page
+
+from src.constants import BrowserPoolConfig
+from src.utils.anti_detection.fingerprint_rotator import FingerprintProfile
 
 from .browser_manager import BrowserManager
 
+if TYPE_CHECKING:
+    from ...core.infra.runners import BotConfigDict
+
+
+@dataclass
+class _SharedBrowser:
+    """Bookkeeping for a long-lived browser serving mission contexts."""
+
+    manager: BrowserManager
+    active_leases: int = 0
+    total_leases: int = 0
+    retiring: bool = False
+
+
+class BrowserLease:
+    """
+    An isolated browser context leased from a shared pooled browser.
+
+    Each lease has its own cookie jar, proxy and fingerprint profile. Closing
+    the lease closes its context and returns the browser to the pool.
+    """
+
+    def __init__(
+        self,
+        pool: "BrowserPool",
+        shared: _SharedBrowser,
+        context: BrowserContext,
+        profile: Optional[FingerprintProfile],
+    ):
+        """
+        Initialize browser lease.
+
+        Args:
+            pool: Pool the lease is returned to
+            shared: Pooled browser hosting the context
+            context: Isolated context for this lease
+            profile: Fingerprint profile the context was created with
+        """
+        self._pool = pool
+        self._shared = shared
+        self.context = context
+        self.profile = profile
+        self._closed = False
+
+    async def new_page(
+        self, apply_stealth: bool = True, apply_fingerprint_bypass: bool = True
+    ) -> Page:
+        """
+        Open a page in the leased context with anti-detection features applied.
+
+        Args:
+            apply_stealth: Whether to apply stealth configuration
+            apply_fingerprint_bypass: Whether to apply fingerprint bypass
+
+        Returns:
+            New Page instance
+        """
+        page = await self.context.new_page()
+        await self._shared.manager.apply_anti_detection(
+            page,
+            self.profile,
+            apply_stealth=apply_stealth,
+            apply_fingerprint_bypass=apply_fingerprint_bypass,
+        )
+        return page
+
+    async def close(self) -> None:
+        """Close the context and return the browser to the pool (idempotent)."""
+        if self._closed:
+            return
+        self._closed = True
+        await self._pool._return_lease(self._shared, self.context)
+
+    async def __aenter__(self) -> "BrowserLease":
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Async context manager exit."""
+        await self.close()
+
 
 class BrowserPool:
     """
@@ -19,15 +105,19 @@ class BrowserPool:
     - Max browser limit with waiting
     - Idle browser cleanup
     - Thread-safe pool operations
+    - Isolated per-mission contexts leased from warm, shared browsers, with
+      health checks and recycling after a maximum number of leases
     """
 
     def __init__(
         self,
-        config: Dict[str, Any],
+        config: Union["BotConfigDict", Dict[str, Any]],
         max_browsers: int = 5,
         idle_timeout_minutes: int = 10,
         header_manager: Any = None,
         proxy_manager: Any = None,
+        contexts_per_browser: int = BrowserPoolConfig.CONTEXTS_PER_BROWSER,
+        max_uses_per_browser: int = BrowserPoolConfig.MAX_USES_PER_BROWSER,
     ):
         """
         Initialize browser pool.
@@ -38,19 +128,29 @@ class BrowserPool:
             idle_timeout_minutes: Minutes before idle browser is closed (default: 10)
             header_manager: Optional HeaderManager for custom headers
             proxy_manager: Optional ProxyManager for proxy configuration
+            contexts_per_browser: Maximum concurrent leased contexts per shared browser
+            max_uses_per_browser: Leases served before a shared browser is recycled
         """
         self.config = config
         self.max_browsers = max_browsers
         self.idle_timeout_minutes = idle_timeout_minutes
         self.header_manager = header_manager
         self.proxy_manager = proxy_manager
+        self.contexts_per_browser = contexts_per_browser
+        self.max_uses_per_browser = max_uses_per_browser
 
         # Browser pool storage: session_id -> BrowserManager
         self._browsers: Dict[str, BrowserManager] = {}
 
-        # Semaphore to limit concurrent browsers
+        # Shared browsers serving leased contexts (see lease())
+        self._shared: List[_SharedBrowser] = []
+
+        # Semaphore to limit concurrent browsers (session and shared alike)
         self._semaphore = asyncio.Semaphore(max_browsers)
 
+        # Semaphore to limit concurrent leases across all shared browsers
+        self._lease_semaphore = asyncio.Semaphore(max_browsers * contexts_per_browser)
+
         # Lock for thread-safe operations
         self._lock = asyncio.Lock()
 
@@ -145,6 +245,147 @@ class BrowserPool:
                 # Just mark as idle (will be cleaned up later if timeout reached)
                 logger.debug(f"Browser marked as idle for session {session_id}")
 
+    async def lease(self) -> BrowserLease:
+        """
+        Lease an isolated browser context from a warm, shared browser.
+
+        Reuses a healthy shared browser with spare capacity and only launches a
+        new one (within max_browsers) when none is available. Waits when every
+        lease slot is taken.
+
+        Returns:
+            BrowserLease; close it (or use ``async with``) to return it to the pool
+        """
+        await self._lease_semaphore.acquire()
+        try:
+            shared = await self._checkout_shared_browser()
+            try:
+                context, profile = await shared.manager.new_isolated_context()
+            except Exception:
+                await self._checkin_shared_browser(shared)
+                raise
+        except Exception as e:
+            self._lease_semaphore.release()
+            logger.error(f"Failed to lease browser context: {e}")
+            raise
+
+        return BrowserLease(self, shared, context, profile)
+
+    async def _checkout_shared_browser(self) -> _SharedBrowser:
+        """
+        Pick a healthy shared browser with spare capacity, launching one if needed.
+
+        Returns:
+            Shared browser with the new lease already counted
+        """
+        dead: List[_SharedBrowser] = []
+        shared: Optional[_SharedBrowser] = None
+
+        async with self._lock:
+            for entry in self._shared:
+                if not entry.retiring and not entry.manager.is_healthy():
+                    logger.warning("Shared browser failed health check - recycling")
+                    entry.retiring = True
+                if entry.retiring and entry.active_leases == 0:
+                    dead.append(entry)
+            for entry in dead:
+                self._shared.remove(entry)
+
+            candidates = [
+                entry
+                for entry in self._shared
+                if not entry.retiring and entry.active_leases < self.contexts_per_browser
+            ]
+            if candidates:
+                shared = min(candidates, key=lambda entry: entry.active_leases)
+                self._count_lease(shared)
+
+        await self._close_shared_browsers(dead)
+        if shared:
+            return shared
+
+        # Launch a new shared browser in a free browser slot
+        await self._semaphore.acquire()
+        try:
+            manager = await self._create_shared_browser()
+        except Exception:
+            self._semaphore.release()
+            raise
+
+        shared = _SharedBrowser(manager=manager)
+        async with self._lock:
+            self._count_lease(shared)
+            self._shared.append(shared)
+            logger.info(
+                f"Shared browser launched "
+                f"(browsers: {len(self._browsers) + len(self._shared)}/{self.max_browsers})"
+            )
+
+            # Start cleanup task if not running
+            if self._cleanup_task is None or self._cleanup_task.done():
+                self._cleanup_task = asyncio.create_task(self._periodic_cleanup())
+
+        return shared
+
+    def _count_lease(self, shared: _SharedBrowser) -> None:
+        """Record a new lease, marking the browser for recycling once it hits max uses."""
+        shared.active_leases += 1
+        shared.total_leases += 1
+        if shared.total_leases >= self.max_uses_per_browser:
+            shared.retiring = True
+
+    async def _checkin_shared_browser(self, shared: _SharedBrowser) -> None:
+        """
+        Drop a lease from a shared browser, recycling it if retired and unused.
+
+        Args:
+            shared: Shared browser the lease was served from
+        """
+        async with self._lock:
+            shared.active_leases -= 1
+            if not shared.manager.is_healthy():
+                shared.retiring = True
+            recycle = shared.retiring and shared.active_leases == 0 and shared in self._shared
+            if recycle:
+                self._shared.remove(shared)
+
+        if recycle:
+            logger.info(f"Recycling shared browser after {shared.total_leases} lease(s)")
+            await self._close_shared_browsers([shared])
+
+    async def _return_lease(self, shared: _SharedBrowser, context: BrowserContext) -> None:
+        """
+        Close a leased context and return its browser to the pool.
+
+        Args:
+            shared: Shared browser the lease was served from
+            context: Leased context to close
+        """
+        try:
+            await context.close()
+        except Exception as e:
+            logger.warning(f"Error closing leased browser context: {e}")
+
+        try:
+            await self._checkin_shared_browser(shared)
+        finally:
+            self._lease_semaphore.release()
+
+    async def _close_shared_browsers(self, entries: List[_SharedBrowser]) -> None:
+        """
+        Close shared browsers already removed from the pool and free their slots.
+
+        Args:
+            entries: Shared browsers to close
+        """
+        for entry in entries:
+            try:
+                await entry.manager.close()
+            except Exception as e:
+                logger.error(f"Error closing shared browser: {e}")
+            finally:
+                self._semaphore.release()
+
     async def close_all(self) -> None:
         """Close all browsers in the pool."""
         async with self._lock:
@@ -168,6 +409,9 @@ class BrowserPool:
                     self._semaphore.release()
 
             self._browsers.clear()
+
+            shared, self._shared = self._shared, []
+            await self._close_shared_browsers(shared)
             logger.info("All browsers closed")
 
     def get_stats(self) -> Dict[str, Any]:
@@ -185,8 +429,10 @@ class BrowserPool:
             "active_browsers": active_count,
             "idle_browsers": idle_count,
             "max_browsers": self.max_browsers,
-            "available_slots": self.max_browsers - len(self._browsers),
+            "available_slots": self.max_browsers - len(self._browsers) - len(self._shared),
             "sessions": list(self._browsers.keys()),
+            "shared_browsers": len(self._shared),
+            "active_leases": sum(entry.active_leases for entry in self._shared),
         }
 
     async def _create_browser(self, session_id: str) -> BrowserManager:
@@ -214,6 +460,21 @@ class BrowserPool:
         logger.debug(f"New browser created for session {session_id}")
         return browser
 
+    async def _create_shared_browser(self) -> BrowserManager:
+        """
+        Create and start a BrowserManager that only hosts leased contexts.
+
+        Returns:
+            Started BrowserManager instance without a default context
+        """
+        browser = BrowserManager(
+            config=self.config,
+            header_manager=self.header_manager,
+            proxy_manager=self.proxy_manager,
+        )
+        await browser.start(create_context=False)
+        return browser
+
     async def _periodic_cleanup(self) -> None:
         """Periodic cleanup of idle browsers."""
         try:
@@ -234,6 +495,24 @@ class BrowserPool:
                                 if idle_duration > idle_threshold:
                                     sessions_to_close.append(session_id)
 
+                    idle_shared = [
+                        entry
+                        for entry in self._shared
+                        if entry.active_leases == 0
+                        and entry.manager.last_activity
+                        and datetime.now(timezone.utc) - entry.manager.last_activity
+                        > idle_threshold
+                    ]
+                    for entry in idle_shared:
+                        self._shared.remove(entry)
+
+                if idle_shared:
+                    logger.info(
+                        f"Closing {len(idle_shared)} idle shared browser(s) "
+                        f"(idle > {self.idle_timeout_minutes}m)"
+                    )
+                    await self._close_shared_browsers(idle_shared)
+
                 # Close idle browsers outside the lock to avoid deadlock with release()
                 for session_id in sessions_to_close:
                     logger.info(
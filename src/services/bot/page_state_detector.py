@@ -243,6 +243,85 @@ _DETECTION_RULES: List[Tuple[str, PageState, float, bool]] = [
 ]
 
 
+# ──────────────────────────────────────────────────────────────────────
+# Batched DOM probe
+#
+# Rules whose selector is plain CSS are evaluated together in ONE
+# page.evaluate() call instead of one locator round-trip per rule.
+# Rules that need Playwright-only selector engines (text=, :has-text, xpath)
+# keep using the per-rule locator path.
+#
+# Probe modes mirror the locator semantics used in _check_element():
+#   "exists"        → locator.count() > 0
+#   "first_visible" → locator.first.is_visible()
+#   "any_visible"   → locator.first.is_visible() for selectors made only of
+#                     ":visible" alternatives (first visible match exists)
+# Visibility follows Playwright: non-empty bounding box and not visibility:hidden.
+# ──────────────────────────────────────────────────────────────────────
+
+_PLAYWRIGHT_ONLY_MARKERS: Tuple[str, ...] = (
+    "text=",
+    ":has-text(",
+    ":text(",
+    ":has(",
+    ">>",
+    "xpath=",
+    "//",
+)
+
+_DOM_PROBE_SCRIPT = """
+(rules) => {
+    const isVisible = (el) => {
+        const style = window.getComputedStyle(el);
+        if (style.visibility === 'hidden') return false;
+        const rect = el.getBoundingClientRect();
+        return rect.width > 0 && rect.height > 0;
+    };
+    return rules.map(([selector, mode]) => {
+        try {
+            if (mode === 'exists') return document.querySelector(selector) !== null;
+            if (mode === 'first_visible') {
+                const el = document.querySelector(selector);
+                return el !== null && isVisible(el);
+            }
+            return Array.from(document.querySelectorAll(selector)).some(isVisible);
+        } catch (e) {
+            return false;
+        }
+    });
+}
+"""
+
+
+def _compile_probe_rule(selector: str, requires_visible: bool) -> Optional[Tuple[str, str]]:
+    """
+    Translate a detection rule into a (css_selector, mode) pair for the DOM probe.
+
+    Returns:
+        Probe entry, or None if the selector needs a Playwright-only engine
+    """
+    if any(marker in selector for marker in _PLAYWRIGHT_ONLY_MARKERS):
+        return None
+
+    if ":visible" in selector:
+        parts = [part.strip() for part in selector.split(",")]
+        if not requires_visible or not all(part.endswith(":visible") for part in parts):
+            return None
+        css = ", ".join(part[: -len(":visible")] for part in parts)
+        if ":visible" in css:
+            return None
+        return (css, "any_visible")
+
+    return (selector, "first_visible" if requires_visible else "exists")
+
+
+# Index of each rule → probe entry (None = per-rule Playwright fallback)
+_PROBE_PLAN: List[Optional[Tuple[str, str]]] = [
+    _compile_probe_rule(selector, requires_visible)
+    for selector, _state, _confidence, requires_visible in _DETECTION_RULES
+]
+
+
 class PageStateDetector:
     """
     Detect current page state using DOM element inspection.
@@ -254,9 +333,20 @@ class PageStateDetector:
         self,
         config: Dict[str, Any],
         cloudflare_handler: Optional[CloudflareHandler] = None,
+        batch_dom_probe: bool = True,
     ):
+        """
+        Initialize page state detector.
+
+        Args:
+            config: Bot configuration dictionary
+            cloudflare_handler: Optional Cloudflare challenge detector
+            batch_dom_probe: Evaluate all CSS-expressible rules in a single
+                page.evaluate() round-trip instead of one locator call per rule
+        """
         self.config = config
         self.cloudflare_handler = cloudflare_handler
+        self.batch_dom_probe = batch_dom_probe
         self._last_state: Optional[PageStateResult] = None
 
     @property
@@ -297,13 +387,11 @@ class PageStateDetector:
                 self._last_state = result
                 return result
 
-        # Step 2: Run all element checks concurrently
-        check_tasks = [
-            self._check_element(page, selector, state, confidence, requires_visible)
-            for selector, state, confidence, requires_visible in _DETECTION_RULES
-        ]
-
-        results = await asyncio.gather(*check_tasks, return_exceptions=True)
+        # Step 2: Run all element checks (batched probe or one locator per rule)
+        if self.batch_dom_probe:
+            results = await self._check_rules_batched(page)
+        else:
+            results = await self._check_rules_individually(page)
 
         for check_result in results:
             if isinstance(check_result, BaseException) or check_result is None:
@@ -454,6 +542,75 @@ class PageStateDetector:
     # Element checking — visibility-aware
     # ──────────────────────────────────────────────────────────────
 
+    async def _check_rules_individually(self, page: Page) -> List[Any]:
+        """Check every detection rule with its own locator call, concurrently."""
+        check_tasks = [
+            self._check_element(page, selector, state, confidence, requires_visible)
+            for selector, state, confidence, requires_visible in _DETECTION_RULES
+        ]
+        return list(await asyncio.gather(*check_tasks, return_exceptions=True))
+
+    async def _check_rules_batched(self, page: Page) -> List[Any]:
+        """
+        Check CSS rules in one page.evaluate() and the rest per rule, concurrently.
+
+        If the probe fails (e.g. page navigated mid-evaluation), the CSS rules
+        are re-checked through the per-rule locator path.
+
+        Returns:
+            Check results in _DETECTION_RULES order (None for no match)
+        """
+        probe_indices = [i for i, entry in enumerate(_PROBE_PLAN) if entry is not None]
+        fallback_indices = [i for i, entry in enumerate(_PROBE_PLAN) if entry is None]
+
+        fallback_tasks = [self._check_element(page, *_DETECTION_RULES[i]) for i in fallback_indices]
+        probe, *fallback_results = await asyncio.gather(
+            self._probe_dom(page, [_PROBE_PLAN[i] for i in probe_indices]),
+            *fallback_tasks,
+            return_exceptions=True,
+        )
+
+        results: List[Any] = [None] * len(_DETECTION_RULES)
+        for i, fallback_result in zip(fallback_indices, fallback_results):
+            results[i] = fallback_result
+
+        if isinstance(probe, list):
+            for i, hit in zip(probe_indices, probe):
+                if hit:
+                    selector, state, confidence, _requires_visible = _DETECTION_RULES[i]
+                    results[i] = (state, confidence, selector)
+        else:
+            logger.debug("Batched DOM probe unavailable, using per-rule checks")
+            retry_results = await asyncio.gather(
+                *(self._check_element(page, *_DETECTION_RULES[i]) for i in probe_indices),
+                return_exceptions=True,
+            )
+            for i, retry_result in zip(probe_indices, retry_results):
+                results[i] = retry_result
+
+        return results
+
+    async def _probe_dom(
+        self, page: Page, probe_entries: List[Optional[Tuple[str, str]]]
+    ) -> Optional[List[bool]]:
+        """
+        Evaluate all probe entries in the page with a single round-trip.
+
+        Returns:
+            One boolean per entry, or None if the probe failed or returned garbage
+        """
+        try:
+            probe = await page.evaluate(
+                _DOM_PROBE_SCRIPT, [list(entry) for entry in probe_entries if entry is not None]
+            )
+        except Exception as e:
+            logger.debug(f"Batched DOM probe failed: {e}")
+            return None
+
+        if not isinstance(probe, list) or len(probe) != len(probe_entries):
+            return None
+        return [bool(hit) for hit in probe]
+
     async def _check_element(
         self,
         page: Page,
@@ -33,7 +33,7 @@ from ..notification.alert_service import AlertChannel, AlertConfig, AlertService
 from ..otp_manager.otp_webhook import get_otp_service
 from ..scheduling.adaptive_scheduler import AdaptiveScheduler
 from ..session.session_recovery import SessionRecovery
-from ..slot_analyzer import SlotPatternAnalyzer
+from ..slot_analyzer import SlotPatternAnalyzer, get_slot_analyzer
 from .auth_service import AuthService
 from .error_handler import ErrorHandler
 from .page_state_detector import PageStateDetector
@@ -429,7 +429,7 @@ class BotServiceFactory:
         scheduler = AdaptiveScheduler(timezone=timezone, country_multiplier=country_multiplier)
 
         # Slot pattern analyzer
-        slot_analyzer = SlotPatternAnalyzer()
+        slot_analyzer = get_slot_analyzer()
 
         # Selector self-healing
         self_healing = SelectorSelfHealing()
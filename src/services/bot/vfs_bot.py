@@ -6,7 +6,7 @@ from typing import TYPE_CHECKING, Any, Dict, Optional
 from loguru import logger
 from playwright.async_api import Page
 
-from ...constants import CircuitBreakerConfig, Timeouts
+from ...constants import BrowserPoolConfig, CircuitBreakerConfig, Timeouts
 from ...core.infra.circuit_breaker import CircuitBreaker, CircuitState
 from ...models.database import Database
 from ...repositories import AppointmentRepository, AppointmentRequestRepository
@@ -24,6 +24,7 @@ from .booking_dependencies import (
 from .booking_workflow import BookingWorkflow
 from .bot_loop_manager import BotLoopManager
 from .browser_manager import BrowserManager
+from .browser_pool import BrowserPool
 from .service_context import BotServiceContext, BotServiceFactory
 
 if TYPE_CHECKING:
@@ -107,6 +108,15 @@ class VFSBot:
             deps=deps,
         )
 
+        # Warm Chromium pool leasing an isolated context to each mission
+        self.browser_pool = BrowserPool(
+            config=self.config,
+            max_browsers=BrowserPoolConfig.MAX_BROWSERS,
+            idle_timeout_minutes=BrowserPoolConfig.IDLE_TIMEOUT_MINUTES,
+            header_manager=self.services.anti_detection.header_manager,
+            proxy_manager=self.services.anti_detection.proxy_manager,
+        )
+
         # Initialize account pool and session orchestrator
         self.account_pool = AccountPool(db=self.db, shutdown_event=self.shutdown_event)
         self.session_orchestrator = SessionOrchestrator(
@@ -114,6 +124,7 @@ class VFSBot:
             account_pool=self.account_pool,
             booking_workflow=self.booking_workflow,
             browser_manager=self.browser_manager,
+            browser_pool=self.browser_pool,
         )
 
         # Initialize bot loop manager
@@ -231,6 +242,14 @@ class VFSBot:
             logger.debug("cleanup() called but already cleaned up")
             return
         self._cleaned_up = True
+        try:
+            await self.session_orchestrator.close()
+        except Exception as e:
+            logger.warning(f"Error closing session orchestrator: {e}")
+        try:
+            await self.account_pool.close()
+        except Exception as e:
+            logger.warning(f"Error closing account pool: {e}")
         try:
             await self.browser_manager.close()
             logger.info("Bot cleanup completed")
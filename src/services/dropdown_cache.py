@@ -0,0 +1,258 @@
+"""In-process cache of parsed VFS dropdown data for the cascading dropdown routes."""
+
+import asyncio
+import hashlib
+import json
+import threading
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from loguru import logger
+
+from src.constants import NotifyChannels
+from src.repositories.dropdown_cache_repository import DropdownCacheRepository
+
+if TYPE_CHECKING:
+    from src.models.database import Database
+
+
+@dataclass(frozen=True)
+class DropdownIndex:
+    """
+    One country's dropdown data, indexed for centre -> category -> subcategory lookups.
+
+    Attributes:
+        country_code: Country code the data belongs to
+        last_synced_at: Sync timestamp of the data (ISO), used as its version
+        etag: Strong ETag derived from the data, shared by all three dropdown routes
+        centres: Centre names
+        categories: Category names by centre
+        subcategories: Subcategory names by (centre, category)
+    """
+
+    country_code: str
+    last_synced_at: Optional[str]
+    etag: str
+    centres: List[str]
+    categories: Dict[str, List[str]]
+    subcategories: Dict[Tuple[str, str], List[str]]
+
+    @classmethod
+    def build(
+        cls, country_code: str, last_synced_at: Optional[str], dropdown_data: Any
+    ) -> "DropdownIndex":
+        """
+        Build index maps from a country's dropdown blob.
+
+        Malformed branches are skipped, matching what the repository getters return.
+
+        Args:
+            country_code: Country code
+            last_synced_at: Sync timestamp of the data (ISO)
+            dropdown_data: ``{centre: {category: [subcategory, ...]}}``
+
+        Returns:
+            DropdownIndex for the country
+        """
+        if not isinstance(dropdown_data, dict):
+            dropdown_data = {}
+
+        categories: Dict[str, List[str]] = {}
+        subcategories: Dict[Tuple[str, str], List[str]] = {}
+        for centre, centre_data in dropdown_data.items():
+            if not isinstance(centre_data, dict):
+                continue
+            categories[centre] = list(centre_data.keys())
+            for category, names in centre_data.items():
+                if isinstance(names, list):
+                    subcategories[(centre, category)] = names
+
+        canonical = json.dumps(dropdown_data, sort_keys=True, separators=(",", ":"))
+        digest = hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+        return cls(
+            country_code=country_code,
+            last_synced_at=last_synced_at,
+            etag=f'"{digest[:32]}"',
+            centres=list(dropdown_data.keys()),
+            categories=categories,
+            subcategories=subcategories,
+        )
+
+
+class DropdownCache:
+    """
+    Keeps parsed dropdown indexes per country between requests.
+
+    A country's blob is fetched and parsed once; a cascade of centre,
+    category and subcategory lookups is then served from memory. Entries are
+    dropped when the ``dropdown_cache_changed`` NOTIFY channel names their
+    country (see Alembic revision 017). While notifications are unavailable,
+    each lookup first reads the stored last_synced_at and reuses the entry
+    only if it is unchanged.
+    """
+
+    def __init__(
+        self,
+        db: "Database",
+        dropdown_cache_repo: Optional[DropdownCacheRepository] = None,
+    ):
+        """
+        Initialize dropdown cache.
+
+        Args:
+            db: Database instance
+            dropdown_cache_repo: Repository used to load dropdown data
+        """
+        self.db = db
+        self.dropdown_cache_repo = dropdown_cache_repo or DropdownCacheRepository(db)
+
+        self._entries: Dict[str, DropdownIndex] = {}
+        # Bumped on every invalidation so a load racing a change is not cached
+        self._generation = 0
+        self._started = False
+        self._listening = False
+        self._lock = asyncio.Lock()
+
+    @property
+    def is_listening(self) -> bool:
+        """Whether change notifications are currently being received."""
+        return self._listening and bool(self.db.notifications_active)
+
+    async def start(self) -> None:
+        """Subscribe to change notifications. Falls back to version checks on failure."""
+        if self._started:
+            return
+        self._started = True
+        try:
+            await self.db.listen(NotifyChannels.DROPDOWN_CACHE, self._on_notification)
+            self._listening = True
+            logger.info("Dropdown cache subscribed to dropdown data notifications")
+        except Exception as e:
+            logger.warning(
+                f"Dropdown cache could not subscribe to notifications, "
+                f"checking last_synced_at per lookup: {e}"
+            )
+            self._listening = False
+
+    async def stop(self) -> None:
+        """Unsubscribe from change notifications and drop all entries."""
+        if self._listening:
+            try:
+                await self.db.unlisten(NotifyChannels.DROPDOWN_CACHE, self._on_notification)
+            except Exception as e:
+                logger.debug(f"Dropdown cache unlisten failed: {e}")
+        self._listening = False
+        self._started = False
+        self.invalidate()
+
+    def invalidate(self, country_code: Optional[str] = None) -> None:
+        """
+        Drop cached data for one country, or for all countries.
+
+        Args:
+            country_code: Country to drop (None drops everything)
+        """
+        self._generation += 1
+        if country_code is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(country_code, None)
+
+    def _on_notification(self, payload: str) -> None:
+        """Drop the country named in a notification payload."""
+        self.invalidate(payload or None)
+
+    async def get(self, country_code: str) -> Optional[DropdownIndex]:
+        """
+        Get the dropdown index for a country.
+
+        Args:
+            country_code: Country code (e.g., 'fra', 'nld')
+
+        Returns:
+            DropdownIndex, or None if the country has no cached dropdown data
+        """
+        if not self._started:
+            await self.start()
+
+        if self._listening and not self.db.notifications_active:
+            # Notifications were missed while disconnected
+            self.invalidate()
+            await self.db.ensure_listening()
+
+        entry = self._entries.get(country_code)
+        if entry is not None:
+            if self.is_listening:
+                return entry
+            last_synced_at = await self.dropdown_cache_repo.get_last_synced_at(country_code)
+            if last_synced_at is not None and last_synced_at == entry.last_synced_at:
+                return entry
+
+        return await self._load(country_code, stale=entry)
+
+    async def _load(
+        self, country_code: str, stale: Optional[DropdownIndex]
+    ) -> Optional[DropdownIndex]:
+        """
+        Fetch and index a country's dropdown data, once for concurrent callers.
+
+        Args:
+            country_code: Country code
+            stale: Entry the caller found outdated, if any
+
+        Returns:
+            DropdownIndex, or None if the country has no cached dropdown data
+        """
+        async with self._lock:
+            # Another caller may have reloaded while this one waited
+            entry = self._entries.get(country_code)
+            if entry is not None and entry is not stale:
+                return entry
+
+            generation = self._generation
+            data = await self.dropdown_cache_repo.get_dropdown_data(country_code)
+            if data is None or data.get("dropdown_data") is None:
+                self._entries.pop(country_code, None)
+                return None
+
+            entry = DropdownIndex.build(
+                country_code, data.get("last_synced_at"), data["dropdown_data"]
+            )
+            if generation == self._generation:
+                self._entries[country_code] = entry
+            logger.debug(
+                f"Dropdown cache loaded {country_code}: {len(entry.centres)} centres "
+                f"(synced {entry.last_synced_at})"
+            )
+            return entry
+
+
+# Global dropdown cache instance
+_dropdown_cache: Optional[DropdownCache] = None
+_dropdown_cache_lock = threading.Lock()
+
+
+def get_dropdown_cache(db: "Database") -> DropdownCache:
+    """
+    Get or create the dropdown cache for a database (singleton).
+
+    Args:
+        db: Database instance
+
+    Returns:
+        DropdownCache instance
+    """
+    global _dropdown_cache
+    with _dropdown_cache_lock:
+        if _dropdown_cache is None or _dropdown_cache.db is not db:
+            _dropdown_cache = DropdownCache(db)
+        return _dropdown_cache
+
+
+async def close_dropdown_cache() -> None:
+    """Stop the dropdown cache, if one was created."""
+    global _dropdown_cache
+    with _dropdown_cache_lock:
+        cache, _dropdown_cache = _dropdown_cache, None
+    if cache is not None:
+        await cache.stop()
@@ -7,6 +7,7 @@ from both email (catch-all mailbox) and SMS sources for 100+ concurrent bot sess
 from .email_otp_handler import EmailOTPHandler, get_email_otp_handler
 from .email_processor import EmailProcessor
 from .imap_listener import IMAPListener
+from .mailbox_watcher import MailboxWatcher
 from .manager import OTPManager, get_otp_manager
 from .models import BotSession, IMAPConfig, OTPEntry, OTPSource, SessionState
 from .otp_webhook import OTPWebhookService, get_otp_service
@@ -31,6 +32,7 @@ __all__ = [
     "SessionRegistry",
     "EmailProcessor",
     "IMAPListener",
+    "MailboxWatcher",
     "SMSWebhookHandler",
     "OTPManager",
     "get_otp_manager",
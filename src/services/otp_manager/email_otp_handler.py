@@ -6,21 +6,21 @@ that receive OTP codes via a catch-all email configuration.
 
 import email
 import email.utils
-import imaplib
 import re
 import threading
 import time
 from dataclasses import dataclass
-from datetime import datetime, timedelta, timezone
-from email import message_from_bytes
+from datetime import datetime, timezone
 from email.header import decode_header
 from email.message import Message
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 from loguru import logger
 
 from src.utils.singleton import get_or_create_sync
 
+from .mailbox_watcher import MailboxWatcher
+from .models import IMAPConfig
 from .pattern_matcher import HTMLTextExtractor, OTPPatternMatcher
 
 
@@ -36,16 +36,6 @@ class EmailOTPEntry:
     used: bool = False
 
 
-@dataclass
-class IMAPConfig:
-    """IMAP server configuration."""
-
-    host: str = "outlook.office365.com"
-    port: int = 993
-    use_ssl: bool = True
-    folder: str = "INBOX"
-
-
 class EmailOTPHandler:
     """
     Thread-safe IMAP-based email OTP handler for Microsoft 365 catch-all system.
@@ -54,6 +44,11 @@ class EmailOTPHandler:
     codes sent to different target email addresses that are all received in a
     single catch-all mailbox.
 
+    All waiters share one long-lived IMAP session (see MailboxWatcher), which
+    uses IDLE when the server supports it and UID-incremental polling when it
+    does not. Waiters register by target address and are woken as soon as a
+    matching OTP is parsed.
+
     Example:
         handler = EmailOTPHandler(
             email="akby.hakan@vizecep.com",
@@ -71,6 +66,7 @@ class EmailOTPHandler:
         poll_interval_seconds: int = 5,
         max_email_age_seconds: int = 300,
         custom_patterns: Optional[List[str]] = None,
+        idle_timeout_seconds: int = 300,
     ):
         """
         Initialize Email OTP Handler.
@@ -80,9 +76,11 @@ class EmailOTPHandler:
             app_password: Microsoft 365 App Password
             imap_config: IMAP configuration (default: outlook.office365.com:993)
             otp_timeout_seconds: Maximum wait time for OTP (default: 120)
-            poll_interval_seconds: Interval between email checks (default: 5)
+            poll_interval_seconds: Interval between email checks when the
+                server does not support IDLE (default: 5)
             max_email_age_seconds: Maximum age of emails to consider (default: 300)
             custom_patterns: Optional custom regex patterns for OTP extraction
+            idle_timeout_seconds: Interval for re-issuing IMAP IDLE (default: 300)
         """
         self._email = email
         self._app_password = app_password
@@ -96,31 +94,23 @@ class EmailOTPHandler:
         self._otp_cache: Dict[str, EmailOTPEntry] = {}
         self._lock = threading.RLock()
 
+        # Waiters by target email, woken when an OTP for that address arrives
+        self._waiters: Dict[str, Set[threading.Event]] = {}
+        self._watcher = MailboxWatcher(
+            email=email,
+            app_password=app_password,
+            imap_config=self._imap_config,
+            on_message=self._process_message,
+            poll_interval_seconds=poll_interval_seconds,
+            idle_timeout_seconds=idle_timeout_seconds,
+            max_email_age_seconds=max_email_age_seconds,
+        )
+
         logger.info(
             f"EmailOTPHandler initialized for {email} "
             f"(timeout: {otp_timeout_seconds}s, poll: {poll_interval_seconds}s)"
         )
 
-    def _connect_imap(self) -> imaplib.IMAP4_SSL:
-        """
-        Create and authenticate IMAP connection.
-
-        Returns:
-            Authenticated IMAP connection
-
-        Raises:
-            imaplib.IMAP4.error: If connection or authentication fails
-        """
-        try:
-            mail = imaplib.IMAP4_SSL(self._imap_config.host, self._imap_config.port)
-            mail.login(self._email, self._app_password)
-            mail.select(self._imap_config.folder)
-            logger.debug(f"IMAP connection established to {self._imap_config.host}")
-            return mail
-        except Exception as e:
-            logger.error(f"IMAP connection failed: {e}")
-            raise
-
     def _decode_header_value(self, header_value: str) -> str:
         """
         Decode MIME-encoded email header.
@@ -234,91 +224,59 @@ class EmailOTPHandler:
 
         return body
 
-    def _fetch_and_process_emails(self, target_email: str, since_time: datetime) -> Optional[str]:
+    def _process_message(self, msg: Message) -> None:
         """
-        Fetch and process emails to find OTP for target email.
+        Extract an OTP from a new message, cache it and wake matching waiters.
 
-        Args:
-            target_email: Target email address to filter
-            since_time: Only process emails received after this time
+        Called from the mailbox watcher thread for every new message.
 
-        Returns:
-            OTP code if found, None otherwise
+        Args:
+            msg: Email message object
         """
-        mail = None
-        try:
-            mail = self._connect_imap()
-
-            # Search for recent unread emails
-            since_date = since_time.strftime("%d-%b-%Y")
-            _, message_numbers = mail.search(None, f"(UNSEEN SINCE {since_date})")
+        target_email = self._extract_target_email(msg)
+        if not target_email:
+            return
 
-            if not message_numbers[0]:
-                logger.debug("No new emails found")
-                return None
-
-            for num in message_numbers[0].split():
-                try:
-                    status, msg_data = mail.fetch(num, "(RFC822)")
-                    if msg_data and isinstance(msg_data[0], tuple) and len(msg_data[0]) >= 2:
-                        email_body_raw = msg_data[0][1]
-                        if isinstance(email_body_raw, bytes):
-                            msg = message_from_bytes(email_body_raw)
-                        else:
-                            continue  # Skip if not bytes
-
-                    # Extract target email from headers
-                    msg_target = self._extract_target_email(msg)
-                    if not msg_target or msg_target.lower() != target_email.lower():
-                        continue
-
-                    # Extract subject and body
-                    subject = self._decode_header_value(msg.get("Subject", ""))
-                    body = self._get_email_body(msg)
-                    full_text = f"{subject} {body}"
-
-                    # Extract OTP
-                    otp = self._pattern_matcher.extract_otp(full_text)
-                    if otp:
-                        # Get received date
-                        date_str = msg.get("Date", "")
-                        try:
-                            received_at = email.utils.parsedate_to_datetime(date_str)
-                        except (ValueError, TypeError):
-                            received_at = datetime.now(timezone.utc)
-
-                        # Cache the OTP
-                        with self._lock:
-                            entry = EmailOTPEntry(
-                                code=otp,
-                                target_email=target_email,
-                                raw_subject=subject,
-                                raw_body=body,
-                                received_at=received_at,
-                            )
-                            self._otp_cache[target_email] = entry
-
-                        logger.info(f"OTP found for target email: {target_email}")
-                        return otp
-
-                except Exception as e:
-                    logger.warning(f"Error processing email: {e}")
-                    continue
+        subject = self._decode_header_value(msg.get("Subject", ""))
+        body = self._get_email_body(msg)
+        otp = self._pattern_matcher.extract_otp(f"{subject} {body}")
+        if not otp:
+            return
 
-            return None
+        date_str = msg.get("Date", "")
+        try:
+            received_at = email.utils.parsedate_to_datetime(date_str)
+        except (ValueError, TypeError):
+            received_at = datetime.now(timezone.utc)
+        if received_at.tzinfo is None:
+            received_at = received_at.replace(tzinfo=timezone.utc)
 
-        except Exception as e:
-            logger.error(f"Error fetching emails: {e}")
-            return None
+        age = (datetime.now(timezone.utc) - received_at).total_seconds()
+        if age > self._max_email_age:
+            logger.debug(f"Ignoring stale OTP email for {target_email} ({age:.0f}s old)")
+            return
 
-        finally:
-            # Always cleanup IMAP connection
-            if mail:
-                try:
-                    mail.close()
-                    mail.logout()
-                except Exception as e:
-                    logger.debug(f"Error closing IMAP connection: {e}")
+        with self._lock:
+            self._otp_cache[target_email] = EmailOTPEntry(
+                code=otp,
+                target_email=target_email,
+                raw_subject=subject,
+                raw_body=body,
+                received_at=received_at,
+            )
+            waiters = list(self._waiters.get(target_email, ()))
+
+        logger.info(f"OTP found for target email: {target_email}")
+        for event in waiters:
+            event.set()
+
+    def _take_cached_otp(self, target_email: str, mark_used: bool) -> Optional[str]:
+        """Return the cached OTP for target email, marking it used if requested."""
+        with self._lock:
+            otp = self.get_cached_otp(target_email)
+            if otp and mark_used:
+                self._otp_cache[target_email].used = True
+            return otp
 
     def wait_for_otp(
         self, target_email: str, timeout: Optional[int] = None, mark_used: bool = True
@@ -326,8 +284,9 @@ class EmailOTPHandler:
         """
         Wait for OTP code for specific target email.
 
-        This method polls the IMAP server for new emails containing OTP codes
-        sent to the specified target email address.
+        The waiter registers interest in the target address and sleeps until
+        the shared mailbox watcher delivers a matching OTP or the timeout
+        elapses; it performs no IMAP I/O itself.
 
         Args:
             target_email: Target email address (e.g., "bot55@vizecep.com")
@@ -341,31 +300,36 @@ class EmailOTPHandler:
         target_email = target_email.lower()
 
         # Check cache first
-        cached_otp = self.get_cached_otp(target_email)
+        cached_otp = self._take_cached_otp(target_email, mark_used)
         if cached_otp:
-            if mark_used:
-                with self._lock:
-                    if target_email in self._otp_cache:
-                        self._otp_cache[target_email].used = True
             return cached_otp
 
-        # Poll for new emails
-        start_time = time.time()
-        since_time = datetime.now(timezone.utc) - timedelta(seconds=self._max_email_age)
-
-        while time.time() - start_time < timeout:
-            otp = self._fetch_and_process_emails(target_email, since_time)
-            if otp:
-                if mark_used:
-                    with self._lock:
-                        if target_email in self._otp_cache:
-                            self._otp_cache[target_email].used = True
-                return otp
+        event = threading.Event()
+        with self._lock:
+            self._waiters.setdefault(target_email, set()).add(event)
 
-            # Wait before next poll
-            remaining = timeout - (time.time() - start_time)
-            if remaining > 0:
-                time.sleep(min(self._poll_interval, remaining))
+        try:
+            self._watcher.start()
+            self._watcher.check_now()
+
+            deadline = time.monotonic() + timeout
+            while True:
+                otp = self._take_cached_otp(target_email, mark_used)
+                if otp:
+                    return otp
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                event.wait(remaining)
+                event.clear()
+        finally:
+            with self._lock:
+                waiters = self._waiters.get(target_email)
+                if waiters is not None:
+                    waiters.discard(event)
+                    if not waiters:
+                        del self._waiters[target_email]
 
         logger.warning(f"OTP timeout for {target_email} after {timeout}s")
         return None
@@ -413,6 +377,7 @@ class EmailOTPHandler:
 
     def close(self):
         """Clean up resources."""
+        self._watcher.stop()
         self.clear_cache()
         logger.info("EmailOTPHandler closed")
 
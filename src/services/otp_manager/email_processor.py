@@ -60,6 +60,20 @@ class EmailProcessor:
 
         return None
 
+    def extract_target_email(self, msg: Message) -> Optional[str]:
+        """
+        Extract the recipient used for session matching.
+
+        Only reads headers, so it also works on header-only messages.
+
+        Args:
+            msg: Email message object (full or headers only)
+
+        Returns:
+            Lowercase target email address or None
+        """
+        return self._extract_target_email(msg)
+
     def _extract_text_from_html(self, html: str) -> str:
         """Extract plain text from HTML content."""
         extractor = HTMLTextExtractor()
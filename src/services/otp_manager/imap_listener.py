@@ -10,17 +10,31 @@ import time
 from collections import deque
 from datetime import datetime, timedelta, timezone
 from email import message_from_bytes
-from typing import Optional
+from typing import List, Optional
 
 from loguru import logger
 
 from .email_processor import EmailProcessor
+from .mailbox_watcher import parse_search_uids, parse_uid_fetch
 from .models import IMAPConfig
 from .session_registry import SessionRegistry
 
+# Headers needed to match a message to a session before downloading it
+_MATCH_HEADERS = "(BODY.PEEK[HEADER.FIELDS (TO DELIVERED-TO X-ORIGINAL-TO SUBJECT DATE)])"
+
+# Upper bound on UIDs per FETCH command line
+_FETCH_BATCH_SIZE = 500
+
 
 class IMAPListener:
-    """IMAP listener for catch-all mailbox monitoring."""
+    """
+    IMAP listener for catch-all mailbox monitoring.
+
+    The mailbox is tracked by UIDVALIDITY and the last seen UID, so each poll
+    only asks for newer messages. New messages are matched against the
+    SessionRegistry using a single batched header fetch; full bodies are
+    downloaded only for messages addressed to a registered session.
+    """
 
     def __init__(
         self,
@@ -65,6 +79,10 @@ class IMAPListener:
         self._processed_uids_set: set = set()
         self._lock = threading.Lock()
 
+        # UID tracking (reset when the server changes UIDVALIDITY)
+        self._uid_validity: Optional[int] = None
+        self._last_uid = 0
+
         # Health tracking
         self._last_noop_time = time.time()
         self._connection_healthy = False
@@ -117,6 +135,7 @@ class IMAPListener:
                 self._connection_healthy = True
                 self._last_noop_time = time.time()
                 reconnect_delay = 5  # Reset on successful connection
+                self._sync_uid_state(mail)
 
                 # Main poll loop
                 while self._running:
@@ -181,54 +200,93 @@ class IMAPListener:
                 time.sleep(reconnect_delay)
                 reconnect_delay = min(reconnect_delay * 2, max_reconnect_delay)
 
-    def _poll_emails(self, mail: imaplib.IMAP4_SSL) -> None:
-        """Poll for new emails."""
-        # Search for recent unread emails
+    def _sync_uid_state(self, mail: imaplib.IMAP4_SSL) -> None:
+        """
+        Resume from the last seen UID, or re-seed when UIDVALIDITY changed.
+
+        On (re-)seed, recent unseen messages are processed once so OTPs that
+        arrived while disconnected are not missed.
+        """
+        _, data = mail.response("UIDVALIDITY")
+        uid_validity = int(data[0]) if data and data[0] else None
+        if uid_validity is not None and uid_validity == self._uid_validity:
+            return
+
+        if self._uid_validity is not None:
+            logger.info("Mailbox UIDVALIDITY changed, re-syncing recent messages")
+        with self._lock:
+            self._processed_uids_set.clear()
+            self._processed_uids_queue.clear()
+        self._uid_validity = uid_validity
+
+        _, data = mail.uid("SEARCH", "UID *")
+        self._last_uid = max(parse_search_uids(data), default=0)
+
         since_time = datetime.now(timezone.utc) - timedelta(seconds=self._max_email_age)
         since_date = since_time.strftime("%d-%b-%Y")
+        _, data = mail.uid("SEARCH", f"(UNSEEN SINCE {since_date})")
+        recent = [uid for uid in parse_search_uids(data) if uid <= self._last_uid]
+        self._process_uids(mail, recent)
 
+    def _poll_emails(self, mail: imaplib.IMAP4_SSL) -> None:
+        """Poll for messages with a UID above the last one seen."""
         try:
-            _, message_numbers = mail.search(None, f"(UNSEEN SINCE {since_date})")
+            _, data = mail.uid("SEARCH", f"UID {self._last_uid + 1}:*")
         except Exception as e:
             logger.error(f"IMAP search failed: {e}")
             raise
 
-        if not message_numbers[0]:
+        # "n:*" always matches the highest UID, even when it is below n
+        new_uids = [uid for uid in parse_search_uids(data) if uid > self._last_uid]
+        if not new_uids:
             return
 
-        for num in message_numbers[0].split():
-            try:
-                # Check if already processed
-                with self._lock:
-                    if num in self._processed_uids_set:
-                        continue
-                    self._processed_uids_set.add(num)
-                    self._processed_uids_queue.append(num)
-
-                # Fetch and process email
-                _, msg_data = mail.fetch(num, "(RFC822)")
-                if msg_data and msg_data[0] and isinstance(msg_data[0], tuple):
-                    email_body = msg_data[0][1]
-                    msg = message_from_bytes(email_body)
-
-                    # Process email
-                    otp_entry = self._email_processor.process_email(msg)
-                    if otp_entry:
-                        # Find session and notify
-                        session = self._session_registry.find_by_email(otp_entry.target_identifier)
-                        if session:
-                            self._session_registry.notify_otp(session.session_id, otp_entry.code)
-                            logger.info(f"OTP delivered to session {session.session_id}")
+        self._process_uids(mail, new_uids)
+        self._last_uid = max(new_uids)
 
+    def _process_uids(self, mail: imaplib.IMAP4_SSL, uids: List[int]) -> None:
+        """Match messages to sessions by header, then fetch and deliver matched bodies."""
+        with self._lock:
+            pending = [uid for uid in uids if uid not in self._processed_uids_set]
+
+        for start in range(0, len(pending), _FETCH_BATCH_SIZE):
+            batch = pending[start : start + _FETCH_BATCH_SIZE]
+            matched = self._match_headers(mail, batch)
+            if matched:
+                self._deliver_bodies(mail, matched)
+
+            with self._lock:
+                for uid in batch:
+                    if uid not in self._processed_uids_set:
+                        self._processed_uids_set.add(uid)
+                        self._processed_uids_queue.append(uid)
+
+    def _match_headers(self, mail: imaplib.IMAP4_SSL, uids: List[int]) -> List[int]:
+        """Fetch recipient headers in one command; return UIDs addressed to a session."""
+        _, data = mail.uid("FETCH", ",".join(str(uid) for uid in uids), _MATCH_HEADERS)
+
+        matched = []
+        for uid, headers in parse_uid_fetch(data).items():
+            target = self._email_processor.extract_target_email(message_from_bytes(headers))
+            if target and self._session_registry.find_by_email(target):
+                matched.append(uid)
+        return sorted(matched)
+
+    def _deliver_bodies(self, mail: imaplib.IMAP4_SSL, uids: List[int]) -> None:
+        """Download matched messages and notify their sessions."""
+        _, data = mail.uid("FETCH", ",".join(str(uid) for uid in uids), "(RFC822)")
+
+        for uid, raw in sorted(parse_uid_fetch(data).items()):
+            try:
+                otp_entry = self._email_processor.process_email(message_from_bytes(raw))
+                if otp_entry:
+                    # Find session and notify
+                    session = self._session_registry.find_by_email(otp_entry.target_identifier)
+                    if session:
+                        self._session_registry.notify_otp(session.session_id, otp_entry.code)
+                        logger.info(f"OTP delivered to session {session.session_id}")
             except Exception as e:
-                logger.warning(f"Error processing email: {e}")
-                with self._lock:
-                    self._processed_uids_set.discard(num)
-                    # Remove from queue if present (may not be at end)
-                    try:
-                        self._processed_uids_queue.remove(num)
-                    except ValueError:
-                        pass
+                logger.warning(f"Error processing email UID {uid}: {e}")
 
     def _cleanup_processed_uids(self) -> None:
         """Clean up processed UIDs set to prevent unbounded memory growth."""
@@ -269,4 +327,6 @@ class IMAPListener:
                 "total_reconnects": self._total_reconnects,
                 "consecutive_poll_errors": self._consecutive_poll_errors,
                 "processed_uids_count": len(self._processed_uids_set),
+                "uid_validity": self._uid_validity,
+                "last_uid": self._last_uid,
             }
@@ -0,0 +1,333 @@
+"""Long-lived IMAP session that pushes new mailbox messages to a callback.
+
+One watcher keeps a single authenticated connection to a mailbox. When the
+server advertises IDLE (RFC 2177) the watcher waits for the server to announce
+new messages; otherwise it polls with UID-incremental searches. Either way,
+only messages with a UID above the last one seen are fetched.
+"""
+
+import imaplib
+import re
+import select
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from email import message_from_bytes
+from email.message import Message
+from typing import Callable, Dict, List, Optional
+
+from loguru import logger
+
+from .models import IMAPConfig
+
+MessageCallback = Callable[[Message], None]
+
+_FETCH_UID_RE = re.compile(rb"UID (\d+)")
+
+
+def parse_search_uids(data: List) -> List[int]:
+    """
+    Parse a UID SEARCH response.
+
+    Args:
+        data: Response data from ``IMAP4.uid("SEARCH", ...)``
+
+    Returns:
+        Sorted list of UIDs
+    """
+    if not data or not data[0]:
+        return []
+    return sorted(int(uid) for uid in data[0].split())
+
+
+def parse_uid_fetch(data: List) -> Dict[int, bytes]:
+    """
+    Parse a UID FETCH response carrying one literal per message.
+
+    Args:
+        data: Response data from ``IMAP4.uid("FETCH", ...)``
+
+    Returns:
+        Mapping of UID to the fetched literal (headers or full message)
+    """
+    fetched: Dict[int, bytes] = {}
+    for item in data or []:
+        if not isinstance(item, tuple) or len(item) < 2:
+            continue
+        match = _FETCH_UID_RE.search(item[0])
+        if match and isinstance(item[1], bytes):
+            fetched[int(match.group(1))] = item[1]
+    return fetched
+
+
+class MailboxWatcher:
+    """
+    Shared IMAP connection for one mailbox, backed by IDLE or UID polling.
+
+    Messages are delivered to ``on_message`` from the watcher thread, in UID
+    order, exactly once per UIDVALIDITY epoch. On the first connection (and
+    whenever UIDVALIDITY changes) unseen messages younger than
+    ``max_email_age_seconds`` are delivered so codes that arrived just before
+    the watcher started are not missed.
+    """
+
+    def __init__(
+        self,
+        email: str,
+        app_password: str,
+        imap_config: IMAPConfig,
+        on_message: MessageCallback,
+        poll_interval_seconds: float = 5,
+        idle_timeout_seconds: float = 300,
+        max_email_age_seconds: int = 300,
+        reconnect_delay_seconds: float = 5,
+        max_reconnect_delay_seconds: float = 60,
+    ):
+        """
+        Initialize mailbox watcher.
+
+        Args:
+            email: Mailbox login
+            app_password: Mailbox app password
+            imap_config: IMAP server configuration
+            on_message: Called with each new message from the watcher thread
+            poll_interval_seconds: Interval between UID searches without IDLE
+            idle_timeout_seconds: Re-issue IDLE after this long (RFC 2177: < 29 min)
+            max_email_age_seconds: Age limit for messages found on first sync
+            reconnect_delay_seconds: Initial delay before reconnecting
+            max_reconnect_delay_seconds: Upper bound for reconnect backoff
+        """
+        self._email = email
+        self._app_password = app_password
+        self._imap_config = imap_config
+        self._on_message = on_message
+        self._poll_interval = poll_interval_seconds
+        self._idle_timeout = idle_timeout_seconds
+        self._max_email_age = max_email_age_seconds
+        self._reconnect_delay = reconnect_delay_seconds
+        self._max_reconnect_delay = max_reconnect_delay_seconds
+
+        self._stop_event = threading.Event()
+        self._wake_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+        self._uid_validity: Optional[int] = None
+        self._last_uid = 0
+        self._supports_idle = False
+        self._connected = False
+        self._idle_tag_counter = 0
+        self.total_connections = 0
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the watcher thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def is_connected(self) -> bool:
+        """Whether the IMAP session is currently established."""
+        return self._connected
+
+    @property
+    def supports_idle(self) -> bool:
+        """Whether the server advertised IDLE on the current connection."""
+        return self._supports_idle
+
+    def start(self) -> None:
+        """Start the watcher thread (no-op if already running)."""
+        with self._lock:
+            if self.is_running:
+                return
+            self._stop_event.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="imap-mailbox-watcher", daemon=True
+            )
+            self._thread.start()
+        logger.info(f"Mailbox watcher started for {self._email}")
+
+    def stop(self, timeout: float = 10) -> None:
+        """
+        Stop the watcher thread and log out.
+
+        Args:
+            timeout: Seconds to wait for the thread to exit
+        """
+        self._stop_event.set()
+        self._wake_event.set()
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout=timeout)
+        self._thread = None
+        logger.info(f"Mailbox watcher stopped for {self._email}")
+
+    def check_now(self) -> None:
+        """Ask a polling watcher to search for new messages without waiting."""
+        self._wake_event.set()
+
+    def _connect(self) -> imaplib.IMAP4:
+        """Create, authenticate and select the mailbox."""
+        if self._imap_config.use_ssl:
+            mail: imaplib.IMAP4 = imaplib.IMAP4_SSL(self._imap_config.host, self._imap_config.port)
+        else:
+            mail = imaplib.IMAP4(self._imap_config.host, self._imap_config.port)
+        mail.login(self._email, self._app_password)
+        typ, _ = mail.select(self._imap_config.folder)
+        if typ != "OK":
+            raise imaplib.IMAP4.error(f"SELECT {self._imap_config.folder} failed")
+        self.total_connections += 1
+        logger.debug(f"Mailbox watcher connected to {self._imap_config.host}")
+        return mail
+
+    def _run(self) -> None:
+        """Connection loop: sync, then IDLE or poll until stopped."""
+        delay = self._reconnect_delay
+
+        while not self._stop_event.is_set():
+            mail = None
+            try:
+                mail = self._connect()
+                self._supports_idle = "IDLE" in mail.capabilities
+                self._connected = True
+                delay = self._reconnect_delay
+                self._sync_uid_validity(mail)
+
+                while not self._stop_event.is_set():
+                    self._fetch_new(mail)
+                    if self._supports_idle:
+                        self._idle(mail)
+                    else:
+                        self._wake_event.wait(self._poll_interval)
+                        self._wake_event.clear()
+            except Exception as e:
+                if not self._stop_event.is_set():
+                    logger.warning(f"Mailbox watcher connection error: {e}")
+            finally:
+                self._connected = False
+                if mail is not None:
+                    self._logout(mail)
+
+            if self._stop_event.wait(delay):
+                break
+            delay = min(delay * 2, self._max_reconnect_delay)
+
+    @staticmethod
+    def _logout(mail: imaplib.IMAP4) -> None:
+        """Close the mailbox and log out, ignoring errors on a dead connection."""
+        try:
+            mail.close()
+            mail.logout()
+        except Exception as e:
+            logger.debug(f"Error closing IMAP connection: {e}")
+
+    def _sync_uid_validity(self, mail: imaplib.IMAP4) -> None:
+        """Resume from the last UID, or re-seed if UIDVALIDITY changed."""
+        _, data = mail.response("UIDVALIDITY")
+        uid_validity = int(data[0]) if data and data[0] else None
+
+        if uid_validity is not None and uid_validity == self._uid_validity:
+            return
+
+        if self._uid_validity is not None:
+            logger.info("Mailbox UIDVALIDITY changed, re-syncing recent messages")
+        self._uid_validity = uid_validity
+
+        # Anything arriving after this point is picked up by _fetch_new()
+        self._last_uid = self._highest_uid(mail)
+
+        since = datetime.now(timezone.utc) - timedelta(seconds=self._max_email_age)
+        typ, data = mail.uid("SEARCH", f"(UNSEEN SINCE {since.strftime('%d-%b-%Y')})")
+        if typ != "OK":
+            raise imaplib.IMAP4.error("UID SEARCH failed")
+        recent = [uid for uid in parse_search_uids(data) if uid <= self._last_uid]
+        self._fetch_uids(mail, recent)
+
+    def _highest_uid(self, mail: imaplib.IMAP4) -> int:
+        """Highest UID currently in the mailbox (0 if empty)."""
+        typ, data = mail.uid("SEARCH", "UID *")
+        uids = parse_search_uids(data) if typ == "OK" else []
+        return max(uids, default=0)
+
+    def _fetch_new(self, mail: imaplib.IMAP4) -> None:
+        """Fetch and deliver messages with a UID above the last one seen."""
+        typ, data = mail.uid("SEARCH", f"UID {self._last_uid + 1}:*")
+        if typ != "OK":
+            raise imaplib.IMAP4.error("UID SEARCH failed")
+
+        # "n:*" always matches the highest UID, even when it is below n
+        new_uids = [uid for uid in parse_search_uids(data) if uid > self._last_uid]
+        if new_uids:
+            self._fetch_uids(mail, new_uids)
+            self._last_uid = max(new_uids)
+
+    def _fetch_uids(self, mail: imaplib.IMAP4, uids: List[int]) -> None:
+        """Fetch the given UIDs in one command and deliver them in UID order."""
+        if not uids:
+            return
+
+        typ, data = mail.uid("FETCH", ",".join(str(uid) for uid in uids), "(RFC822)")
+        if typ != "OK":
+            raise imaplib.IMAP4.error("UID FETCH failed")
+
+        for uid, raw in sorted(parse_uid_fetch(data).items()):
+            try:
+                self._on_message(message_from_bytes(raw))
+            except Exception as e:
+                logger.warning(f"Error processing email UID {uid}: {e}")
+
+    def _idle(self, mail: imaplib.IMAP4) -> None:
+        """
+        Wait in IDLE until new mail is announced, the timeout elapses or stop() is called.
+
+        imaplib has no IDLE support before Python 3.14, so the command is
+        driven directly on the socket. The buffered reader imaplib uses is
+        drained by the preceding tagged response, so IDLE lines are read
+        from the socket without going through it.
+        """
+        self._idle_tag_counter += 1
+        tag = f"IDLE{self._idle_tag_counter}".encode()
+        mail.send(tag + b" IDLE\r\n")
+
+        line = self._read_line(mail)
+        while not line.startswith(b"+"):
+            if line.startswith(tag):
+                raise imaplib.IMAP4.error(f"IDLE rejected: {line!r}")
+            line = self._read_line(mail)
+
+        deadline = time.monotonic() + self._idle_timeout
+        while not self._stop_event.is_set() and time.monotonic() < deadline:
+            if not self._wait_readable(mail, 1.0):
+                continue
+            line = self._read_line(mail)
+            if line.startswith(b"* BYE"):
+                raise imaplib.IMAP4.abort(f"Server closed IDLE: {line!r}")
+            if line.rstrip().endswith(b"EXISTS"):
+                break
+
+        mail.send(b"DONE\r\n")
+        line = self._read_line(mail)
+        while not line.startswith(tag):
+            line = self._read_line(mail)
+        if not line[len(tag) :].lstrip().startswith(b"OK"):
+            raise imaplib.IMAP4.error(f"IDLE failed: {line!r}")
+
+    @staticmethod
+    def _wait_readable(mail: imaplib.IMAP4, timeout: float) -> bool:
+        """Whether the socket has data (including data already decrypted by TLS)."""
+        sock = mail.sock
+        pending = getattr(sock, "pending", None)
+        if pending is not None and pending() > 0:
+            return True
+        readable, _, _ = select.select([sock], [], [], timeout)
+        return bool(readable)
+
+    @staticmethod
+    def _read_line(mail: imaplib.IMAP4) -> bytes:
+        """Read one CRLF-terminated line directly from the socket."""
+        line = bytearray()
+        while not line.endswith(b"\r\n"):
+            chunk = mail.sock.recv(1)
+            if not chunk:
+                raise imaplib.IMAP4.abort("Connection closed during IDLE")
+            line += chunk
+        return bytes(line)
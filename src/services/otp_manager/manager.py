@@ -4,6 +4,7 @@ This module provides the central OTPManager class that coordinates
 all OTP management components.
 """
 
+import asyncio
 import threading
 import time
 from typing import Any, Dict, List, Optional
@@ -14,7 +15,7 @@ from src.utils.singleton import get_or_create_sync
 
 from .email_processor import EmailProcessor
 from .imap_listener import IMAPListener
-from .models import IMAPConfig, SessionState
+from .models import BotSession, IMAPConfig, SessionState
 from .pattern_matcher import OTPPatternMatcher
 from .session_registry import SessionRegistry
 from .sms_handler import SMSWebhookHandler
@@ -41,6 +42,7 @@ class OTPManager:
         )
 
         otp = manager.wait_for_otp(session_id, timeout=120)
+        # or, from async code: await manager.wait_for_otp_async(session_id)
         manager.unregister_session(session_id)
         manager.stop()
     """
@@ -175,7 +177,8 @@ class OTPManager:
         """
         Wait for OTP code (from email or SMS).
 
-        This method blocks until an OTP is received or timeout occurs.
+        This method blocks the calling thread until an OTP is received or
+        timeout occurs. From async code use wait_for_otp_async() instead.
 
         Args:
             session_id: Session ID
@@ -198,15 +201,61 @@ class OTPManager:
         # Wait for OTP
         session.state = SessionState.WAITING_OTP
         if session.otp_event is not None:
-            result = session.otp_event.wait(timeout=timeout)
-        else:
-            result = False
+            session.otp_event.wait(timeout=timeout)
 
-        if result and session.otp_code:
-            logger.info(f"OTP received for session {session_id}")
+        return self._finish_wait(session, session.otp_code)
+
+    async def wait_for_otp_async(
+        self, session_id: str, timeout: Optional[float] = None
+    ) -> Optional[str]:
+        """
+        Wait for OTP code (from email or SMS) without blocking the event loop.
+
+        The wait is an asyncio future resolved via call_soon_threadsafe by the
+        IMAP/SMS producer threads, so no executor thread is held per waiter.
+
+        Args:
+            session_id: Session ID
+            timeout: Maximum wait time in seconds (default: otp_timeout_seconds)
+
+        Returns:
+            OTP code or None if timeout
+        """
+        timeout = timeout or self._otp_timeout
+        session = self._session_registry.get_session(session_id)
+
+        if not session:
+            logger.error(f"Session not found: {session_id}")
+            return None
+
+        # Check if OTP already received
+        if session.otp_code:
             return session.otp_code
 
-        logger.warning(f"OTP timeout for session {session_id}")
+        loop = asyncio.get_running_loop()
+        future: "asyncio.Future[Optional[str]]" = loop.create_future()
+        if not self._session_registry.add_async_waiter(session_id, loop, future):
+            logger.error(f"Session not found: {session_id}")
+            return None
+
+        session.state = SessionState.WAITING_OTP
+        try:
+            otp_code = await asyncio.wait_for(future, timeout=timeout)
+        except asyncio.TimeoutError:
+            otp_code = None
+        finally:
+            self._session_registry.remove_async_waiter(session_id, future)
+
+        return self._finish_wait(session, otp_code)
+
+    @staticmethod
+    def _finish_wait(session: BotSession, otp_code: Optional[str]) -> Optional[str]:
+        """Log the wait outcome and mark the session expired on timeout."""
+        if otp_code:
+            logger.info(f"OTP received for session {session.session_id}")
+            return otp_code
+
+        logger.warning(f"OTP timeout for session {session.session_id}")
         session.state = SessionState.EXPIRED
         return None
 
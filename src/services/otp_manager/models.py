@@ -3,11 +3,12 @@
 This module contains all data classes and enums used by the OTP Manager system.
 """
 
+import asyncio
 import threading
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 
 class OTPSource(Enum):
@@ -64,6 +65,7 @@ class BotSession:
         created_at: Session creation timestamp
         otp_event: Threading event for OTP notification (auto-initialized)
         otp_code: Received OTP code (None until received)
+        otp_waiters: asyncio futures of async waiters, with the loop that owns each
     """
 
     session_id: str
@@ -75,6 +77,9 @@ class BotSession:
     created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     otp_event: Optional[threading.Event] = field(default=None, init=False)
     otp_code: Optional[str] = None
+    otp_waiters: List[Tuple[asyncio.AbstractEventLoop, "asyncio.Future[Optional[str]]"]] = field(
+        default_factory=list, init=False, repr=False
+    )
 
     def __post_init__(self):
         """Initialize event after dataclass creation."""
@@ -3,6 +3,7 @@
 This module provides thread-safe session management for OTP delivery.
 """
 
+import asyncio
 import threading
 import uuid
 from datetime import datetime, timezone
@@ -91,6 +92,9 @@ class SessionRegistry:
             if session.phone_number:
                 self._phone_to_session.pop(session.phone_number, None)
 
+            # Release async waiters instead of leaving them until timeout
+            self._resolve_async_waiters(session, None)
+
         logger.info(f"Session unregistered: {session_id}")
         return True
 
@@ -136,10 +140,68 @@ class SessionRegistry:
             session.state = SessionState.OTP_RECEIVED
             if session.otp_event:
                 session.otp_event.set()
+            self._resolve_async_waiters(session, otp_code)
 
         logger.debug(f"Session {session_id} notified with OTP")
         return True
 
+    def add_async_waiter(
+        self,
+        session_id: str,
+        loop: asyncio.AbstractEventLoop,
+        future: "asyncio.Future[Optional[str]]",
+    ) -> bool:
+        """
+        Register an asyncio future to be resolved with the session's OTP.
+
+        If the OTP has already arrived the future is resolved immediately.
+
+        Args:
+            session_id: Session ID
+            loop: Event loop that owns the future
+            future: Future resolved with the OTP code (or None on unregister)
+
+        Returns:
+            True if the session exists
+        """
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if not session:
+                return False
+            if session.otp_code:
+                future.set_result(session.otp_code)
+            else:
+                session.otp_waiters.append((loop, future))
+        return True
+
+    def remove_async_waiter(self, session_id: str, future: "asyncio.Future[Optional[str]]") -> None:
+        """
+        Forget an async waiter (after timeout or cancellation).
+
+        Args:
+            session_id: Session ID
+            future: Future previously passed to add_async_waiter()
+        """
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if session:
+                session.otp_waiters = [w for w in session.otp_waiters if w[1] is not future]
+
+    @staticmethod
+    def _resolve_async_waiters(session: BotSession, otp_code: Optional[str]) -> None:
+        """
+        Hand the OTP to every async waiter on its own event loop.
+
+        Safe to call from IMAP/SMS producer threads (must be called with lock held).
+        """
+        waiters, session.otp_waiters = session.otp_waiters, []
+        for loop, future in waiters:
+            try:
+                loop.call_soon_threadsafe(_set_future_result, future, otp_code)
+            except RuntimeError:
+                # Event loop already closed; nobody is awaiting this future
+                pass
+
     def cleanup_expired(self) -> int:
         """
         Remove expired sessions.
@@ -168,3 +230,9 @@ class SessionRegistry:
         """Get all active sessions."""
         with self._lock:
             return list(self._sessions.values())
+
+
+def _set_future_result(future: "asyncio.Future[Optional[str]]", value: Optional[str]) -> None:
+    """Resolve a future unless its waiter already gave up."""
+    if not future.done():
+        future.set_result(value)
@@ -1,11 +1,17 @@
 """Session management subpackage — orchestration, recovery, and account pooling."""
 
+from .account_availability import AccountAvailability
 from .account_pool import AccountPool, PooledAccount
+from .account_usage_log import AccountUsageLogWriter
+from .mission_index import MissionIndex
 from .session_orchestrator import SessionOrchestrator
 from .session_recovery import SessionRecovery
 
 __all__ = [
+    "AccountAvailability",
     "AccountPool",
+    "AccountUsageLogWriter",
+    "MissionIndex",
     "PooledAccount",
     "SessionOrchestrator",
     "SessionRecovery",
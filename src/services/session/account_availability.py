@@ -0,0 +1,170 @@
+"""Event-driven signal for when an account in the pool may have become usable."""
+
+import asyncio
+import heapq
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, List, Optional, Set
+
+from loguru import logger
+
+from src.constants import NotifyChannels
+
+if TYPE_CHECKING:
+    from src.models.database import Database
+
+# Delay used for expiries that are already due, so a waiter whose clock runs
+# ahead of the database does not spin while NOW() catches up
+_DUE_EXPIRY_DELAY = 0.1
+
+
+class AccountAvailability:
+    """
+    Wakes waiters when an account may have become usable.
+
+    Two sources end a wait:
+
+    - the ``account_pool_changed`` NOTIFY channel (see Alembic revision 018),
+      published when an account is released, reset or reactivated, by any
+      worker or by a manual change in the database;
+    - expiry timers: cooldown/quarantine expiries passed to
+      :meth:`schedule_expiry` are kept in a min-heap, and one event loop timer
+      is armed for the earliest of them.
+
+    A wake only means "re-check": waiters take :meth:`changed_event` before
+    querying the pool and wait on it afterwards, so a change that lands
+    between the query and the wait is not missed. While notifications are
+    unavailable, :attr:`is_listening` is False and callers keep polling.
+    """
+
+    def __init__(self, db: "Database"):
+        """
+        Initialize availability signal.
+
+        Args:
+            db: Database instance
+        """
+        self.db = db
+
+        self._changed = asyncio.Event()
+        self._expiries: List[datetime] = []
+        self._scheduled: Set[datetime] = set()
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._timer_due: Optional[datetime] = None
+        self._started = False
+        self._listening = False
+
+    @property
+    def is_listening(self) -> bool:
+        """Whether change notifications are currently being received."""
+        return self._listening and bool(self.db.notifications_active)
+
+    async def start(self) -> None:
+        """Subscribe to change notifications. Callers fall back to polling on failure."""
+        if self._started:
+            return
+        self._started = True
+        try:
+            await self.db.listen(NotifyChannels.ACCOUNT_POOL, self._on_notification)
+            self._listening = True
+            logger.info("Account availability subscribed to account pool notifications")
+        except Exception as e:
+            logger.warning(
+                f"Account availability could not subscribe to notifications, "
+                f"falling back to polling: {e}"
+            )
+            self._listening = False
+
+    async def stop(self) -> None:
+        """Unsubscribe from change notifications and cancel expiry timers."""
+        if self._listening:
+            try:
+                await self.db.unlisten(NotifyChannels.ACCOUNT_POOL, self._on_notification)
+            except Exception as e:
+                logger.debug(f"Account availability unlisten failed: {e}")
+        self._listening = False
+        self._started = False
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = None
+        self._timer_due = None
+        self._expiries.clear()
+        self._scheduled.clear()
+        # Release anyone still waiting so they re-check and see the shutdown
+        self.notify_changed()
+
+    async def ensure_listening(self) -> bool:
+        """
+        Re-open the LISTEN connection if it was lost.
+
+        Notifications may have been missed while disconnected, so waiters are
+        woken to re-check.
+
+        Returns:
+            True if notifications are being received
+        """
+        if not self._listening:
+            return False
+        if self.db.notifications_active:
+            return True
+        self.notify_changed()
+        return bool(await self.db.ensure_listening())
+
+    def changed_event(self) -> asyncio.Event:
+        """
+        Get the event set by the next change.
+
+        Take it before checking the pool, then wait on it.
+
+        Returns:
+            Event set on the next notification or expiry
+        """
+        return self._changed
+
+    def notify_changed(self) -> None:
+        """Wake everyone waiting on the current changed event."""
+        changed, self._changed = self._changed, asyncio.Event()
+        changed.set()
+
+    def _on_notification(self, payload: str) -> None:
+        """Wake waiters when an account is released, reset or reactivated."""
+        self.notify_changed()
+
+    def schedule_expiry(self, expires_at: Optional[datetime]) -> None:
+        """
+        Wake waiters when a cooldown or quarantine expires.
+
+        Args:
+            expires_at: Expiry time (None is ignored)
+        """
+        if expires_at is None or expires_at in self._scheduled:
+            return
+        self._scheduled.add(expires_at)
+        heapq.heappush(self._expiries, expires_at)
+        if self._timer_due is None or expires_at < self._timer_due:
+            self._arm_timer()
+
+    def _arm_timer(self) -> None:
+        """Arm the event loop timer for the earliest scheduled expiry."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+            self._timer_due = None
+        if not self._expiries:
+            return
+
+        due = self._expiries[0]
+        delay = (due - datetime.now(timezone.utc)).total_seconds()
+        loop = asyncio.get_running_loop()
+        self._timer = loop.call_later(max(delay, _DUE_EXPIRY_DELAY), self._on_expiry)
+        self._timer_due = due
+
+    def _on_expiry(self) -> None:
+        """Drop every expiry that has passed, wake waiters and re-arm."""
+        self._timer = None
+        self._timer_due = None
+        # Loop timers and the wall clock drift slightly; treat near-due expiries as due
+        cutoff = datetime.now(timezone.utc) + timedelta(seconds=_DUE_EXPIRY_DELAY)
+        while self._expiries and self._expiries[0] <= cutoff:
+            self._scheduled.discard(heapq.heappop(self._expiries))
+        self.notify_changed()
+        self._arm_timer()
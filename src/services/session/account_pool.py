@@ -3,7 +3,7 @@
 import asyncio
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import List, Optional
 
 from loguru import logger
 
@@ -11,6 +11,8 @@ from src.constants import AccountPoolConfig
 from src.models.database import Database
 from src.repositories.account_pool_repository import AccountPoolRepository
 
+from .account_availability import AccountAvailability
+
 
 @dataclass
 class PooledAccount:
@@ -61,7 +63,9 @@ class AccountPool:
     """
     Manages VFS account pool with LRU + cooldown hybrid allocation strategy.
 
-    Thread-safe account acquisition and release with:
+    Account acquisition and release are safe for concurrent callers in any
+    process: the database claims rows with FOR UPDATE SKIP LOCKED, so no
+    in-process lock serializes missions. Provides:
     - Cooldown period after each use
     - Quarantine on repeated failures
     - LRU (Least Recently Used) selection among available accounts
@@ -74,6 +78,7 @@ class AccountPool:
         quarantine_seconds: int = AccountPoolConfig.QUARANTINE_SECONDS,
         max_failures: int = AccountPoolConfig.MAX_FAILURES,
         shutdown_event: Optional[asyncio.Event] = None,
+        reconcile_interval: float = AccountPoolConfig.AVAILABILITY_RECONCILE_SECONDS,
     ):
         """
         Initialize account pool.
@@ -84,6 +89,7 @@ class AccountPool:
             quarantine_seconds: Quarantine duration on max failures (default: 1800s / 30 min)
             max_failures: Maximum consecutive failures before quarantine (default: 3)
             shutdown_event: Optional shutdown event for graceful termination
+            reconcile_interval: Longest event-driven wait before re-checking the pool
         """
         self.db = db
         self.repo = AccountPoolRepository(db)
@@ -91,7 +97,8 @@ class AccountPool:
         self.quarantine_seconds = quarantine_seconds
         self.max_failures = max_failures
         self._shutdown_event = shutdown_event
-        self._lock = asyncio.Lock()  # Thread safety for acquire/release operations
+        self.reconcile_interval = reconcile_interval
+        self.availability = AccountAvailability(db)
 
         logger.info(
             f"AccountPool initialized (cooldown={cooldown_seconds}s, "
@@ -120,45 +127,111 @@ class AccountPool:
             await asyncio.sleep(sleep_time)
             return False
 
+    async def _wait_for_change(self, changed: asyncio.Event, timeout: float) -> bool:
+        """
+        Wait for an availability change, the timeout, or shutdown.
+
+        Args:
+            changed: Event from AccountAvailability.changed_event()
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            True if shutdown was signaled, False otherwise
+        """
+        waiters = [asyncio.ensure_future(changed.wait())]
+        if self._shutdown_event is not None:
+            waiters.append(asyncio.ensure_future(self._shutdown_event.wait()))
+        try:
+            await asyncio.wait(waiters, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for waiter in waiters:
+                waiter.cancel()
+        return self._shutdown_event is not None and self._shutdown_event.is_set()
+
+    async def close(self) -> None:
+        """Stop availability notifications and expiry timers."""
+        await self.availability.stop()
+
     async def load_accounts(self) -> int:
         """
         Load and validate accounts from database.
 
         This is mainly for initialization and monitoring purposes.
-        The actual account selection happens in acquire_account().
+        The actual account selection happens in acquire_account(), which
+        decrypts only the password of the account it hands out.
 
         Returns:
             Number of available accounts
         """
-        accounts = await self.repo.get_available_accounts()
-        logger.info(f"Loaded {len(accounts)} available accounts from pool")
-        return len(accounts)
+        summary = await self.repo.get_availability_summary()
+        available = int(summary["available"])
+        logger.info(f"Loaded {available} available accounts from pool")
+        return available
 
     async def acquire_account(self) -> Optional[PooledAccount]:
         """
         Acquire an account from the pool using LRU + cooldown strategy.
 
         Uses atomic SELECT ... FOR UPDATE SKIP LOCKED at the database level
-        to prevent race conditions across multiple workers/instances.
-
-        Thread-safe using both asyncio.Lock (in-process) and database-level locking.
+        to prevent race conditions across concurrent missions, workers and
+        instances, so callers are not serialized in-process.
 
         Returns:
             PooledAccount if available, None otherwise
         """
-        async with self._lock:
-            account_dict = await self.repo.acquire_next_available_account()
+        account_dict = await self.repo.acquire_next_available_account()
 
-            if not account_dict:
-                logger.warning("No available accounts in pool")
-                return None
+        if not account_dict:
+            logger.warning("No available accounts in pool")
+            return None
 
-            account = PooledAccount.from_dict(account_dict)
+        account = PooledAccount.from_dict(account_dict)
+        logger.info(
+            f"Acquired account {account.id} (email: {account.email}, "
+            f"total_uses: {account.total_uses}, last_used: {account.last_used_at})"
+        )
+        return account
+
+    async def acquire_accounts(self, count: int) -> List[PooledAccount]:
+        """
+        Acquire up to ``count`` accounts in a single database statement.
+
+        Same LRU + cooldown selection and row locking as acquire_account(),
+        for callers that start several missions at once.
+
+        Args:
+            count: Maximum number of accounts to acquire
+
+        Returns:
+            Acquired accounts, least recently used first (may be fewer than count)
+        """
+        account_dicts = await self.repo.acquire_available_accounts(count)
+        accounts = [PooledAccount.from_dict(account_dict) for account_dict in account_dicts]
+
+        if len(accounts) < count:
+            logger.warning(f"Acquired {len(accounts)} of {count} requested accounts from pool")
+        for account in accounts:
             logger.info(
                 f"Acquired account {account.id} (email: {account.email}, "
                 f"total_uses: {account.total_uses}, last_used: {account.last_used_at})"
             )
-            return account
+        return accounts
+
+    async def return_unused_accounts(self, accounts: List[PooledAccount]) -> int:
+        """
+        Return accounts that were acquired but never used by a mission.
+
+        Args:
+            accounts: Accounts to put back to 'available'
+
+        Returns:
+            Number of accounts returned
+        """
+        returned = await self.repo.return_unused_accounts([account.id for account in accounts])
+        if returned:
+            logger.info(f"Returned {returned} unused account(s) to pool")
+            self.availability.notify_changed()
+        return returned
 
     async def release_account(
         self,
@@ -182,70 +255,69 @@ class AccountPool:
         Returns:
             True if release successful, False otherwise
         """
-        async with self._lock:
-            now = datetime.now(timezone.utc)
-
-            if result in ("success", "no_slot"):
-                # Success or no slot - cooldown
-                cooldown_until = now + timedelta(seconds=self.cooldown_seconds)
-                success = await self.repo.release_account(
-                    account_id,
-                    result_status=result,
-                    cooldown_until=cooldown_until,
-                )
-                logger.info(
-                    f"Released account {account_id} to cooldown "
-                    f"(result: {result}, cooldown_until: {cooldown_until})"
-                )
-                return success
+        now = datetime.now(timezone.utc)
 
-            elif result in ("login_fail", "error"):
-                # Login failure or error - check for quarantine
-                account = await self.repo.get_account_by_id(account_id, decrypt=False)
-                if not account:
-                    logger.error(f"Account {account_id} not found for release")
-                    return False
+        if result in ("success", "no_slot"):
+            # Success or no slot - cooldown
+            cooldown_until = now + timedelta(seconds=self.cooldown_seconds)
+            success = await self.repo.release_account(
+                account_id,
+                result_status=result,
+                cooldown_until=cooldown_until,
+            )
+            logger.info(
+                f"Released account {account_id} to cooldown "
+                f"(result: {result}, cooldown_until: {cooldown_until})"
+            )
+            if success:
+                self.availability.schedule_expiry(cooldown_until)
+            return success
+
+        elif result in ("login_fail", "error"):
+            # Login failure or error - the repository counts the failure and
+            # quarantines at max_failures in a single UPDATE ... RETURNING
+            quarantine_until = now + timedelta(seconds=self.quarantine_seconds)
+            released = await self.repo.release_failed_account(
+                account_id,
+                result_status=result,
+                max_failures=self.max_failures,
+                quarantine_until=quarantine_until,
+            )
+            if not released:
+                return False
 
-                new_failures = account["consecutive_failures"] + 1
-
-                if new_failures >= self.max_failures:
-                    # Quarantine
-                    quarantine_until = now + timedelta(seconds=self.quarantine_seconds)
-                    success = await self.repo.release_account(
-                        account_id,
-                        result_status=result,
-                        quarantine_until=quarantine_until,
-                    )
-                    logger.warning(
-                        f"Account {account_id} QUARANTINED (failures: {new_failures}, "
-                        f"quarantine_until: {quarantine_until}, error: {error_message})"
-                    )
-                else:
-                    # Not yet at max failures - back to available
-                    success = await self.repo.release_account(
-                        account_id,
-                        result_status=result,
-                    )
-                    logger.info(
-                        f"Released account {account_id} with failure "
-                        f"(result: {result}, failures: {new_failures}, error: {error_message})"
-                    )
-                return success
-
-            elif result == "banned":
-                # Banned - extended quarantine
-                quarantine_until = now + timedelta(seconds=self.quarantine_seconds * 2)
-                success = await self.repo.release_account(
-                    account_id,
-                    result_status=result,
-                    quarantine_until=quarantine_until,
+            new_failures = released["consecutive_failures"]
+            if released["status"] == "quarantine":
+                logger.warning(
+                    f"Account {account_id} QUARANTINED (failures: {new_failures}, "
+                    f"quarantine_until: {quarantine_until}, error: {error_message})"
                 )
-                logger.error(f"Account {account_id} BANNED - quarantined until {quarantine_until}")
-                return success
-
+                self.availability.schedule_expiry(quarantine_until)
             else:
-                logger.error(f"Invalid result status: {result}")
-                return False
+                # Not yet at max failures - back to available
+                logger.info(
+                    f"Released account {account_id} with failure "
+                    f"(result: {result}, failures: {new_failures}, error: {error_message})"
+                )
+                self.availability.notify_changed()
+            return True
+
+        elif result == "banned":
+            # Banned - extended quarantine
+            quarantine_until = now + timedelta(seconds=self.quarantine_seconds * 2)
+            success = await self.repo.release_account(
+                account_id,
+                result_status=result,
+                quarantine_until=quarantine_until,
+            )
+            logger.error(f"Account {account_id} BANNED - quarantined until {quarantine_until}")
+            if success:
+                self.availability.schedule_expiry(quarantine_until)
+            return success
+
+        else:
+            logger.error(f"Invalid result status: {result}")
+            return False
 
     async def get_wait_time(self) -> float:
         """
@@ -258,7 +330,11 @@ class AccountPool:
             Wait time in seconds (0 if accounts available now)
         """
         earliest_cooldown = await self.repo.get_next_available_cooldown_time()
+        return self._seconds_until(earliest_cooldown)
 
+    @staticmethod
+    def _seconds_until(earliest_cooldown: Optional[datetime]) -> float:
+        """Seconds until a cooldown expiry (0 if None or already past)."""
         if earliest_cooldown is None:
             return 0.0
 
@@ -291,7 +367,11 @@ class AccountPool:
         """
         Wait for an account to become available.
 
-        Polls for available accounts, waiting for cooldowns to expire if needed.
+        Waits on AccountAvailability: woken by releases, resets and
+        reactivations from any worker (NOTIFY), and by a timer for the next
+        cooldown or quarantine expiry. Each wake costs one count-only query.
+        While notifications are unavailable, polls instead, sleeping until the
+        next expiry (capped at 60s).
 
         Args:
             timeout: Maximum time to wait in seconds (None = wait indefinitely)
@@ -299,7 +379,8 @@ class AccountPool:
         Returns:
             True if account became available, False if timeout or shutdown requested
         """
-        start_time = datetime.now(timezone.utc)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout if timeout else None
 
         while True:
             # Check for shutdown event
@@ -307,20 +388,40 @@ class AccountPool:
                 logger.info("Shutdown event detected, stopping wait for account")
                 return False
 
-            # Check if account available now
-            available = await self.repo.get_available_accounts()
-            if available:
+            # Taken before the query so a change during it is not missed
+            changed = self.availability.changed_event()
+
+            # Check if account available now (count only - no password decryption)
+            summary = await self.repo.get_availability_summary()
+            if summary["available"] > 0:
                 return True
 
             # Check timeout
-            if timeout:
-                elapsed = (datetime.now(timezone.utc) - start_time).total_seconds()
-                if elapsed >= timeout:
-                    logger.warning(f"Timed out waiting for available account ({timeout}s)")
+            remaining = deadline - loop.time() if deadline is not None else None
+            if remaining is not None and remaining <= 0:
+                logger.warning(f"Timed out waiting for available account ({timeout}s)")
+                return False
+
+            # Subscribe on the first wait; a lost LISTEN connection wakes waiters
+            await self.availability.start()
+            await self.availability.ensure_listening()
+
+            if self.availability.is_listening:
+                self.availability.schedule_expiry(summary["next_cooldown_until"])
+                wait_time = self.reconcile_interval
+                if remaining is not None:
+                    wait_time = min(wait_time, remaining)
+                logger.info(
+                    f"No available accounts - waiting up to {wait_time:.1f}s "
+                    f"for a release or cooldown expiry..."
+                )
+                if await self._wait_for_change(changed, wait_time):
+                    logger.info("Shutdown event detected during account wait")
                     return False
+                continue
 
-            # Calculate wait time
-            wait_time = await self.get_wait_time()
+            # Calculate wait time from the same snapshot
+            wait_time = self._seconds_until(summary["next_cooldown_until"])
             if wait_time <= 0:
                 # No cooldowns but still no available accounts
                 # This could happen if all accounts are quarantined
@@ -0,0 +1,137 @@
+"""Buffered background writer for account_usage_log entries."""
+
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Dict, Optional
+
+from src.constants import AccountPoolConfig
+from src.repositories.account_pool_repository import USAGE_LOG_COLUMNS
+from src.utils.batch_writer import BatchWriter
+
+if TYPE_CHECKING:
+    from src.repositories.account_pool_repository import AccountPoolRepository
+
+
+class AccountUsageLogWriter:
+    """
+    Takes account usage logging off the mission release path.
+
+    Between start() and stop(), log() only queues the entry for a BatchWriter
+    that COPYs account_usage_log rows in batches (see BatchWriter for
+    backpressure and row-by-row retry). Outside start()/stop(), log() inserts
+    the entry directly.
+    """
+
+    def __init__(
+        self,
+        repo: "AccountPoolRepository",
+        queue_size: int = AccountPoolConfig.USAGE_LOG_QUEUE_SIZE,
+        batch_size: int = AccountPoolConfig.USAGE_LOG_BATCH_SIZE,
+        flush_interval: float = AccountPoolConfig.USAGE_LOG_FLUSH_INTERVAL_SECONDS,
+        enqueue_timeout: float = AccountPoolConfig.USAGE_LOG_ENQUEUE_TIMEOUT_SECONDS,
+    ):
+        """
+        Initialize usage log writer.
+
+        Args:
+            repo: Account pool repository whose database receives the entries
+            queue_size: Pending entries held before log() applies backpressure
+            batch_size: Maximum entries written per flush
+            flush_interval: Seconds the writer waits to fill a batch
+            enqueue_timeout: Seconds log() waits for queue space before dropping
+        """
+        self.repo = repo
+        # Entries are queued as rows already in USAGE_LOG_COLUMNS order
+        self._pipeline: BatchWriter[tuple] = BatchWriter(
+            name="account_usage_log",
+            table="account_usage_log",
+            columns=USAGE_LOG_COLUMNS,
+            to_row=lambda row: row,
+            get_db=lambda: self.repo.db,
+            queue_size=queue_size,
+            batch_size=batch_size,
+            flush_interval=flush_interval,
+            enqueue_timeout=enqueue_timeout,
+        )
+
+    @property
+    def is_running(self) -> bool:
+        """Whether log() is queueing entries for the background writer."""
+        return self._pipeline.is_running
+
+    async def start(self) -> None:
+        """Start the queue and the background writer task."""
+        await self._pipeline.start()
+
+    async def stop(
+        self, timeout: float = AccountPoolConfig.USAGE_LOG_DRAIN_TIMEOUT_SECONDS
+    ) -> None:
+        """
+        Flush queued entries and stop the writer.
+
+        Entries logged after stop() begins are inserted directly.
+
+        Args:
+            timeout: Seconds to wait for the queue to drain
+        """
+        await self._pipeline.stop(timeout)
+
+    def get_metrics(self) -> Dict[str, int]:
+        """
+        Get writer counters.
+
+        Returns:
+            Dictionary with enqueued/written/dropped counts, backpressure waits,
+            flushes, write errors, and current queue depth and capacity
+        """
+        return self._pipeline.get_metrics()
+
+    async def log(
+        self,
+        account_id: int,
+        mission_code: str,
+        session_number: int,
+        result: str,
+        started_at: datetime,
+        request_id: Optional[int] = None,
+        error_message: Optional[str] = None,
+        completed_at: Optional[datetime] = None,
+    ) -> None:
+        """
+        Record one account usage.
+
+        Args:
+            account_id: Account ID
+            mission_code: Mission/country code
+            session_number: Session number
+            result: Result status ('success', 'no_slot', 'login_fail', 'error', 'banned')
+            started_at: Usage start timestamp
+            request_id: Optional appointment request ID
+            error_message: Optional error message
+            completed_at: Optional completion timestamp (defaults to now)
+        """
+        completed_at = completed_at or datetime.now(timezone.utc)
+        if not self._pipeline.is_running:
+            await self.repo.log_usage(
+                account_id=account_id,
+                mission_code=mission_code,
+                session_number=session_number,
+                result=result,
+                started_at=started_at,
+                request_id=request_id,
+                error_message=error_message,
+                completed_at=completed_at,
+            )
+            return
+
+        await self._pipeline.put(
+            (
+                account_id,
+                mission_code,
+                session_number,
+                request_id,
+                result,
+                error_message,
+                started_at,
+                completed_at,
+            )
+        )
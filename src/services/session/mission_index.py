@@ -0,0 +1,164 @@
+"""In-process index of pending appointment requests grouped by mission."""
+
+import asyncio
+import time
+from typing import TYPE_CHECKING, Dict, List, Optional, Set
+
+from loguru import logger
+
+from src.constants import AccountPoolConfig, NotifyChannels
+from src.repositories.appointment_request_repository import (
+    AppointmentRequest,
+    AppointmentRequestRepository,
+)
+
+if TYPE_CHECKING:
+    from src.models.database import Database
+
+
+class MissionIndex:
+    """
+    Keeps pending appointment requests grouped by country_code between sessions.
+
+    The index is loaded once and then kept current from the
+    ``appointment_requests_changed`` NOTIFY channel (see Alembic revision 013):
+    each notification marks a request ID dirty, and only dirty requests are
+    re-read before the next snapshot. A full reload runs every
+    ``reconcile_interval`` seconds to guard against drift, and on every call
+    while notifications are unavailable (same cost as the previous behaviour).
+    """
+
+    def __init__(
+        self,
+        db: "Database",
+        appointment_request_repo: Optional[AppointmentRequestRepository] = None,
+        reconcile_interval: float = AccountPoolConfig.MISSION_INDEX_RECONCILE_SECONDS,
+    ):
+        """
+        Initialize mission index.
+
+        Args:
+            db: Database instance
+            appointment_request_repo: Repository used to load requests
+            reconcile_interval: Seconds between full reloads
+        """
+        self.db = db
+        self.appointment_request_repo = appointment_request_repo or AppointmentRequestRepository(db)
+        self.reconcile_interval = reconcile_interval
+
+        self._requests: Dict[int, AppointmentRequest] = {}
+        self._snapshot: Optional[Dict[str, List[AppointmentRequest]]] = None
+        self._dirty_ids: Set[int] = set()
+        self._needs_reload = True
+        self._last_reload: float = 0.0
+        self._started = False
+        self._listening = False
+        self._lock = asyncio.Lock()
+
+    @property
+    def is_listening(self) -> bool:
+        """Whether change notifications are currently being received."""
+        return self._listening and bool(self.db.notifications_active)
+
+    async def start(self) -> None:
+        """Subscribe to change notifications. Falls back to full reloads on failure."""
+        if self._started:
+            return
+        self._started = True
+        try:
+            await self.db.listen(NotifyChannels.APPOINTMENT_REQUESTS, self._on_notification)
+            self._listening = True
+            logger.info("Mission index subscribed to appointment request notifications")
+        except Exception as e:
+            logger.warning(
+                f"Mission index could not subscribe to notifications, "
+                f"falling back to full reload per session: {e}"
+            )
+            self._listening = False
+
+    async def stop(self) -> None:
+        """Unsubscribe from change notifications."""
+        if self._listening:
+            try:
+                await self.db.unlisten(NotifyChannels.APPOINTMENT_REQUESTS, self._on_notification)
+            except Exception as e:
+                logger.debug(f"Mission index unlisten failed: {e}")
+        self._listening = False
+        self._started = False
+        self._needs_reload = True
+
+    def _on_notification(self, payload: str) -> None:
+        """Mark the request named in a notification payload as dirty."""
+        try:
+            self._dirty_ids.add(int(payload))
+        except (TypeError, ValueError):
+            logger.warning(f"Unexpected mission index notification payload: {payload!r}")
+            self._needs_reload = True
+
+    async def get_missions(self) -> Dict[str, List[AppointmentRequest]]:
+        """
+        Get pending appointment requests grouped by mission (country_code).
+
+        Returns:
+            Dictionary mapping lowercase country_code to requests, newest first
+        """
+        async with self._lock:
+            if not self._started:
+                await self.start()
+
+            if self._listening and not self.db.notifications_active:
+                # Notifications were missed while disconnected
+                self._needs_reload = True
+                await self.db.ensure_listening()
+
+            reconcile_due = time.monotonic() - self._last_reload >= self.reconcile_interval
+            if self._needs_reload or reconcile_due or not self.is_listening:
+                await self._reload()
+            elif self._dirty_ids:
+                await self._apply_changes()
+
+            if self._snapshot is None:
+                self._snapshot = self._build_snapshot()
+
+            return {code: list(requests) for code, requests in self._snapshot.items()}
+
+    async def _reload(self) -> None:
+        """Replace the index with a full read of pending requests."""
+        # Changes notified from here on are re-applied after the reload
+        self._dirty_ids.clear()
+        pending = await self.appointment_request_repo.get_all(status="pending")
+
+        self._requests = {request.id: request for request in pending}
+        self._snapshot = None
+        self._needs_reload = False
+        self._last_reload = time.monotonic()
+        logger.debug(f"Mission index reloaded: {len(self._requests)} pending requests")
+
+    async def _apply_changes(self) -> None:
+        """Re-read only the requests named in notifications since the last snapshot."""
+        changed_ids = self._dirty_ids
+        self._dirty_ids = set()
+
+        try:
+            refreshed = await self.appointment_request_repo.get_by_ids(sorted(changed_ids))
+        except Exception:
+            # Changes are lost from the dirty set; recover with a full reload next time
+            self._needs_reload = True
+            raise
+
+        for request_id in changed_ids:
+            self._requests.pop(request_id, None)
+        for request in refreshed:
+            if request.status == "pending":
+                self._requests[request.id] = request
+
+        self._snapshot = None
+        logger.debug(f"Mission index applied {len(changed_ids)} change(s)")
+
+    def _build_snapshot(self) -> Dict[str, List[AppointmentRequest]]:
+        """Group indexed requests by lowercase country_code, newest first."""
+        ordered = sorted(self._requests.values(), key=lambda r: (r.created_at, r.id), reverse=True)
+        missions: Dict[str, List[AppointmentRequest]] = {}
+        for request in ordered:
+            missions.setdefault(request.country_code.lower(), []).append(request)
+        return missions
@@ -2,7 +2,7 @@
 
 import asyncio
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
 from loguru import logger
 from playwright.async_api import Page
@@ -13,10 +13,13 @@ from src.repositories.account_pool_repository import AccountPoolRepository
 from src.repositories.appointment_request_repository import AppointmentRequestRepository
 
 from .account_pool import AccountPool, PooledAccount
+from .account_usage_log import AccountUsageLogWriter
+from .mission_index import MissionIndex
 
 if TYPE_CHECKING:
     from src.services.bot.booking_workflow import BookingWorkflow
     from src.services.bot.browser_manager import BrowserManager
+    from src.services.bot.browser_pool import BrowserLease, BrowserPool
 
 
 class SessionOrchestrator:
@@ -38,6 +41,8 @@ class SessionOrchestrator:
         booking_workflow: "BookingWorkflow",
         browser_manager: "BrowserManager",
         max_concurrent_missions: int = AccountPoolConfig.MAX_CONCURRENT_MISSIONS,
+        mission_index: Optional[MissionIndex] = None,
+        browser_pool: Optional["BrowserPool"] = None,
     ):
         """
         Initialize session orchestrator.
@@ -48,15 +53,21 @@ class SessionOrchestrator:
             booking_workflow: Booking workflow instance
             browser_manager: Browser manager instance
             max_concurrent_missions: Maximum concurrent missions per session
+            mission_index: Pending-request index (created from db if not provided)
+            browser_pool: Warm browser pool to lease mission contexts from; without
+                one, each mission launches and closes its own browser
         """
         self.db = db
         self.account_pool = account_pool
         self.booking_workflow = booking_workflow
         self.browser_manager = browser_manager
+        self.browser_pool = browser_pool
         self.max_concurrent_missions = max_concurrent_missions
 
         self.appointment_request_repo = AppointmentRequestRepository(db)
         self.account_pool_repo = AccountPoolRepository(db)
+        self.usage_log = AccountUsageLogWriter(self.account_pool_repo)
+        self.mission_index = mission_index or MissionIndex(db, self.appointment_request_repo)
 
         self.session_number = 0
         self._semaphore = asyncio.Semaphore(max_concurrent_missions)
@@ -69,27 +80,29 @@ class SessionOrchestrator:
         """
         Get active pending appointment requests grouped by mission (country_code).
 
+        Served from the incrementally maintained MissionIndex, so only requests
+        changed since the previous session are re-read from the database.
+
         Returns:
             Dictionary mapping country_code to list of appointment requests
             Example: {"fr": [request1, request2], "be": [request3]}
         """
-        # Get all pending appointment requests
-        all_pending = await self.appointment_request_repo.get_all(status="pending")
-
-        # Group by country_code (mission)
-        missions: Dict[str, List[Any]] = {}
-        for request in all_pending:
-            country_code = request.country_code.lower()
-            if country_code not in missions:
-                missions[country_code] = []
-            missions[country_code].append(request)
+        missions = await self.mission_index.get_missions()
+        pending_count = sum(len(requests) for requests in missions.values())
 
         logger.info(
-            f"Found {len(all_pending)} pending requests across {len(missions)} missions: "
+            f"Found {pending_count} pending requests across {len(missions)} missions: "
             f"{list(missions.keys())}"
         )
         return missions
 
+    async def close(self) -> None:
+        """Release background resources (mission index, usage log writer, browser pool)."""
+        await self.mission_index.stop()
+        await self.usage_log.stop()
+        if self.browser_pool:
+            await self.browser_pool.close_all()
+
     async def run_session(self) -> Dict[str, Any]:
         """
         Run one complete session cycle.
@@ -120,16 +133,36 @@ class SessionOrchestrator:
                 "duration_seconds": 0,
             }
 
-        # Process missions in parallel (up to max_concurrent_missions)
-        tasks = []
-        for mission_code, requests in missions.items():
-            task = asyncio.create_task(
-                self._process_mission_with_semaphore(mission_code, requests),
-                name=f"session_{self.session_number}_mission_{mission_code}",
+        # Usage entries are written in batches off the release path
+        await self.usage_log.start()
+
+        # Claim accounts for the missions that start right away in one statement;
+        # later missions acquire their own as concurrency slots free up
+        claims: Dict[str, PooledAccount] = {}
+        try:
+            claimed = await self.account_pool.acquire_accounts(
+                min(len(missions), self.max_concurrent_missions)
             )
-            tasks.append(task)
+            claims = dict(zip(missions, claimed))
+        except Exception as e:
+            logger.error(f"Batch account acquisition failed, acquiring per mission: {e}")
+
+        # Process missions in parallel (up to max_concurrent_missions)
+        try:
+            tasks = []
+            for mission_code, requests in missions.items():
+                task = asyncio.create_task(
+                    self._process_mission_with_semaphore(mission_code, requests, claims),
+                    name=f"session_{self.session_number}_mission_{mission_code}",
+                )
+                tasks.append(task)
 
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            # Missions take their claim when they start; return any never started
+            # (session cancelled, task creation failed) so they do not stay in_use
+            if claims:
+                await self.account_pool.return_unused_accounts(list(claims.values()))
 
         # Compile session summary
         session_end = datetime.now(timezone.utc)
@@ -157,8 +190,9 @@ class SessionOrchestrator:
             f"(duration: {duration:.1f}s, missions: {len(missions)}) =========="
         )
 
-        # Note: Each mission now creates and closes its own isolated BrowserManager instance,
-        # so there's no need to restart the shared browser_manager after the session.
+        # Note: Each mission gets its own isolated browser context (leased from the pool, or
+        # a dedicated BrowserManager without one), so there's no need to restart the shared
+        # browser_manager after the session.
         # The shared browser_manager is retained for backwards compatibility and potential
         # future use cases, but is no longer used by mission processing.
 
@@ -168,6 +202,7 @@ class SessionOrchestrator:
         self,
         mission_code: str,
         requests: List[Any],
+        claims: Optional[Dict[str, PooledAccount]] = None,
     ) -> Dict[str, Any]:
         """
         Process a mission with semaphore for concurrency control.
@@ -175,12 +210,17 @@ class SessionOrchestrator:
         Args:
             mission_code: Mission/country code
             requests: List of appointment requests for this mission
+            claims: Accounts claimed for the session's missions, by mission code;
+                this mission's claim is removed once _process_mission() owns it
 
         Returns:
             Mission processing result
         """
         async with self._semaphore:
-            return await self._process_mission(mission_code, requests)
+            # No await between taking the claim and _process_mission()'s
+            # try/finally, which releases the account
+            account = claims.pop(mission_code, None) if claims else None
+            return await self._process_mission(mission_code, requests, account)
 
     async def _acquire_account(
         self,
@@ -243,7 +283,7 @@ class SessionOrchestrator:
 
         Args:
             page: Playwright Page to close, or None if never opened
-            browser: BrowserManager instance to close, or None if never started
+            browser: BrowserLease or BrowserManager to close, or None if never started
             mission_code: Mission/country code for log messages
         """
         if page:
@@ -274,7 +314,7 @@ class SessionOrchestrator:
         error_message: Optional[str],
     ) -> None:
         """
-        Log account usage and release the account back to the pool.
+        Queue the account usage entry and release the account back to the pool.
 
         Args:
             account: PooledAccount to release
@@ -291,7 +331,7 @@ class SessionOrchestrator:
             request_ids = [req.id for req in requests] if requests else []
             primary_request_id = request_ids[0] if request_ids else None
 
-            await self.account_pool_repo.log_usage(
+            await self.usage_log.log(
                 account_id=account.id,
                 mission_code=mission_code,
                 session_number=self.session_number,
@@ -322,12 +362,13 @@ class SessionOrchestrator:
         self,
         mission_code: str,
         requests: List[Any],
+        account: Optional[PooledAccount] = None,
     ) -> Dict[str, Any]:
         """
         Process a single mission (country).
 
-        1. Acquire account from pool
-        2. Create isolated browser instance for this mission
+        1. Acquire account from pool (unless one was claimed for the mission)
+        2. Lease an isolated browser context (or create a browser) for this mission
         3. Open browser page
         4. Process appointment requests with booking workflow
         5. Release account with result
@@ -336,6 +377,7 @@ class SessionOrchestrator:
         Args:
             mission_code: Mission/country code
             requests: List of appointment requests for this mission
+            account: Account already acquired for this mission (acquired here if None)
 
         Returns:
             Mission processing result
@@ -346,14 +388,18 @@ class SessionOrchestrator:
         )
 
         started_at = datetime.now(timezone.utc)
-        account: Optional[PooledAccount] = None
-        mission_browser = None
+        mission_browser: Optional[Union["BrowserLease", "BrowserManager"]] = None
         page: Optional[Page] = None
         result = "error"
         error_message = None
 
         try:
-            account = await self._acquire_account(mission_code, requests)
+            if account is None:
+                account = await self._acquire_account(mission_code, requests)
+            else:
+                logger.info(
+                    f"Mission {mission_code.upper()}: Using account {account.id} ({account.email})"
+                )
             if not account:
                 return {
                     "status": "no_account",
@@ -361,9 +407,15 @@ class SessionOrchestrator:
                     "requests_count": len(requests),
                 }
 
-            logger.info(f"Starting isolated browser instance for mission {mission_code.upper()}")
-            mission_browser = self._create_mission_browser()
-            await mission_browser.start()
+            if self.browser_pool:
+                logger.info(f"Leasing isolated browser context for mission {mission_code.upper()}")
+                mission_browser = await self.browser_pool.lease()
+            else:
+                logger.info(
+                    f"Starting isolated browser instance for mission {mission_code.upper()}"
+                )
+                mission_browser = self._create_mission_browser()
+                await mission_browser.start()
 
             page = await mission_browser.new_page()
 
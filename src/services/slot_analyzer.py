@@ -1,12 +1,21 @@
-"""Slot pattern analysis and reporting."""
+"""Slot pattern analysis and reporting.
+
+Found slots are appended to a JSON Lines log and counted into per-hour
+buckets (UTC hour -> country -> centre -> count) as they are written, so
+analytics cost scales with the number of buckets rather than the number of
+recorded slots and history is not capped. A snapshot of the buckets and the
+log offset they cover is saved periodically; loading reads the snapshot and
+replays only the log tail written after it.
+"""
 
 import asyncio
 import json
+import os
 import threading
 from collections import defaultdict
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 from loguru import logger
 
@@ -14,65 +23,231 @@ from loguru import logger
 _BATCH_SIZE = 10  # Write to disk every N records (async)
 _BATCH_INTERVAL = 60.0  # Or every 60 seconds (whichever comes first)
 
-# Retention limit to prevent unbounded growth
-_MAX_SLOT_RECORDS = 10_000  # Maximum number of slot records to keep
+# Save a bucket snapshot after this many appended records (and on flush)
+_SNAPSHOT_EVERY = 5_000
+
+_SNAPSHOT_VERSION = 1
+_HOUR_KEY_FORMAT = "%Y-%m-%dT%H"
+
+# hour key ("2026-10-16T09", UTC) -> country -> centre -> slots found
+Buckets = Dict[str, Dict[str, Dict[str, int]]]
+
+
+def _hour_key(found_at: str) -> str:
+    """
+    Get the UTC hour bucket key for an ISO timestamp.
+
+    Timezone-naive timestamps (older records) are treated as UTC.
+
+    Args:
+        found_at: ISO 8601 timestamp
+
+    Returns:
+        Bucket key such as "2026-10-16T09"
+
+    Raises:
+        ValueError: If found_at is not a valid ISO timestamp
+    """
+    moment = datetime.fromisoformat(found_at)
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(timezone.utc)
+    return moment.strftime(_HOUR_KEY_FORMAT)
 
 
 class SlotPatternAnalyzer:
-    """Analyze and report slot availability patterns."""
+    """
+    Analyze and report slot availability patterns.
+
+    One process should record slots into a given log; any number of
+    instances (e.g. the dashboard in a separate web process) can read it and
+    pick up newly appended records on their next analysis.
+    """
+
+    def __init__(self, data_file: str = "data/slot_patterns.jsonl"):
+        """
+        Initialize analyzer, loading counters from the snapshot and log tail.
 
-    def __init__(self, data_file: str = "data/slot_patterns.json"):
+        A legacy ``slot_patterns.json`` next to the log is imported once and
+        renamed to ``slot_patterns.json.migrated``.
+
+        Args:
+            data_file: Path of the append-only slot log
+        """
         self.data_file = Path(data_file)
+        self.snapshot_file = self.data_file.with_name(f"{self.data_file.stem}.buckets.json")
         self.data_file.parent.mkdir(parents=True, exist_ok=True)
-        self._patterns: Dict[str, Any] = self._load_data()
-        self._pending_writes = 0
-        self._last_save_time = datetime.now(timezone.utc)
-        self._lock = threading.Lock()  # Protect batch write state
 
-    def _load_data(self) -> Dict[str, Any]:
-        """Load existing pattern data from file."""
-        if self.data_file.exists():
-            try:
-                with open(self.data_file, "r", encoding="utf-8") as f:
-                    data: Dict[str, Any] = json.load(f)
-                    # Enforce retention on load
-                    self._enforce_retention(data)
-                    return data
-            except Exception as e:
-                logger.error(f"Failed to load pattern data: {e}")
-        return {"slots": [], "stats": {}}
-
-    def _save_data_sync(self) -> None:
-        """Save pattern data to file."""
+        self._lock = threading.Lock()  # Protect pending records and batch write state
+        self._io_lock = threading.Lock()  # Protect buckets, log offset and file access
+        self._pending: List[Dict[str, Any]] = []
+        self._last_save_time = datetime.now(timezone.utc)
+        self._buckets: Buckets = {}
+        self._log_offset = 0
+        self._since_snapshot = 0
+
+        with self._io_lock:
+            self._load_snapshot()
+            self._migrate_legacy_file()
+            replayed = self._replay_tail()
+        if replayed:
+            logger.debug(f"Replayed {replayed} slot records from {self.data_file}")
+
+    def _load_snapshot(self) -> None:
+        """Load bucket counters and the log offset they cover."""
+        if not self.snapshot_file.exists():
+            return
         try:
-            # Enforce retention before saving
-            self._enforce_retention(self._patterns)
-            with open(self.data_file, "w", encoding="utf-8") as f:
-                json.dump(self._patterns, f, indent=2, ensure_ascii=False)
-            with self._lock:
-                self._pending_writes = 0
-                self._last_save_time = datetime.now(timezone.utc)
+            with open(self.snapshot_file, "r", encoding="utf-8") as f:
+                snapshot: Dict[str, Any] = json.load(f)
+            if snapshot.get("version") != _SNAPSHOT_VERSION:
+                raise ValueError(f"unsupported snapshot version {snapshot.get('version')}")
+            self._buckets = snapshot["buckets"]
+            self._log_offset = int(snapshot["log_offset"])
         except Exception as e:
-            logger.error(f"Failed to save pattern data: {e}")
+            logger.error(f"Failed to load slot pattern snapshot, rebuilding from log: {e}")
+            self._buckets = {}
+            self._log_offset = 0
+
+    def _save_snapshot(self) -> None:
+        """Atomically write bucket counters and the covered log offset."""
+        tmp_file = self.snapshot_file.with_name(f"{self.snapshot_file.name}.tmp")
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "version": _SNAPSHOT_VERSION,
+                    "log_offset": self._log_offset,
+                    "buckets": self._buckets,
+                },
+                f,
+                ensure_ascii=False,
+                separators=(",", ":"),
+            )
+        os.replace(tmp_file, self.snapshot_file)
+        self._since_snapshot = 0
+
+    def _migrate_legacy_file(self) -> None:
+        """Import records from the previous whole-file JSON store."""
+        legacy_file = self.data_file.with_suffix(".json")
+        if legacy_file == self.data_file or not legacy_file.exists():
+            return
+        migrated_file = legacy_file.with_name(f"{legacy_file.name}.migrated")
+        try:
+            # Rename before importing so a failure part-way never re-imports on next start
+            legacy_file.rename(migrated_file)
+            with open(migrated_file, "r", encoding="utf-8") as f:
+                slots = json.load(f).get("slots", [])
+            self._append_records(slots)
+            logger.info(f"Migrated {len(slots)} slot records from {legacy_file}")
+        except Exception as e:
+            logger.error(f"Failed to migrate legacy slot pattern data: {e}")
+
+    def _count(self, record: Dict[str, Any], buckets: Optional[Buckets] = None) -> None:
+        """
+        Add one record to the bucket counters.
+
+        Args:
+            record: Slot record with found_at, country and centre
+            buckets: Counters to update (defaults to the analyzer's own)
+
+        Raises:
+            ValueError: If found_at is not a valid ISO timestamp
+            KeyError: If a required field is missing
+        """
+        target = self._buckets if buckets is None else buckets
+        centres = target.setdefault(_hour_key(record["found_at"]), {}).setdefault(
+            record["country"], {}
+        )
+        centres[record["centre"]] = centres.get(record["centre"], 0) + 1
+
+    def _replay_tail(self) -> int:
+        """
+        Count records appended to the log since the current offset.
+
+        A trailing line without a newline (a write in progress) is left for
+        the next replay. Caller must hold ``_io_lock``.
 
-    @staticmethod
-    def _enforce_retention(data: Dict[str, Any]) -> None:
+        Returns:
+            Number of records counted
         """
-        Enforce retention policy by trimming slots list to max size.
+        try:
+            size = self.data_file.stat().st_size
+        except FileNotFoundError:
+            size = 0
+        if size < self._log_offset:
+            logger.warning(f"{self.data_file} shrank below the snapshot offset, rebuilding")
+            self._buckets = {}
+            self._log_offset = 0
+        if size == self._log_offset:
+            return 0
+
+        replayed = 0
+        with open(self.data_file, "rb") as f:
+            f.seek(self._log_offset)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                self._log_offset += len(line)
+                try:
+                    self._count(json.loads(line))
+                except (ValueError, KeyError, TypeError):
+                    continue
+                replayed += 1
+        self._since_snapshot += replayed
+        return replayed
+
+    def _append_records(self, records: Iterable[Dict[str, Any]]) -> int:
+        """
+        Append records to the log and count them. Caller must hold ``_io_lock``.
+
+        Args:
+            records: Slot records to store
 
-        Removes oldest records (FIFO) when limit is exceeded.
+        Returns:
+            Number of records appended
+        """
+        # Pick up anything appended by another writer so offsets stay aligned
+        self._replay_tail()
+
+        lines = []
+        appended = 0
+        for record in records:
+            try:
+                self._count(record)
+            except (ValueError, KeyError, TypeError) as e:
+                logger.warning(f"Skipping invalid slot record: {e}")
+                continue
+            lines.append(json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n")
+            appended += 1
+        if not lines:
+            return 0
+
+        data = "".join(lines).encode("utf-8")
+        with open(self.data_file, "ab") as f:
+            f.write(data)
+        self._log_offset += len(data)
+        self._since_snapshot += appended
+        if self._since_snapshot >= _SNAPSHOT_EVERY:
+            self._save_snapshot()
+        return appended
+
+    def _save_data_sync(self, snapshot: bool = False) -> None:
+        """
+        Append pending records to the log.
 
         Args:
-            data: Pattern data dictionary to enforce retention on
+            snapshot: Also save the bucket snapshot regardless of how many
+                records were appended since the last one
         """
-        slots = data.get("slots", [])
-        if len(slots) > _MAX_SLOT_RECORDS:
-            # Keep only the most recent records
-            data["slots"] = slots[-_MAX_SLOT_RECORDS:]
-            logger.info(
-                f"Enforced retention: trimmed {len(slots) - _MAX_SLOT_RECORDS} old slot records "
-                f"(kept {_MAX_SLOT_RECORDS} most recent)"
-            )
+        try:
+            with self._io_lock:
+                with self._lock:
+                    pending, self._pending = self._pending, []
+                    self._last_save_time = datetime.now(timezone.utc)
+                self._append_records(pending)
+                if snapshot and self._since_snapshot:
+                    self._save_snapshot()
+        except Exception as e:
+            logger.error(f"Failed to save pattern data: {e}")
 
     async def record_slot_found_async(
         self,
@@ -96,10 +271,9 @@ class SlotPatternAnalyzer:
             "found_weekday": now.strftime("%A"),
             "duration_seconds": duration_seconds,
         }
-        self._patterns["slots"].append(record)
 
         with self._lock:
-            self._pending_writes += 1
+            self._pending.append(record)
 
         logger.info(f"Slot pattern recorded: {country}/{centre}")
 
@@ -111,58 +285,74 @@ class SlotPatternAnalyzer:
         should_save = False
 
         with self._lock:
-            if self._pending_writes >= _BATCH_SIZE:
+            if len(self._pending) >= _BATCH_SIZE:
                 should_save = True
             else:
                 elapsed = (datetime.now(timezone.utc) - self._last_save_time).total_seconds()
-                if elapsed >= _BATCH_INTERVAL and self._pending_writes > 0:
+                if elapsed >= _BATCH_INTERVAL and self._pending:
                     should_save = True
 
         if should_save:
             await asyncio.to_thread(self._save_data_sync)
 
     async def flush(self) -> None:
-        """Force write any pending data to disk."""
+        """Force write any pending data and the bucket snapshot to disk."""
         with self._lock:
-            pending = self._pending_writes
+            pending = len(self._pending)
 
+        await asyncio.to_thread(self._save_data_sync, True)
         if pending > 0:
-            await asyncio.to_thread(self._save_data_sync)
             logger.info(f"Flushed {pending} pending slot records to disk")
 
     def analyze_patterns(self, days: int = 30) -> Dict[str, Any]:
-        """Analyze patterns from the last N days."""
-        cutoff = datetime.now(timezone.utc) - timedelta(days=days)
-        recent_slots = []
-        for s in self._patterns.get("slots", []):
-            try:
-                # Support both timezone-aware and naive datetime strings for backward compatibility
-                found_at = datetime.fromisoformat(s["found_at"])
-                # Make timezone-naive datetimes UTC-aware for comparison
-                if found_at.tzinfo is None:
-                    found_at = found_at.replace(tzinfo=timezone.utc)
-                if found_at > cutoff:
-                    recent_slots.append(s)
-            except (ValueError, KeyError):
-                continue
+        """
+        Analyze patterns from the last N days.
 
-        if not recent_slots:
-            return {"message": "Insufficient data"}
+        The window is applied at UTC hour granularity. Records appended to
+        the log by another process since the last call are counted first.
 
-        # Hourly analysis
-        hour_counts: Dict[int, int] = defaultdict(int)
-        for slot in recent_slots:
-            hour_counts[slot["found_hour"]] += 1
+        Args:
+            days: Number of days to analyze
 
-        # Daily analysis
-        day_counts: Dict[str, int] = defaultdict(int)
-        for slot in recent_slots:
-            day_counts[slot["found_weekday"]] += 1
+        Returns:
+            Analysis with best hours, days and centres, or a message when
+            there is no data in the window
+        """
+        cutoff_key = (datetime.now(timezone.utc) - timedelta(days=days)).strftime(_HOUR_KEY_FORMAT)
+
+        with self._io_lock:
+            self._replay_tail()
+            recent: Buckets = {
+                hour: countries for hour, countries in self._buckets.items() if hour >= cutoff_key
+            }
+            with self._lock:
+                pending = list(self._pending)
+        if pending:
+            # Count unsaved records into a copy so the shared buckets stay log-aligned
+            recent = {
+                hour: {country: dict(centres) for country, centres in countries.items()}
+                for hour, countries in recent.items()
+            }
+            for record in pending:
+                if _hour_key(record["found_at"]) >= cutoff_key:
+                    self._count(record, recent)
 
-        # Centre-based analysis
+        hour_counts: Dict[int, int] = defaultdict(int)
+        day_counts: Dict[str, int] = defaultdict(int)
         centre_counts: Dict[str, int] = defaultdict(int)
-        for slot in recent_slots:
-            centre_counts[slot["centre"]] += 1
+        total = 0
+        for hour, countries in recent.items():
+            hour_total = 0
+            for centres in countries.values():
+                for centre, count in centres.items():
+                    centre_counts[centre] += count
+                    hour_total += count
+            hour_counts[int(hour[11:13])] += hour_total
+            day_counts[datetime.strptime(hour, _HOUR_KEY_FORMAT).strftime("%A")] += hour_total
+            total += hour_total
+
+        if not total:
+            return {"message": "Insufficient data"}
 
         # Best hours (top 3)
         best_hours = sorted(hour_counts.items(), key=lambda x: x[1], reverse=True)[:3]
@@ -175,11 +365,11 @@ class SlotPatternAnalyzer:
 
         return {
             "period_days": days,
-            "total_slots_found": len(recent_slots),
+            "total_slots_found": total,
             "best_hours": [{"hour": f"{h}:00", "count": c} for h, c in best_hours],
             "best_days": [{"day": d, "count": c} for d, c in best_days],
             "best_centres": [{"centre": c, "count": cnt} for c, cnt in best_centres],
-            "avg_slots_per_day": round(len(recent_slots) / days, 2),
+            "avg_slots_per_day": round(total / days, 2),
         }
 
     def generate_weekly_report(self) -> str:
@@ -209,3 +399,24 @@ class SlotPatternAnalyzer:
             report += f"  • {c['centre']} - {c['count']} slot\n"
 
         return report
+
+
+# Global slot pattern analyzer instance
+_slot_analyzer: Optional[SlotPatternAnalyzer] = None
+_slot_analyzer_lock = threading.Lock()
+
+
+def get_slot_analyzer() -> SlotPatternAnalyzer:
+    """
+    Get or create slot pattern analyzer singleton.
+
+    Returns:
+        SlotPatternAnalyzer instance
+    """
+    global _slot_analyzer
+    if _slot_analyzer is not None:
+        return _slot_analyzer
+    with _slot_analyzer_lock:
+        if _slot_analyzer is None:
+            _slot_analyzer = SlotPatternAnalyzer()
+        return _slot_analyzer
@@ -7,10 +7,13 @@ from datetime import datetime, timezone
 from enum import Enum
 from functools import wraps
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Union
+from typing import IO, TYPE_CHECKING, Any, Callable, Dict, List, Optional, Union
 
 from loguru import logger
 
+from ..constants import AuditLogConfig
+from .batch_writer import BatchWriter
+
 if TYPE_CHECKING:
     from ..models.database import Database
 
@@ -75,8 +78,21 @@ class AuditLogger:
     - Database persistence
     - JSONL file output for long-term storage
     - Structured logging
+    - Optional batched pipeline (start()/stop()): a BatchWriter that COPYs
+      events in batches and appends each batch through one open JSONL handle
     """
 
+    _DB_COLUMNS = [
+        "action",
+        "user_id",
+        "username",
+        "ip_address",
+        "user_agent",
+        "details",
+        "timestamp",
+        "success",
+    ]
+
     SENSITIVE_KEYS = {
         "password",
         "token",
@@ -89,19 +105,46 @@ class AuditLogger:
         "session",
     }
 
-    def __init__(self, db: Optional["Database"] = None, log_file: Optional[str] = None):
+    def __init__(
+        self,
+        db: Optional["Database"] = None,
+        log_file: Optional[str] = None,
+        queue_size: int = AuditLogConfig.QUEUE_SIZE,
+        batch_size: int = AuditLogConfig.BATCH_SIZE,
+        flush_interval: float = AuditLogConfig.FLUSH_INTERVAL_SECONDS,
+        enqueue_timeout: float = AuditLogConfig.ENQUEUE_TIMEOUT_SECONDS,
+    ):
         """
         Initialize audit logger.
 
         Args:
             db: Database instance for persistence
             log_file: Optional JSONL file path for audit logs
+            queue_size: Pending events held by the batched pipeline
+            batch_size: Maximum events written per flush
+            flush_interval: Seconds the writer waits to fill a batch
+            enqueue_timeout: Seconds log() waits for queue space before dropping
         """
         self.db = db
         self.log_file = Path(log_file) if log_file else None
         self._buffer: List[AuditEntry] = []
         self._buffer_size = 100
 
+        # Batched pipeline, active between start() and stop()
+        self._file: Optional[IO[str]] = None
+        self._pipeline: BatchWriter[AuditEntry] = BatchWriter(
+            name="audit_log",
+            table="audit_log",
+            columns=self._DB_COLUMNS,
+            to_row=self._to_row,
+            get_db=lambda: self.db,
+            queue_size=queue_size,
+            batch_size=batch_size,
+            flush_interval=flush_interval,
+            enqueue_timeout=enqueue_timeout,
+            on_batch=self._handle_batch,
+        )
+
         # Create log file directory if needed
         if self.log_file:
             self.log_file.parent.mkdir(parents=True, exist_ok=True)
@@ -155,6 +198,10 @@ class AuditLogger:
             f"ip={ip_address} | success={success}",
         )
 
+        if self._pipeline.is_running:
+            await self._pipeline.put(entry)
+            return
+
         # Write to JSONL file if configured
         if self.log_file:
             await self._write_to_file(entry)
@@ -169,6 +216,82 @@ class AuditLogger:
                 # Keep only the newer half to avoid frequent trimming
                 self._buffer = self._buffer[-self._buffer_size // 2 :]
 
+    @property
+    def is_running(self) -> bool:
+        """Whether the batched pipeline is accepting events."""
+        return self._pipeline.is_running
+
+    async def start(self) -> None:
+        """Start the batched pipeline: JSONL handle and batch writer."""
+        if self._pipeline.is_running:
+            return
+
+        if self.log_file:
+            self._file = await asyncio.to_thread(open, self.log_file, "a", encoding="utf-8")
+        await self._pipeline.start()
+
+    async def stop(self, timeout: float = AuditLogConfig.DRAIN_TIMEOUT_SECONDS) -> None:
+        """
+        Drain queued events, stop the writer and close the JSONL handle.
+
+        Events logged after stop() begins are written directly, as before start().
+
+        Args:
+            timeout: Seconds to wait for the queue to drain
+        """
+        if not self._pipeline.is_running:
+            return
+
+        await self._pipeline.stop(timeout)
+
+        if self._file:
+            await asyncio.to_thread(self._file.close)
+            self._file = None
+
+    def get_metrics(self) -> Dict[str, int]:
+        """
+        Get batched pipeline counters.
+
+        Returns:
+            Dictionary with enqueued/written/dropped counts, backpressure waits,
+            flushes, write errors, and current queue depth and capacity
+        """
+        return self._pipeline.get_metrics()
+
+    @staticmethod
+    def _to_row(entry: AuditEntry) -> tuple:
+        """Map an entry to an audit_log row in _DB_COLUMNS order."""
+        return (
+            entry.action,
+            entry.user_id,
+            entry.username,
+            entry.ip_address,
+            entry.user_agent,
+            json.dumps(entry.details),
+            entry.timestamp,
+            entry.success,
+        )
+
+    async def _handle_batch(self, batch: List[AuditEntry]) -> None:
+        """Buffer a batch when there is no database, and append it to the JSONL file."""
+        if not self.db:
+            self._buffer_entries(batch)
+        if self._file:
+            lines = "".join(entry.to_json() + "\n" for entry in batch)
+            await asyncio.to_thread(self._sync_write_lines, lines)
+
+    def _buffer_entries(self, entries: List[AuditEntry]) -> None:
+        """Keep entries in the bounded in-memory buffer, trimming the oldest half when full."""
+        self._buffer.extend(entries)
+        if len(self._buffer) >= self._buffer_size:
+            self._buffer = self._buffer[-self._buffer_size // 2 :]
+
+    def _sync_write_lines(self, lines: str) -> None:
+        """Append lines to the long-lived JSONL handle."""
+        if self._file is not None:
+            self._file.write(lines)
+            self._file.flush()
+
     def _sanitize(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Mask sensitive data in the details dictionary."""
         if not isinstance(data, dict):
@@ -0,0 +1,290 @@
+"""Chunked authenticated encryption for streaming database backups.
+
+A stream backup is a sequence of independently compressed and encrypted
+frames, so backups and restores never hold more than one chunk in memory.
+
+File layout::
+
+    header = MAGIC (8) | version (1) | compression (1) | key_id (8) | salt (16) | chunk_size (4)
+    frame  = final flag (1) | ciphertext length (4) | AES-256-GCM ciphertext + tag
+
+Each file derives its own AES-256 key from the backup Fernet key with
+HKDF-SHA256 and a random salt. Frame nonces are a 96-bit counter whose last
+byte marks the final frame, and the header is authenticated with every frame,
+so reordering, truncation, appending or header tampering fail decryption.
+"""
+
+import base64
+import hashlib
+import importlib
+import os
+import struct
+import zlib
+from types import ModuleType
+from typing import BinaryIO, Iterator, List, Optional, cast
+
+from cryptography.exceptions import InvalidTag
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+
+zstandard: Optional[ModuleType]
+try:
+    zstandard = importlib.import_module("zstandard")
+except ImportError:
+    zstandard = None
+
+MAGIC = b"VFSBKS1\n"
+FORMAT_VERSION = 1
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+COMPRESSION_NONE = "none"
+COMPRESSION_GZIP = "gzip"
+COMPRESSION_ZSTD = "zstd"
+_COMPRESSION_IDS = {COMPRESSION_NONE: 0, COMPRESSION_GZIP: 1, COMPRESSION_ZSTD: 2}
+_COMPRESSION_NAMES = {value: key for key, value in _COMPRESSION_IDS.items()}
+
+_HEADER = struct.Struct(">8sBB8s16sI")
+_FRAME = struct.Struct(">BI")
+_TAG_SIZE = 16
+# Compressed incompressible data can exceed the chunk size slightly
+_MAX_FRAME_OVERHEAD = 64 * 1024
+_HKDF_INFO = b"vfs-bot backup stream v1"
+
+
+class BackupStreamError(Exception):
+    """Raised when a stream backup is malformed, truncated or fails authentication."""
+
+
+def _key_material(fernet_key: bytes) -> bytes:
+    """Decode a urlsafe-base64 Fernet key into its 32 raw bytes."""
+    raw = base64.urlsafe_b64decode(fernet_key)
+    if len(raw) != 32:
+        raise ValueError("Backup encryption key must be a 32-byte urlsafe-base64 Fernet key")
+    return raw
+
+
+def key_id(fernet_key: bytes) -> bytes:
+    """
+    Short identifier for a backup key (not secret-bearing).
+
+    Args:
+        fernet_key: Fernet key (urlsafe base64)
+
+    Returns:
+        8-byte key identifier stored in stream headers
+    """
+    return hashlib.sha256(b"vfs-bot backup key id" + _key_material(fernet_key)).digest()[:8]
+
+
+def _derive_key(fernet_key: bytes, salt: bytes) -> AESGCM:
+    """Derive the per-file AES-256-GCM key."""
+    hkdf = HKDF(algorithm=hashes.SHA256(), length=32, salt=salt, info=_HKDF_INFO)
+    return AESGCM(hkdf.derive(_key_material(fernet_key)))
+
+
+def _nonce(counter: int, final: bool) -> bytes:
+    """96-bit nonce: 88-bit frame counter followed by the final-frame flag."""
+    return counter.to_bytes(11, "big") + (b"\x01" if final else b"\x00")
+
+
+def _require_compression(compression: str) -> int:
+    """Validate a compression name and return its header id."""
+    if compression not in _COMPRESSION_IDS:
+        raise ValueError(f"Unsupported backup compression: {compression}")
+    if compression == COMPRESSION_ZSTD and zstandard is None:
+        raise ValueError("zstd backup compression requires the 'zstandard' package")
+    return _COMPRESSION_IDS[compression]
+
+
+def is_stream_backup(path: "os.PathLike[str] | str") -> bool:
+    """
+    Check whether a file is a stream backup (as opposed to a single Fernet token).
+
+    Args:
+        path: Backup file path
+
+    Returns:
+        True if the file starts with the stream backup magic bytes
+    """
+    with open(path, "rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+class BackupStreamWriter:
+    """
+    Incrementally compress and encrypt a byte stream into frames.
+
+    Memory use is bounded by ``chunk_size``: plaintext is buffered until a
+    full chunk is available, then compressed, encrypted and written.
+    """
+
+    def __init__(
+        self,
+        fileobj: BinaryIO,
+        fernet_key: bytes,
+        compression: str = COMPRESSION_GZIP,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ):
+        """
+        Initialize writer and write the stream header.
+
+        Args:
+            fileobj: Binary file opened for writing
+            fernet_key: Backup Fernet key (urlsafe base64)
+            compression: "none", "gzip" or "zstd"
+            chunk_size: Plaintext bytes per frame
+
+        Raises:
+            ValueError: If compression or key is invalid
+        """
+        compression_id = _require_compression(compression)
+        salt = os.urandom(16)
+        self._file = fileobj
+        self._compression = compression
+        self._chunk_size = chunk_size
+        self._cipher = _derive_key(fernet_key, salt)
+        self._header = _HEADER.pack(
+            MAGIC, FORMAT_VERSION, compression_id, key_id(fernet_key), salt, chunk_size
+        )
+        self._buffer = bytearray()
+        self._counter = 0
+        self._closed = False
+        self._zstd = (
+            zstandard.ZstdCompressor()
+            if zstandard is not None and compression == COMPRESSION_ZSTD
+            else None
+        )
+        self.bytes_in = 0
+        self._file.write(self._header)
+
+    def write(self, data: bytes) -> None:
+        """
+        Append plaintext to the stream.
+
+        Args:
+            data: Plaintext bytes
+        """
+        if self._closed:
+            raise ValueError("write to closed BackupStreamWriter")
+        self._buffer += data
+        self.bytes_in += len(data)
+        while len(self._buffer) >= self._chunk_size:
+            chunk = bytes(self._buffer[: self._chunk_size])
+            del self._buffer[: self._chunk_size]
+            self._write_frame(chunk, final=False)
+
+    def close(self) -> None:
+        """Write the final frame (possibly empty). Does not close the file."""
+        if self._closed:
+            return
+        self._write_frame(bytes(self._buffer), final=True)
+        self._buffer = bytearray()
+        self._closed = True
+
+    def _compress(self, chunk: bytes) -> bytes:
+        if self._compression == COMPRESSION_GZIP:
+            return zlib.compress(chunk, 6)
+        if self._zstd is not None:
+            return cast(bytes, self._zstd.compress(chunk))
+        return chunk
+
+    def _write_frame(self, chunk: bytes, final: bool) -> None:
+        ciphertext = self._cipher.encrypt(
+            _nonce(self._counter, final), self._compress(chunk), self._header
+        )
+        self._file.write(_FRAME.pack(1 if final else 0, len(ciphertext)))
+        self._file.write(ciphertext)
+        self._counter += 1
+
+
+def _decompress(compression: str, data: bytes, chunk_size: int) -> bytes:
+    """Decompress one frame, refusing output larger than a chunk."""
+    if compression == COMPRESSION_GZIP:
+        decompressor = zlib.decompressobj()
+        plain = decompressor.decompress(data, chunk_size)
+        if decompressor.unconsumed_tail or not decompressor.eof:
+            raise BackupStreamError("Frame decompresses beyond the declared chunk size")
+        return plain
+    if compression == COMPRESSION_ZSTD:
+        if zstandard is None:
+            raise BackupStreamError("zstd backup requires the 'zstandard' package")
+        try:
+            return cast(
+                bytes,
+                zstandard.ZstdDecompressor().decompress(data, max_output_size=chunk_size),
+            )
+        except zstandard.ZstdError as e:
+            raise BackupStreamError(f"Invalid zstd frame: {e}") from e
+    return data
+
+
+def _read_exact(fileobj: BinaryIO, size: int) -> Optional[bytes]:
+    """Read exactly size bytes; None at clean EOF, error on a partial read."""
+    data = fileobj.read(size)
+    if not data:
+        return None
+    while len(data) < size:
+        more = fileobj.read(size - len(data))
+        if not more:
+            raise BackupStreamError("Backup stream is truncated")
+        data += more
+    return data
+
+
+def iter_backup_stream(fileobj: BinaryIO, fernet_keys: List[bytes]) -> Iterator[bytes]:
+    """
+    Decrypt and decompress a stream backup frame by frame.
+
+    Args:
+        fileobj: Binary file positioned at the start of the backup
+        fernet_keys: Candidate backup keys (current first, then old keys)
+
+    Yields:
+        Plaintext chunks of at most the stream's chunk size
+
+    Raises:
+        BackupStreamError: If the stream is malformed, truncated or tampered with
+    """
+    header = _read_exact(fileobj, _HEADER.size)
+    if header is None:
+        raise BackupStreamError("Backup stream is empty")
+    magic, version, compression_id, stored_key_id, salt, chunk_size = _HEADER.unpack(header)
+    if magic != MAGIC or version != FORMAT_VERSION:
+        raise BackupStreamError("Not a stream backup (bad magic or version)")
+    compression = _COMPRESSION_NAMES.get(compression_id)
+    if compression is None:
+        raise BackupStreamError(f"Unknown compression id {compression_id}")
+
+    fernet_key = next((k for k in fernet_keys if key_id(k) == stored_key_id), None)
+    if fernet_key is None:
+        raise BackupStreamError("No configured backup key matches this backup")
+    cipher = _derive_key(fernet_key, salt)
+
+    counter = 0
+    max_frame = chunk_size + _MAX_FRAME_OVERHEAD + _TAG_SIZE
+    while True:
+        frame_header = _read_exact(fileobj, _FRAME.size)
+        if frame_header is None:
+            raise BackupStreamError("Backup stream is truncated (no final frame)")
+        flag, length = _FRAME.unpack(frame_header)
+        if flag not in (0, 1) or length > max_frame:
+            raise BackupStreamError("Corrupt frame header")
+        ciphertext = _read_exact(fileobj, length) if length else b""
+        if ciphertext is None:
+            raise BackupStreamError("Backup stream is truncated")
+
+        final = flag == 1
+        try:
+            compressed = cipher.decrypt(_nonce(counter, final), ciphertext, header)
+        except InvalidTag as e:
+            raise BackupStreamError(f"Frame {counter} failed authentication") from e
+        counter += 1
+
+        plain = _decompress(compression, compressed, chunk_size)
+        if plain:
+            yield plain
+        if final:
+            if fileobj.read(1):
+                raise BackupStreamError("Unexpected data after final frame")
+            return
@@ -0,0 +1,285 @@
+"""Bounded, batched background writer for append-only tables."""
+
+import asyncio
+from typing import (
+    TYPE_CHECKING,
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    List,
+    Optional,
+    Sequence,
+    TypeVar,
+)
+
+from loguru import logger
+
+from .db_helpers import batch_insert
+
+if TYPE_CHECKING:
+    from ..models.database import Database
+
+T = TypeVar("T")
+
+
+class BatchWriter(Generic[T]):
+    """
+    Bounded queue drained by a single background task that COPYs batches into a table.
+
+    Between start() and stop(), put() only queues the item; the writer flushes
+    when a batch fills or the flush window passes. When the queue is full,
+    put() waits up to ``enqueue_timeout`` for space and then drops the item.
+    A batch that COPY rejects (e.g. one row violates a foreign key) is retried
+    row by row so one bad row does not lose the others; rows that still fail
+    are counted as dropped.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        table: str,
+        columns: Sequence[str],
+        to_row: Callable[[T], tuple],
+        get_db: Callable[[], Optional["Database"]],
+        queue_size: int,
+        batch_size: int,
+        flush_interval: float,
+        enqueue_timeout: float,
+        on_batch: Optional[Callable[[List[T]], Awaitable[None]]] = None,
+    ):
+        """
+        Initialize batch writer.
+
+        Args:
+            name: Name used for the writer task and log messages
+            table: Table the rows are copied into
+            columns: Column order of the tuples returned by ``to_row``
+            to_row: Maps a queued item to a row tuple
+            get_db: Returns the database to write to; with None, batches are
+                only passed to ``on_batch``
+            queue_size: Pending items held before put() applies backpressure
+            batch_size: Maximum items written per flush
+            flush_interval: Seconds the writer waits to fill a batch
+            enqueue_timeout: Seconds put() waits for queue space before dropping
+            on_batch: Optional coroutine called with every batch before it is
+                copied (e.g. to also append it to a file)
+        """
+        self.name = name
+        self.table = table
+        self.columns = list(columns)
+        self._to_row = to_row
+        self._get_db = get_db
+        self._on_batch = on_batch
+        self._queue_size = queue_size
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._enqueue_timeout = enqueue_timeout
+        self._queue: Optional[asyncio.Queue] = None
+        self._writer_task: Optional[asyncio.Task] = None
+        self._metrics: Dict[str, int] = {
+            "enqueued": 0,
+            "written": 0,
+            "dropped": 0,
+            "backpressure_waits": 0,
+            "flushes": 0,
+            "write_errors": 0,
+        }
+
+    @property
+    def is_running(self) -> bool:
+        """Whether put() is queueing items for the background writer."""
+        return self._queue is not None
+
+    async def start(self) -> None:
+        """Start the queue and the background writer task."""
+        if self._queue is not None:
+            return
+
+        self._queue = asyncio.Queue(maxsize=self._queue_size)
+        self._writer_task = asyncio.create_task(
+            self._writer(self._queue), name=f"{self.name}_writer"
+        )
+        logger.info(
+            f"Batch writer {self.name} started (queue: {self._queue_size}, "
+            f"batch: {self._batch_size}, flush: {self._flush_interval}s)"
+        )
+
+    async def stop(self, timeout: float) -> None:
+        """
+        Flush queued items and stop the writer.
+
+        Args:
+            timeout: Seconds to wait for the queue to drain
+        """
+        queue, self._queue = self._queue, None
+        if queue is None:
+            return
+
+        writer_task, self._writer_task = self._writer_task, None
+        if writer_task is not None:
+            try:
+                # The sentinel makes the writer flush immediately instead of
+                # waiting out the flush window
+                await asyncio.wait_for(self._drain(queue, writer_task), timeout=timeout)
+            except asyncio.TimeoutError:
+                writer_task.cancel()
+                self._metrics["dropped"] += queue.qsize()
+                logger.error(
+                    f"Batch writer {self.name} drain timed out, "
+                    f"{queue.qsize()} item(s) not written"
+                )
+            except Exception as e:
+                self._metrics["dropped"] += queue.qsize()
+                logger.error(f"Batch writer {self.name} failed during drain: {e}")
+
+        logger.info(f"Batch writer {self.name} stopped ({self.get_metrics()})")
+
+    async def _drain(self, queue: asyncio.Queue, writer_task: asyncio.Task) -> None:
+        """Queue the stop sentinel and wait for the writer to flush and exit."""
+        if writer_task.done():
+            raise RuntimeError(f"{self.name} writer is not running")
+        await queue.put(None)
+        await writer_task
+
+    def get_metrics(self) -> Dict[str, int]:
+        """
+        Get writer counters.
+
+        Returns:
+            Dictionary with enqueued/written/dropped counts, backpressure waits,
+            flushes, write errors, and current queue depth and capacity
+        """
+        return {
+            **self._metrics,
+            "queue_depth": self._queue.qsize() if self._queue is not None else 0,
+            "queue_capacity": self._queue_size,
+        }
+
+    async def put(self, item: T) -> bool:
+        """
+        Queue an item, waiting up to enqueue_timeout for space before dropping it.
+
+        Args:
+            item: Item to write
+
+        Returns:
+            False if the writer is not running or the item was dropped
+        """
+        queue = self._queue
+        if queue is None:
+            return False
+
+        try:
+            queue.put_nowait(item)
+        except asyncio.QueueFull:
+            # Backpressure: slow the caller down instead of growing without bound
+            self._metrics["backpressure_waits"] += 1
+            try:
+                await asyncio.wait_for(queue.put(item), timeout=self._enqueue_timeout)
+            except asyncio.TimeoutError:
+                self._metrics["dropped"] += 1
+                if self._metrics["dropped"] % 1000 == 1:
+                    logger.error(
+                        f"Batch writer {self.name} queue full, dropping items "
+                        f"({self._metrics['dropped']} dropped so far)"
+                    )
+                return False
+
+        self._metrics["enqueued"] += 1
+        return True
+
+    async def _writer(self, queue: asyncio.Queue) -> None:
+        """
+        Single background writer: flush when a batch fills or the time window ends.
+
+        Args:
+            queue: Queue to drain until the stop sentinel arrives
+        """
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            batch: List[T] = []
+            item = await queue.get()
+            deadline = loop.time() + self._flush_interval
+
+            while True:
+                # None is the stop sentinel queued by stop()
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+                if len(batch) >= self._batch_size:
+                    break
+                if not queue.empty():
+                    item = queue.get_nowait()
+                    continue
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(queue.get(), timeout=remaining)
+                except asyncio.TimeoutError:
+                    break
+
+            if stopping:
+                # Pick up items that were waiting on backpressure when stop() began
+                while not queue.empty():
+                    item = queue.get_nowait()
+                    if item is not None:
+                        batch.append(item)
+
+            if batch:
+                try:
+                    await self._flush(batch)
+                except Exception as e:
+                    self._metrics["write_errors"] += 1
+                    logger.error(f"Batch writer {self.name} flush failed: {e}")
+
+    async def _flush(self, batch: List[T]) -> None:
+        """Hand a batch to on_batch, then copy it into the table."""
+        self._metrics["flushes"] += 1
+
+        if self._on_batch is not None:
+            try:
+                await self._on_batch(batch)
+            except Exception as e:
+                self._metrics["write_errors"] += 1
+                logger.error(f"Batch writer {self.name} failed to handle {len(batch)} item(s): {e}")
+
+        db = self._get_db()
+        if db is None:
+            # Nothing to copy into; on_batch has taken care of the items
+            self._metrics["written"] += len(batch)
+            return
+        self._metrics["written"] += await self._copy(db, [self._to_row(item) for item in batch])
+
+    async def _copy(self, db: "Database", rows: List[tuple]) -> int:
+        """
+        Copy rows with a single binary COPY, retrying row by row if it is rejected.
+
+        Args:
+            db: Database to write to
+            rows: Row tuples in column order
+
+        Returns:
+            Number of rows written
+        """
+        try:
+            async with db.get_connection() as conn:
+                await batch_insert(conn, self.table, self.columns, rows, use_copy=True)
+            return len(rows)
+        except Exception as e:
+            self._metrics["write_errors"] += 1
+            logger.warning(f"Batch writer {self.name} COPY of {len(rows)} row(s) failed: {e}")
+
+        written = 0
+        for row in rows:
+            try:
+                async with db.get_connection() as conn:
+                    await batch_insert(conn, self.table, self.columns, [row], use_copy=True)
+                written += 1
+            except Exception as e:
+                self._metrics["dropped"] += 1
+                logger.error(f"Failed to write {self.table} row ({row[0]}): {e}")
+        return written
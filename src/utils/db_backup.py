@@ -2,6 +2,14 @@
 
 This module provides automated backup functionality for PostgreSQL databases
 using pg_dump and pg_restore for online (hot) backups.
+
+Two on-disk formats share the ``.sql.enc`` extension:
+
+- legacy: the whole dump encrypted as a single Fernet token (memory ~3x dump size)
+- stream: chunked AES-GCM frames from ``src.utils.backup_stream``, piped
+  directly from pg_dump / into psql with memory bounded by the chunk size
+
+Restore detects the format from the file header.
 """
 
 import asyncio
@@ -9,12 +17,19 @@ import os
 import tempfile
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from urllib.parse import urlparse
 
 from cryptography.fernet import Fernet, MultiFernet
 from loguru import logger
 
+from src.utils.backup_stream import (
+    COMPRESSION_GZIP,
+    DEFAULT_CHUNK_SIZE,
+    BackupStreamWriter,
+    is_stream_backup,
+    iter_backup_stream,
+)
 from src.utils.masking import mask_database_url
 
 
@@ -33,6 +48,9 @@ class DatabaseBackup:
         retention_days: int = 7,
         interval_hours: int = 6,
         max_backups: Optional[int] = None,
+        streaming: bool = False,
+        compression: str = COMPRESSION_GZIP,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
     ):
         """
         Initialize database backup service.
@@ -43,6 +61,9 @@ class DatabaseBackup:
             retention_days: Number of days to keep backups (default: 7)
             interval_hours: Hours between scheduled backups (default: 6)
             max_backups: Maximum number of backups to retain (if set, overrides retention_days)
+            streaming: Write chunked stream backups instead of a single Fernet token
+            compression: Stream backup compression ("none", "gzip" or "zstd")
+            chunk_size: Plaintext bytes per stream frame
         """
         self._database_url: str = database_url or os.getenv(
             "DATABASE_URL") or "postgresql://localhost:5432/vfs_bot"
@@ -50,6 +71,9 @@ class DatabaseBackup:
         self._retention_days = retention_days
         self._interval_hours = interval_hours
         self._max_backups = max_backups
+        self._streaming = streaming
+        self._compression = compression
+        self._chunk_size = chunk_size
         self._running = False
         self._task: Optional[asyncio.Task] = None
 
@@ -57,9 +81,10 @@ class DatabaseBackup:
         self._backup_dir.mkdir(parents=True, exist_ok=True)
 
         retention_info = f"{max_backups} backups" if max_backups else f"{retention_days}d"
+        format_info = f", stream/{compression}" if streaming else ""
         logger.info(
             f"Database backup initialized: {mask_database_url(self._database_url)} -> {backup_dir} "
-            f"(retention: {retention_info}, interval: {interval_hours}h)"
+            f"(retention: {retention_info}, interval: {interval_hours}h{format_info})"
         )
 
     def _get_encryption_key(self) -> bytes:
@@ -85,6 +110,27 @@ class DatabaseBackup:
             )
         return key.encode() if isinstance(key, str) else key
 
+    def _get_decryption_keys(self) -> List[bytes]:
+        """
+        Get backup keys to try for decryption, current key first.
+
+        Returns:
+            List of Fernet keys (current, then old key if configured and valid)
+        """
+        keys = [self._get_encryption_key()]
+
+        old_key = os.getenv("BACKUP_ENCRYPTION_KEY_OLD") or os.getenv("ENCRYPTION_KEY_OLD")
+        if old_key:
+            try:
+                old_key_bytes = old_key.encode() if isinstance(old_key, str) else old_key
+                Fernet(old_key_bytes)
+                keys.append(old_key_bytes)
+                logger.debug("Old backup encryption key loaded for decryption")
+            except Exception as e:
+                logger.warning(f"Failed to load old backup encryption key: {e}")
+
+        return keys
+
     def _encrypt_file(self, plain_path: Path, encrypted_path: Path) -> None:
         """
         Encrypt a file using Fernet encryption.
@@ -133,21 +179,8 @@ class DatabaseBackup:
             Exception: If decryption fails
         """
         try:
-            # Build key list for MultiFernet (new key first, then old key if available)
-            key = self._get_encryption_key()
-            fernet_keys = [Fernet(key)]
-
-            # Check for old backup encryption key
-            old_key = os.getenv("BACKUP_ENCRYPTION_KEY_OLD") or os.getenv("ENCRYPTION_KEY_OLD")
-            if old_key:
-                try:
-                    old_key_bytes = old_key.encode() if isinstance(old_key, str) else old_key
-                    fernet_keys.append(Fernet(old_key_bytes))
-                    logger.debug("Old backup encryption key loaded for decryption")
-                except Exception as e:
-                    logger.warning(f"Failed to load old backup encryption key: {e}")
-
-            cipher = MultiFernet(fernet_keys)
+            # MultiFernet tries the new key first, then the old key if available
+            cipher = MultiFernet([Fernet(key) for key in self._get_decryption_keys()])
 
             # Read encrypted file
             with open(encrypted_path, "rb") as f:
@@ -186,7 +219,8 @@ class DatabaseBackup:
         Create a backup of the database.
 
         Uses pg_dump for online backup without locking the database.
-        Encrypts the backup file using Fernet encryption.
+        Encrypts the backup file using Fernet encryption, or in streaming mode
+        pipes pg_dump output through chunked encryption straight to disk.
 
         Args:
             suffix: Optional suffix to add to backup filename (e.g., "pre_migration")
@@ -203,6 +237,16 @@ class DatabaseBackup:
         logger.info(f"Creating database backup: {backup_path}")
 
         try:
+            if self._streaming:
+                # No plaintext ever touches the disk
+                await self._perform_streaming_backup(self._database_url, backup_path)
+                backup_size = backup_path.stat().st_size
+                logger.info(
+                    f"Stream backup created and encrypted successfully: {backup_path} "
+                    f"({backup_size:,} bytes)"
+                )
+                return str(backup_path)
+
             # Run pg_dump to temporary SQL file
             await self._perform_backup(self._database_url, str(temp_sql_path))
 
@@ -240,14 +284,91 @@ class DatabaseBackup:
             database_url: PostgreSQL database URL
             backup_path: Backup destination path
         """
+        cmd, env = self._build_pg_command("pg_dump", database_url)
+        cmd.extend(["-f", backup_path])
+
+        # Run pg_dump
+        process = await asyncio.create_subprocess_exec(
+            *cmd, env=env, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+        )
+
+        stdout, stderr = await process.communicate()
+
+        if process.returncode != 0:
+            error_msg = stderr.decode() if stderr else "Unknown error"
+            raise Exception(f"pg_dump failed with return code {process.returncode}: {error_msg}")
+
+        logger.debug("PostgreSQL backup completed")
+
+    async def _perform_streaming_backup(self, database_url: str, backup_path: Path) -> None:
+        """
+        Pipe pg_dump stdout through chunked encryption into the backup file.
+
+        Compression and encryption run in a worker thread one read at a time,
+        so memory stays at O(chunk size) regardless of dump size.
+
+        Args:
+            database_url: PostgreSQL database URL
+            backup_path: Encrypted backup destination path
+
+        Raises:
+            Exception: If pg_dump fails
+        """
+        key = self._get_encryption_key()
+        cmd, env = self._build_pg_command("pg_dump", database_url)
+
+        process = await asyncio.create_subprocess_exec(
+            *cmd, env=env, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+        )
+        assert process.stdout is not None and process.stderr is not None
+        # Drain stderr concurrently so a chatty pg_dump cannot block on a full pipe
+        stderr_task = asyncio.create_task(process.stderr.read())
+
+        try:
+            fd = os.open(backup_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "wb") as f:
+                writer = BackupStreamWriter(f, key, self._compression, self._chunk_size)
+                while True:
+                    chunk = await process.stdout.read(self._chunk_size)
+                    if not chunk:
+                        break
+                    await asyncio.to_thread(writer.write, chunk)
+                await asyncio.to_thread(writer.close)
+        except BaseException:
+            if process.returncode is None:
+                process.kill()
+            await process.wait()
+            stderr_task.cancel()
+            raise
+
+        returncode = await process.wait()
+        stderr = await stderr_task
+        if returncode != 0:
+            error_msg = stderr.decode() if stderr else "Unknown error"
+            raise Exception(f"pg_dump failed with return code {returncode}: {error_msg}")
+
+        logger.debug(f"PostgreSQL stream backup completed ({writer.bytes_in:,} bytes dumped)")
+
+    @staticmethod
+    def _build_pg_command(executable: str, database_url: str) -> Tuple[List[str], Dict[str, str]]:
+        """
+        Build a pg_dump/psql command and environment from a database URL.
+
+        Args:
+            executable: Client binary ("pg_dump" or "psql")
+            database_url: PostgreSQL database URL
+
+        Returns:
+            Tuple of (command arguments, environment with PGPASSWORD if present)
+        """
         # Set up environment with password if present
         env = os.environ.copy()
 
         # Parse database URL to extract connection parameters
         parsed = urlparse(database_url)
 
-        # Build pg_dump command with separate parameters for security
-        cmd = ["pg_dump"]
+        # Build command with separate parameters for security
+        cmd = [executable]
 
         if parsed.hostname:
             cmd.extend(["-h", parsed.hostname])
@@ -258,24 +379,11 @@ class DatabaseBackup:
         if parsed.path and len(parsed.path) > 1:
             cmd.extend(["-d", parsed.path[1:]])  # Remove leading /
 
-        cmd.extend(["-f", backup_path])
-
         # Set password in environment for security
         if parsed.password:
             env["PGPASSWORD"] = parsed.password
 
-        # Run pg_dump
-        process = await asyncio.create_subprocess_exec(
-            *cmd, env=env, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
-        )
-
-        stdout, stderr = await process.communicate()
-
-        if process.returncode != 0:
-            error_msg = stderr.decode() if stderr else "Unknown error"
-            raise Exception(f"pg_dump failed with return code {process.returncode}: {error_msg}")
-
-        logger.debug("PostgreSQL backup completed")
+        return cmd, env
 
     async def cleanup_old_backups(self) -> int:
         """
@@ -395,7 +503,9 @@ class DatabaseBackup:
         """
         Restore database from backup file.
 
-        Supports both encrypted (.sql.enc) and legacy unencrypted (.sql) backups.
+        Supports stream (.sql.enc), Fernet-encrypted (.sql.enc) and legacy
+        unencrypted (.sql) backups. Stream backups are decrypted straight
+        into psql without a temporary plaintext file.
 
         Args:
             backup_path: Path to backup file
@@ -423,6 +533,11 @@ class DatabaseBackup:
             # Check if this is an encrypted backup
             is_encrypted = backup_file.suffix == ".enc"
 
+            if is_encrypted and is_stream_backup(backup_file):
+                await self._perform_streaming_restore(backup_file, self._database_url)
+                logger.info("Database restore completed successfully")
+                return True
+
             if is_encrypted:
                 # Decrypt to temporary file (use NamedTemporaryFile for security)
                 temp_sql_file = tempfile.NamedTemporaryFile(
@@ -460,30 +575,9 @@ class DatabaseBackup:
             backup_path: Source backup file
             database_url: Target database URL
         """
-        # Set up environment with password if present
-        env = os.environ.copy()
-
-        # Parse database URL to extract connection parameters
-        parsed = urlparse(database_url)
-
-        # Build psql command with separate parameters for security
-        cmd = ["psql"]
-
-        if parsed.hostname:
-            cmd.extend(["-h", parsed.hostname])
-        if parsed.port:
-            cmd.extend(["-p", str(parsed.port)])
-        if parsed.username:
-            cmd.extend(["-U", parsed.username])
-        if parsed.path and len(parsed.path) > 1:
-            cmd.extend(["-d", parsed.path[1:]])  # Remove leading /
-
+        cmd, env = self._build_pg_command("psql", database_url)
         cmd.extend(["-f", backup_path])
 
-        # Set password in environment for security
-        if parsed.password:
-            env["PGPASSWORD"] = parsed.password
-
         # Run psql to restore
         process = await asyncio.create_subprocess_exec(
             *cmd, env=env, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
@@ -499,6 +593,65 @@ class DatabaseBackup:
 
         logger.debug("Restored backup to database")
 
+    async def _perform_streaming_restore(self, backup_file: Path, database_url: str) -> None:
+        """
+        Decrypt a stream backup frame by frame into psql's stdin.
+
+        psql runs the script in a single transaction with ON_ERROR_STOP, so a
+        frame that fails authentication mid-restore rolls everything back.
+
+        Args:
+            backup_file: Stream backup file
+            database_url: Target database URL
+
+        Raises:
+            BackupStreamError: If the backup is truncated or tampered with
+            Exception: If psql fails
+        """
+        keys = self._get_decryption_keys()
+        cmd, env = self._build_pg_command("psql", database_url)
+        cmd.extend(["--single-transaction", "-v", "ON_ERROR_STOP=1"])
+
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            env=env,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        assert process.stdin is not None and process.stderr is not None
+        stderr_task = asyncio.create_task(process.stderr.read())
+
+        try:
+            with open(backup_file, "rb") as f:
+                chunks = iter_backup_stream(f, keys)
+                while True:
+                    chunk = await asyncio.to_thread(next, chunks, None)
+                    if chunk is None:
+                        break
+                    try:
+                        process.stdin.write(chunk)
+                        await process.stdin.drain()
+                    except (BrokenPipeError, ConnectionResetError):
+                        # psql stopped reading (ON_ERROR_STOP); report its error below
+                        break
+            process.stdin.close()
+        except BaseException:
+            # Abort before COMMIT so the single transaction is rolled back
+            if process.returncode is None:
+                process.kill()
+            await process.wait()
+            stderr_task.cancel()
+            raise
+
+        returncode = await process.wait()
+        stderr = await stderr_task
+        if returncode != 0:
+            error_msg = stderr.decode() if stderr else "Unknown error"
+            raise Exception(f"psql restore failed with return code {returncode}: {error_msg}")
+
+        logger.debug("Restored stream backup to database")
+
     async def list_backups(self) -> List[Dict[str, Any]]:
         """
         List available backups with metadata.
@@ -603,6 +756,8 @@ def get_backup_service(
     backup_dir: str = "data/backups",
     retention_days: int = 7,
     interval_hours: int = 6,
+    streaming: Optional[bool] = None,
+    compression: Optional[str] = None,
 ) -> DatabaseBackup:
     """
     Get or create the global database backup service.
@@ -612,6 +767,8 @@ def get_backup_service(
         backup_dir: Backup directory (only used on first call)
         retention_days: Retention period (only used on first call)
         interval_hours: Backup interval (only used on first call)
+        streaming: Use stream backups (default: BACKUP_STREAMING env var)
+        compression: Stream compression (default: BACKUP_COMPRESSION env var or gzip)
 
     Returns:
         DatabaseBackup instance
@@ -619,11 +776,17 @@ def get_backup_service(
     global _backup_service
 
     if _backup_service is None:
+        if streaming is None:
+            streaming = os.getenv("BACKUP_STREAMING", "false").lower() == "true"
+        if compression is None:
+            compression = os.getenv("BACKUP_COMPRESSION", COMPRESSION_GZIP)
         _backup_service = DatabaseBackup(
             database_url=database_url,
             backup_dir=backup_dir,
             retention_days=retention_days,
             interval_hours=interval_hours,
+            streaming=streaming,
+            compression=compression,
         )
 
     return _backup_service
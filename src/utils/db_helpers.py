@@ -1,11 +1,16 @@
 """Database batch operations helpers for improved performance."""
 
+import base64
+import binascii
 import re
-from typing import Any, Awaitable, Callable, Dict, List, TypeVar
+from datetime import datetime
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple, TypeVar
 
 import asyncpg
 from loguru import logger
 
+from src.constants import Pagination
+
 T = TypeVar("T")
 
 # PostgreSQL reserved words - prevent SQL injection via identifier names
@@ -164,25 +169,78 @@ def validate_sql_identifier(identifier: str) -> bool:
     return True
 
 
+def _build_conflict_clause(
+    columns: List[str],
+    conflict_columns: Optional[List[str]],
+    update_columns: Optional[List[str]],
+) -> str:
+    """
+    Build an ``ON CONFLICT`` clause for upserts.
+
+    Args:
+        columns: Inserted column names
+        conflict_columns: Columns of the unique constraint to upsert on, or None
+        update_columns: Columns to overwrite on conflict; None updates every inserted
+            column outside conflict_columns, an empty list means ``DO NOTHING``
+
+    Returns:
+        The clause (with a leading space), or an empty string for plain inserts
+
+    Raises:
+        ValueError: If a column name is invalid
+    """
+    if not conflict_columns:
+        return ""
+
+    for col in conflict_columns + (update_columns or []):
+        if not validate_sql_identifier(col):
+            raise ValueError(f"Invalid column name: {col}")
+
+    if update_columns is None:
+        update_columns = [col for col in columns if col not in conflict_columns]
+
+    target = ", ".join(conflict_columns)
+    if not update_columns:
+        return f" ON CONFLICT ({target}) DO NOTHING"
+
+    assignments = ", ".join(f"{col} = EXCLUDED.{col}" for col in update_columns)
+    return f" ON CONFLICT ({target}) DO UPDATE SET {assignments}"
+
+
 async def batch_insert(
     conn: asyncpg.Connection,
     table: str,
     columns: List[str],
     rows: List[tuple],
     batch_size: int = 100,
+    use_copy: bool = False,
+    conflict_columns: Optional[List[str]] = None,
+    update_columns: Optional[List[str]] = None,
 ) -> int:
     """
     Insert multiple rows in batches for better performance.
 
+    With ``use_copy=True`` rows are streamed with binary COPY
+    (``copy_records_to_table``) in a single transaction instead of
+    ``executemany`` batches, which is an order of magnitude faster for bulk
+    loads. Passing ``conflict_columns`` turns the insert into an upsert; in
+    COPY mode rows are first copied into a temporary staging table and then
+    merged with ``INSERT ... ON CONFLICT``. A single upsert with ``DO UPDATE``
+    must not repeat a conflict key (PostgreSQL refuses to update a row twice).
+
     Args:
         conn: Database connection
         table: Table name (will be validated)
         columns: Column names (will be validated)
         rows: List of tuples with values to insert
-        batch_size: Number of rows to insert per batch
+        batch_size: Number of rows to insert per batch (executemany mode only)
+        use_copy: Load rows with binary COPY instead of executemany
+        conflict_columns: Unique-constraint columns to upsert on (default: plain insert)
+        update_columns: Columns to update on conflict (default: all non-conflict
+            columns; an empty list means ``DO NOTHING``)
 
     Returns:
-        Total number of rows inserted
+        Total number of rows inserted (or upserted)
 
     Raises:
         ValueError: If table or column names are invalid
@@ -213,9 +271,14 @@ async def batch_insert(
         if not validate_sql_identifier(col):
             raise ValueError(f"Invalid column name: {col}")
 
+    conflict_clause = _build_conflict_clause(columns, conflict_columns, update_columns)
+
+    if use_copy:
+        return await _copy_insert(conn, table, columns, rows, conflict_clause)
+
     placeholders = ", ".join([f"${i+1}" for i in range(len(columns))])
     column_list = ", ".join(columns)
-    query = f"INSERT INTO {table} ({column_list}) VALUES ({placeholders})"
+    query = f"INSERT INTO {table} ({column_list}) VALUES ({placeholders}){conflict_clause}"
 
     total_inserted = 0
 
@@ -237,6 +300,54 @@ async def batch_insert(
     return total_inserted
 
 
+async def _copy_insert(
+    conn: asyncpg.Connection,
+    table: str,
+    columns: List[str],
+    rows: List[tuple],
+    conflict_clause: str,
+) -> int:
+    """
+    Load rows with binary COPY, merging through a staging table for upserts.
+
+    Args:
+        conn: Database connection
+        table: Validated table name
+        columns: Validated column names
+        rows: List of tuples with values to insert
+        conflict_clause: ON CONFLICT clause from _build_conflict_clause(), or ""
+
+    Returns:
+        Number of rows copied (plain insert) or inserted/updated (upsert)
+    """
+    try:
+        async with conn.transaction():
+            if not conflict_clause:
+                result = await conn.copy_records_to_table(table, records=rows, columns=columns)
+            else:
+                # Session-local, column-exact copy of the target without constraints,
+                # so COPY never trips over NOT NULL/defaults of omitted columns
+                staging = f"_stage_{table}"[:63]
+                column_list = ", ".join(columns)
+                await conn.execute(
+                    f"CREATE TEMP TABLE {staging} AS "
+                    f"SELECT {column_list} FROM {table} WITH NO DATA"
+                )
+                await conn.copy_records_to_table(staging, records=rows, columns=columns)
+                result = await conn.execute(
+                    f"INSERT INTO {table} ({column_list}) "
+                    f"SELECT {column_list} FROM {staging}{conflict_clause}"
+                )
+                await conn.execute(f"DROP TABLE {staging}")
+    except Exception as e:
+        logger.error(f"Failed to COPY rows into {table}: {e}")
+        raise
+
+    total_inserted = _parse_command_tag(result)
+    logger.info(f"COPY inserted {total_inserted} rows into {table}")
+    return total_inserted
+
+
 async def batch_update(
     conn: asyncpg.Connection,
     table: str,
@@ -514,3 +625,150 @@ async def execute_in_transaction(
     except Exception as e:
         logger.error(f"Transaction failed, rolled back: {e}")
         raise
+
+
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    """
+    Encode a row's keyset position as an opaque pagination cursor.
+
+    Args:
+        created_at: Row creation timestamp
+        row_id: Row primary key (tie-breaker for equal timestamps)
+
+    Returns:
+        URL-safe cursor string
+    """
+    raw = f"{created_at.isoformat()}|{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """
+    Decode a cursor produced by encode_cursor().
+
+    Args:
+        cursor: Opaque cursor string
+
+    Returns:
+        Tuple of (created_at, row_id)
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        created_at, row_id = raw.rsplit("|", 1)
+        return datetime.fromisoformat(created_at), int(row_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise ValueError("Invalid pagination cursor") from e
+
+
+def keyset_query(
+    query: str,
+    params: List[Any],
+    cursor: Optional[str] = None,
+    limit: Optional[int] = None,
+) -> Tuple[str, List[Any]]:
+    """
+    Add keyset pagination to a filtered SELECT ordered newest first.
+
+    Rows are ordered by ``(created_at, id)`` descending and the cursor
+    condition is a row-value comparison, so each page is an index range scan
+    no matter how deep it is (unlike OFFSET).
+
+    Args:
+        query: SELECT statement ending in a WHERE clause (use ``WHERE 1=1`` if unfiltered)
+        params: Positional parameters already used by query
+        cursor: Cursor of the last row of the previous page, or None for the first page
+        limit: Optional LIMIT
+
+    Returns:
+        Tuple of (query, params) ready for execution
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    params = list(params)
+    if cursor:
+        created_at, row_id = decode_cursor(cursor)
+        query += f" AND (created_at, id) < (${len(params) + 1}, ${len(params) + 2})"
+        params.extend([created_at, row_id])
+
+    query += " ORDER BY created_at DESC, id DESC"
+    if limit is not None:
+        query += f" LIMIT ${len(params) + 1}"
+        params.append(limit)
+
+    return query, params
+
+
+async def fetch_keyset_page(
+    conn: asyncpg.Connection,
+    query: str,
+    params: List[Any],
+    limit: int,
+    cursor: Optional[str] = None,
+) -> Tuple[List[Any], Optional[str]]:
+    """
+    Fetch one keyset page and the cursor for the next one.
+
+    Args:
+        conn: Database connection
+        query: SELECT statement ending in a WHERE clause (see keyset_query())
+        params: Positional parameters already used by query
+        limit: Page size
+        cursor: Cursor returned with the previous page, or None for the first page
+
+    Returns:
+        Tuple of (rows, next_cursor); next_cursor is None on the last page
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    # One extra row tells whether another page exists without a COUNT(*)
+    query, params = keyset_query(query, params, cursor, limit + 1)
+    rows = await conn.fetch(query, *params)
+
+    if len(rows) <= limit:
+        return list(rows), None
+
+    rows = rows[:limit]
+    return rows, encode_cursor(rows[-1]["created_at"], rows[-1]["id"])
+
+
+async def stream_keyset_rows(
+    conn: asyncpg.Connection,
+    query: str,
+    params: List[Any],
+    cursor: Optional[str] = None,
+    chunk_size: int = Pagination.STREAM_CHUNK_SIZE,
+) -> AsyncIterator[List[Any]]:
+    """
+    Iterate a keyset-ordered result through a server-side cursor.
+
+    Rows are pulled ``chunk_size`` at a time inside a read-only transaction,
+    so memory stays flat regardless of how many rows match.
+
+    Args:
+        conn: Database connection (held for the whole iteration)
+        query: SELECT statement ending in a WHERE clause (see keyset_query())
+        params: Positional parameters already used by query
+        cursor: Optional cursor to resume after
+        chunk_size: Rows fetched per round-trip
+
+    Yields:
+        Lists of at most chunk_size rows, newest first
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    query, params = keyset_query(query, params, cursor)
+
+    async with conn.transaction(readonly=True):
+        portal = await conn.cursor(query, *params)
+        while True:
+            rows = await portal.fetch(chunk_size)
+            if rows:
+                yield rows
+            if len(rows) < chunk_size:
+                break
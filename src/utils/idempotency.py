@@ -127,14 +127,14 @@ class RedisIdempotencyBackend(IdempotencyBackend):
         Initialize Redis backend.
 
         Args:
-            redis_client: Redis client instance
+            redis_client: redis.asyncio client instance (see AsyncRedisManager)
         """
         self._redis = redis_client
 
     async def get(self, key: str) -> Optional[Any]:
         """Get cached result for idempotency key."""
         redis_key = f"idempotency:{key}"
-        data = await asyncio.to_thread(self._redis.get, redis_key)
+        data = await self._redis.get(redis_key)
         if data:
             try:
                 logger.debug(f"Idempotency hit for key: {key[:16]}...")
@@ -150,7 +150,7 @@ class RedisIdempotencyBackend(IdempotencyBackend):
         # Serialize result to JSON
         data = json.dumps(result, default=str)
         # Use SETEX for atomic set with expiration
-        await asyncio.to_thread(self._redis.setex, redis_key, ttl_seconds, data)
+        await self._redis.setex(redis_key, ttl_seconds, data)
         logger.debug(f"Idempotency stored for key: {key[:16]}...")
 
     async def cleanup_expired(self) -> int:
@@ -202,14 +202,14 @@ class IdempotencyStore:
         """
         Auto-detect and initialize appropriate backend.
 
-        Uses RedisManager for a shared connection if available, falls back to in-memory.
+        Uses AsyncRedisManager for a shared connection if available, falls back to in-memory.
 
         Returns:
             IdempotencyBackend instance
         """
-        from src.core.infra.redis_manager import RedisManager
+        from src.core.infra.redis_manager import AsyncRedisManager
 
-        client = RedisManager.get_client()
+        client = AsyncRedisManager.get_client()
 
         if client is not None:
             logger.info("IdempotencyStore using Redis backend")
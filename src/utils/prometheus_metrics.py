@@ -138,6 +138,19 @@ BOT_RUNNING = Gauge(
 
 BOT_UPTIME_SECONDS = Gauge("vfs_bot_uptime_seconds", "Bot uptime in seconds", registry=REGISTRY)
 
+# WebSocket fan-out metrics
+WEBSOCKET_MESSAGES_DROPPED_TOTAL = Counter(
+    "vfs_websocket_messages_dropped_total",
+    "Broadcast messages not delivered because a client's send queue was full",
+    registry=REGISTRY,
+)
+
+WEBSOCKET_SLOW_CONSUMERS_TOTAL = Counter(
+    "vfs_websocket_slow_consumers_disconnected_total",
+    "WebSocket clients disconnected for falling behind on broadcasts",
+    registry=REGISTRY,
+)
+
 
 class MetricsHelper:
     """Helper class for common metrics operations."""
@@ -354,6 +367,16 @@ class MetricsHelper:
         """
         BOT_UPTIME_SECONDS.set(seconds)
 
+    @staticmethod
+    def record_websocket_message_dropped() -> None:
+        """Record a broadcast message dropped for a slow WebSocket client."""
+        WEBSOCKET_MESSAGES_DROPPED_TOTAL.inc()
+
+    @staticmethod
+    def record_websocket_slow_consumer() -> None:
+        """Record a WebSocket client disconnected for falling behind."""
+        WEBSOCKET_SLOW_CONSUMERS_TOTAL.inc()
+
 
 def get_metrics() -> bytes:
     """
@@ -0,0 +1,97 @@
+"""Integration tests for concurrent account acquisition against PostgreSQL."""
+
+import asyncio
+from typing import AsyncGenerator, List
+
+import pytest
+import pytest_asyncio
+
+from src.models.database import Database
+from src.repositories.account_pool_repository import AccountPoolRepository
+from src.services.session.account_pool import AccountPool
+
+POOL_SIZE = 60
+WORKERS = 32
+EMAIL_DOMAIN = "concurrency.test"
+
+
+async def _create_accounts(repo: AccountPoolRepository) -> List[int]:
+    """Add POOL_SIZE available accounts to the pool."""
+    return [
+        await repo.create_account(f"acquire{i}@{EMAIL_DOMAIN}", f"password-{i}", "+905550000000")
+        for i in range(POOL_SIZE)
+    ]
+
+
+async def _clear_pool(db: Database) -> None:
+    """Empty vfs_account_pool (usage log rows cascade)."""
+    async with db.get_connection() as conn:
+        await conn.execute("TRUNCATE TABLE vfs_account_pool RESTART IDENTITY CASCADE")
+
+
+@pytest_asyncio.fixture
+async def pool_db(test_db: Database) -> AsyncGenerator[Database, None]:
+    """Test database whose account pool holds only the accounts a test creates."""
+    await _clear_pool(test_db)
+    try:
+        yield test_db
+    finally:
+        await _clear_pool(test_db)
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_concurrent_acquire_never_double_assigns(pool_db: Database):
+    """Concurrent single and batch acquires drain the pool without sharing an account."""
+    repo = AccountPoolRepository(pool_db)
+    pool = AccountPool(db=pool_db)
+    created = await _create_accounts(repo)
+
+    async def worker(index: int) -> List[int]:
+        acquired: List[int] = []
+        while True:
+            if index % 2:
+                batch = await pool.acquire_accounts(3)
+                if not batch:
+                    return acquired
+                acquired.extend(account.id for account in batch)
+            else:
+                account = await pool.acquire_account()
+                if account is None:
+                    return acquired
+                acquired.append(account.id)
+
+    try:
+        results = await asyncio.gather(*(worker(i) for i in range(WORKERS)))
+        acquired = [account_id for ids in results for account_id in ids]
+        stats = await repo.get_pool_stats()
+    finally:
+        await pool.close()
+
+    assert len(acquired) == len(set(acquired)) == POOL_SIZE
+    assert set(acquired) == set(created)
+    assert stats["in_use"] == POOL_SIZE
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_batch_acquire_is_least_recently_used_first(pool_db: Database):
+    """acquire_accounts() claims the least recently used accounts, in LRU order."""
+    repo = AccountPoolRepository(pool_db)
+    pool = AccountPool(db=pool_db)
+    created = await _create_accounts(repo)
+
+    try:
+        async with pool_db.get_connection() as conn:
+            # Higher ids were used longer ago
+            await conn.execute(
+                "UPDATE vfs_account_pool SET last_used_at = NOW() - make_interval(secs => id) "
+                "WHERE id = ANY($1::bigint[])",
+                created,
+            )
+        accounts = await pool.acquire_accounts(3)
+    finally:
+        await pool.close()
+
+    assert [account.id for account in accounts] == sorted(created, reverse=True)[:3]
+    assert all(account.status == "in_use" for account in accounts)
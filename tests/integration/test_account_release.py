@@ -0,0 +1,84 @@
+"""Integration tests for releasing accounts and logging their usage in PostgreSQL."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.models.database import Database
+from src.repositories.account_pool_repository import AccountPoolRepository
+from src.services.session.account_usage_log import AccountUsageLogWriter
+
+EMAIL = "release@release.test"
+
+
+async def _delete_account(db: Database) -> None:
+    """Remove the account created by these tests (usage rows cascade)."""
+    async with db.get_connection() as conn:
+        await conn.execute("DELETE FROM vfs_account_pool WHERE email = $1", EMAIL)
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_release_failed_account_quarantines_at_threshold(test_db: Database):
+    """Failures are counted in the UPDATE; the third one quarantines the account."""
+    repo = AccountPoolRepository(test_db)
+    await _delete_account(test_db)
+    account_id = await repo.create_account(EMAIL, "password", "+905550000000")
+    quarantine_until = datetime.now(timezone.utc) + timedelta(minutes=30)
+
+    try:
+        results = [
+            await repo.release_failed_account(account_id, "login_fail", 3, quarantine_until)
+            for _ in range(3)
+        ]
+        account = await repo.get_account_by_id(account_id, decrypt=False)
+        missing = await repo.release_failed_account(-1, "error", 3, quarantine_until)
+    finally:
+        await _delete_account(test_db)
+
+    assert [r["status"] for r in results] == ["available", "available", "quarantine"]
+    assert [r["consecutive_failures"] for r in results] == [1, 2, 3]
+    assert results[0]["quarantine_until"] is None
+    assert results[2]["quarantine_until"] == quarantine_until
+    assert account is not None and account["total_uses"] == 3
+    assert missing is None
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_usage_log_writer_copies_entries(test_db: Database):
+    """Buffered usage entries land in account_usage_log when the writer drains."""
+    repo = AccountPoolRepository(test_db)
+    await _delete_account(test_db)
+    account_id = await repo.create_account(EMAIL, "password", "+905550000000")
+    writer = AccountUsageLogWriter(repo, flush_interval=60)
+    started_at = datetime.now(timezone.utc)
+
+    try:
+        await writer.start()
+        for session_number in range(1, 4):
+            await writer.log(
+                account_id=account_id,
+                mission_code="fra",
+                session_number=session_number,
+                result="no_slot",
+                started_at=started_at,
+                error_message="Requests: []",
+            )
+        await writer.stop()
+
+        async with test_db.get_connection() as conn:
+            rows = await conn.fetch(
+                "SELECT session_number, result FROM account_usage_log "
+                "WHERE account_id = $1 ORDER BY session_number",
+                account_id,
+            )
+    finally:
+        await _delete_account(test_db)
+
+    assert [(row["session_number"], row["result"]) for row in rows] == [
+        (1, "no_slot"),
+        (2, "no_slot"),
+        (3, "no_slot"),
+    ]
+    assert writer.get_metrics()["flushes"] == 1
@@ -0,0 +1,139 @@
+"""Benchmark account acquisition throughput for concurrent missions.
+
+Seeds ACQUIRE_BENCH_ACCOUNTS accounts in vfs_account_pool, then runs
+ACQUIRE_BENCH_ROUNDS rounds in which 1, 8 and 32 missions each need an
+account at the same moment. Accounts are put back to 'available' between
+rounds, outside the timed section. Reports accounts acquired per second for:
+
+- serialized: every acquire_account() behind one process-wide asyncio.Lock
+  (the previous behaviour),
+- lock-free: concurrent acquire_account() calls, relying on FOR UPDATE SKIP LOCKED,
+- batch: one acquire_accounts(n) statement for the round.
+
+Every round also checks that no account was handed to two missions.
+
+Requires PostgreSQL at TEST_DATABASE_URL with no other active accounts in
+vfs_account_pool (skipped otherwise).
+"""
+
+import asyncio
+import os
+import time
+from typing import Awaitable, Callable, Dict, List
+
+import pytest
+
+from src.constants import Database as DbConstants
+from src.models.database import Database
+from src.repositories.account_pool_repository import AccountPoolRepository
+from src.services.session.account_pool import AccountPool
+
+ACCOUNTS = int(os.getenv("ACQUIRE_BENCH_ACCOUNTS", "64"))
+ROUNDS = int(os.getenv("ACQUIRE_BENCH_ROUNDS", "40"))
+CONCURRENCY = (1, 8, 32)
+EMAIL_DOMAIN = "acquire-bench.test"
+
+
+async def _reset(db: Database) -> None:
+    """Put every benchmark account back to 'available'."""
+    async with db.get_connection() as conn:
+        await conn.execute(
+            "UPDATE vfs_account_pool SET status = 'available' WHERE email LIKE $1",
+            f"%@{EMAIL_DOMAIN}",
+        )
+
+
+async def _throughput(
+    db: Database, missions: int, round_: Callable[[int], Awaitable[List[int]]]
+) -> float:
+    """Run ROUNDS rounds of ``missions`` acquisitions; return accounts per second."""
+    elapsed = 0.0
+    for _ in range(ROUNDS):
+        await _reset(db)
+        start = time.perf_counter()
+        ids = await round_(missions)
+        elapsed += time.perf_counter() - start
+        assert len(ids) == len(set(ids)) == missions
+    return ROUNDS * missions / elapsed
+
+
+class TestAccountAcquireBenchmark:
+    """Accounts acquired per second at 1/8/32 concurrent missions."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.slow
+    async def test_lock_free_and_batch_acquire_throughput(self):
+        """Dropping the in-process lock lets concurrent missions acquire in parallel."""
+        database_url = os.getenv("TEST_DATABASE_URL", DbConstants.TEST_URL)
+        db = Database(database_url=database_url)
+        try:
+            await asyncio.wait_for(db.connect(), timeout=5)
+        except Exception as e:
+            pytest.skip(f"PostgreSQL not available: {e}")
+
+        repo = AccountPoolRepository(db)
+        pool = AccountPool(db=db)
+        lock = asyncio.Lock()
+
+        async def acquire_serialized() -> int:
+            async with lock:
+                account = await pool.acquire_account()
+            assert account is not None
+            return account.id
+
+        async def acquire_lock_free() -> int:
+            account = await pool.acquire_account()
+            assert account is not None
+            return account.id
+
+        async def serialized(n: int) -> List[int]:
+            return list(await asyncio.gather(*(acquire_serialized() for _ in range(n))))
+
+        async def lock_free(n: int) -> List[int]:
+            return list(await asyncio.gather(*(acquire_lock_free() for _ in range(n))))
+
+        async def batch(n: int) -> List[int]:
+            return [account.id for account in await pool.acquire_accounts(n)]
+
+        async with db.get_connection() as conn:
+            others = await conn.fetchval(
+                "SELECT COUNT(*) FROM vfs_account_pool WHERE is_active AND email NOT LIKE $1",
+                f"%@{EMAIL_DOMAIN}",
+            )
+        if others:
+            await db.close()
+            pytest.skip(f"vfs_account_pool has {others} other active accounts")
+
+        results: Dict[str, Dict[int, float]] = {"serialized": {}, "lock-free": {}, "batch": {}}
+        try:
+            async with db.get_connection() as conn:
+                await conn.execute(
+                    "DELETE FROM vfs_account_pool WHERE email LIKE $1", f"%@{EMAIL_DOMAIN}"
+                )
+            for i in range(ACCOUNTS):
+                await repo.create_account(f"bench{i}@{EMAIL_DOMAIN}", f"pw-{i}", "+905550000000")
+
+            for missions in CONCURRENCY:
+                results["serialized"][missions] = await _throughput(db, missions, serialized)
+                results["lock-free"][missions] = await _throughput(db, missions, lock_free)
+                results["batch"][missions] = await _throughput(db, missions, batch)
+        finally:
+            async with db.get_connection() as conn:
+                await conn.execute(
+                    "DELETE FROM vfs_account_pool WHERE email LIKE $1", f"%@{EMAIL_DOMAIN}"
+                )
+            await pool.close()
+            await db.close()
+
+        lines = [f"\nAccount acquire throughput, {ROUNDS} rounds, pool of {ACCOUNTS}:"]
+        lines.append("  missions " + "".join(f"{name:>14}" for name in results))
+        for missions in CONCURRENCY:
+            lines.append(
+                f"  {missions:>8} "
+                + "".join(f"{results[name][missions]:>10,.0f} /s" for name in results)
+            )
+        print("\n".join(lines))
+
+        top = CONCURRENCY[-1]
+        assert results["lock-free"][top] > results["serialized"][top]
+        assert results["batch"][top] > results["serialized"][top]
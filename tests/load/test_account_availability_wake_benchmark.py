@@ -0,0 +1,126 @@
+"""Benchmark how quickly AccountPool waiters wake after an account is released.
+
+Simulates ACCOUNT_WAKE_RELEASES releases from "another worker" at random
+intervals (0-ACCOUNT_WAKE_MAX_GAP_MS apart) while ACCOUNT_WAKE_WAITERS bot
+loops sit in wait_for_available_account() and acquire whatever frees up.
+Cooldowns elsewhere in the pool expire every ACCOUNT_WAKE_COOLDOWN_TICK
+seconds. Reports release -> wake latency and summary queries per release for:
+
+- polling: no LISTEN connection, so waiters only re-check at cooldown expiries
+  (the previous behaviour),
+- event-driven: each release is delivered as an ``account_pool_changed``
+  notification.
+
+The pool is an in-memory fake; no database is required.
+"""
+
+import asyncio
+import os
+import random
+import statistics
+import time
+from collections import deque
+from datetime import datetime, timedelta, timezone
+from typing import Any, Deque, Dict, List, Tuple
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.services.session.account_pool import AccountPool
+
+RELEASES = int(os.getenv("ACCOUNT_WAKE_RELEASES", "200"))
+WAITERS = int(os.getenv("ACCOUNT_WAKE_WAITERS", "4"))
+MAX_GAP_MS = float(os.getenv("ACCOUNT_WAKE_MAX_GAP_MS", "20"))
+COOLDOWN_TICK = float(os.getenv("ACCOUNT_WAKE_COOLDOWN_TICK", "0.5"))
+
+
+class FakePoolRepository:
+    """Counts available accounts; cooldowns elsewhere expire every COOLDOWN_TICK."""
+
+    def __init__(self) -> None:
+        self.available = 0
+        self.queries = 0
+        self.epoch = datetime.now(timezone.utc)
+
+    async def get_availability_summary(self) -> Dict[str, Any]:
+        self.queries += 1
+        elapsed = (datetime.now(timezone.utc) - self.epoch).total_seconds()
+        ticks = int(elapsed / COOLDOWN_TICK) + 1
+        next_tick = self.epoch + timedelta(seconds=ticks * COOLDOWN_TICK)
+        return {"available": self.available, "next_cooldown_until": next_tick}
+
+
+async def _run(event_driven: bool) -> Tuple[List[float], int]:
+    """Drive RELEASES releases through WAITERS waiters; return latencies and query count."""
+    db = MagicMock()
+    db.listen = AsyncMock(side_effect=None if event_driven else ConnectionError("no LISTEN"))
+    db.unlisten = AsyncMock()
+    db.ensure_listening = AsyncMock(return_value=event_driven)
+    db.notifications_active = event_driven
+
+    repo = FakePoolRepository()
+    shutdown = asyncio.Event()
+    with patch("src.services.session.account_pool.AccountPoolRepository", return_value=repo):
+        pool = AccountPool(db=db, shutdown_event=shutdown)
+
+    released: Deque[float] = deque()
+    latencies: List[float] = []
+    rng = random.Random(42)
+
+    async def bot_loop() -> None:
+        while not shutdown.is_set():
+            if not await pool.wait_for_available_account(timeout=None):
+                return
+            if repo.available > 0:
+                # acquire_account()
+                repo.available -= 1
+                latencies.append(time.perf_counter() - released.popleft())
+
+    async def other_worker() -> None:
+        for i in range(RELEASES):
+            await asyncio.sleep(rng.uniform(0, MAX_GAP_MS) / 1000)
+            released.append(time.perf_counter())
+            repo.available += 1
+            if event_driven:
+                # What the LISTEN connection delivers for the release's NOTIFY
+                pool.availability._on_notification(str(i))
+
+    waiters = [asyncio.create_task(bot_loop()) for _ in range(WAITERS)]
+    await other_worker()
+    while len(latencies) < RELEASES:
+        await asyncio.sleep(0.01)
+    shutdown.set()
+    await asyncio.gather(*waiters)
+    await pool.close()
+    return latencies, repo.queries
+
+
+def _p(latencies: List[float], q: float) -> float:
+    """Latency percentile in milliseconds."""
+    ordered = sorted(latencies)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))] * 1000
+
+
+class TestAccountAvailabilityWakeBenchmark:
+    """Release -> wake latency for waiting bot loops."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.slow
+    async def test_event_driven_wake_beats_polling(self):
+        """Waiters wake on the release itself instead of the next cooldown expiry."""
+        polling, polling_queries = await _run(event_driven=False)
+        events, event_queries = await _run(event_driven=True)
+
+        print(
+            f"\nAccount wake latency, {RELEASES} releases, {WAITERS} waiters, "
+            f"cooldown expiries every {COOLDOWN_TICK}s:"
+            f"\n  polling:      p50 {_p(polling, 0.5):8.2f} ms  p99 {_p(polling, 0.99):8.2f} ms"
+            f"  queries/release {polling_queries / RELEASES:.2f}"
+            f"\n  event-driven: p50 {_p(events, 0.5):8.2f} ms  p99 {_p(events, 0.99):8.2f} ms"
+            f"  queries/release {event_queries / RELEASES:.2f}"
+            f"\n  mean speedup: "
+            f"{statistics.mean(polling) / max(statistics.mean(events), 1e-9):.0f}x"
+        )
+
+        assert len(events) == len(polling) == RELEASES
+        assert _p(events, 0.5) < _p(polling, 0.5) / 10
@@ -0,0 +1,98 @@
+"""Benchmark per-iteration availability checks for a 5,000-account pool."""
+
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.repositories.account_pool_repository import AccountPoolRepository
+from src.services.session.account_pool import AccountPool
+from src.utils.encryption import encrypt_password
+
+POOL_SIZE = 5000
+ITERATIONS = 5
+
+
+class PoolConnection:
+    """In-memory connection serving a pool of accounts with real Fernet ciphertext."""
+
+    def __init__(self, size: int):
+        now = datetime.now(timezone.utc)
+        ciphertext = [encrypt_password(f"password-{i}") for i in range(size)]
+        self.rows = [
+            {
+                "id": i,
+                "email": f"account{i}@example.com",
+                "password": ciphertext[i],
+                "phone": "+905550000000",
+                "status": "available",
+                "last_used_at": None,
+                "cooldown_until": None,
+                "quarantine_until": None,
+                "consecutive_failures": 0,
+                "total_uses": 0,
+                "is_active": True,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for i in range(size)
+        ]
+
+    async def __aenter__(self) -> "PoolConnection":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        return None
+
+    async def fetch(self, query: str, *args: Any) -> List[Dict[str, Any]]:
+        return self.rows
+
+    async def fetchrow(self, query: str, *args: Any) -> Dict[str, Any]:
+        if "COUNT(*)" in query:
+            return {"available": len(self.rows), "next_cooldown_until": None}
+        return {"earliest_cooldown": None}
+
+
+async def _cpu_per_iteration(check) -> float:
+    """Average process CPU seconds for one availability check."""
+    await check()  # warm up
+    start = time.process_time()
+    for _ in range(ITERATIONS):
+        await check()
+    return (time.process_time() - start) / ITERATIONS
+
+
+class TestAccountPoolAvailabilityBenchmark:
+    """CPU cost of the bot loop's availability check against pool size."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.slow
+    async def test_count_only_check_skips_password_decryption(self):
+        """load_accounts() no longer decrypts every available account."""
+        db = MagicMock()
+        db.get_connection.return_value = PoolConnection(POOL_SIZE)
+        pool = AccountPool(db=db)
+        repo = AccountPoolRepository(db)
+
+        async def before():
+            # Previous load_accounts(): fetch and decrypt every available account
+            accounts = await repo.get_available_accounts()
+            assert len(accounts) == POOL_SIZE
+
+        async def after():
+            assert await pool.load_accounts() == POOL_SIZE
+            assert await pool.wait_for_available_account(timeout=1) is True
+
+        before_cpu = await _cpu_per_iteration(before)
+        after_cpu = await _cpu_per_iteration(after)
+
+        print(
+            f"\nAvailability check, {POOL_SIZE} accounts, per bot-loop iteration:"
+            f"\n  decrypt all (before):   {before_cpu * 1000:.2f} ms CPU"
+            f"\n  count-only (after):     {after_cpu * 1000:.3f} ms CPU"
+            f"\n  speedup: {before_cpu / max(after_cpu, 1e-9):.0f}x"
+        )
+
+        assert after_cpu < before_cpu / 10
@@ -0,0 +1,208 @@
+"""Benchmark the mission release path: usage logging plus account release.
+
+Seeds RELEASE_BENCH_MISSIONS in-use accounts in vfs_account_pool and releases
+each one once, RELEASE_BENCH_CONCURRENCY at a time, cycling through the
+results success, no_slot, login_fail and error (half of the missions fail).
+Reports release latency and database statements per mission for:
+
+- before: an INSERT into account_usage_log per mission, and for failures a
+  read of the account plus a ``SELECT consecutive_failures`` ahead of the
+  UPDATE (the previous behaviour),
+- after: usage entries queued for AccountUsageLogWriter (one COPY per batch,
+  counted once the writer drains) and one UPDATE ... RETURNING per release.
+
+Requires PostgreSQL at TEST_DATABASE_URL (skipped otherwise).
+"""
+
+import asyncio
+import os
+import statistics
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Any, AsyncIterator, Awaitable, Callable, List, Tuple
+
+import pytest
+
+from src.constants import Database as DbConstants
+from src.models.database import Database
+from src.repositories.account_pool_repository import AccountPoolRepository
+from src.services.session.account_pool import AccountPool
+from src.services.session.account_usage_log import AccountUsageLogWriter
+
+MISSIONS = int(os.getenv("RELEASE_BENCH_MISSIONS", "400"))
+CONCURRENCY = int(os.getenv("RELEASE_BENCH_CONCURRENCY", "8"))
+RESULTS = ("success", "no_slot", "login_fail", "error")
+EMAIL_DOMAIN = "release-bench.test"
+_STATEMENTS = {"execute", "executemany", "fetch", "fetchrow", "fetchval", "copy_records_to_table"}
+
+
+class CountingConnection:
+    """Connection proxy that counts statements sent to the server."""
+
+    def __init__(self, conn: Any, counter: List[int]):
+        self._conn = conn
+        self._counter = counter
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._conn, name)
+        if name in _STATEMENTS:
+            self._counter[0] += 1
+        return attr
+
+
+class CountingDatabase:
+    """Database wrapper whose connections count statements."""
+
+    def __init__(self, db: Database):
+        self._db = db
+        self.counter = [0]
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._db, name)
+
+    @asynccontextmanager
+    async def get_connection(self, *args: Any, **kwargs: Any) -> AsyncIterator[CountingConnection]:
+        async with self._db.get_connection(*args, **kwargs) as conn:
+            yield CountingConnection(conn, self.counter)
+
+
+async def _seed(db: Database) -> List[int]:
+    """Put every benchmark account in use with no failures, as after an acquire."""
+    async with db.get_connection() as conn:
+        await conn.execute(
+            "UPDATE vfs_account_pool SET status = 'in_use', consecutive_failures = 0, "
+            "cooldown_until = NULL, quarantine_until = NULL WHERE email LIKE $1",
+            f"%@{EMAIL_DOMAIN}",
+        )
+        await conn.execute(
+            "DELETE FROM account_usage_log WHERE account_id IN "
+            "(SELECT id FROM vfs_account_pool WHERE email LIKE $1)",
+            f"%@{EMAIL_DOMAIN}",
+        )
+        rows = await conn.fetch(
+            "SELECT id FROM vfs_account_pool WHERE email LIKE $1 ORDER BY id",
+            f"%@{EMAIL_DOMAIN}",
+        )
+    return [row["id"] for row in rows]
+
+
+async def _run(
+    counting: CountingDatabase,
+    account_ids: List[int],
+    release: Callable[[int, str, datetime], Awaitable[None]],
+) -> Tuple[List[float], int]:
+    """Release every account once; return per-mission latencies and statements issued."""
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+    latencies: List[float] = []
+    started_at = datetime.now(timezone.utc)
+    counting.counter[0] = 0
+
+    async def mission(i: int, account_id: int) -> None:
+        async with semaphore:
+            start = time.perf_counter()
+            await release(account_id, RESULTS[i % len(RESULTS)], started_at)
+            latencies.append(time.perf_counter() - start)
+
+    await asyncio.gather(*(mission(i, account_id) for i, account_id in enumerate(account_ids)))
+    return latencies, counting.counter[0]
+
+
+def _p(latencies: List[float], q: float) -> float:
+    """Latency percentile in milliseconds."""
+    ordered = sorted(latencies)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))] * 1000
+
+
+class TestAccountReleaseBenchmark:
+    """Release latency and statements per mission, before and after."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.slow
+    async def test_single_update_and_buffered_usage_log(self):
+        """One UPDATE ... RETURNING per release; usage entries leave the critical path."""
+        database_url = os.getenv("TEST_DATABASE_URL", DbConstants.TEST_URL)
+        db = Database(database_url=database_url)
+        try:
+            await asyncio.wait_for(db.connect(), timeout=5)
+        except Exception as e:
+            pytest.skip(f"PostgreSQL not available: {e}")
+
+        counting = CountingDatabase(db)
+        repo = AccountPoolRepository(counting)  # type: ignore[arg-type]
+        pool = AccountPool(db=counting)  # type: ignore[arg-type]
+        writer = AccountUsageLogWriter(repo)
+
+        async def before(account_id: int, result: str, started_at: datetime) -> None:
+            await repo.log_usage(account_id, "fra", 1, result, started_at)
+            now = datetime.now(timezone.utc)
+            if result in ("success", "no_slot"):
+                await repo.release_account(
+                    account_id, result, cooldown_until=now + timedelta(seconds=600)
+                )
+                return
+            account = await repo.get_account_by_id(account_id, decrypt=False)
+            assert account is not None
+            async with counting.get_connection() as conn:
+                await conn.fetchrow(
+                    "SELECT consecutive_failures FROM vfs_account_pool WHERE id = $1",
+                    account_id,
+                )
+            quarantine = account["consecutive_failures"] + 1 >= pool.max_failures
+            await repo.release_account(
+                account_id,
+                result,
+                quarantine_until=now + timedelta(seconds=1800) if quarantine else None,
+            )
+
+        async def after(account_id: int, result: str, started_at: datetime) -> None:
+            await writer.log(account_id, "fra", 1, result, started_at)
+            await pool.release_account(account_id, result)
+
+        try:
+            async with db.get_connection() as conn:
+                await conn.execute(
+                    "DELETE FROM vfs_account_pool WHERE email LIKE $1", f"%@{EMAIL_DOMAIN}"
+                )
+            for i in range(MISSIONS):
+                await repo.create_account(f"rel{i}@{EMAIL_DOMAIN}", f"pw-{i}", "+905550000000")
+
+            before_latency, before_statements = await _run(counting, await _seed(db), before)
+
+            account_ids = await _seed(db)
+            await writer.start()
+            after_latency, after_statements = await _run(counting, account_ids, after)
+            await writer.stop()
+            after_statements = counting.counter[0]
+
+            async with db.get_connection() as conn:
+                logged = await conn.fetchval(
+                    "SELECT COUNT(*) FROM account_usage_log WHERE account_id = ANY($1::bigint[])",
+                    account_ids,
+                )
+        finally:
+            async with db.get_connection() as conn:
+                await conn.execute(
+                    "DELETE FROM vfs_account_pool WHERE email LIKE $1", f"%@{EMAIL_DOMAIN}"
+                )
+            await pool.close()
+            await db.close()
+
+        print(
+            f"\nMission release, {MISSIONS} missions at concurrency {CONCURRENCY}, "
+            f"half failures:"
+            f"\n  before: p50 {_p(before_latency, 0.5):6.2f} ms  "
+            f"p99 {_p(before_latency, 0.99):6.2f} ms  "
+            f"mean {statistics.mean(before_latency) * 1000:6.2f} ms  "
+            f"statements/mission {before_statements / MISSIONS:.2f}"
+            f"\n  after:  p50 {_p(after_latency, 0.5):6.2f} ms  "
+            f"p99 {_p(after_latency, 0.99):6.2f} ms  "
+            f"mean {statistics.mean(after_latency) * 1000:6.2f} ms  "
+            f"statements/mission {after_statements / MISSIONS:.2f}"
+            f" (usage log: {writer.get_metrics()['flushes']} COPY)"
+        )
+
+        assert logged == MISSIONS
+        assert before_statements == MISSIONS * 2 + MISSIONS // 2 * 2
+        assert after_statements < MISSIONS * 1.1
+        assert statistics.mean(after_latency) < statistics.mean(before_latency)
@@ -0,0 +1,109 @@
+"""Benchmark for bulk person loading in AppointmentRequestRepository."""
+
+import asyncio
+import json
+import time
+from typing import Any, Dict, List
+
+import pytest
+
+from src.repositories.appointment_request_repository import AppointmentRequestRepository
+
+SIMULATED_LATENCY_SECONDS = 0.0005
+
+
+class RoundTripCountingConnection:
+    """In-memory connection that counts round-trips and simulates network latency."""
+
+    def __init__(self, request_count: int, persons_per_request: int = 2):
+        self.round_trips = 0
+        self.requests = [
+            {
+                "id": i,
+                "country_code": "fra",
+                "visa_category": "Schengen",
+                "visa_subcategory": "Tourism",
+                "centres": json.dumps(["Istanbul"]),
+                "preferred_dates": json.dumps([]),
+                "person_count": persons_per_request,
+                "status": "pending",
+                "created_at": f"2025-01-01T00:00:{i % 60:02d}",
+            }
+            for i in range(1, request_count + 1)
+        ]
+        self.persons = [
+            {"id": i * 10 + j, "request_id": i, "email": f"p{i}_{j}@example.com"}
+            for i in range(1, request_count + 1)
+            for j in range(persons_per_request)
+        ]
+
+    async def __aenter__(self) -> "RoundTripCountingConnection":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        return None
+
+    async def _round_trip(self) -> None:
+        self.round_trips += 1
+        await asyncio.sleep(SIMULATED_LATENCY_SECONDS)
+
+    async def fetchrow(self, query: str, *args: Any) -> Dict[str, Any]:
+        await self._round_trip()
+        return {"email": "p1_0@example.com"}
+
+    async def fetch(self, query: str, *args: Any) -> List[Dict[str, Any]]:
+        await self._round_trip()
+        if "FROM appointment_persons" in query and "ANY(" in query:
+            wanted = set(args[0])
+            return [p for p in self.persons if p["request_id"] in wanted]
+        if "FROM appointment_persons" in query and "WHERE request_id = $1" in query:
+            return [p for p in self.persons if p["request_id"] == args[0]]
+        return list(self.requests)
+
+
+class _Database:
+    def __init__(self, conn: RoundTripCountingConnection):
+        self._conn = conn
+
+    def get_connection(self) -> RoundTripCountingConnection:
+        return self._conn
+
+
+class TestAppointmentRequestBulkLoad:
+    """Round-trip count and latency for get_all() as the request count grows."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.slow
+    @pytest.mark.parametrize("request_count", [10, 100, 1000, 3000])
+    async def test_get_all_round_trips_constant(self, request_count: int):
+        """get_all() uses the same number of round-trips for any number of requests."""
+        conn = RoundTripCountingConnection(request_count)
+        repo = AppointmentRequestRepository(_Database(conn))  # type: ignore[arg-type]
+
+        start_time = time.perf_counter()
+        requests = await repo.get_all(status="pending")
+        elapsed = time.perf_counter() - start_time
+
+        assert len(requests) == request_count
+        assert all(len(r.persons) == 2 for r in requests)
+        assert conn.round_trips == 2
+
+        print(
+            f"get_all: {request_count} requests, {conn.round_trips} round-trips "
+            f"in {elapsed * 1000:.1f}ms"
+        )
+
+    @pytest.mark.asyncio
+    @pytest.mark.slow
+    @pytest.mark.parametrize("request_count", [10, 100, 1000])
+    async def test_get_all_pending_for_user_round_trips_constant(self, request_count: int):
+        """get_all_pending_for_user() uses a constant number of round-trips."""
+        conn = RoundTripCountingConnection(request_count)
+        repo = AppointmentRequestRepository(_Database(conn))  # type: ignore[arg-type]
+
+        requests = await repo.get_all_pending_for_user(user_id=1)
+
+        assert len(requests) == request_count
+        assert conn.round_trips == 3
+
+        print(f"get_all_pending_for_user: {request_count} requests, {conn.round_trips} round-trips")
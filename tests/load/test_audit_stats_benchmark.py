@@ -0,0 +1,173 @@
+"""Benchmark /api/v1/audit/stats aggregation over a large audit log.
+
+Loads AUDIT_STATS_BENCH_ROWS audit rows (default 5M, spread over 90 days) into
+a scratch schema with migration 015 applied, then compares:
+
+- the previous route logic (fetch 10,000 rows, count in Python; wrong past 10k),
+- a raw ``GROUP BY`` / ``COUNT(*) FILTER`` scan of audit_log,
+- AuditLogRepository.get_stats() answered from the trigger-maintained rollup.
+
+Requires PostgreSQL at TEST_DATABASE_URL (skipped otherwise).
+"""
+
+import importlib.util
+import os
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, AsyncIterator, Awaitable, Callable, List
+
+import asyncpg
+import pytest
+
+from src.constants import Database as DbConstants
+from src.repositories.audit_log_repository import AuditLogRepository
+
+ROWS = int(os.getenv("AUDIT_STATS_BENCH_ROWS", "5000000"))
+LOAD_BATCH = 100_000
+ITERATIONS = 5
+SCHEMA = "bench_audit_stats"
+
+COPY_COLUMNS = ["action", "username", "ip_address", "timestamp", "success", "created_at"]
+ACTIONS = ["login_success", "login_failure", "user_created", "token_refresh", "slot_checked"]
+MIGRATION = Path(__file__).parents[2] / "alembic/versions/015_audit_log_hourly_rollup.py"
+
+RAW_STATS_SQL = """
+    SELECT action, COUNT(*) AS total, COUNT(*) FILTER (WHERE success IS FALSE) AS failures
+    FROM audit_log
+    WHERE $1::timestamptz IS NULL OR created_at >= $1
+    GROUP BY action
+"""
+
+
+def _migration_statements() -> List[str]:
+    """SQL executed by migration 015's upgrade(), captured instead of run through Alembic."""
+    spec = importlib.util.spec_from_file_location("audit_rollup_migration", MIGRATION)
+    assert spec is not None and spec.loader is not None
+    migration = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(migration)
+    statements: List[str] = []
+    migration.op = SimpleNamespace(execute=statements.append)
+    migration.upgrade()
+    return statements
+
+
+class _SingleConnectionDatabase:
+    """Minimal Database stand-in handing out one existing connection."""
+
+    def __init__(self, conn: asyncpg.Connection):
+        self.conn = conn
+
+    @asynccontextmanager
+    async def get_connection(self) -> AsyncIterator[asyncpg.Connection]:
+        yield self.conn
+
+
+async def _timed(query: Callable[[], Awaitable[Any]]) -> float:
+    """Average wall-clock seconds for one call after a warm-up call."""
+    await query()
+    start_time = time.perf_counter()
+    for _ in range(ITERATIONS):
+        await query()
+    return (time.perf_counter() - start_time) / ITERATIONS
+
+
+class TestAuditStatsBenchmark:
+    """Stats latency from raw audit rows vs. the hourly rollup."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.slow
+    async def test_rollup_vs_raw_aggregation(self):
+        """The rollup answers all-time and ranged stats in O(buckets), matching raw counts."""
+        database_url = os.getenv("TEST_DATABASE_URL", DbConstants.TEST_URL)
+        try:
+            conn = await asyncpg.connect(database_url, timeout=5)
+        except Exception as e:
+            pytest.skip(f"PostgreSQL not available: {e}")
+
+        try:
+            await conn.execute(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE")
+            await conn.execute(f"CREATE SCHEMA {SCHEMA}")
+            await conn.execute(f"SET search_path TO {SCHEMA}, public")
+            await conn.execute("""
+                CREATE TABLE audit_log (
+                    id BIGSERIAL PRIMARY KEY,
+                    action TEXT NOT NULL,
+                    user_id BIGINT,
+                    username TEXT,
+                    ip_address TEXT,
+                    user_agent TEXT,
+                    details TEXT,
+                    timestamp TEXT NOT NULL,
+                    success BOOLEAN DEFAULT TRUE,
+                    created_at TIMESTAMPTZ DEFAULT NOW()
+                )
+            """)
+            await conn.execute("CREATE INDEX idx_audit_log_timestamp ON audit_log(timestamp)")
+            for statement in _migration_statements():
+                await conn.execute(statement)
+
+            # Rows go through the insert trigger, as they would from the audit writer
+            now = datetime.now(timezone.utc)
+            load_start = time.perf_counter()
+            for offset in range(0, ROWS, LOAD_BATCH):
+                records = []
+                for i in range(offset, min(offset + LOAD_BATCH, ROWS)):
+                    created_at = now - timedelta(seconds=(i * 7919) % (90 * 86400))
+                    records.append(
+                        (
+                            ACTIONS[i % len(ACTIONS)],
+                            f"user{i % 1000}",
+                            "10.0.0.1",
+                            created_at.isoformat(),
+                            i % 20 != 0,
+                            created_at,
+                        )
+                    )
+                await conn.copy_records_to_table(
+                    "audit_log",
+                    records=records,
+                    columns=COPY_COLUMNS,
+                    schema_name=SCHEMA,
+                )
+            load_seconds = time.perf_counter() - load_start
+            await conn.execute("ANALYZE audit_log")
+            await conn.execute("ANALYZE audit_log_hourly")
+
+            repo = AuditLogRepository(_SingleConnectionDatabase(conn))  # type: ignore[arg-type]
+            week_ago = now - timedelta(days=7)
+
+            async def legacy():
+                # Previous route: newest 10,000 rows counted in Python
+                logs = await repo.get_all(limit=10000)
+                return len(logs), sum(1 for log in logs if not log["success"])
+
+            timings = {
+                "legacy (10k rows)": await _timed(legacy),
+                "raw GROUP BY, all": await _timed(lambda: conn.fetch(RAW_STATS_SQL, None)),
+                "rollup, all": await _timed(lambda: repo.get_stats()),
+                "raw GROUP BY, 7d": await _timed(lambda: conn.fetch(RAW_STATS_SQL, week_ago)),
+                "rollup, 7d": await _timed(lambda: repo.get_stats(since=week_ago)),
+            }
+
+            raw = await conn.fetch(RAW_STATS_SQL, None)
+            stats = await repo.get_stats()
+            buckets = await conn.fetchval("SELECT COUNT(*) FROM audit_log_hourly")
+        finally:
+            await conn.execute(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE")
+            await conn.close()
+
+        print(
+            f"\nAudit stats over {ROWS:,} rows ({buckets:,} rollup rows), "
+            f"loaded through trigger at {ROWS / load_seconds:,.0f} rows/s:"
+        )
+        for name, seconds in timings.items():
+            print(f"  {name:<20} {seconds * 1000:>10.2f} ms")
+
+        assert stats["total"] == ROWS
+        assert stats["by_action"] == {row["action"]: row["total"] for row in raw}
+        assert stats["total"] - stats["successes"] == sum(row["failures"] for row in raw)
+        assert timings["rollup, all"] < timings["raw GROUP BY, all"]
+        assert timings["rollup, 7d"] < timings["raw GROUP BY, 7d"]
@@ -0,0 +1,198 @@
+"""Benchmark mission browser provisioning: one Chromium per mission vs. a warm pool.
+
+Runs short "missions" (open page, load a local static-HTML fixture site, fill a
+form, follow a link) with AccountPoolConfig.MAX_CONCURRENT_MISSIONS in flight,
+and reports missions per minute and peak RSS of the process tree (Python plus
+every Chromium process).
+
+Tune with BROWSER_BENCH_MISSIONS.
+"""
+
+import asyncio
+import os
+import threading
+import time
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Awaitable, Callable, Dict
+
+import pytest
+
+from src.constants import AccountPoolConfig, BrowserPoolConfig
+from src.services.bot.browser_manager import BrowserManager
+from src.services.bot.browser_pool import BrowserPool
+
+pytest.importorskip("playwright.async_api")
+
+MISSIONS = int(os.getenv("BROWSER_BENCH_MISSIONS", "30"))
+CONCURRENCY = AccountPoolConfig.MAX_CONCURRENT_MISSIONS
+
+CONFIG = {
+    "bot": {"headless": True},
+    "anti_detection": {"enabled": True, "stealth_mode": True, "fingerprint_bypass": True},
+}
+
+_LOGIN_HTML = """<!doctype html>
+<html><head><title>Login</title><style>body { font-family: sans-serif; }</style></head>
+<body>
+  <form action="appointment.html">
+    <input name="email" type="email"><input name="password" type="password">
+    <button id="login" type="submit">Sign in</button>
+  </form>
+</body></html>
+"""
+
+_APPOINTMENT_HTML = """<!doctype html>
+<html><head><title>Appointment</title></head>
+<body>
+  <select id="centres">{options}</select>
+  <table>{rows}</table>
+</body></html>
+""".format(
+    options="".join(f"<option>Centre {i}</option>" for i in range(50)),
+    rows="".join(
+        f"<tr><td>2026-11-{i % 28 + 1:02d}</td><td>slot {i}</td></tr>" for i in range(500)
+    ),
+)
+
+
+class _QuietHandler(SimpleHTTPRequestHandler):
+    """Static file handler that doesn't log every request."""
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+def _process_tree_rss_mb() -> float:
+    """Resident memory of this process and all descendants (Linux /proc)."""
+    parents: Dict[int, int] = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            stat = Path(f"/proc/{entry}/stat").read_text()
+        except OSError:
+            continue
+        parents[int(entry)] = int(stat.rsplit(")", 1)[1].split()[1])
+
+    tree = {os.getpid()}
+    changed = True
+    while changed:
+        children = {pid for pid, ppid in parents.items() if ppid in tree} - tree
+        tree |= children
+        changed = bool(children)
+
+    total_kb = 0
+    for pid in tree:
+        try:
+            for line in Path(f"/proc/{pid}/status").read_text().splitlines():
+                if line.startswith("VmRSS:"):
+                    total_kb += int(line.split()[1])
+        except OSError:
+            continue
+    return total_kb / 1024
+
+
+async def _mission(page, base_url: str) -> None:
+    """Short mission: log in on the fixture site and read the slot table."""
+    await page.goto(f"{base_url}/login.html")
+    await page.fill("input[name=email]", "user@example.com")
+    await page.fill("input[name=password]", "secret")
+    await page.click("#login")
+    await page.wait_for_selector("#centres")
+    assert await page.locator("tr").count() == 500
+
+
+async def _run(provision: Callable[[], Awaitable[None]]) -> Dict[str, float]:
+    """Run MISSIONS missions with CONCURRENCY in flight; sample tree RSS meanwhile."""
+    peak_rss = 0.0
+    done = asyncio.Event()
+
+    async def sample_rss():
+        nonlocal peak_rss
+        while not done.is_set():
+            peak_rss = max(peak_rss, _process_tree_rss_mb())
+            await asyncio.sleep(0.05)
+
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+
+    async def one():
+        async with semaphore:
+            await provision()
+
+    sampler = asyncio.create_task(sample_rss())
+    start_time = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(MISSIONS)))
+    elapsed = time.perf_counter() - start_time
+    done.set()
+    await sampler
+
+    return {"missions_per_minute": MISSIONS / elapsed * 60, "peak_rss_mb": peak_rss}
+
+
+class TestBrowserPoolMissionsBenchmark:
+    """Missions per minute and peak RSS with and without the warm browser pool."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.slow
+    async def test_pooled_contexts_vs_browser_per_mission(self, tmp_path):
+        """Leasing contexts from warm browsers beats launching Chromium per mission."""
+        (tmp_path / "login.html").write_text(_LOGIN_HTML)
+        (tmp_path / "appointment.html").write_text(_APPOINTMENT_HTML)
+        handler = partial(_QuietHandler, directory=str(tmp_path))
+        server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        base_url = f"http://127.0.0.1:{server.server_port}"
+
+        probe = BrowserManager(CONFIG)
+        try:
+            await probe.start(create_context=False)
+        except Exception as e:
+            server.shutdown()
+            pytest.skip(f"Chromium not available: {e}")
+        await probe.close()
+
+        async def browser_per_mission():
+            # Previous SessionOrchestrator behaviour
+            browser = BrowserManager(CONFIG)
+            await browser.start()
+            try:
+                page = await browser.new_page()
+                await _mission(page, base_url)
+                await page.close()
+            finally:
+                await browser.close()
+
+        pool = BrowserPool(
+            CONFIG,
+            max_browsers=BrowserPoolConfig.MAX_BROWSERS,
+            idle_timeout_minutes=BrowserPoolConfig.IDLE_TIMEOUT_MINUTES,
+        )
+
+        async def pooled_context():
+            async with await pool.lease() as lease:
+                page = await lease.new_page()
+                await _mission(page, base_url)
+                await page.close()
+
+        try:
+            legacy = await _run(browser_per_mission)
+            pooled = await _run(pooled_context)
+            stats = pool.get_stats()
+        finally:
+            await pool.close_all()
+            server.shutdown()
+
+        print(
+            f"\nMission browsers: {MISSIONS} missions, concurrency {CONCURRENCY}"
+            f"\n  browser per mission: {legacy['missions_per_minute']:.0f} missions/min, "
+            f"peak RSS {legacy['peak_rss_mb']:.0f} MB"
+            f"\n  warm pool ({BrowserPoolConfig.MAX_BROWSERS} browsers x "
+            f"{BrowserPoolConfig.CONTEXTS_PER_BROWSER} contexts): "
+            f"{pooled['missions_per_minute']:.0f} missions/min, "
+            f"peak RSS {pooled['peak_rss_mb']:.0f} MB"
+        )
+
+        assert stats["shared_browsers"] <= BrowserPoolConfig.MAX_BROWSERS
+        assert pooled["missions_per_minute"] > legacy["missions_per_minute"]
@@ -0,0 +1,191 @@
+"""Benchmark the centre -> category -> subcategory dropdown cascade.
+
+Stores a synthetic dropdown blob (DROPDOWN_BENCH_CENTRES centres, 12
+categories each, 15 subcategories per category) in vfs_dropdown_cache with
+migration 017 applied, then drives DROPDOWN_BENCH_CASCADES three-request
+cascades over ``httpx.ASGITransport``, DROPDOWN_BENCH_CONCURRENCY at a time,
+and reports requests per second for:
+
+- the previous routes: each request fetches and parses the whole country blob,
+- the in-process DropdownCache (blob parsed once, index lookups),
+- the same with If-None-Match, so every request is answered with 304.
+
+It also checks that an upsert reaches the cache through NOTIFY.
+
+Requires PostgreSQL at TEST_DATABASE_URL (skipped otherwise).
+"""
+
+import asyncio
+import importlib.util
+import logging
+import os
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional
+
+import httpx
+import pytest
+from fastapi import APIRouter, Depends, FastAPI
+
+from src.constants import Database as DbConstants
+from src.models.database import Database
+from src.repositories.dropdown_cache_repository import DropdownCacheRepository
+from src.services.dropdown_cache import close_dropdown_cache, get_dropdown_cache
+from web.dependencies import get_db
+from web.routes.appointments import router
+
+CENTRES = int(os.getenv("DROPDOWN_BENCH_CENTRES", "60"))
+CASCADES = int(os.getenv("DROPDOWN_BENCH_CASCADES", "2000"))
+CONCURRENCY = int(os.getenv("DROPDOWN_BENCH_CONCURRENCY", "50"))
+COUNTRY = "zzb"
+PREFIX = "/appointments/countries"
+MIGRATIONS = Path(__file__).parents[2] / "alembic/versions"
+
+
+def _migration_statements(filename: str) -> List[str]:
+    """SQL executed by a migration's upgrade(), captured instead of run through Alembic."""
+    spec = importlib.util.spec_from_file_location(filename, MIGRATIONS / filename)
+    assert spec is not None and spec.loader is not None
+    migration = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(migration)
+    statements: List[str] = []
+    migration.op = SimpleNamespace(execute=statements.append)
+    migration.upgrade()
+    return statements
+
+
+def _dropdown_data() -> Dict[str, Dict[str, List[str]]]:
+    """Synthetic country blob shaped like DropdownSyncService output."""
+    return {
+        f"Centre {c:03d}": {
+            f"Category {k:02d}": [f"Subcategory {c:03d}-{k:02d}-{s:02d}" for s in range(15)]
+            for k in range(12)
+        }
+        for c in range(CENTRES)
+    }
+
+
+def _legacy_router() -> APIRouter:
+    """The previous dropdown routes: one repository fetch and parse per request."""
+    legacy = APIRouter(prefix="/appointments")
+
+    @legacy.get("/countries/{country_code}/centres")
+    async def centres(country_code: str, db=Depends(get_db)):
+        return await DropdownCacheRepository(db).get_centres(country_code)
+
+    @legacy.get("/countries/{country_code}/centres/{centre_name}/categories")
+    async def categories(country_code: str, centre_name: str, db=Depends(get_db)):
+        return await DropdownCacheRepository(db).get_categories(country_code, centre_name)
+
+    @legacy.get(
+        "/countries/{country_code}/centres/{centre_name}/categories/{category_name}/subcategories"
+    )
+    async def subcategories(
+        country_code: str, centre_name: str, category_name: str, db=Depends(get_db)
+    ):
+        return await DropdownCacheRepository(db).get_subcategories(
+            country_code, centre_name, category_name
+        )
+
+    return legacy
+
+
+def _app(db: Database, dropdown_router: APIRouter) -> FastAPI:
+    """Minimal app serving the dropdown routes from the benchmark database."""
+    app = FastAPI()
+    app.include_router(dropdown_router)
+    app.dependency_overrides[get_db] = lambda: db
+    return app
+
+
+async def _cascades(app: FastAPI, conditional: bool) -> float:
+    """Run CASCADES cascades, CONCURRENCY at a time; return requests per second."""
+    etags: Dict[str, Optional[str]] = {}
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+
+        async def get(path: str) -> Any:
+            headers = {"If-None-Match": etags[path]} if conditional and etags.get(path) else {}
+            response = await client.get(path, headers=headers)
+            if response.status_code == 304:
+                return None
+            assert response.status_code == 200, response.text
+            etags[path] = response.headers.get("etag")
+            return response.json()
+
+        async def cascade(i: int) -> None:
+            centre = f"Centre {i % CENTRES:03d}"
+            category = f"Category {i % 12:02d}"
+            async with semaphore:
+                await get(f"{PREFIX}/{COUNTRY}/centres")
+                await get(f"{PREFIX}/{COUNTRY}/centres/{centre}/categories")
+                await get(
+                    f"{PREFIX}/{COUNTRY}/centres/{centre}/categories/{category}/subcategories"
+                )
+
+        # Warm-up: first parse, and every path's ETag for the conditional run
+        for i in range(CENTRES * 12):
+            await cascade(i)
+        start_time = time.perf_counter()
+        await asyncio.gather(*(cascade(i) for i in range(CASCADES)))
+        return CASCADES * 3 / (time.perf_counter() - start_time)
+
+
+class TestDropdownCascadeBenchmark:
+    """Requests/second for the cascading dropdown routes."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.slow
+    async def test_cached_cascade_vs_blob_per_request(self):
+        """Index lookups and 304s out-run parsing the blob on every request."""
+        # httpx logs every request at INFO, which would dominate the timings
+        logging.getLogger("httpx").setLevel(logging.WARNING)
+        database_url = os.getenv("TEST_DATABASE_URL", DbConstants.TEST_URL)
+        db = Database(database_url=database_url)
+        try:
+            await asyncio.wait_for(db.connect(), timeout=5)
+        except Exception as e:
+            pytest.skip(f"PostgreSQL not available: {e}")
+
+        repo = DropdownCacheRepository(db)
+        try:
+            async with db.get_connection() as conn:
+                for statement in _migration_statements("010_add_dropdown_cache.py"):
+                    await conn.execute(statement)
+                for statement in _migration_statements("017_dropdown_cache_notify.py"):
+                    await conn.execute(statement)
+            await repo.upsert_dropdown_data(COUNTRY, _dropdown_data())
+
+            legacy_rps = await _cascades(_app(db, _legacy_router()), conditional=False)
+            cached_rps = await _cascades(_app(db, router), conditional=False)
+            revalidated_rps = await _cascades(_app(db, router), conditional=True)
+
+            cache = get_dropdown_cache(db)
+            listening = cache.is_listening
+            before = await cache.get(COUNTRY)
+            await repo.upsert_dropdown_data(COUNTRY, {"Centre new": {"Category 00": ["Only"]}})
+            for _ in range(50):
+                if COUNTRY not in cache._entries:
+                    break
+                await asyncio.sleep(0.02)
+            after = await cache.get(COUNTRY)
+        finally:
+            await repo.delete_dropdown_data(COUNTRY)
+            await close_dropdown_cache()
+            await db.close()
+
+        print(
+            f"\nDropdown cascade ({CENTRES} centres x 12 categories x 15 subcategories), "
+            f"{CASCADES} cascades at concurrency {CONCURRENCY}:"
+            f"\n  blob fetched and parsed per request: {legacy_rps:,.0f} req/s"
+            f"\n  in-process DropdownCache:           {cached_rps:,.0f} req/s"
+            f"\n  DropdownCache + If-None-Match (304): {revalidated_rps:,.0f} req/s"
+            f"\n  invalidated via NOTIFY: {listening and before is not after}"
+        )
+
+        assert before is not None and after is not None
+        assert after.centres == ["Centre new"] and after.etag != before.etag
+        assert cached_rps > legacy_rps
@@ -0,0 +1,115 @@
+"""Benchmark keyset pagination and server-side cursor streaming on audit_log.
+
+Loads KEYSET_BENCH_ROWS audit-log rows into a temporary table and reports:
+
+- latency of a deep page with ``OFFSET`` vs. a keyset cursor,
+- peak Python heap (tracemalloc) of fetching every row at once vs.
+  streaming them with stream_keyset_rows().
+
+Requires PostgreSQL at TEST_DATABASE_URL (skipped otherwise).
+"""
+
+import os
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+
+import asyncpg
+import pytest
+
+from src.constants import Database as DbConstants
+from src.utils.db_helpers import encode_cursor, fetch_keyset_page, stream_keyset_rows
+
+ROWS = int(os.getenv("KEYSET_BENCH_ROWS", "1000000"))
+PAGE_SIZE = 100
+DEEP_PAGE = ROWS // PAGE_SIZE - 1
+
+BASE_QUERY = "SELECT * FROM audit_log WHERE 1=1"
+
+
+class TestKeysetPaginationBenchmark:
+    """Deep-page latency and streaming memory for list endpoints."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.slow
+    async def test_keyset_vs_offset_and_streaming_memory(self):
+        """Keyset pages stay fast at depth; streaming keeps the heap flat."""
+        database_url = os.getenv("TEST_DATABASE_URL", DbConstants.TEST_URL)
+        try:
+            conn = await asyncpg.connect(database_url, timeout=5)
+        except Exception as e:
+            pytest.skip(f"PostgreSQL not available: {e}")
+
+        try:
+            # Temp table shadows any real audit_log for this session
+            await conn.execute("""
+                CREATE TEMP TABLE audit_log (
+                    id BIGINT PRIMARY KEY,
+                    action TEXT NOT NULL,
+                    username TEXT,
+                    details TEXT,
+                    timestamp TEXT NOT NULL,
+                    success BOOLEAN DEFAULT TRUE,
+                    created_at TIMESTAMPTZ NOT NULL
+                )
+            """)
+            newest = datetime.now(timezone.utc)
+            await conn.copy_records_to_table(
+                "audit_log",
+                records=[
+                    (
+                        i,
+                        "login_success",
+                        f"user{i % 1000}",
+                        '{"login_method": "password"}',
+                        (newest - timedelta(seconds=i)).isoformat(),
+                        True,
+                        newest - timedelta(seconds=i),
+                    )
+                    for i in range(ROWS)
+                ],
+            )
+            await conn.execute("CREATE INDEX ON audit_log(created_at DESC, id DESC)")
+            await conn.execute("ANALYZE audit_log")
+
+            start_time = time.perf_counter()
+            offset_rows = await conn.fetch(
+                f"{BASE_QUERY} ORDER BY created_at DESC, id DESC LIMIT $1 OFFSET $2",
+                PAGE_SIZE,
+                DEEP_PAGE * PAGE_SIZE,
+            )
+            offset_ms = (time.perf_counter() - start_time) * 1000
+
+            # Cursor of the last row before the deep page, as a client would hold it
+            before = DEEP_PAGE * PAGE_SIZE - 1
+            cursor = encode_cursor(newest - timedelta(seconds=before), before)
+            start_time = time.perf_counter()
+            keyset_rows, _ = await fetch_keyset_page(conn, BASE_QUERY, [], PAGE_SIZE, cursor)
+            keyset_ms = (time.perf_counter() - start_time) * 1000
+
+            tracemalloc.start()
+            all_rows = await conn.fetch(f"{BASE_QUERY} ORDER BY created_at DESC, id DESC")
+            _, fetch_peak = tracemalloc.get_traced_memory()
+            count_all = len(all_rows)
+            del all_rows
+            tracemalloc.reset_peak()
+
+            streamed = 0
+            async for rows in stream_keyset_rows(conn, BASE_QUERY, []):
+                streamed += len(rows)
+            _, stream_peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+        finally:
+            await conn.close()
+
+        print(
+            f"\nKeyset pagination over {ROWS:,} rows, page {DEEP_PAGE:,} of {PAGE_SIZE}:"
+            f"\n  OFFSET: {offset_ms:.2f} ms   keyset: {keyset_ms:.2f} ms"
+            f"\n  peak heap, fetch all: {fetch_peak / 2**20:.1f} MiB   "
+            f"server-side cursor: {stream_peak / 2**20:.1f} MiB"
+        )
+
+        assert [row["id"] for row in keyset_rows] == [row["id"] for row in offset_rows]
+        assert count_all == streamed == ROWS
+        assert keyset_ms < offset_ms
+        assert stream_peak < fetch_peak / 10
@@ -0,0 +1,97 @@
+"""Benchmark event-loop lag while 200 logins verify bcrypt passwords at once.
+
+A heartbeat task sleeps HEARTBEAT_SECONDS in a loop and records how late it
+wakes up. Reports heartbeat lag (p50/p99/max), wall time and outcomes for:
+
+- the previous login path: ``verify_password()`` inline on the event loop,
+- PasswordVerifier: bcrypt in a bounded thread pool, 503 past its queue limit.
+
+LOGIN_BENCH_ROUNDS sets the bcrypt cost of the stored hash (default 10, so the
+inline run stays short; production uses Security.PASSWORD_HASH_ROUNDS).
+"""
+
+import asyncio
+import os
+import statistics
+import time
+from typing import Awaitable, Callable, Dict, List
+
+import pytest
+from passlib.context import CryptContext
+
+from src.core.auth import PasswordVerifier, verify_password
+from src.core.exceptions import PasswordVerifierBusyError
+
+LOGINS = int(os.getenv("LOGIN_BENCH_CONCURRENCY", "200"))
+ROUNDS = int(os.getenv("LOGIN_BENCH_ROUNDS", "10"))
+HEARTBEAT_SECONDS = 0.01
+PASSWORD = "Bench-Password-123!"
+
+
+async def _measure(login: Callable[[], Awaitable[bool]]) -> Dict[str, float]:
+    """Run LOGINS concurrent logins while sampling event-loop lag."""
+    lags: List[float] = []
+
+    async def heartbeat() -> None:
+        while True:
+            expected = time.perf_counter() + HEARTBEAT_SECONDS
+            await asyncio.sleep(HEARTBEAT_SECONDS)
+            lags.append(max(0.0, time.perf_counter() - expected))
+
+    beat = asyncio.create_task(heartbeat())
+    await asyncio.sleep(HEARTBEAT_SECONDS * 2)
+    start_time = time.perf_counter()
+    outcomes = await asyncio.gather(*(login() for _ in range(LOGINS)), return_exceptions=True)
+    wall = time.perf_counter() - start_time
+    # Let a heartbeat that was starved during the burst record its lag
+    await asyncio.sleep(HEARTBEAT_SECONDS * 2)
+    beat.cancel()
+
+    lags.sort()
+    return {
+        "wall": wall,
+        "ok": sum(1 for outcome in outcomes if outcome is True),
+        "busy": sum(1 for outcome in outcomes if isinstance(outcome, PasswordVerifierBusyError)),
+        "p50": statistics.median(lags) * 1000 if lags else 0.0,
+        "p99": lags[int(len(lags) * 0.99) - 1] * 1000 if lags else 0.0,
+        "max": lags[-1] * 1000 if lags else 0.0,
+        "beats": len(lags),
+    }
+
+
+class TestLoginEventLoopLagBenchmark:
+    """Event-loop responsiveness during a login burst."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.slow
+    async def test_pool_keeps_event_loop_responsive(self):
+        """Pooled bcrypt keeps heartbeat lag low and sheds excess load with 503."""
+        hashed = CryptContext(schemes=["bcrypt"]).hash(PASSWORD, rounds=ROUNDS)
+
+        async def inline_login() -> bool:
+            return verify_password(PASSWORD, hashed)
+
+        verifier = PasswordVerifier()
+
+        async def pooled_login() -> bool:
+            return await verifier.verify(PASSWORD, hashed)
+
+        try:
+            inline = await _measure(inline_login)
+            pooled = await _measure(pooled_login)
+        finally:
+            verifier.shutdown()
+
+        print(f"\n{LOGINS} concurrent logins, bcrypt cost {ROUNDS}:")
+        for name, result in (("inline verify_password", inline), ("PasswordVerifier", pooled)):
+            print(
+                f"  {name:<23} loop lag p50 {result['p50']:.1f} ms, "
+                f"p99 {result['p99']:.1f} ms, max {result['max']:.1f} ms "
+                f"({result['beats']:.0f} heartbeats); wall {result['wall']:.2f} s; "
+                f"{result['ok']:.0f} verified, {result['busy']:.0f} rejected with 503"
+            )
+
+        assert inline["ok"] == LOGINS
+        assert pooled["ok"] + pooled["busy"] == LOGINS
+        assert pooled["ok"] >= verifier.max_workers + verifier.max_queue
+        assert pooled["max"] < inline["max"]
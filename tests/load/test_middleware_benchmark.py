@@ -0,0 +1,147 @@
+"""Benchmark the HTTP middleware stack in-process with httpx.AsyncClient.
+
+Drives the full FastAPI app (error handler, security headers, CORS) over
+``httpx.ASGITransport`` and reports requests per second and p99 latency for
+``/health`` and an authenticated route. Health probes are stubbed so the
+numbers reflect request handling rather than external services.
+
+Tune with MIDDLEWARE_BENCH_REQUESTS and MIDDLEWARE_BENCH_CONCURRENCY.
+"""
+
+import asyncio
+import logging
+import os
+import statistics
+import time
+from typing import Dict, List
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+from fastapi import Request
+from starlette.middleware import Middleware
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from src.core.auth import create_access_token
+from web.app import create_app
+from web.middleware import ErrorHandlerMiddleware, SecurityHeadersMiddleware
+from web.middleware.security_headers import _SECURITY_HEADERS
+
+REQUESTS = int(os.getenv("MIDDLEWARE_BENCH_REQUESTS", "2000"))
+CONCURRENCY = int(os.getenv("MIDDLEWARE_BENCH_CONCURRENCY", "50"))
+
+AUTHENTICATED_ROUTE = "/api/v1/bot/logs"
+
+_HEALTHY = {"status": "healthy"}
+
+
+def _with_legacy_middlewares(app):
+    """Swap the ASGI middlewares for BaseHTTPMiddleware equivalents, as before the rewrite."""
+    errors = ErrorHandlerMiddleware(app=app)
+
+    async def error_dispatch(request: Request, call_next):
+        try:
+            return await call_next(request)
+        except Exception as e:
+            return errors.handle_exception(e, request)
+
+    async def headers_dispatch(request: Request, call_next):
+        response = await call_next(request)
+        for name, value in _SECURITY_HEADERS:
+            response.headers[name] = value
+        return response
+
+    replacements = {
+        ErrorHandlerMiddleware: error_dispatch,
+        SecurityHeadersMiddleware: headers_dispatch,
+    }
+    app.user_middleware = [
+        (
+            Middleware(BaseHTTPMiddleware, dispatch=replacements[middleware.cls])
+            if middleware.cls in replacements
+            else middleware
+        )
+        for middleware in app.user_middleware
+    ]
+    return app
+
+
+async def _drive(asgi_app, path: str, headers: Dict[str, str]) -> Dict[str, float]:
+    """Send REQUESTS GETs with CONCURRENCY in flight; return rps and latency percentiles."""
+    latencies: List[float] = []
+    queue: asyncio.Queue = asyncio.Queue()
+    for _ in range(REQUESTS):
+        queue.put_nowait(None)
+
+    transport = httpx.ASGITransport(app=asgi_app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        # Warm up routing, dependency caches and JWT key loading
+        response = await client.get(path, headers=headers)
+        assert response.status_code == 200, response.text
+
+        async def worker():
+            while not queue.empty():
+                queue.get_nowait()
+                start = time.perf_counter()
+                response = await client.get(path, headers=headers)
+                latencies.append(time.perf_counter() - start)
+                assert response.status_code == 200
+
+        start_time = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(CONCURRENCY)))
+        elapsed = time.perf_counter() - start_time
+
+    latencies.sort()
+    return {
+        "rps": len(latencies) / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p99_ms": latencies[int(len(latencies) * 0.99) - 1] * 1000,
+    }
+
+
+class TestMiddlewareBenchmark:
+    """Requests/second and p99 through the production middleware stack."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.slow
+    async def test_health_and_authenticated_route_throughput(self):
+        """Pure-ASGI middlewares keep per-request overhead low on hot routes."""
+        # httpx logs every request at INFO, which would dominate the timings
+        logging.getLogger("httpx").setLevel(logging.WARNING)
+        app = create_app(run_security_validation=False, env_override="testing")
+        legacy_app = _with_legacy_middlewares(
+            create_app(run_security_validation=False, env_override="testing")
+        )
+        token = create_access_token({"sub": "admin"})
+        routes = {
+            "/health": {},
+            AUTHENTICATED_ROUTE: {"Authorization": f"Bearer {token}"},
+        }
+
+        with (
+            patch(
+                "web.routes.health.diagnostics.check_database",
+                AsyncMock(return_value=_HEALTHY),
+            ),
+            patch("web.routes.health.diagnostics.check_redis", AsyncMock(return_value=_HEALTHY)),
+            patch(
+                "web.routes.health.diagnostics.check_proxy_health",
+                AsyncMock(return_value=_HEALTHY),
+            ),
+            patch(
+                "web.routes.health.diagnostics.check_notification_health",
+                AsyncMock(return_value=_HEALTHY),
+            ),
+            patch("src.core.auth.jwt_tokens.check_blacklisted", AsyncMock(return_value=False)),
+        ):
+            print(f"\nMiddleware benchmark: {REQUESTS} requests, concurrency {CONCURRENCY}")
+            for path, headers in routes.items():
+                current = await _drive(app, path, headers)
+                legacy = await _drive(legacy_app, path, headers)
+                print(
+                    f"  {path}: {current['rps']:.0f} req/s, p50 {current['p50_ms']:.2f} ms, "
+                    f"p99 {current['p99_ms']:.2f} ms"
+                    f"\n    with BaseHTTPMiddleware: {legacy['rps']:.0f} req/s, "
+                    f"p50 {legacy['p50_ms']:.2f} ms, p99 {legacy['p99_ms']:.2f} ms"
+                )
+                assert current["rps"] > 0
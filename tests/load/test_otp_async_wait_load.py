@@ -0,0 +1,67 @@
+"""Load test for OTPManager.wait_for_otp_async with many concurrent waiters."""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+from src.services.otp_manager import OTPManager
+
+WAITERS = 1000
+
+
+class TestOTPAsyncWaitLoad:
+    """1,000 concurrent async OTP waiters on a small default executor."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.slow
+    async def test_thousand_waiters_do_not_use_executor(self):
+        """Waiters hold no executor threads; producer threads resolve them all."""
+        with patch("src.services.otp_manager.manager.IMAPListener"):
+            manager = OTPManager(email="test@example.com", app_password="password")
+
+        loop = asyncio.get_running_loop()
+        executor = ThreadPoolExecutor(max_workers=4)
+        loop.set_default_executor(executor)
+        threads_before = threading.active_count()
+
+        session_ids = [
+            manager.register_session(target_email=f"bot{i}@example.com") for i in range(WAITERS)
+        ]
+        waiters = [
+            asyncio.create_task(manager.wait_for_otp_async(session_id, timeout=30))
+            for session_id in session_ids
+        ]
+        await asyncio.sleep(0.1)
+
+        # The default executor stays available while all waiters are pending
+        start_time = time.perf_counter()
+        assert await loop.run_in_executor(None, lambda: "free") == "free"
+        executor_latency = time.perf_counter() - start_time
+        assert threading.active_count() - threads_before <= 4
+
+        # Deliver OTPs from producer threads, as the IMAP listener and SMS webhook do
+        def produce(ids):
+            for session_id in ids:
+                manager.manual_otp_input(session_id, session_id[:6])
+
+        start_time = time.perf_counter()
+        producers = [threading.Thread(target=produce, args=(session_ids[i::4],)) for i in range(4)]
+        for producer in producers:
+            producer.start()
+        results = await asyncio.gather(*waiters)
+        elapsed = time.perf_counter() - start_time
+        for producer in producers:
+            producer.join()
+        executor.shutdown(wait=False)
+
+        print(
+            f"{WAITERS} async OTP waiters resolved in {elapsed * 1000:.0f}ms; "
+            f"executor round-trip while waiting: {executor_latency * 1000:.1f}ms"
+        )
+
+        assert results == [session_id[:6] for session_id in session_ids]
+        assert elapsed < 5
@@ -0,0 +1,110 @@
+"""Benchmark for PageStateDetector batched DOM probe vs per-rule locators.
+
+Fixture pages are written under tmp_path and loaded from file:// URLs.
+Requires a Playwright Chromium install (skipped otherwise).
+"""
+
+import statistics
+import time
+from pathlib import Path
+from typing import Any, Dict
+
+import pytest
+
+from src.services.bot.page_state_detector import PageState, PageStateDetector
+
+playwright_api = pytest.importorskip("playwright.async_api")
+
+ITERATIONS = 30
+
+# Minimal static pages that trigger the main detection paths
+PAGE_FIXTURES = {
+    PageState.LOGIN_PAGE: """
+        <form>
+          <input name="email" type="email">
+          <input name="password" type="password">
+          <div class="spinner" style="display:none"></div>
+        </form>
+    """,
+    PageState.OTP_LOGIN: """
+        <form><input name="otp" type="text"></form>
+        <div class="session-expired-modal" style="visibility:hidden">Session expired</div>
+    """,
+    PageState.APPOINTMENT_PAGE: """
+        <mat-sidenav></mat-sidenav>
+        <select id="centres"><option>Istanbul</option></select>
+    """,
+    PageState.PAYMENT_PAGE: """
+        <input name="cardNumber"><input name="cvv">
+    """,
+}
+
+
+def _config(fixture_dir: Path) -> Dict[str, Any]:
+    """Detector config whose VFS base URL is the local fixture directory."""
+    # OTP disambiguation treats pages outside vfs.base_url as payment pages
+    return {"vfs": {"base_url": fixture_dir.as_uri(), "country": "tur", "mission": "deu"}}
+
+
+def _p95(samples):
+    """95th percentile of a list of durations."""
+    return statistics.quantiles(samples, n=20)[-1]
+
+
+async def _measure(detector: PageStateDetector, page) -> tuple:
+    """Run detection ITERATIONS times; return (states, detections/s, p95 ms)."""
+    states = set()
+    durations = []
+    for _ in range(ITERATIONS):
+        start_time = time.perf_counter()
+        result = await detector.detect(page)
+        durations.append(time.perf_counter() - start_time)
+        states.add(result.state)
+    return states, ITERATIONS / sum(durations), _p95(durations) * 1000
+
+
+class TestPageStateDetectionBenchmark:
+    """Detections per second and p95 latency with and without the batched probe."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.slow
+    async def test_batched_probe_matches_and_outperforms_locators(self, tmp_path):
+        """Both modes agree on every fixture; the batched probe is faster."""
+        config = _config(tmp_path)
+        fixtures = {}
+        for i, (expected, html) in enumerate(PAGE_FIXTURES.items()):
+            fixtures[expected] = tmp_path / f"fixture_{i}.html"
+            fixtures[expected].write_text(f"<html><body>{html}</body></html>", encoding="utf-8")
+
+        async with playwright_api.async_playwright() as p:
+            try:
+                browser = await p.chromium.launch(headless=True)
+            except Exception as e:
+                pytest.skip(f"Chromium not available: {e}")
+
+            try:
+                page = await browser.new_page()
+                totals = {"locators": [], "batched": []}
+
+                for expected, path in fixtures.items():
+                    await page.goto(path.as_uri())
+                    individual_states, individual_rate, individual_p95 = await _measure(
+                        PageStateDetector(config, batch_dom_probe=False), page
+                    )
+                    batched_states, batched_rate, batched_p95 = await _measure(
+                        PageStateDetector(config, batch_dom_probe=True), page
+                    )
+                    totals["locators"].append(individual_rate)
+                    totals["batched"].append(batched_rate)
+
+                    print(
+                        f"{expected.name}: locators={individual_rate:,.0f}/s "
+                        f"(p95 {individual_p95:.1f}ms) batched={batched_rate:,.0f}/s "
+                        f"(p95 {batched_p95:.1f}ms)"
+                    )
+
+                    assert individual_states == batched_states == {expected}
+            finally:
+                await browser.close()
+
+        assert statistics.mean(totals["batched"]) > statistics.mean(totals["locators"])
@@ -0,0 +1,155 @@
+"""Benchmark the redis.asyncio dedup, idempotency and rate-limit backends.
+
+Runs REDIS_BENCH_OPS operations, REDIS_BENCH_CONCURRENCY at a time, per backend
+and reports ops/second and how many default-executor threads were spawned for:
+
+- the previous pattern: synchronous ``redis.Redis`` calls via ``asyncio.to_thread``,
+- the redis.asyncio backends (EVALSHA for the sliding-window script).
+
+Uses REDIS_URL (default redis://localhost:6379/15), falling back to fakeredis
+when it is installed; skipped when neither is available.
+"""
+
+import asyncio
+import os
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Tuple
+
+import pytest
+
+from src.core.rate_limiting import RedisBackend
+from src.services.appointment_deduplication import RedisDeduplicationBackend
+from src.utils.idempotency import RedisIdempotencyBackend
+
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/15")
+OPS = int(os.getenv("REDIS_BENCH_OPS", "20000"))
+CONCURRENCY = int(os.getenv("REDIS_BENCH_CONCURRENCY", "100"))
+TTL_SECONDS = 300
+
+
+def _clients() -> Tuple[Any, Any, str]:
+    """Return (sync client, async client, description) or skip."""
+    import redis
+    import redis.asyncio as redis_asyncio
+
+    try:
+        sync_client = redis.from_url(REDIS_URL, decode_responses=True, socket_connect_timeout=2)
+        sync_client.ping()
+        async_client = redis_asyncio.from_url(
+            REDIS_URL, decode_responses=True, max_connections=CONCURRENCY
+        )
+        return sync_client, async_client, f"redis-server at {REDIS_URL}"
+    except Exception as e:
+        try:
+            import fakeredis
+        except ImportError:
+            pytest.skip(f"Redis not available and fakeredis not installed: {e}")
+        server = fakeredis.FakeServer()
+        return (
+            fakeredis.FakeRedis(server=server, decode_responses=True),
+            fakeredis.FakeAsyncRedis(server=server, decode_responses=True),
+            "fakeredis",
+        )
+
+
+class _ThreadedDedup:
+    """Previous RedisDeduplicationBackend.is_duplicate(): sync client in a worker thread."""
+
+    def __init__(self, client: Any):
+        self._redis = client
+
+    async def is_duplicate(self, key: str, ttl_seconds: int) -> bool:
+        return bool(await asyncio.to_thread(self._redis.exists, f"dedup:{key}"))
+
+
+class _ThreadedIdempotency:
+    """Previous RedisIdempotencyBackend.get(): sync client in a worker thread."""
+
+    def __init__(self, client: Any):
+        self._redis = client
+
+    async def get(self, key: str) -> Any:
+        return await asyncio.to_thread(self._redis.get, f"idempotency:{key}")
+
+
+def _executor_threads() -> int:
+    """Threads started by the event loop's default executor so far."""
+    return sum(1 for t in threading.enumerate() if t.name.startswith("asyncio_"))
+
+
+async def _run(op: Callable[[int], Awaitable[Any]]) -> float:
+    """Run OPS calls of op, CONCURRENCY at a time; return ops/second."""
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+
+    async def one(i: int) -> None:
+        async with semaphore:
+            await op(i)
+
+    start_time = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(OPS)))
+    return OPS / (time.perf_counter() - start_time)
+
+
+class TestRedisBackendsBenchmark:
+    """Throughput and executor usage of the Redis-backed services."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.slow
+    async def test_async_backends_vs_to_thread(self):
+        """redis.asyncio backends use no executor threads and out-run to_thread."""
+        sync_client, async_client, target = _clients()
+        dedup = RedisDeduplicationBackend(async_client)
+        idempotency = RedisIdempotencyBackend(async_client)
+        rate_limit = RedisBackend(sync_client, async_client=async_client)
+        await dedup.mark_booked("bench:hit", TTL_SECONDS)
+        await idempotency.set("bench:hit", {"status": "booked"}, TTL_SECONDS)
+
+        # Async backends first, so any executor thread afterwards is from to_thread
+        threads_before = _executor_threads()
+        current: Dict[str, float] = {
+            "dedup is_duplicate": await _run(
+                lambda i: dedup.is_duplicate("bench:hit", TTL_SECONDS)
+            ),
+            "idempotency get": await _run(lambda i: idempotency.get("bench:hit")),
+            "rate limit check": await _run(
+                lambda i: rate_limit.check_and_record_attempt_async(f"bench:{i % 500}", 10**6, 60)
+            ),
+        }
+        async_threads = _executor_threads() - threads_before
+
+        legacy_dedup = _ThreadedDedup(sync_client)
+        legacy_idempotency = _ThreadedIdempotency(sync_client)
+        legacy: Dict[str, float] = {
+            "dedup is_duplicate": await _run(
+                lambda i: legacy_dedup.is_duplicate("bench:hit", TTL_SECONDS)
+            ),
+            "idempotency get": await _run(lambda i: legacy_idempotency.get("bench:hit")),
+            "rate limit check": await _run(
+                lambda i: asyncio.to_thread(
+                    rate_limit.check_and_record_attempt, f"bench:{i % 500}", 10**6, 60
+                )
+            ),
+        }
+        threaded_threads = _executor_threads() - threads_before - async_threads
+
+        await dedup.clear()
+        for i in range(500):
+            await rate_limit.clear_attempts_async(f"bench:{i}")
+        await async_client.delete("idempotency:bench:hit")
+        await async_client.aclose()
+        sync_client.close()
+
+        print(f"\nRedis backends ({target}), {OPS:,} ops at concurrency {CONCURRENCY}:")
+        for name in current:
+            print(
+                f"  {name:<20} to_thread: {legacy[name]:>9,.0f} ops/s   "
+                f"redis.asyncio: {current[name]:>9,.0f} ops/s"
+            )
+        print(
+            f"  default executor threads spawned: to_thread {threaded_threads}, "
+            f"redis.asyncio {async_threads}"
+        )
+
+        assert async_threads == 0
+        assert current["dedup is_duplicate"] > legacy["dedup is_duplicate"]
@@ -0,0 +1,65 @@
+"""Micro-benchmark for SelectorLearner synchronous vs write-behind persistence."""
+
+import asyncio
+import time
+
+import pytest
+
+from src.selector.learning import SelectorLearner
+
+SELECTOR_PATHS = [f"section_{i}.element_{j}" for i in range(20) for j in range(10)]
+LOOKUPS = 2000
+
+
+def _seed(learner: SelectorLearner) -> None:
+    """Populate metrics so each save rewrites a realistically sized file."""
+    for path in SELECTOR_PATHS:
+        learner.record_success(path, 0)
+        learner.record_failure(path, 1)
+    learner.flush()
+
+
+async def _run_lookups(learner: SelectorLearner) -> float:
+    """Simulate selector lookups from the event loop; return lookups per second."""
+    start_time = time.perf_counter()
+    for i in range(LOOKUPS):
+        path = SELECTOR_PATHS[i % len(SELECTOR_PATHS)]
+        learner.get_optimized_order(path, ["#primary", "#fallback"])
+        if i % 4 == 0:
+            learner.record_failure(path, 0)
+        else:
+            learner.record_success(path, 0)
+        if i % 100 == 0:
+            # Let background tasks run, as concurrent missions would
+            await asyncio.sleep(0)
+    elapsed = time.perf_counter() - start_time
+    return LOOKUPS / elapsed
+
+
+class TestSelectorLearningThroughput:
+    """Lookups per second before (sync save) and after (write-behind)."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.slow
+    async def test_write_behind_lookup_throughput(self, tmp_path):
+        """Write-behind mode keeps file I/O off the lookup path."""
+        sync_learner = SelectorLearner(str(tmp_path / "sync.json"))
+        _seed(sync_learner)
+        sync_rate = await _run_lookups(sync_learner)
+
+        wb_learner = SelectorLearner(
+            str(tmp_path / "write_behind.json"), write_behind=True, flush_interval=0.5
+        )
+        _seed(wb_learner)
+        wb_rate = await _run_lookups(wb_learner)
+        await wb_learner.close()
+
+        print(
+            f"Selector lookups/s: sync={sync_rate:,.0f} write_behind={wb_rate:,.0f} "
+            f"({wb_rate / sync_rate:.1f}x)"
+        )
+
+        assert not wb_learner.is_dirty
+        reloaded = SelectorLearner(str(tmp_path / "write_behind.json"))
+        assert reloaded.metrics == wb_learner.metrics
+        assert wb_rate > sync_rate
@@ -0,0 +1,157 @@
+"""Benchmark the slot pattern store with 1M synthetic slot observations.
+
+Spreads SLOT_BENCH_RECORDS observations (default 1,000,000) over a year, 4
+countries and 24 centres and reports:
+
+- the previous store: ``analyze_patterns()`` re-parsing every ISO timestamp
+  in memory, and saving by rewriting the whole JSON file with ``indent=2``,
+- the append-only log with hourly buckets: ingest throughput, cold load from
+  the snapshot, full rebuild from the log, appending one batch, and
+  ``analyze_patterns()`` for 7/30/90 days.
+"""
+
+import json
+import os
+import statistics
+import tempfile
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List
+
+import pytest
+
+from src.services.slot_analyzer import _BATCH_SIZE, SlotPatternAnalyzer
+
+RECORDS = int(os.getenv("SLOT_BENCH_RECORDS", "1000000"))
+CHUNK = 50_000
+ANALYZE_REPEATS = 5
+COUNTRIES = {
+    "nld": ["Amsterdam", "Rotterdam", "The Hague", "Utrecht", "Eindhoven", "Groningen"],
+    "deu": ["Berlin", "Munich", "Hamburg", "Frankfurt", "Cologne", "Stuttgart"],
+    "fra": ["Paris", "Lyon", "Marseille", "Toulouse", "Nice", "Nantes"],
+    "ita": ["Rome", "Milan", "Naples", "Turin", "Florence", "Bologna"],
+}
+CENTRES = [(country, centre) for country, centres in COUNTRIES.items() for centre in centres]
+
+
+def _observations(count: int, start: int = 0) -> Iterator[Dict[str, Any]]:
+    """Yield slot records spread evenly over the past year, newest last."""
+    now = datetime.now(timezone.utc)
+    step = timedelta(days=365) / RECORDS
+    for i in range(start, start + count):
+        found_at = now - step * (RECORDS - i)
+        country, centre = CENTRES[i % len(CENTRES)]
+        yield {
+            "country": country,
+            "centre": centre,
+            "category": "Tourism",
+            "slot_date": "2026-11-02",
+            "slot_time": "09:30",
+            "found_at": found_at.isoformat(),
+            "found_hour": found_at.hour,
+            "found_weekday": found_at.strftime("%A"),
+            "duration_seconds": None,
+        }
+
+
+def _legacy_analyze(slots: List[Dict[str, Any]], days: int) -> Dict[str, Any]:
+    """Previous analyze_patterns(): filter and count every record on each call."""
+    cutoff = datetime.now(timezone.utc) - timedelta(days=days)
+    recent_slots = []
+    for s in slots:
+        found_at = datetime.fromisoformat(s["found_at"])
+        if found_at.tzinfo is None:
+            found_at = found_at.replace(tzinfo=timezone.utc)
+        if found_at > cutoff:
+            recent_slots.append(s)
+    hour_counts: Dict[int, int] = defaultdict(int)
+    day_counts: Dict[str, int] = defaultdict(int)
+    centre_counts: Dict[str, int] = defaultdict(int)
+    for slot in recent_slots:
+        hour_counts[slot["found_hour"]] += 1
+        day_counts[slot["found_weekday"]] += 1
+        centre_counts[slot["centre"]] += 1
+    return {"total_slots_found": len(recent_slots)}
+
+
+def _timed(func: Any, *args: Any) -> float:
+    """Run func once and return elapsed milliseconds."""
+    start_time = time.perf_counter()
+    func(*args)
+    return (time.perf_counter() - start_time) * 1000
+
+
+class TestSlotPatternStoreBenchmark:
+    """Ingest, load and analytics cost of the slot pattern store."""
+
+    @pytest.mark.slow
+    def test_bucketed_store_vs_json_file(self):
+        """Analytics over hourly buckets beat re-scanning every record."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            log_file = Path(tmp_dir) / "slot_patterns.jsonl"
+            analyzer = SlotPatternAnalyzer(str(log_file))
+
+            start_time = time.perf_counter()
+            with analyzer._io_lock:
+                for offset in range(0, RECORDS, CHUNK):
+                    analyzer._append_records(_observations(min(CHUNK, RECORDS - offset), offset))
+                analyzer._save_snapshot()
+            ingest_seconds = time.perf_counter() - start_time
+            log_mb = log_file.stat().st_size / 1e6
+            buckets = sum(
+                len(centres)
+                for countries in analyzer._buckets.values()
+                for centres in countries.values()
+            )
+
+            load_ms = _timed(SlotPatternAnalyzer, str(log_file))
+            analyzer.snapshot_file.unlink()
+            rebuild_ms = _timed(SlotPatternAnalyzer, str(log_file))
+
+            # Oldest timestamps, so the extra records fall outside the analyzed windows
+            batch = list(_observations(_BATCH_SIZE))
+            append_times = []
+            for _ in range(ANALYZE_REPEATS):
+                analyzer._pending.extend(batch)
+                append_times.append(_timed(analyzer._save_data_sync))
+            append_ms = statistics.median(append_times)
+
+            current = {
+                days: statistics.median(
+                    _timed(analyzer.analyze_patterns, days) for _ in range(ANALYZE_REPEATS)
+                )
+                for days in (7, 30, 90)
+            }
+            results = {days: analyzer.analyze_patterns(days) for days in (7, 30, 90)}
+
+            slots = list(_observations(RECORDS))
+            legacy = {days: _timed(_legacy_analyze, slots, days) for days in (7, 30, 90)}
+            legacy_totals = {days: _legacy_analyze(slots, days) for days in (7, 30)}
+            legacy_file = Path(tmp_dir) / "slot_patterns.json"
+            with open(legacy_file, "w", encoding="utf-8") as f:
+                start_time = time.perf_counter()
+                json.dump({"slots": slots, "stats": {}}, f, indent=2, ensure_ascii=False)
+            legacy_save_ms = (time.perf_counter() - start_time) * 1000
+            legacy_mb = legacy_file.stat().st_size / 1e6
+
+        print(
+            f"\nSlot pattern store, {RECORDS:,} observations over 365 days, "
+            f"{len(CENTRES)} centres ({buckets:,} hour/centre buckets):"
+            f"\n  JSON file: save (rewrite, indent=2) {legacy_save_ms:,.0f} ms "
+            f"({legacy_mb:,.0f} MB); analyze 7d {legacy[7]:,.0f} ms, "
+            f"30d {legacy[30]:,.0f} ms, 90d {legacy[90]:,.0f} ms"
+            f"\n  append-only log + buckets: ingest {RECORDS / ingest_seconds:,.0f} records/s "
+            f"({log_mb:,.0f} MB); append {_BATCH_SIZE}-record batch {append_ms:.2f} ms; "
+            f"cold load {load_ms:,.1f} ms; rebuild without snapshot {rebuild_ms:,.0f} ms"
+            f"\n  analyze 7d {current[7]:.2f} ms, 30d {current[30]:.2f} ms, "
+            f"90d {current[90]:.2f} ms"
+        )
+
+        # Hour-granular windows may take in up to one extra hour of records
+        for days in (7, 30):
+            expected = legacy_totals[days]["total_slots_found"]
+            assert 0 <= results[days]["total_slots_found"] - expected <= RECORDS / 365 / 24 + 1
+        assert current[90] < legacy[90]
+        assert load_ms < rebuild_ms
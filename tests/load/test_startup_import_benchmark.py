@@ -0,0 +1,99 @@
+"""Benchmark cold-start import time for ``main.py --mode web``.
+
+Runs ``python -X importtime`` in a fresh interpreter on the imports web mode
+performs before serving (``main`` plus ``web.app``), reports the total and the
+slowest modules by cumulative time, and checks them against a tracked budget:
+
+- STARTUP_IMPORT_BUDGET_MS (default 2000) caps the cumulative import time,
+  about twice what a cold import measures on a single-core CI runner,
+- the bot stack (browser automation, notification channels) must not be
+  imported at all, since web mode never runs it.
+
+STARTUP_BENCH_RUNS sets how many cold interpreters are timed (median reported).
+"""
+
+import os
+import re
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import pytest
+
+BUDGET_MS = float(os.getenv("STARTUP_IMPORT_BUDGET_MS", "2000"))
+RUNS = int(os.getenv("STARTUP_BENCH_RUNS", "3"))
+TOP_MODULES = 10
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+WEB_MODE_IMPORTS = "import main; import web.app"
+# Modules only the bot and both modes need
+BOT_ONLY_MODULES = (
+    "playwright",
+    "src.services.bot.vfs_bot",
+    "src.services.bot.booking_workflow",
+    "src.services.notification.notification",
+)
+
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)$")
+
+
+def _cold_import() -> Tuple[float, Dict[str, float], List[str]]:
+    """Import the web-mode set in a fresh interpreter.
+
+    Returns:
+        Tuple of (total ms, cumulative ms per module, bot-only modules loaded)
+    """
+    probe = (
+        f"{WEB_MODE_IMPORTS}; import sys; "
+        f"print(','.join(m for m in {BOT_ONLY_MODULES!r} if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", probe],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        timeout=120,
+        check=True,
+    )
+
+    total_us = 0
+    cumulative: Dict[str, float] = {}
+    for line in result.stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        cumulative_us, indent, module = int(match.group(2)), match.group(3), match.group(4)
+        # Unindented entries are imported directly by the probe; their
+        # cumulative times add up to the whole import
+        if len(indent) == 1:
+            total_us += cumulative_us
+        cumulative[module] = cumulative_us / 1000
+
+    loaded = [m for m in result.stdout.strip().split(",") if m]
+    return total_us / 1000, cumulative, loaded
+
+
+class TestStartupImportBenchmark:
+    """Cold-start import cost of web mode."""
+
+    @pytest.mark.slow
+    def test_web_mode_import_budget(self):
+        """Web-mode imports stay within budget and leave the bot stack unloaded."""
+        runs = [_cold_import() for _ in range(RUNS)]
+        totals = [total for total, _, _ in runs]
+        _, cumulative, loaded = runs[-1]
+
+        slowest = sorted(cumulative.items(), key=lambda item: item[1], reverse=True)
+        print(
+            f"\nCold import of `{WEB_MODE_IMPORTS}` ({RUNS} runs): "
+            f"median {statistics.median(totals):.0f} ms, min {min(totals):.0f} ms, "
+            f"max {max(totals):.0f} ms (budget {BUDGET_MS:.0f} ms)"
+        )
+        print("  slowest modules by cumulative time (last run):")
+        for module, elapsed in slowest[:TOP_MODULES]:
+            print(f"    {elapsed:>8.1f} ms  {module}")
+        print(f"  bot-only modules loaded: {', '.join(loaded) or 'none'}")
+
+        assert not loaded, f"Web mode imported bot-only modules: {loaded}"
+        assert statistics.median(totals) < BUDGET_MS
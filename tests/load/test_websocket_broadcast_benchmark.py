@@ -0,0 +1,156 @@
+"""Benchmark ConnectionManager.broadcast() fan-out to 1,000 simulated clients.
+
+Most clients receive instantly; WS_BENCH_SLOW_CLIENTS take WS_BENCH_SLOW_DELAY_MS
+per message and WS_BENCH_STALLED_CLIENTS never finish a send. Reports the
+distribution of delivery latency (broadcast call to client receipt) for the
+healthy clients with:
+
+- the previous sequential ``await send_json()`` loop (stalled clients are left
+  out here, since a single one would block it forever),
+- the serialize-once fan-out through per-client queues and sender tasks.
+
+Tune with WS_BENCH_CLIENTS, WS_BENCH_BROADCASTS and the variables above.
+"""
+
+import asyncio
+import json
+import os
+import statistics
+import time
+from typing import Dict, List
+
+import pytest
+
+from web.websocket.manager import ConnectionManager
+
+CLIENTS = int(os.getenv("WS_BENCH_CLIENTS", "1000"))
+SLOW_CLIENTS = int(os.getenv("WS_BENCH_SLOW_CLIENTS", "20"))
+STALLED_CLIENTS = int(os.getenv("WS_BENCH_STALLED_CLIENTS", "5"))
+SLOW_DELAY_MS = float(os.getenv("WS_BENCH_SLOW_DELAY_MS", "20"))
+BROADCASTS = int(os.getenv("WS_BENCH_BROADCASTS", "150"))
+# The sequential loop pays every slow client's delay on every broadcast
+LEGACY_BROADCASTS = 20
+BROADCAST_INTERVAL_SECONDS = 0.01
+
+
+class SimulatedClient:
+    """Stand-in for a Starlette WebSocket that records delivery latency."""
+
+    def __init__(self, delay: float = 0.0, stalled: bool = False):
+        self.delay = delay
+        self.stalled = stalled
+        self.latencies: List[float] = []
+        self.closed = False
+
+    async def _receive(self, text: str) -> None:
+        if self.stalled:
+            await asyncio.Event().wait()
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        self.latencies.append(time.perf_counter() - json.loads(text)["data"]["sent_at"])
+
+    async def send_text(self, text: str) -> None:
+        await self._receive(text)
+
+    async def send_json(self, data: dict) -> None:
+        # What starlette.websockets.WebSocket.send_json() does per call
+        await self._receive(json.dumps(data, separators=(",", ":"), ensure_ascii=False))
+
+    async def close(self, code: int = 1000, reason: str = "") -> None:
+        self.closed = True
+
+
+def _message(sequence: int) -> dict:
+    """A log broadcast like add_log() sends, stamped with its send time."""
+    return {
+        "type": "log",
+        "data": {
+            "message": f"Checking slots for centre Istanbul ({sequence})",
+            "level": "INFO",
+            "timestamp": "2026-10-16 12:00:00",
+            "sent_at": time.perf_counter(),
+        },
+    }
+
+
+async def _legacy_broadcast(clients: List[SimulatedClient], message: dict) -> None:
+    """Previous ConnectionManager.broadcast(): one awaited send_json per client."""
+    for client in clients:
+        await client.send_json(message)
+
+
+def _distribution(clients: List[SimulatedClient]) -> Dict[str, float]:
+    """Latency percentiles in milliseconds across the given clients."""
+    latencies = sorted(latency for client in clients for latency in client.latencies)
+    return {
+        "p50": statistics.median(latencies) * 1000,
+        "p95": latencies[int(len(latencies) * 0.95) - 1] * 1000,
+        "p99": latencies[int(len(latencies) * 0.99) - 1] * 1000,
+        "max": latencies[-1] * 1000,
+    }
+
+
+def _clients(with_stalled: bool) -> List[SimulatedClient]:
+    stalled = STALLED_CLIENTS if with_stalled else 0
+    return (
+        [SimulatedClient(stalled=True) for _ in range(stalled)]
+        + [SimulatedClient(delay=SLOW_DELAY_MS / 1000) for _ in range(SLOW_CLIENTS)]
+        + [SimulatedClient() for _ in range(CLIENTS - SLOW_CLIENTS - stalled)]
+    )
+
+
+class TestWebSocketBroadcastBenchmark:
+    """Delivery latency to healthy clients while some clients are slow."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.slow
+    async def test_fanout_isolates_slow_clients(self):
+        """Healthy clients keep low latency; stalled clients are cut off, not waited on."""
+        legacy_clients = _clients(with_stalled=False)
+        for sequence in range(LEGACY_BROADCASTS):
+            await _legacy_broadcast(legacy_clients, _message(sequence))
+            await asyncio.sleep(BROADCAST_INTERVAL_SECONDS)
+        legacy = _distribution(legacy_clients[SLOW_CLIENTS:])
+
+        manager = ConnectionManager()
+        manager.MAX_CONNECTIONS = CLIENTS
+        clients = _clients(with_stalled=True)
+        for client in clients:
+            assert await manager.connect(client)  # type: ignore[arg-type]
+
+        call_times: List[float] = []
+        for sequence in range(BROADCASTS):
+            start_time = time.perf_counter()
+            await manager.broadcast(_message(sequence))
+            call_times.append(time.perf_counter() - start_time)
+            await asyncio.sleep(BROADCAST_INTERVAL_SECONDS)
+
+        # Let slow clients catch up before measuring
+        await asyncio.sleep(SLOW_DELAY_MS / 1000 * BROADCASTS + 0.5)
+        healthy = clients[STALLED_CLIENTS + SLOW_CLIENTS :]
+        current = _distribution(healthy)
+        metrics = manager.get_metrics()
+
+        for client in list(manager._connections):
+            await manager.disconnect(client)
+
+        print(
+            f"\nWebSocket broadcast to {CLIENTS} clients "
+            f"({SLOW_CLIENTS} slow at {SLOW_DELAY_MS:.0f} ms/message, "
+            f"{STALLED_CLIENTS} stalled), delivery latency to healthy clients:"
+            f"\n  sequential send_json ({LEGACY_BROADCASTS} broadcasts, no stalled clients): "
+            f"p50 {legacy['p50']:.1f} ms, p95 {legacy['p95']:.1f} ms, "
+            f"p99 {legacy['p99']:.1f} ms, max {legacy['max']:.1f} ms"
+            f"\n  queued fan-out ({BROADCASTS} broadcasts): "
+            f"p50 {current['p50']:.1f} ms, p95 {current['p95']:.1f} ms, "
+            f"p99 {current['p99']:.1f} ms, max {current['max']:.1f} ms"
+            f"\n  broadcast() call: mean {statistics.mean(call_times) * 1000:.2f} ms, "
+            f"max {max(call_times) * 1000:.2f} ms"
+            f"\n  slow consumers disconnected: {metrics['slow_consumers_disconnected']}, "
+            f"messages dropped: {metrics['messages_dropped']}"
+        )
+
+        assert all(len(client.latencies) == BROADCASTS for client in healthy)
+        assert all(client.closed for client in clients[:STALLED_CLIENTS])
+        assert metrics["slow_consumers_disconnected"] == STALLED_CLIENTS
+        assert current["p99"] < legacy["p99"]
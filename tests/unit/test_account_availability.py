@@ -0,0 +1,184 @@
+"""Tests for event-driven account availability waits."""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.constants import NotifyChannels
+from src.services.session.account_availability import AccountAvailability
+from src.services.session.account_pool import AccountPool
+
+
+@pytest.fixture
+def db():
+    """Database mock that accepts LISTEN subscriptions."""
+    database = MagicMock()
+    database.listen = AsyncMock()
+    database.unlisten = AsyncMock()
+    database.ensure_listening = AsyncMock(return_value=True)
+    database.notifications_active = True
+    return database
+
+
+@pytest.fixture
+def repo():
+    """Account pool repository mock with an empty pool."""
+    repository = AsyncMock()
+    repository.get_availability_summary.return_value = {
+        "available": 0,
+        "next_cooldown_until": None,
+    }
+    return repository
+
+
+@pytest.fixture
+def pool(db, repo):
+    """AccountPool with a long reconcile interval, so only events end a wait."""
+    with patch("src.services.session.account_pool.AccountPoolRepository", return_value=repo):
+        account_pool = AccountPool(db=db, cooldown_seconds=60, reconcile_interval=30)
+    account_pool.repo = repo
+    return account_pool
+
+
+@pytest.mark.asyncio
+async def test_notification_sets_changed_event(db):
+    """A NOTIFY sets the event taken before it and arms a fresh one."""
+    availability = AccountAvailability(db)
+    await availability.start()
+    changed = availability.changed_event()
+
+    availability._on_notification("7")
+
+    db.listen.assert_awaited_once_with(NotifyChannels.ACCOUNT_POOL, availability._on_notification)
+    assert changed.is_set()
+    assert not availability.changed_event().is_set()
+    assert availability.is_listening
+
+
+@pytest.mark.asyncio
+async def test_expiry_timer_fires_earliest_first(db):
+    """Expiries share one timer, armed for the earliest and re-armed after it fires."""
+    availability = AccountAvailability(db)
+    now = datetime.now(timezone.utc)
+    later = now + timedelta(seconds=30)
+    sooner = now + timedelta(seconds=0.15)
+
+    availability.schedule_expiry(later)
+    availability.schedule_expiry(sooner)
+    availability.schedule_expiry(sooner)
+    changed = availability.changed_event()
+
+    assert availability._timer_due == sooner
+    await asyncio.wait_for(changed.wait(), timeout=2)
+    assert availability._expiries == [later]
+    assert availability._timer_due == later
+
+    await availability.stop()
+    assert availability._timer is None
+
+
+@pytest.mark.asyncio
+async def test_past_expiry_does_not_spin(db):
+    """An expiry already due waits a short delay instead of firing immediately."""
+    availability = AccountAvailability(db)
+    availability.schedule_expiry(datetime.now(timezone.utc) - timedelta(seconds=5))
+
+    assert availability._timer is not None
+    remaining = availability._timer.when() - asyncio.get_running_loop().time()
+    assert remaining > 0.05
+    await availability.stop()
+
+
+@pytest.mark.asyncio
+async def test_subscribe_failure_falls_back_to_polling(db):
+    """Without LISTEN, callers are told to poll."""
+    db.listen.side_effect = ConnectionError("no listener")
+    availability = AccountAvailability(db)
+
+    await availability.start()
+
+    assert not availability.is_listening
+    assert await availability.ensure_listening() is False
+
+
+@pytest.mark.asyncio
+async def test_lost_listener_wakes_waiters(db):
+    """Reconnecting after a lost LISTEN connection wakes waiters to re-check."""
+    availability = AccountAvailability(db)
+    await availability.start()
+    changed = availability.changed_event()
+
+    db.notifications_active = False
+    await availability.ensure_listening()
+
+    db.ensure_listening.assert_awaited_once()
+    assert changed.is_set()
+
+
+@pytest.mark.asyncio
+async def test_wait_wakes_on_release_notification(pool, repo):
+    """A waiter wakes on a release from another worker, not on a poll timer."""
+    waiter = asyncio.create_task(pool.wait_for_available_account(timeout=10))
+    await asyncio.sleep(0.05)
+    assert not waiter.done()
+    assert repo.get_availability_summary.await_count == 1
+
+    repo.get_availability_summary.return_value = {"available": 1, "next_cooldown_until": None}
+    pool.availability._on_notification("3")
+
+    assert await asyncio.wait_for(waiter, timeout=1) is True
+    assert repo.get_availability_summary.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_wait_wakes_at_cooldown_expiry(pool, repo):
+    """A waiter wakes when the next cooldown expires, from the summary's expiry."""
+    cooldown_until = datetime.now(timezone.utc) + timedelta(seconds=0.2)
+    repo.get_availability_summary.side_effect = [
+        {"available": 0, "next_cooldown_until": cooldown_until},
+        {"available": 1, "next_cooldown_until": None},
+    ]
+
+    assert await pool.wait_for_available_account(timeout=10) is True
+    assert repo.get_availability_summary.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_change_during_query_is_not_missed(pool, repo):
+    """A notification landing while the pool is queried still ends the wait."""
+    summaries = iter(
+        [
+            {"available": 0, "next_cooldown_until": None},
+            {"available": 1, "next_cooldown_until": None},
+        ]
+    )
+
+    async def summary_then_release():
+        result = next(summaries)
+        pool.availability._on_notification("3")
+        return result
+
+    repo.get_availability_summary.side_effect = summary_then_release
+
+    assert await asyncio.wait_for(pool.wait_for_available_account(timeout=10), timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_in_process_release_schedules_cooldown_expiry(pool, repo):
+    """Releasing to cooldown arms the expiry timer without a database round-trip."""
+    repo.release_account.return_value = True
+
+    await pool.release_account(1, "success")
+
+    due = pool.availability._timer_due
+    assert due is not None
+    assert 55 < (due - datetime.now(timezone.utc)).total_seconds() <= 60
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_wait_times_out(pool):
+    """Event-driven waits still honour the timeout."""
+    assert await pool.wait_for_available_account(timeout=0.1) is False
@@ -62,14 +62,18 @@ def sample_account_dict():
 
 
 @pytest.mark.asyncio
-async def test_load_accounts(account_pool, mock_account_pool_repo, sample_account_dict):
-    """Test loading accounts from database."""
-    mock_account_pool_repo.get_available_accounts.return_value = [sample_account_dict]
+async def test_load_accounts(account_pool, mock_account_pool_repo):
+    """Test loading accounts counts availability without decrypting passwords."""
+    mock_account_pool_repo.get_availability_summary.return_value = {
+        "available": 1,
+        "next_cooldown_until": None,
+    }
 
     count = await account_pool.load_accounts()
 
     assert count == 1
-    mock_account_pool_repo.get_available_accounts.assert_called_once()
+    mock_account_pool_repo.get_availability_summary.assert_called_once()
+    mock_account_pool_repo.get_available_accounts.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -159,37 +163,56 @@ async def test_release_account_no_slot(account_pool, mock_account_pool_repo):
 @pytest.mark.asyncio
 async def test_release_account_login_fail_below_max(account_pool, mock_account_pool_repo):
     """Test releasing account with login failure below max failures."""
-    # Simulate account with 1 consecutive failure (below max of 3)
-    mock_account_pool_repo.get_account_by_id.return_value = {
-        "consecutive_failures": 1,
+    # The repository counted the failure (2, below max of 3) and kept the account available
+    mock_account_pool_repo.release_failed_account.return_value = {
+        "status": "available",
+        "consecutive_failures": 2,
+        "quarantine_until": None,
     }
-    mock_account_pool_repo.release_account.return_value = True
 
     result = await account_pool.release_account(1, "login_fail", "Login error")
 
     assert result is True
-    # Should NOT quarantine (only 2 failures total)
-    call_args = mock_account_pool_repo.release_account.call_args
+    # One statement: no read of the failure counter beforehand
+    mock_account_pool_repo.get_account_by_id.assert_not_called()
+    mock_account_pool_repo.release_account.assert_not_called()
+    call_args = mock_account_pool_repo.release_failed_account.call_args
     assert call_args[1]["result_status"] == "login_fail"
-    assert "quarantine_until" not in call_args[1] or call_args[1]["quarantine_until"] is None
+    assert call_args[1]["max_failures"] == 3
+    assert call_args[1]["quarantine_until"] is not None
+    assert account_pool.availability._timer_due is None
 
 
 @pytest.mark.asyncio
 async def test_release_account_login_fail_quarantine(account_pool, mock_account_pool_repo):
     """Test releasing account with login failure reaching max failures."""
-    # Simulate account with 2 consecutive failures (will hit max of 3)
-    mock_account_pool_repo.get_account_by_id.return_value = {
-        "consecutive_failures": 2,
-    }
-    mock_account_pool_repo.release_account.return_value = True
+    # The repository counted the third failure and quarantined the account
+    mock_account_pool_repo.release_failed_account.side_effect = (
+        lambda account_id, result_status, max_failures, quarantine_until: {
+            "status": "quarantine",
+            "consecutive_failures": 3,
+            "quarantine_until": quarantine_until,
+        }
+    )
 
     result = await account_pool.release_account(1, "login_fail", "Login error")
 
     assert result is True
-    # Should quarantine (3 failures total)
-    call_args = mock_account_pool_repo.release_account.call_args
-    assert call_args[1]["result_status"] == "login_fail"
-    assert call_args[1]["quarantine_until"] is not None
+    mock_account_pool_repo.get_account_by_id.assert_not_called()
+    # Waiters are woken when the quarantine expires
+    quarantine_until = mock_account_pool_repo.release_failed_account.call_args[1][
+        "quarantine_until"
+    ]
+    assert account_pool.availability._timer_due == quarantine_until
+    await account_pool.close()
+
+
+@pytest.mark.asyncio
+async def test_release_account_failure_unknown_account(account_pool, mock_account_pool_repo):
+    """A failed release of an unknown account reports failure."""
+    mock_account_pool_repo.release_failed_account.return_value = None
+
+    assert await account_pool.release_account(99, "error", "boom") is False
 
 
 @pytest.mark.asyncio
@@ -274,10 +297,54 @@ async def test_acquire_release_thread_safety(
     await asyncio.gather(*tasks)
 
     # Verify all operations completed without errors
-    # Lock should have prevented race conditions
     assert mock_account_pool_repo.acquire_next_available_account.call_count == 5
 
 
+@pytest.mark.asyncio
+async def test_concurrent_acquires_are_not_serialized(
+    account_pool, mock_account_pool_repo, sample_account_dict
+):
+    """Concurrent acquires overlap; the database row lock is the only guard."""
+    in_flight = 0
+    peak = 0
+
+    async def acquire_next():
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return sample_account_dict
+
+    mock_account_pool_repo.acquire_next_available_account.side_effect = acquire_next
+
+    accounts = await asyncio.gather(*(account_pool.acquire_account() for _ in range(8)))
+
+    assert all(account is not None for account in accounts)
+    assert peak == 8
+
+
+@pytest.mark.asyncio
+async def test_acquire_accounts_batch(account_pool, mock_account_pool_repo, sample_account_dict):
+    """Acquire several accounts with one repository call, keeping its LRU order."""
+    second = {**sample_account_dict, "id": 2, "email": "second@example.com"}
+    mock_account_pool_repo.acquire_available_accounts.return_value = [sample_account_dict, second]
+
+    accounts = await account_pool.acquire_accounts(3)
+
+    mock_account_pool_repo.acquire_available_accounts.assert_awaited_once_with(3)
+    assert [account.id for account in accounts] == [1, 2]
+    assert accounts[1].email == "second@example.com"
+
+
+@pytest.mark.asyncio
+async def test_acquire_accounts_empty_pool(account_pool, mock_account_pool_repo):
+    """An empty pool yields an empty batch."""
+    mock_account_pool_repo.acquire_available_accounts.return_value = []
+
+    assert await account_pool.acquire_accounts(2) == []
+
+
 @pytest.mark.asyncio
 async def test_wait_for_available_account_with_shutdown(mock_db, mock_account_pool_repo):
     """Test wait_for_available_account respects shutdown event."""
@@ -295,8 +362,10 @@ async def test_wait_for_available_account_with_shutdown(mock_db, mock_account_po
         pool.repo = mock_account_pool_repo
 
     # No accounts available
-    mock_account_pool_repo.get_available_accounts.return_value = []
-    mock_account_pool_repo.get_next_available_cooldown_time.return_value = None
+    mock_account_pool_repo.get_availability_summary.return_value = {
+        "available": 0,
+        "next_cooldown_until": None,
+    }
 
     # Set shutdown event after a short delay
     async def trigger_shutdown():
@@ -326,30 +395,35 @@ async def test_wait_for_available_account_no_shutdown_event(mock_db, mock_accoun
         )
         pool.repo = mock_account_pool_repo
 
-    now = datetime.now(timezone.utc)
-    sample_account = {
-        "id": 1,
-        "email": "test@example.com",
-        "password": "pass",
-        "phone": "+1234567890",
-        "status": "available",
-        "last_used_at": now,
-        "cooldown_until": None,
-        "quarantine_until": None,
-        "consecutive_failures": 0,
-        "total_uses": 0,
-        "is_active": True,
-        "created_at": now,
-        "updated_at": now,
-    }
-
     # Account becomes available immediately
-    mock_account_pool_repo.get_available_accounts.return_value = [sample_account]
+    mock_account_pool_repo.get_availability_summary.return_value = {
+        "available": 1,
+        "next_cooldown_until": None,
+    }
 
     # Should return True immediately
     result = await pool.wait_for_available_account(timeout=5.0)
 
     assert result is True
+    mock_account_pool_repo.get_available_accounts.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_wait_for_available_account_sleeps_until_cooldown(
+    account_pool, mock_account_pool_repo
+):
+    """The wait uses the cooldown from the same summary query, then re-checks."""
+    cooldown_until = datetime.now(timezone.utc) + timedelta(seconds=0.2)
+    mock_account_pool_repo.get_availability_summary.side_effect = [
+        {"available": 0, "next_cooldown_until": cooldown_until},
+        {"available": 1, "next_cooldown_until": None},
+    ]
+
+    result = await account_pool.wait_for_available_account(timeout=5.0)
+
+    assert result is True
+    assert mock_account_pool_repo.get_availability_summary.call_count == 2
+    mock_account_pool_repo.get_next_available_cooldown_time.assert_not_called()
 
 
 # ──────────────────────────────────────────────────────────────
@@ -428,3 +502,18 @@ def test_pooled_account_repr_hides_password(sample_account_dict):
     assert "password" not in account_repr
     # But the password is still accessible directly
     assert account.password == sample_account_dict["password"]
+
+
+@pytest.mark.asyncio
+async def test_return_unused_accounts(account_pool, mock_account_pool_repo, sample_account_dict):
+    """Unused accounts go back to 'available' in one call and wake waiters."""
+    mock_account_pool_repo.return_unused_accounts.return_value = 1
+    changed = account_pool.availability.changed_event()
+
+    returned = await account_pool.return_unused_accounts(
+        [PooledAccount.from_dict(sample_account_dict)]
+    )
+
+    assert returned == 1
+    mock_account_pool_repo.return_unused_accounts.assert_awaited_once_with([1])
+    assert changed.is_set()
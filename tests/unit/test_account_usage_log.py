@@ -0,0 +1,151 @@
+"""Tests for the buffered account_usage_log writer."""
+
+import asyncio
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.repositories.account_pool_repository import USAGE_LOG_COLUMNS, AccountPoolRepository
+from src.services.session.account_usage_log import AccountUsageLogWriter
+
+
+@pytest.fixture
+def mock_db():
+    """Database whose connection records COPY calls."""
+    conn = AsyncMock()
+    conn.copy_records_to_table = AsyncMock(return_value="COPY 1")
+    conn.transaction = MagicMock(
+        return_value=AsyncMock(
+            __aenter__=AsyncMock(return_value=None),
+            __aexit__=AsyncMock(return_value=False),
+        )
+    )
+    db = MagicMock()
+    db.get_connection = MagicMock(
+        return_value=AsyncMock(
+            __aenter__=AsyncMock(return_value=conn),
+            __aexit__=AsyncMock(return_value=False),
+        )
+    )
+    db.conn = conn
+    return db
+
+
+async def _log(writer: AccountUsageLogWriter, account_id: int, **kwargs) -> None:
+    """Log one usage entry with fixed mission details."""
+    await writer.log(
+        account_id=account_id,
+        mission_code="fra",
+        session_number=1,
+        result="success",
+        started_at=datetime.now(timezone.utc),
+        **kwargs,
+    )
+
+
+class TestAccountUsageLogWriter:
+    """Batching, fallback and drain behaviour."""
+
+    @pytest.mark.asyncio
+    async def test_entries_are_batched_into_one_copy(self, mock_db):
+        """Queued entries reach account_usage_log through a single COPY."""
+        writer = AccountUsageLogWriter(AccountPoolRepository(mock_db), flush_interval=60)
+        await writer.start()
+
+        for i in range(20):
+            await _log(writer, i, request_id=100 + i)
+        mock_db.conn.copy_records_to_table.assert_not_awaited()
+        await writer.stop()
+
+        mock_db.conn.copy_records_to_table.assert_awaited_once()
+        call = mock_db.conn.copy_records_to_table.await_args
+        assert call.args[0] == "account_usage_log"
+        assert call.kwargs["columns"] == USAGE_LOG_COLUMNS
+        records = call.kwargs["records"]
+        assert [record[0] for record in records] == list(range(20))
+        assert records[3][3] == 103
+        assert records[0][7] is not None  # completed_at defaults to now
+        assert writer.get_metrics()["written"] == 20
+
+    @pytest.mark.asyncio
+    async def test_full_batch_flushes_without_waiting(self, mock_db):
+        """A full batch is written before the flush window ends."""
+        writer = AccountUsageLogWriter(
+            AccountPoolRepository(mock_db), batch_size=5, flush_interval=60
+        )
+        await writer.start()
+
+        for i in range(5):
+            await _log(writer, i)
+        for _ in range(50):
+            if mock_db.conn.copy_records_to_table.await_count:
+                break
+            await asyncio.sleep(0.01)
+
+        assert mock_db.conn.copy_records_to_table.await_count == 1
+        await writer.stop()
+
+    @pytest.mark.asyncio
+    async def test_rejected_batch_is_retried_row_by_row(self, mock_db):
+        """One bad entry does not lose the rest of its batch."""
+
+        async def copy(table, records, columns):
+            if len(records) > 1 or records[0][0] == 2:
+                raise ValueError("foreign key violation")
+            return "COPY 1"
+
+        mock_db.conn.copy_records_to_table.side_effect = copy
+        writer = AccountUsageLogWriter(AccountPoolRepository(mock_db), flush_interval=60)
+        await writer.start()
+
+        for i in range(4):
+            await _log(writer, i)
+        await writer.stop()
+
+        metrics = writer.get_metrics()
+        assert metrics["written"] == 3
+        assert metrics["dropped"] == 1
+        assert metrics["write_errors"] == 1
+
+    @pytest.mark.asyncio
+    async def test_full_queue_drops_after_timeout(self, mock_db):
+        """When the writer falls behind, log() waits briefly and then drops."""
+        blocked = asyncio.Event()
+
+        async def copy(table, records, columns):
+            await blocked.wait()
+            return f"COPY {len(records)}"
+
+        mock_db.conn.copy_records_to_table.side_effect = copy
+        writer = AccountUsageLogWriter(
+            AccountPoolRepository(mock_db),
+            queue_size=1,
+            batch_size=1,
+            flush_interval=60,
+            enqueue_timeout=0.05,
+        )
+        await writer.start()
+
+        for i in range(4):
+            await _log(writer, i)
+        metrics = writer.get_metrics()
+        blocked.set()
+        await writer.stop()
+
+        assert metrics["dropped"] >= 1
+        assert metrics["backpressure_waits"] >= 1
+
+    @pytest.mark.asyncio
+    async def test_logs_directly_when_not_running(self, mock_db):
+        """Without start(), each entry is inserted immediately."""
+        repo = AccountPoolRepository(mock_db)
+        repo.log_usage = AsyncMock(return_value=1)
+        writer = AccountUsageLogWriter(repo)
+
+        await _log(writer, 7, error_message="Requests: [1]")
+
+        repo.log_usage.assert_awaited_once()
+        assert repo.log_usage.await_args.kwargs["account_id"] == 7
+        mock_db.conn.copy_records_to_table.assert_not_awaited()
+        assert not writer.is_running
@@ -2,12 +2,14 @@
 
 import asyncio
 import time
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 from src.services.appointment_deduplication import (
     AppointmentDeduplication,
     InMemoryDeduplicationBackend,
+    RedisDeduplicationBackend,
     get_deduplication_service,
 )
 
@@ -248,3 +250,40 @@ class TestDeduplicationServiceGlobal:
         assert service is not None
         assert isinstance(service, AppointmentDeduplication)
         assert service._ttl_seconds == 3600  # Default TTL
+
+
+@pytest.mark.asyncio
+class TestRedisDeduplicationBackend:
+    """Test cases for the redis.asyncio deduplication backend."""
+
+    async def test_mark_and_check_await_async_client(self):
+        """Test that commands are awaited on the async client."""
+        mock_redis = MagicMock()
+        mock_redis.setex = AsyncMock()
+        mock_redis.exists = AsyncMock(return_value=1)
+        backend = RedisDeduplicationBackend(mock_redis)
+
+        await backend.mark_booked("1:Istanbul:Tourism:2026-11-01", 3600)
+        assert await backend.is_duplicate("1:Istanbul:Tourism:2026-11-01", 3600)
+
+        mock_redis.setex.assert_awaited_once_with("dedup:1:Istanbul:Tourism:2026-11-01", 3600, "1")
+        mock_redis.exists.assert_awaited_once_with("dedup:1:Istanbul:Tourism:2026-11-01")
+
+    async def test_clear_deletes_in_one_pipeline(self):
+        """Test that clear() sends all DELETEs in a single pipelined round trip."""
+        keys = [f"dedup:{i}" for i in range(250)]
+        mock_redis = MagicMock()
+        mock_redis.scan = AsyncMock(side_effect=[(7, keys[:200]), (0, keys[200:])])
+        pipe = MagicMock()
+        pipe.execute = AsyncMock()
+        mock_redis.pipeline.return_value.__aenter__ = AsyncMock(return_value=pipe)
+        mock_redis.pipeline.return_value.__aexit__ = AsyncMock(return_value=False)
+        backend = RedisDeduplicationBackend(mock_redis)
+
+        await backend.clear()
+
+        mock_redis.pipeline.assert_called_once_with(transaction=False)
+        assert pipe.delete.call_count == 3
+        deleted = [key for call in pipe.delete.call_args_list for key in call[0]]
+        assert deleted == keys
+        pipe.execute.assert_awaited_once()
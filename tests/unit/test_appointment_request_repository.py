@@ -0,0 +1,183 @@
+"""Tests for AppointmentRequestRepository bulk person loading."""
+
+import json
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.repositories.appointment_request_repository import AppointmentRequestRepository
+from src.utils.db_helpers import decode_cursor
+
+
+def _request_row(request_id: int, status: str = "pending") -> dict:
+    """Build a raw appointment_requests row."""
+    return {
+        "id": request_id,
+        "country_code": "fra",
+        "visa_category": None,
+        "visa_subcategory": "Tourism",
+        "centres": json.dumps(["Istanbul"]),
+        "preferred_dates": json.dumps(["2025-01-01"]),
+        "person_count": 1,
+        "status": status,
+        "created_at": "2025-01-01T00:00:00",
+    }
+
+
+def _person_row(person_id: int, request_id: int) -> dict:
+    """Build a raw appointment_persons row."""
+    return {"id": person_id, "request_id": request_id, "email": f"p{person_id}@example.com"}
+
+
+@pytest.fixture
+def repo_and_conn():
+    """Create a repository backed by a mocked connection."""
+    conn = AsyncMock()
+    conn.__aenter__ = AsyncMock(return_value=conn)
+    conn.__aexit__ = AsyncMock(return_value=None)
+
+    db = MagicMock()
+    db.get_connection = MagicMock(return_value=conn)
+
+    return AppointmentRequestRepository(db), conn
+
+
+@pytest.mark.asyncio
+async def test_get_all_loads_persons_in_single_query(repo_and_conn):
+    """get_all() issues one request query and one bulk person query."""
+    repo, conn = repo_and_conn
+    conn.fetch = AsyncMock(
+        side_effect=[
+            [_request_row(2), _request_row(1)],
+            [_person_row(10, 1), _person_row(20, 2), _person_row(21, 2)],
+        ]
+    )
+
+    requests = await repo.get_all(status="pending")
+
+    assert conn.fetch.await_count == 2
+    person_query, person_ids = conn.fetch.await_args_list[1].args
+    assert "ANY($1::bigint[])" in person_query
+    assert person_ids == [2, 1]
+
+    assert [r.id for r in requests] == [2, 1]
+    assert [p["id"] for p in requests[0].persons] == [20, 21]
+    assert [p["id"] for p in requests[1].persons] == [10]
+    assert requests[0].centres == ["Istanbul"]
+    assert requests[0].visa_category == ""
+
+
+@pytest.mark.asyncio
+async def test_get_all_empty_skips_person_query(repo_and_conn):
+    """No person query is issued when there are no requests."""
+    repo, conn = repo_and_conn
+    conn.fetch = AsyncMock(return_value=[])
+
+    assert await repo.get_all() == []
+    assert conn.fetch.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_get_all_pending_for_user_uses_bulk_path(repo_and_conn):
+    """get_all_pending_for_user() no longer calls get_by_id() per request."""
+    repo, conn = repo_and_conn
+    conn.fetchrow = AsyncMock(return_value={"email": "p10@example.com"})
+    conn.fetch = AsyncMock(
+        side_effect=[
+            [_request_row(1), _request_row(3)],
+            [_person_row(10, 1), _person_row(30, 3)],
+        ]
+    )
+    repo.get_by_id = AsyncMock()
+
+    requests = await repo.get_all_pending_for_user(user_id=5)
+
+    repo.get_by_id.assert_not_awaited()
+    assert conn.fetchrow.await_count == 1
+    assert conn.fetch.await_count == 2
+    assert [r.id for r in requests] == [1, 3]
+    assert requests[1].persons[0]["id"] == 30
+
+
+@pytest.mark.asyncio
+async def test_get_all_pending_for_user_unknown_user(repo_and_conn):
+    """Unknown users return an empty list without querying requests."""
+    repo, conn = repo_and_conn
+    conn.fetchrow = AsyncMock(return_value=None)
+    conn.fetch = AsyncMock()
+
+    assert await repo.get_all_pending_for_user(user_id=99) == []
+    conn.fetch.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_get_by_ids(repo_and_conn):
+    """get_by_ids() loads requests and persons in two queries."""
+    repo, conn = repo_and_conn
+    conn.fetch = AsyncMock(side_effect=[[_request_row(7)], [_person_row(70, 7)]])
+
+    requests = await repo.get_by_ids([7, 8])
+
+    assert conn.fetch.await_count == 2
+    assert len(requests) == 1
+    assert requests[0].persons == [_person_row(70, 7)]
+
+    conn.fetch.reset_mock()
+    assert await repo.get_by_ids([]) == []
+    conn.fetch.assert_not_awaited()
+
+
+def _timestamped_request_row(request_id: int) -> dict:
+    """Build a raw appointment_requests row with a TIMESTAMPTZ created_at."""
+    row = _request_row(request_id)
+    row["created_at"] = datetime(2025, 1, 1, tzinfo=timezone.utc) + timedelta(hours=request_id)
+    return row
+
+
+@pytest.mark.asyncio
+async def test_get_page_returns_next_cursor(repo_and_conn):
+    """get_page() loads persons in bulk and returns the cursor of the last row."""
+    repo, conn = repo_and_conn
+    conn.fetch = AsyncMock(
+        side_effect=[
+            [_timestamped_request_row(3), _timestamped_request_row(2), _timestamped_request_row(1)],
+            [_person_row(30, 3), _person_row(20, 2)],
+        ]
+    )
+
+    requests, next_cursor = await repo.get_page(limit=2, status="pending")
+
+    request_query, status, limit = conn.fetch.await_args_list[0].args
+    assert "ORDER BY created_at DESC, id DESC LIMIT $2" in request_query
+    assert (status, limit) == ("pending", 3)
+    assert conn.fetch.await_args_list[1].args[1] == [3, 2]
+
+    assert [r.id for r in requests] == [3, 2]
+    assert decode_cursor(next_cursor) == (_timestamped_request_row(2)["created_at"], 2)
+
+
+@pytest.mark.asyncio
+async def test_stream_loads_persons_per_chunk(repo_and_conn):
+    """stream() yields every request, with one person query per cursor chunk."""
+    repo, conn = repo_and_conn
+
+    @asynccontextmanager
+    async def transaction(**kwargs):
+        yield
+
+    conn.transaction = transaction
+    portal = MagicMock()
+    portal.fetch = AsyncMock(
+        side_effect=[[_request_row(i) for i in range(500, 0, -1)], [_request_row(0)]]
+    )
+    conn.cursor = AsyncMock(return_value=portal)
+    conn.fetch = AsyncMock(side_effect=[[_person_row(1, 500)], [_person_row(2, 0)]])
+
+    requests = [request async for request in repo.stream()]
+
+    assert len(requests) == 501
+    assert conn.fetch.await_count == 2
+    assert requests[0].persons[0]["id"] == 1
+    assert requests[-1].persons[0]["id"] == 2
@@ -0,0 +1,161 @@
+"""Tests for the batched AuditLogger pipeline."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.utils.audit_logger import AuditAction, AuditLogger
+
+
+@pytest.fixture
+def mock_db():
+    """Database whose connection records COPY calls."""
+    conn = AsyncMock()
+    conn.copy_records_to_table = AsyncMock(return_value="COPY 1")
+    conn.transaction = MagicMock(
+        return_value=AsyncMock(
+            __aenter__=AsyncMock(return_value=None),
+            __aexit__=AsyncMock(return_value=False),
+        )
+    )
+    db = MagicMock()
+    db.get_connection = MagicMock(
+        return_value=AsyncMock(
+            __aenter__=AsyncMock(return_value=conn),
+            __aexit__=AsyncMock(return_value=False),
+        )
+    )
+    db.conn = conn
+    return db
+
+
+class TestAuditLoggerPipeline:
+    """Queue, batching, backpressure and drain behaviour."""
+
+    @pytest.mark.asyncio
+    async def test_events_are_batched_into_one_copy_and_one_file_write(self, mock_db, tmp_path):
+        """Queued events reach the DB via a single COPY and the file via one handle."""
+        log_file = tmp_path / "audit.jsonl"
+        audit_logger = AuditLogger(db=mock_db, log_file=str(log_file), flush_interval=60)
+        await audit_logger.start()
+
+        with patch(
+            "src.utils.audit_logger.asyncio.to_thread", wraps=asyncio.to_thread
+        ) as to_thread:
+            for i in range(50):
+                await audit_logger.log(
+                    AuditAction.LOGIN_SUCCESS, user_id=i, details={"token": "abcdefgh"}
+                )
+            await audit_logger.stop()
+
+        mock_db.conn.copy_records_to_table.assert_awaited_once()
+        call = mock_db.conn.copy_records_to_table.await_args
+        assert call.args[0] == "audit_log"
+        assert len(call.kwargs["records"]) == 50
+        # One thread hop for the batched write, one for closing the handle
+        assert to_thread.call_count == 2
+
+        lines = log_file.read_text().splitlines()
+        assert len(lines) == 50
+        assert json.loads(lines[0])["details"]["token"] == "ab***gh"
+        assert audit_logger.get_metrics()["written"] == 50
+        assert audit_logger.get_metrics()["flushes"] == 1
+
+    @pytest.mark.asyncio
+    async def test_flushes_when_batch_size_reached(self, mock_db):
+        """A full batch is written without waiting for the time window."""
+        audit_logger = AuditLogger(db=mock_db, batch_size=10, flush_interval=60)
+        await audit_logger.start()
+
+        for i in range(25):
+            await audit_logger.log(AuditAction.BOT_STARTED, user_id=i)
+        await asyncio.sleep(0.05)
+
+        assert mock_db.conn.copy_records_to_table.await_count == 2
+        await audit_logger.stop()
+        assert mock_db.conn.copy_records_to_table.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_flushes_after_time_window(self, mock_db):
+        """A partial batch is written once the flush interval passes."""
+        audit_logger = AuditLogger(db=mock_db, flush_interval=0.01)
+        await audit_logger.start()
+
+        await audit_logger.log(AuditAction.LOGOUT, username="alice")
+        await asyncio.sleep(0.1)
+
+        mock_db.conn.copy_records_to_table.assert_awaited_once()
+        await audit_logger.stop()
+
+    @pytest.mark.asyncio
+    async def test_full_queue_applies_backpressure_then_drops(self, mock_db):
+        """log() waits for space, then drops and counts the event on timeout."""
+        audit_logger = AuditLogger(db=mock_db, queue_size=2, enqueue_timeout=0.01)
+        await audit_logger.start()
+        # Stall the writer so the queue cannot drain
+        audit_logger._pipeline._writer_task.cancel()
+        await asyncio.sleep(0)
+
+        for i in range(3):
+            await audit_logger.log(AuditAction.LOGIN_FAILURE, user_id=i)
+
+        metrics = audit_logger.get_metrics()
+        assert metrics["enqueued"] == 2
+        assert metrics["backpressure_waits"] == 1
+        assert metrics["dropped"] == 1
+        assert metrics["queue_depth"] == 2
+
+        await audit_logger.stop(timeout=0.01)
+        assert audit_logger.get_metrics()["dropped"] == 3
+
+    @pytest.mark.asyncio
+    async def test_db_failure_counts_dropped_entries(self, mock_db):
+        """A failed COPY is retried per entry; entries that still fail are dropped."""
+        mock_db.conn.copy_records_to_table.side_effect = RuntimeError("db down")
+        audit_logger = AuditLogger(db=mock_db)
+        await audit_logger.start()
+
+        await audit_logger.log(AuditAction.USER_CREATED, username="bob")
+        await audit_logger.stop()
+
+        metrics = audit_logger.get_metrics()
+        assert metrics["write_errors"] == 1
+        assert metrics["written"] == 0
+        assert metrics["dropped"] == 1
+
+    @pytest.mark.asyncio
+    async def test_rejected_batch_is_retried_row_by_row(self, mock_db):
+        """One bad entry (e.g. a foreign key violation) does not lose its batch."""
+
+        async def copy(table, records, columns):
+            if len(records) > 1 or records[0][1] == 2:
+                raise RuntimeError("violates foreign key constraint")
+            return "COPY 1"
+
+        mock_db.conn.copy_records_to_table.side_effect = copy
+        audit_logger = AuditLogger(db=mock_db, flush_interval=60)
+        await audit_logger.start()
+
+        for user_id in range(4):
+            await audit_logger.log(AuditAction.LOGIN_SUCCESS, user_id=user_id)
+        await audit_logger.stop()
+
+        metrics = audit_logger.get_metrics()
+        assert metrics["written"] == 3
+        assert metrics["dropped"] == 1
+        assert metrics["write_errors"] == 1
+
+    @pytest.mark.asyncio
+    async def test_logs_directly_after_stop(self, mock_db):
+        """Once stopped, log() falls back to per-event persistence."""
+        audit_logger = AuditLogger(db=mock_db)
+        await audit_logger.start()
+        await audit_logger.stop()
+
+        await audit_logger.log(AuditAction.BOT_STOPPED)
+
+        assert not audit_logger.is_running
+        mock_db.conn.execute.assert_awaited_once()
+        mock_db.conn.copy_records_to_table.assert_not_called()
@@ -1,11 +1,14 @@
 """Tests for audit log routes."""
 
+import json
+from datetime import datetime, timedelta, timezone
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from fastapi.testclient import TestClient
 
 from src.repositories.audit_log_repository import AuditLogEntry
+from src.utils.db_helpers import encode_cursor
 from web.app import create_app
 
 
@@ -21,50 +24,65 @@ def mock_audit_repo(monkeypatch):
     """Mock audit log repository."""
     mock_repo = MagicMock()
 
+    logs = [
+        {
+            "id": 1,
+            "action": "login_success",
+            "user_id": 1,
+            "username": "testuser",
+            "ip_address": "192.168.1.1",
+            "user_agent": "Mozilla/5.0",
+            "details": '{"login_method": "password"}',
+            "timestamp": "2024-01-01T10:00:00Z",
+            "success": True,
+            "resource_type": None,
+            "resource_id": None,
+        },
+        {
+            "id": 2,
+            "action": "user_created",
+            "user_id": 1,
+            "username": "admin",
+            "ip_address": "192.168.1.2",
+            "user_agent": "Mozilla/5.0",
+            "details": '{"new_user_id": 2}',
+            "timestamp": "2024-01-01T11:00:00Z",
+            "success": True,
+            "resource_type": "user",
+            "resource_id": "2",
+        },
+        {
+            "id": 3,
+            "action": "login_failure",
+            "user_id": None,
+            "username": "unknown",
+            "ip_address": "192.168.1.3",
+            "user_agent": "Mozilla/5.0",
+            "details": '{"reason": "invalid_credentials"}',
+            "timestamp": "2024-01-01T12:00:00Z",
+            "success": False,
+            "resource_type": None,
+            "resource_id": None,
+        },
+    ]
+
     # Mock get_all method
-    mock_repo.get_all = AsyncMock(
-        return_value=[
-            {
-                "id": 1,
-                "action": "login_success",
-                "user_id": 1,
-                "username": "testuser",
-                "ip_address": "192.168.1.1",
-                "user_agent": "Mozilla/5.0",
-                "details": '{"login_method": "password"}',
-                "timestamp": "2024-01-01T10:00:00Z",
-                "success": True,
-                "resource_type": None,
-                "resource_id": None,
-            },
-            {
-                "id": 2,
-                "action": "user_created",
-                "user_id": 1,
-                "username": "admin",
-                "ip_address": "192.168.1.2",
-                "user_agent": "Mozilla/5.0",
-                "details": '{"new_user_id": 2}',
-                "timestamp": "2024-01-01T11:00:00Z",
-                "success": True,
-                "resource_type": "user",
-                "resource_id": "2",
-            },
-            {
-                "id": 3,
-                "action": "login_failure",
-                "user_id": None,
-                "username": "unknown",
-                "ip_address": "192.168.1.3",
-                "user_agent": "Mozilla/5.0",
-                "details": '{"reason": "invalid_credentials"}',
-                "timestamp": "2024-01-01T12:00:00Z",
-                "success": False,
-                "resource_type": None,
-                "resource_id": None,
-            },
-        ]
-    )
+    mock_repo.get_all = AsyncMock(return_value=logs)
+
+    def matching(success=None, **filters):
+        return [log for log in logs if success is None or log["success"] == success]
+
+    # Mock keyset listing: one page of `limit` rows, cursor "next" if more remain
+    async def mock_get_page(limit=100, cursor=None, **filters):
+        rows = matching(**filters)
+        return rows[:limit], "next" if len(rows) > limit else None
+
+    async def mock_stream(cursor=None, **filters):
+        for log in matching(**filters):
+            yield log
+
+    mock_repo.get_page = AsyncMock(side_effect=mock_get_page)
+    mock_repo.stream = MagicMock(side_effect=mock_stream)
 
     # Mock get_by_id method
     async def mock_get_by_id(log_id: int):
@@ -84,6 +102,16 @@ def mock_audit_repo(monkeypatch):
 
     mock_repo.get_by_id = AsyncMock(side_effect=mock_get_by_id)
 
+    # Mock get_stats method (aggregated from the hourly rollup)
+    mock_repo.get_stats = AsyncMock(
+        return_value={
+            "total": 3,
+            "successes": 2,
+            "by_action": {"login_success": 1, "user_created": 1, "login_failure": 1},
+            "recent_failures": 1,
+        }
+    )
+
     # Monkeypatch the dependency
     async def mock_get_audit_log_repository():
         return mock_repo
@@ -185,6 +213,71 @@ class TestAuditLogRoutes:
         # Should filter out the failed login
         assert all(log["success"] for log in data)
 
+    def test_list_audit_logs_pagination(self, mock_audit_repo):
+        """Test keyset pagination via cursor query param and X-Next-Cursor header."""
+        from web.app import create_app
+        from web.dependencies import get_audit_log_repository, verify_jwt_token
+
+        app = create_app(run_security_validation=False, env_override="testing")
+
+        async def override_get_audit_log_repository():
+            return mock_audit_repo
+
+        async def mock_verify():
+            return {"sub": "testuser", "user_id": 1}
+
+        app.dependency_overrides[get_audit_log_repository] = override_get_audit_log_repository
+        app.dependency_overrides[verify_jwt_token] = mock_verify
+
+        client = TestClient(app)
+
+        response = client.get("/api/v1/audit/logs?limit=2&success=true")
+        assert response.status_code == 200
+        assert len(response.json()) == 2
+        assert "X-Next-Cursor" not in response.headers
+
+        response = client.get("/api/v1/audit/logs?limit=2")
+        assert response.headers["X-Next-Cursor"] == "next"
+
+        created_at = datetime(2024, 1, 1, 12, tzinfo=timezone.utc)
+        cursor = encode_cursor(created_at, 3)
+        response = client.get(f"/api/v1/audit/logs?cursor={cursor}&action=login_success")
+        assert response.status_code == 200
+        mock_audit_repo.get_page.assert_awaited_with(
+            limit=100, cursor=cursor, action="login_success", user_id=None, success=None
+        )
+
+        response = client.get("/api/v1/audit/logs?cursor=not-a-cursor")
+        assert response.status_code == 400
+
+    def test_list_audit_logs_ndjson(self, mock_audit_repo):
+        """Test NDJSON streaming when the client accepts application/x-ndjson."""
+        from web.app import create_app
+        from web.dependencies import get_audit_log_repository, verify_jwt_token
+
+        app = create_app(run_security_validation=False, env_override="testing")
+
+        async def override_get_audit_log_repository():
+            return mock_audit_repo
+
+        async def mock_verify():
+            return {"sub": "testuser", "user_id": 1}
+
+        app.dependency_overrides[get_audit_log_repository] = override_get_audit_log_repository
+        app.dependency_overrides[verify_jwt_token] = mock_verify
+
+        client = TestClient(app)
+
+        response = client.get(
+            "/api/v1/audit/logs?success=false", headers={"Accept": "application/x-ndjson"}
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert [line["action"] for line in lines] == ["login_failure"]
+        mock_audit_repo.get_page.assert_not_called()
+
     def test_get_audit_log_by_id_requires_auth(self, client):
         """Test that getting a specific audit log requires authentication."""
         response = client.get("/api/v1/audit/logs/1")
@@ -276,3 +369,37 @@ class TestAuditLogRoutes:
 
         # Success rate: 2 successes out of 3 total
         assert data["success_rate"] == pytest.approx(2 / 3, rel=0.01)
+        assert data["recent_failures"] == 1
+        assert data["range"] == "all"
+        mock_audit_repo.get_stats.assert_awaited_once_with(since=None)
+        mock_audit_repo.get_all.assert_not_called()
+
+    def test_get_audit_stats_range(self, mock_audit_repo):
+        """Test that the range parameter bounds the stats query."""
+        from web.app import create_app
+        from web.dependencies import get_audit_log_repository, verify_jwt_token
+
+        app = create_app(run_security_validation=False, env_override="testing")
+
+        async def override_get_audit_log_repository():
+            return mock_audit_repo
+
+        async def mock_verify():
+            return {"sub": "testuser", "user_id": 1}
+
+        app.dependency_overrides[get_audit_log_repository] = override_get_audit_log_repository
+        app.dependency_overrides[verify_jwt_token] = mock_verify
+
+        client = TestClient(app)
+
+        response = client.get("/api/v1/audit/stats?range=7d")
+        assert response.status_code == 200
+        assert response.json()["range"] == "7d"
+
+        since = mock_audit_repo.get_stats.call_args.kwargs["since"]
+        expected = datetime.now(timezone.utc) - timedelta(days=7)
+        assert abs((since - expected).total_seconds()) < 60
+
+        for invalid in ("7w", "0h", "-1d", "forever"):
+            response = client.get(f"/api/v1/audit/stats?range={invalid}")
+            assert response.status_code == 422
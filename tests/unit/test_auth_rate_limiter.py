@@ -2,7 +2,7 @@
 
 import time
 from datetime import timezone
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -358,3 +358,51 @@ class TestCheckAndRecordAttempt:
             assert len(kwargs["args"]) == 4
             assert kwargs["args"][0] == 3  # max_attempts
             assert kwargs["args"][1] == 60  # window_seconds
+
+    @pytest.mark.asyncio
+    async def test_in_memory_backend_async_methods(self):
+        """Test that the async API works on the in-memory backend."""
+        limiter = AuthRateLimiter(max_attempts=2, window_seconds=60, backend=InMemoryBackend())
+
+        assert not await limiter.check_and_record_attempt_async("user1")
+        assert not await limiter.check_and_record_attempt_async("user1")
+        assert await limiter.check_and_record_attempt_async("user1")
+
+        await limiter.clear_attempts_async("user1")
+        assert not await limiter.check_and_record_attempt_async("user1")
+
+    @pytest.mark.asyncio
+    async def test_redis_backend_async_uses_evalsha(self):
+        """Test that the async path runs the cached script by SHA on the async client."""
+        from src.core.rate_limiting.backends import _RATE_LIMIT_LUA_SHA
+
+        mock_async = MagicMock()
+        mock_async.evalsha = AsyncMock(side_effect=[0, 1])
+        mock_async.delete = AsyncMock()
+        backend = RedisBackend(MagicMock(), async_client=mock_async)
+        limiter = AuthRateLimiter(max_attempts=1, window_seconds=60, backend=backend)
+
+        assert not await limiter.check_and_record_attempt_async("user1")
+        assert await limiter.check_and_record_attempt_async("user1")
+        await limiter.clear_attempts_async("user1")
+
+        args = mock_async.evalsha.call_args_list[0][0]
+        assert args[:3] == (_RATE_LIMIT_LUA_SHA, 1, "auth_rl:user1")
+        assert args[3:5] == (1, 60)
+        mock_async.delete.assert_awaited_once_with("auth_rl:user1")
+
+    @pytest.mark.asyncio
+    async def test_redis_backend_async_loads_script_on_noscript(self):
+        """Test that a flushed script cache is reloaded once and the call retried."""
+        from redis.exceptions import NoScriptError
+
+        from src.core.rate_limiting.backends import _RATE_LIMIT_LUA_SCRIPT
+
+        mock_async = MagicMock()
+        mock_async.evalsha = AsyncMock(side_effect=[NoScriptError("NOSCRIPT"), 0])
+        mock_async.script_load = AsyncMock()
+        backend = RedisBackend(MagicMock(), async_client=mock_async)
+
+        assert not await backend.check_and_record_attempt_async("user1", 5, 60)
+        mock_async.script_load.assert_awaited_once_with(_RATE_LIMIT_LUA_SCRIPT)
+        assert mock_async.evalsha.await_count == 2
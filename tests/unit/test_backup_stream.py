@@ -0,0 +1,190 @@
+"""Tests for chunked stream backup encryption and streaming backup/restore."""
+
+import io
+import os
+import stat
+import sys
+from pathlib import Path
+
+import pytest
+from cryptography.fernet import Fernet
+
+from src.utils.backup_stream import (
+    MAGIC,
+    BackupStreamError,
+    BackupStreamWriter,
+    is_stream_backup,
+    iter_backup_stream,
+)
+from src.utils.db_backup import DatabaseBackup
+
+CHUNK = 4096
+
+
+def _encrypt(data: bytes, key: bytes, compression: str = "gzip", chunk_size: int = CHUNK) -> bytes:
+    buffer = io.BytesIO()
+    writer = BackupStreamWriter(buffer, key, compression=compression, chunk_size=chunk_size)
+    # Uneven writes exercise buffering across frame boundaries
+    for start in range(0, len(data), 1000):
+        writer.write(data[start : start + 1000])
+    writer.close()
+    return buffer.getvalue()
+
+
+def _decrypt(blob: bytes, keys) -> bytes:
+    return b"".join(iter_backup_stream(io.BytesIO(blob), keys))
+
+
+@pytest.fixture
+def key():
+    return Fernet.generate_key()
+
+
+@pytest.fixture
+def dump():
+    return b"".join(b"INSERT INTO t VALUES (%d, 'row %d');\n" % (i, i) for i in range(2000))
+
+
+class TestBackupStreamFormat:
+    """Framing, authentication and integrity checks."""
+
+    @pytest.mark.parametrize("compression", ["none", "gzip"])
+    def test_roundtrip(self, key, dump, compression):
+        """Data survives encryption and decryption, chunked at the frame size."""
+        blob = _encrypt(dump, key, compression)
+        chunks = list(iter_backup_stream(io.BytesIO(blob), [key]))
+
+        assert blob.startswith(MAGIC)
+        assert b"".join(chunks) == dump
+        assert max(len(chunk) for chunk in chunks) <= CHUNK
+        assert dump[:100] not in blob
+
+    def test_empty_stream_roundtrip(self, key):
+        """An empty dump still produces a valid (final-frame-only) stream."""
+        assert _decrypt(_encrypt(b"", key), [key]) == b""
+
+    def test_gzip_compresses(self, key, dump):
+        """gzip output is smaller than the plaintext for SQL dumps."""
+        assert len(_encrypt(dump, key, "gzip")) < len(dump) / 2
+
+    def test_tampered_frame_is_rejected(self, key, dump):
+        """Flipping a ciphertext byte fails authentication."""
+        blob = bytearray(_encrypt(dump, key, "none"))
+        blob[len(blob) // 2] ^= 0x01
+
+        with pytest.raises(BackupStreamError):
+            _decrypt(bytes(blob), [key])
+
+    def test_tampered_header_is_rejected(self, key, dump):
+        """The header is authenticated with every frame."""
+        blob = bytearray(_encrypt(dump, key))
+        blob[30] ^= 0x01  # inside the salt
+
+        with pytest.raises(BackupStreamError):
+            _decrypt(bytes(blob), [key])
+
+    def test_truncation_is_detected(self, key, dump):
+        """Dropping whole trailing frames is detected (no final frame)."""
+        blob = _encrypt(dump, key, "none")
+        first_frame_end = 38 + 5 + CHUNK + 16
+
+        with pytest.raises(BackupStreamError, match="truncated"):
+            _decrypt(blob[:first_frame_end], [key])
+        with pytest.raises(BackupStreamError, match="truncated"):
+            _decrypt(blob[:-7], [key])
+
+    def test_trailing_data_is_rejected(self, key, dump):
+        """Bytes appended after the final frame are rejected."""
+        with pytest.raises(BackupStreamError, match="after final frame"):
+            _decrypt(_encrypt(dump, key) + b"x", [key])
+
+    def test_old_key_is_selected_by_key_id(self, key, dump):
+        """Backups made with a rotated-out key decrypt with the old key."""
+        new_key = Fernet.generate_key()
+        assert _decrypt(_encrypt(dump, key), [new_key, key]) == dump
+
+    def test_unknown_key_is_rejected(self, key, dump):
+        """Without a matching key the stream cannot be read."""
+        with pytest.raises(BackupStreamError, match="No configured backup key"):
+            _decrypt(_encrypt(dump, key), [Fernet.generate_key()])
+
+    def test_unsupported_compression(self, key):
+        """Unknown compression names are rejected up front."""
+        with pytest.raises(ValueError):
+            BackupStreamWriter(io.BytesIO(), key, compression="lz4")
+
+
+def _write_script(path: Path, body: str) -> None:
+    path.write_text(f"#!{sys.executable}\n{body}")
+    path.chmod(path.stat().st_mode | stat.S_IEXEC)
+
+
+@pytest.fixture
+def pg_tools(tmp_path, monkeypatch, dump):
+    """Fake pg_dump (prints a dump) and psql (captures stdin) on PATH."""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    source = tmp_path / "dump.sql"
+    source.write_bytes(dump)
+    captured = tmp_path / "restored.sql"
+
+    _write_script(
+        bin_dir / "pg_dump",
+        "import shutil, sys\n"
+        f"shutil.copyfileobj(open({str(source)!r}, 'rb'), sys.stdout.buffer)\n",
+    )
+    _write_script(
+        bin_dir / "psql",
+        "import shutil, sys\n"
+        f"open({str(captured) + '.args'!r}, 'w').write(' '.join(sys.argv[1:]))\n"
+        f"shutil.copyfileobj(sys.stdin.buffer, open({str(captured)!r}, 'wb'))\n",
+    )
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    return captured
+
+
+class TestStreamingDatabaseBackup:
+    """DatabaseBackup in streaming mode, piping through pg_dump/psql."""
+
+    @pytest.fixture
+    def service(self, tmp_path, key, monkeypatch):
+        monkeypatch.setenv("BACKUP_ENCRYPTION_KEY", key.decode())
+        return DatabaseBackup(
+            database_url="postgresql://user:pw@localhost:5432/vfs",
+            backup_dir=str(tmp_path / "backups"),
+            streaming=True,
+            chunk_size=CHUNK,
+        )
+
+    @pytest.mark.asyncio
+    async def test_create_and_restore_stream_backup(self, service, pg_tools, dump, tmp_path):
+        """pg_dump output is stream-encrypted and restored byte-for-byte into psql."""
+        backup_path = Path(await service.create_backup())
+
+        assert is_stream_backup(backup_path)
+        assert stat.S_IMODE(backup_path.stat().st_mode) == 0o600
+        assert list(backup_path.parent.glob("*.sql")) == []
+
+        assert await service.restore_from_backup(str(backup_path)) is True
+        assert pg_tools.read_bytes() == dump
+        assert "--single-transaction" in Path(str(pg_tools) + ".args").read_text()
+
+    @pytest.mark.asyncio
+    async def test_restore_rejects_tampered_stream(self, service, pg_tools):
+        """A tampered stream backup fails the restore."""
+        backup_path = Path(await service.create_backup())
+        blob = bytearray(backup_path.read_bytes())
+        blob[-20] ^= 0x01
+        tampered = backup_path.with_name("tampered.sql.enc")
+        tampered.write_bytes(bytes(blob))
+
+        assert await service.restore_from_backup(str(tampered)) is False
+
+    @pytest.mark.asyncio
+    async def test_failed_pg_dump_removes_partial_backup(self, service, pg_tools, tmp_path):
+        """A non-zero pg_dump exit leaves no backup file behind."""
+        _write_script(tmp_path / "bin" / "pg_dump", "import sys\nsys.exit(3)\n")
+
+        with pytest.raises(Exception, match="pg_dump failed"):
+            await service.create_backup()
+        assert list(Path(service._backup_dir).iterdir()) == []
@@ -0,0 +1,120 @@
+"""Tests for the shared bounded batch writer."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.utils.batch_writer import BatchWriter
+
+
+@pytest.fixture
+def mock_db():
+    """Database whose connection records COPY calls."""
+    conn = AsyncMock()
+    conn.copy_records_to_table = AsyncMock(return_value="COPY 1")
+    conn.transaction = MagicMock(
+        return_value=AsyncMock(
+            __aenter__=AsyncMock(return_value=None),
+            __aexit__=AsyncMock(return_value=False),
+        )
+    )
+    db = MagicMock()
+    db.get_connection = MagicMock(
+        return_value=AsyncMock(
+            __aenter__=AsyncMock(return_value=conn),
+            __aexit__=AsyncMock(return_value=False),
+        )
+    )
+    db.conn = conn
+    return db
+
+
+def _writer(db, **kwargs) -> BatchWriter:
+    """Writer copying (id, name) rows into a test table."""
+    options = {
+        "queue_size": 100,
+        "batch_size": 50,
+        "flush_interval": 60,
+        "enqueue_timeout": 0.05,
+        **kwargs,
+    }
+    return BatchWriter(
+        name="test",
+        table="test_rows",
+        columns=["id", "name"],
+        to_row=lambda item: (item["id"], item["name"]),
+        get_db=lambda: db,
+        **options,
+    )
+
+
+class TestBatchWriter:
+    """Row mapping, hooks and drain behaviour."""
+
+    @pytest.mark.asyncio
+    async def test_items_are_mapped_and_copied_once(self, mock_db):
+        """Queued items reach the table through one COPY of mapped rows."""
+        on_batch = AsyncMock()
+        writer = _writer(mock_db, on_batch=on_batch)
+        await writer.start()
+
+        for i in range(3):
+            assert await writer.put({"id": i, "name": f"row{i}"}) is True
+        await writer.stop(timeout=1)
+
+        call = mock_db.conn.copy_records_to_table.await_args
+        assert call.args[0] == "test_rows"
+        assert call.kwargs["columns"] == ["id", "name"]
+        assert call.kwargs["records"] == [(0, "row0"), (1, "row1"), (2, "row2")]
+        on_batch.assert_awaited_once()
+        assert writer.get_metrics()["written"] == 3
+
+    @pytest.mark.asyncio
+    async def test_failed_hook_does_not_block_copy(self, mock_db):
+        """An on_batch failure is counted, and the batch is still copied."""
+        writer = _writer(mock_db, on_batch=AsyncMock(side_effect=OSError("disk full")))
+        await writer.start()
+
+        await writer.put({"id": 1, "name": "a"})
+        await writer.stop(timeout=1)
+
+        mock_db.conn.copy_records_to_table.assert_awaited_once()
+        metrics = writer.get_metrics()
+        assert metrics["write_errors"] == 1
+        assert metrics["written"] == 1
+
+    @pytest.mark.asyncio
+    async def test_without_database_batches_only_reach_hook(self):
+        """With no database, batches go to on_batch alone."""
+        on_batch = AsyncMock()
+        writer = _writer(None, on_batch=on_batch)
+        await writer.start()
+
+        await writer.put({"id": 1, "name": "a"})
+        await writer.stop(timeout=1)
+
+        assert on_batch.await_args.args[0] == [{"id": 1, "name": "a"}]
+        assert writer.get_metrics()["written"] == 1
+
+    @pytest.mark.asyncio
+    async def test_drain_timeout_counts_unwritten_items(self, mock_db):
+        """Items still queued when the drain times out are counted as dropped."""
+        blocked = asyncio.Event()
+
+        async def copy(table, records, columns):
+            await blocked.wait()
+            return f"COPY {len(records)}"
+
+        mock_db.conn.copy_records_to_table.side_effect = copy
+        writer = _writer(mock_db, queue_size=5, batch_size=1)
+        await writer.start()
+
+        for i in range(4):
+            await writer.put({"id": i, "name": "x"})
+        await asyncio.sleep(0.01)
+        await writer.stop(timeout=0.05)
+
+        assert not writer.is_running
+        assert await writer.put({"id": 9, "name": "late"}) is False
+        assert writer.get_metrics()["dropped"] >= 3
@@ -135,3 +135,26 @@ async def test_no_recovery_notification_when_already_closed(
     for call in mock_alert.call_args_list:
         _, kwargs = call
         assert "recovered" not in kwargs.get("message", "")
+
+
+@pytest.mark.asyncio
+async def test_idle_interval_ends_when_account_becomes_available(bot_loop_manager):
+    """With no accounts, the adaptive wait ends as soon as the pool reports one."""
+    scheduler = bot_loop_manager.services.automation.scheduler
+    scheduler.get_optimal_interval.return_value = 30
+    scheduler.get_mode_info.return_value = {"mode": "normal", "description": "test"}
+    account_pool = bot_loop_manager.account_pool
+    account_pool.availability.is_listening = True
+
+    async def account_released(timeout):
+        await asyncio.sleep(0.05)
+        return True
+
+    account_pool.wait_for_available_account = AsyncMock(side_effect=account_released)
+
+    shutdown = await asyncio.wait_for(
+        bot_loop_manager._wait_adaptive_interval(until_account_available=True), timeout=2
+    )
+
+    assert shutdown is False
+    account_pool.wait_for_available_account.assert_awaited_once_with(timeout=30)
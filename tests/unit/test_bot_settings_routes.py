@@ -259,8 +259,8 @@ class TestSlotAnalyticsRoute:
         mock_result = {
             "message": "Insufficient data",
         }
-        with patch("src.services.slot_analyzer.SlotPatternAnalyzer") as MockAnalyzer:
-            instance = MockAnalyzer.return_value
+        with patch("src.services.slot_analyzer.get_slot_analyzer") as mock_get_analyzer:
+            instance = mock_get_analyzer.return_value
             instance.analyze_patterns.return_value = mock_result
 
             response = client.get("/api/v1/bot/slot-analytics")
@@ -270,8 +270,8 @@ class TestSlotAnalyticsRoute:
 
     def test_slot_analytics_default_days(self, client, mock_auth):
         """Test slot-analytics uses default days=7 when not specified."""
-        with patch("src.services.slot_analyzer.SlotPatternAnalyzer") as MockAnalyzer:
-            instance = MockAnalyzer.return_value
+        with patch("src.services.slot_analyzer.get_slot_analyzer") as mock_get_analyzer:
+            instance = mock_get_analyzer.return_value
             instance.analyze_patterns.return_value = {"message": "Insufficient data"}
 
             client.get("/api/v1/bot/slot-analytics")
@@ -279,8 +279,8 @@ class TestSlotAnalyticsRoute:
 
     def test_slot_analytics_custom_days(self, client, mock_auth):
         """Test slot-analytics accepts custom days parameter."""
-        with patch("src.services.slot_analyzer.SlotPatternAnalyzer") as MockAnalyzer:
-            instance = MockAnalyzer.return_value
+        with patch("src.services.slot_analyzer.get_slot_analyzer") as mock_get_analyzer:
+            instance = mock_get_analyzer.return_value
             instance.analyze_patterns.return_value = {"message": "Insufficient data"}
 
             client.get("/api/v1/bot/slot-analytics?days=30")
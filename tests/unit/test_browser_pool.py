@@ -361,3 +361,137 @@ class TestBrowserPool:
         assert stats["total_browsers"] == 2
         assert stats["idle_browsers"] == 1
         assert stats["active_browsers"] == 1
+
+
+def _shared_manager(healthy: bool = True) -> MagicMock:
+    """Mock BrowserManager hosting leased contexts."""
+    manager = MagicMock()
+    manager.is_healthy = MagicMock(return_value=healthy)
+    manager.close = AsyncMock()
+    manager.apply_anti_detection = AsyncMock()
+
+    async def new_isolated_context():
+        context = MagicMock()
+        context.close = AsyncMock()
+        context.new_page = AsyncMock(return_value=MagicMock())
+        return context, MagicMock()
+
+    manager.new_isolated_context = AsyncMock(side_effect=new_isolated_context)
+    return manager
+
+
+class TestBrowserPoolLeases:
+    """Tests for isolated contexts leased from shared browsers."""
+
+    @pytest.mark.asyncio
+    async def test_leases_share_a_warm_browser(self, test_config):
+        """Sequential leases reuse one browser, each with its own context."""
+        pool = BrowserPool(test_config, max_browsers=2)
+        manager = _shared_manager()
+
+        with patch.object(
+            pool, "_create_shared_browser", AsyncMock(return_value=manager)
+        ) as create:
+            async with await pool.lease() as first:
+                first_context = first.context
+            async with await pool.lease() as second:
+                page = await second.new_page()
+
+        create.assert_called_once()
+        assert first_context is not second.context
+        first_context.close.assert_called_once()
+        second.context.close.assert_called_once()
+        manager.apply_anti_detection.assert_called_once_with(
+            page, second.profile, apply_stealth=True, apply_fingerprint_bypass=True
+        )
+        assert pool.get_stats()["shared_browsers"] == 1
+        assert pool.get_stats()["active_leases"] == 0
+        await pool.close_all()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_leases_bounded_by_contexts_per_browser(self, test_config):
+        """A second browser launches only when the first is full."""
+        pool = BrowserPool(test_config, max_browsers=2, contexts_per_browser=2)
+        managers = [_shared_manager(), _shared_manager()]
+
+        with patch.object(pool, "_create_shared_browser", AsyncMock(side_effect=managers)):
+            leases = [await pool.lease() for _ in range(3)]
+            assert pool.get_stats()["shared_browsers"] == 2
+            assert pool.get_stats()["available_slots"] == 0
+
+            # All four lease slots taken: a fifth lease waits for a release
+            leases.append(await pool.lease())
+            waiter = asyncio.create_task(pool.lease())
+            await asyncio.sleep(0.01)
+            assert not waiter.done()
+
+            await leases[0].close()
+            leases.append(await asyncio.wait_for(waiter, timeout=1))
+
+        assert pool.get_stats()["active_leases"] == 4
+        await pool.close_all()
+
+    @pytest.mark.asyncio
+    async def test_browser_recycled_after_max_uses(self, test_config):
+        """A browser that served max_uses_per_browser leases is closed and replaced."""
+        pool = BrowserPool(test_config, max_browsers=1, max_uses_per_browser=2)
+        managers = [_shared_manager(), _shared_manager()]
+
+        with patch.object(pool, "_create_shared_browser", AsyncMock(side_effect=managers)):
+            for _ in range(2):
+                await (await pool.lease()).close()
+            managers[0].close.assert_called_once()
+            assert pool._semaphore._value == 1
+
+            lease = await pool.lease()
+
+        assert lease._shared.manager is managers[1]
+        await lease.close()
+        managers[1].close.assert_not_called()
+        await pool.close_all()
+
+    @pytest.mark.asyncio
+    async def test_unhealthy_browser_replaced_on_next_lease(self, test_config):
+        """A disconnected browser fails the health check and is replaced."""
+        pool = BrowserPool(test_config, max_browsers=1)
+        managers = [_shared_manager(), _shared_manager()]
+
+        with patch.object(pool, "_create_shared_browser", AsyncMock(side_effect=managers)):
+            await (await pool.lease()).close()
+            managers[0].is_healthy.return_value = False
+
+            lease = await pool.lease()
+
+        managers[0].close.assert_called_once()
+        assert lease._shared.manager is managers[1]
+        await pool.close_all()
+
+    @pytest.mark.asyncio
+    async def test_failed_context_creation_releases_slots(self, test_config):
+        """A context that fails to open does not leak lease or browser slots."""
+        pool = BrowserPool(test_config, max_browsers=1, contexts_per_browser=1)
+        manager = _shared_manager()
+        manager.new_isolated_context.side_effect = Exception("context failed")
+
+        with patch.object(pool, "_create_shared_browser", AsyncMock(return_value=manager)):
+            with pytest.raises(Exception, match="context failed"):
+                await pool.lease()
+
+        assert pool._lease_semaphore._value == 1
+        assert pool.get_stats()["active_leases"] == 0
+        await pool.close_all()
+
+    @pytest.mark.asyncio
+    async def test_close_all_closes_shared_browsers(self, test_config):
+        """close_all() closes shared browsers and restores every browser slot."""
+        pool = BrowserPool(test_config, max_browsers=2)
+        manager = _shared_manager()
+
+        with patch.object(pool, "_create_shared_browser", AsyncMock(return_value=manager)):
+            lease = await pool.lease()
+            await pool.close_all()
+            await lease.close()
+
+        manager.close.assert_called_once()
+        assert pool._semaphore._value == pool.max_browsers
+        assert pool.get_stats()["shared_browsers"] == 0
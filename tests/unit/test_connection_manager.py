@@ -13,9 +13,23 @@ def make_mock_websocket():
     """Create a mock WebSocket object."""
     ws = MagicMock()
     ws.send_json = AsyncMock()
+    ws.send_text = AsyncMock()
+    ws.close = AsyncMock()
     return ws
 
 
+async def stall(payload):
+    """send_text side effect for a client that never reads."""
+    await asyncio.Event().wait()
+
+
+async def drain(manager):
+    """Let every sender task flush its queue and pending slow-client closes finish."""
+    await asyncio.gather(*(channel.queue.join() for channel in manager._channels.values()))
+    await asyncio.gather(*manager._close_tasks)
+    await asyncio.sleep(0)
+
+
 class TestConnectionManagerConnect:
     """Tests for ConnectionManager.connect method."""
 
@@ -159,9 +173,12 @@ class TestConnectionManagerBroadcast:
         await manager.connect(ws2)
 
         await manager.broadcast({"type": "update", "data": {}})
+        await drain(manager)
 
-        ws1.send_json.assert_called_once()
-        ws2.send_json.assert_called_once()
+        ws1.send_text.assert_called_once_with('{"type":"update","data":{}}')
+        ws2.send_text.assert_called_once_with('{"type":"update","data":{}}')
+        await manager.disconnect(ws1)
+        await manager.disconnect(ws2)
 
     @pytest.mark.asyncio
     async def test_broadcast_cleans_disconnected(self):
@@ -169,16 +186,18 @@ class TestConnectionManagerBroadcast:
         manager = ConnectionManager()
         ws1 = make_mock_websocket()
         ws2 = make_mock_websocket()
-        ws2.send_json = AsyncMock(side_effect=RuntimeError("Disconnected"))
+        ws2.send_text = AsyncMock(side_effect=RuntimeError("Disconnected"))
 
         await manager.connect(ws1)
         await manager.connect(ws2)
 
         await manager.broadcast({"type": "update"})
+        await drain(manager)
 
         # ws2 should be removed
         assert ws2 not in manager._connections
         assert ws1 in manager._connections
+        await manager.disconnect(ws1)
 
     @pytest.mark.asyncio
     async def test_broadcast_empty_connections(self):
@@ -187,6 +206,114 @@ class TestConnectionManagerBroadcast:
         # Should not raise
         await manager.broadcast({"type": "test"})
 
+    @pytest.mark.asyncio
+    async def test_broadcast_serializes_once(self):
+        """The message is JSON-encoded once, not once per client."""
+        manager = ConnectionManager()
+        clients = [make_mock_websocket() for _ in range(3)]
+        for ws in clients:
+            await manager.connect(ws)
+
+        with patch("web.websocket.manager.json.dumps", return_value="{}") as dumps:
+            await manager.broadcast({"type": "update"})
+        await drain(manager)
+
+        dumps.assert_called_once()
+        for ws in clients:
+            ws.send_text.assert_called_once_with("{}")
+            ws.send_json.assert_not_called()
+            await manager.disconnect(ws)
+
+    @pytest.mark.asyncio
+    async def test_stalled_client_does_not_delay_others(self):
+        """A client stuck in send doesn't hold up delivery to other clients."""
+        manager = ConnectionManager()
+        stalled = make_mock_websocket()
+        stalled.send_text = AsyncMock(side_effect=stall)
+        fast = make_mock_websocket()
+        await manager.connect(stalled)
+        await manager.connect(fast)
+
+        await asyncio.wait_for(manager.broadcast({"type": "update"}), timeout=1)
+        await asyncio.wait_for(manager._channels[fast].queue.join(), timeout=1)
+
+        fast.send_text.assert_called_once()
+        await manager.disconnect(stalled)
+        await manager.disconnect(fast)
+
+    @pytest.mark.asyncio
+    async def test_slow_consumer_disconnected_on_overflow(self):
+        """A client whose queue overflows is closed and forgotten."""
+        manager = ConnectionManager()
+        manager.SEND_QUEUE_SIZE = 2
+        slow = make_mock_websocket()
+        slow.send_text = AsyncMock(side_effect=stall)
+        fast = make_mock_websocket()
+        await manager.connect(slow)
+        await manager.connect(fast)
+
+        # The slow client's sender takes the first message and stalls on it
+        for i in range(4):
+            await manager.broadcast({"type": "log", "data": {"n": i}})
+            await asyncio.sleep(0)
+        await drain(manager)
+
+        assert slow not in manager._connections
+        assert slow not in manager._channels
+        slow.close.assert_awaited_once()
+        assert slow.close.await_args.kwargs["code"] == 1013
+        assert fast.send_text.await_count == 4
+
+        metrics = manager.get_metrics()
+        assert metrics["slow_consumers_disconnected"] == 1
+        assert metrics["messages_dropped"] == 1
+        assert metrics["connections"] == 1
+        await manager.disconnect(fast)
+
+    @pytest.mark.asyncio
+    async def test_slow_consumer_drop_policy(self):
+        """With the drop policy, overflowing messages are dropped and counted."""
+        manager = ConnectionManager()
+        manager.SEND_QUEUE_SIZE = 1
+        manager.SLOW_CONSUMER_POLICY = "drop"
+        release = asyncio.Event()
+
+        async def send_when_released(payload):
+            await release.wait()
+
+        slow = make_mock_websocket()
+        slow.send_text = AsyncMock(side_effect=send_when_released)
+        await manager.connect(slow)
+
+        for i in range(4):
+            await manager.broadcast({"type": "log", "data": {"n": i}})
+            await asyncio.sleep(0)
+        release.set()
+        await drain(manager)
+
+        assert slow in manager._connections
+        slow.close.assert_not_called()
+        # First message in flight, second queued, the other two dropped
+        assert slow.send_text.await_count == 2
+        assert manager.get_metrics()["messages_dropped"] == 2
+        await manager.disconnect(slow)
+
+    @pytest.mark.asyncio
+    async def test_disconnect_cancels_sender(self):
+        """Disconnect stops the client's sender task."""
+        manager = ConnectionManager()
+        ws = make_mock_websocket()
+        await manager.connect(ws)
+        assert manager._channels[ws].sender is None
+
+        await manager.broadcast({"type": "update"})
+        sender = manager._channels[ws].sender
+
+        await manager.disconnect(ws)
+        await asyncio.sleep(0)
+
+        assert sender.cancelled()
+
 
 class TestConnectionManagerRateLimit:
     """Tests for _check_rate_limit token bucket algorithm."""
@@ -0,0 +1,192 @@
+"""Tests for database batch helpers."""
+
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.utils.db_helpers import (
+    batch_insert,
+    decode_cursor,
+    encode_cursor,
+    fetch_keyset_page,
+    keyset_query,
+    stream_keyset_rows,
+)
+
+COLUMNS = ["email", "status"]
+ROWS = [(f"user{i}@example.com", "available") for i in range(250)]
+
+
+@pytest.fixture
+def conn():
+    """Mock asyncpg connection recording executed statements."""
+    connection = MagicMock()
+    connection.executemany = AsyncMock()
+    connection.execute = AsyncMock(return_value="INSERT 0 250")
+    connection.copy_records_to_table = AsyncMock(return_value="COPY 250")
+
+    @asynccontextmanager
+    async def transaction(**kwargs):
+        yield
+
+    connection.transaction = transaction
+    return connection
+
+
+class TestBatchInsert:
+    """batch_insert() in executemany and COPY modes."""
+
+    @pytest.mark.asyncio
+    async def test_executemany_in_batches(self, conn):
+        """Default mode inserts with executemany, batch_size rows at a time."""
+        assert await batch_insert(conn, "account_pool", COLUMNS, ROWS) == 250
+
+        assert conn.executemany.await_count == 3
+        query, batch = conn.executemany.await_args_list[0].args
+        assert query == "INSERT INTO account_pool (email, status) VALUES ($1, $2)"
+        assert len(batch) == 100
+        conn.copy_records_to_table.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_copy_mode(self, conn):
+        """use_copy streams all rows through one binary COPY."""
+        assert await batch_insert(conn, "account_pool", COLUMNS, ROWS, use_copy=True) == 250
+
+        conn.copy_records_to_table.assert_awaited_once_with(
+            "account_pool", records=ROWS, columns=COLUMNS
+        )
+        conn.executemany.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_copy_upsert_goes_through_staging_table(self, conn):
+        """COPY upserts load a temp staging table, then merge with ON CONFLICT."""
+        inserted = await batch_insert(
+            conn, "account_pool", COLUMNS, ROWS, use_copy=True, conflict_columns=["email"]
+        )
+
+        assert inserted == 250
+        statements = [call.args[0] for call in conn.execute.await_args_list]
+        assert statements[0] == (
+            "CREATE TEMP TABLE _stage_account_pool AS "
+            "SELECT email, status FROM account_pool WITH NO DATA"
+        )
+        conn.copy_records_to_table.assert_awaited_once_with(
+            "_stage_account_pool", records=ROWS, columns=COLUMNS
+        )
+        assert statements[1] == (
+            "INSERT INTO account_pool (email, status) "
+            "SELECT email, status FROM _stage_account_pool "
+            "ON CONFLICT (email) DO UPDATE SET status = EXCLUDED.status"
+        )
+        assert statements[2] == "DROP TABLE _stage_account_pool"
+
+    @pytest.mark.asyncio
+    async def test_executemany_upsert_do_nothing(self, conn):
+        """An empty update_columns list skips conflicting rows."""
+        await batch_insert(
+            conn, "account_pool", COLUMNS, ROWS[:1], conflict_columns=["email"], update_columns=[]
+        )
+
+        query = conn.executemany.await_args.args[0]
+        assert query.endswith("VALUES ($1, $2) ON CONFLICT (email) DO NOTHING")
+
+    @pytest.mark.asyncio
+    async def test_rejects_invalid_conflict_column(self, conn):
+        """Conflict and update columns are validated like other identifiers."""
+        with pytest.raises(ValueError, match="Invalid column name"):
+            await batch_insert(
+                conn, "account_pool", COLUMNS, ROWS, conflict_columns=["email; DROP TABLE x"]
+            )
+
+    @pytest.mark.asyncio
+    async def test_empty_rows(self, conn):
+        """Nothing is sent for an empty row list."""
+        assert await batch_insert(conn, "account_pool", COLUMNS, [], use_copy=True) == 0
+        conn.copy_records_to_table.assert_not_called()
+
+
+def _keyset_rows(count):
+    """Rows ordered newest first, as the keyset query would return them."""
+    newest = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    return [{"id": count - i, "created_at": newest - timedelta(minutes=i)} for i in range(count)]
+
+
+class TestKeysetPagination:
+    """Opaque cursors, keyset queries, pages and server-side streaming."""
+
+    def test_cursor_round_trip(self):
+        """Cursors are opaque URL-safe strings that decode to (created_at, id)."""
+        created_at = datetime(2026, 10, 16, 12, 30, 15, 123456, tzinfo=timezone.utc)
+
+        cursor = encode_cursor(created_at, 42)
+
+        assert "|" not in cursor and "=" not in cursor
+        assert decode_cursor(cursor) == (created_at, 42)
+
+    @pytest.mark.parametrize("cursor", ["not-base64!", "bm8tc2VwYXJhdG9y", "eHx5"])
+    def test_invalid_cursor(self, cursor):
+        """Malformed cursors raise ValueError."""
+        with pytest.raises(ValueError, match="Invalid pagination cursor"):
+            decode_cursor(cursor)
+
+    def test_keyset_query_appends_after_filters(self):
+        """The cursor condition and LIMIT use the next free parameter numbers."""
+        created_at = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+        query, params = keyset_query(
+            "SELECT * FROM audit_log WHERE action = $1",
+            ["login"],
+            cursor=encode_cursor(created_at, 7),
+            limit=51,
+        )
+
+        assert query == (
+            "SELECT * FROM audit_log WHERE action = $1 AND (created_at, id) < ($2, $3)"
+            " ORDER BY created_at DESC, id DESC LIMIT $4"
+        )
+        assert params == ["login", created_at, 7, 51]
+
+    @pytest.mark.asyncio
+    async def test_fetch_page_returns_next_cursor(self):
+        """One extra row is fetched to decide whether a next page exists."""
+        conn = MagicMock()
+        rows = _keyset_rows(3)
+        conn.fetch = AsyncMock(return_value=rows)
+
+        page, next_cursor = await fetch_keyset_page(conn, "SELECT * FROM logs WHERE 1=1", [], 2)
+
+        assert conn.fetch.await_args.args[-1] == 3
+        assert page == rows[:2]
+        assert decode_cursor(next_cursor) == (rows[1]["created_at"], rows[1]["id"])
+
+    @pytest.mark.asyncio
+    async def test_fetch_last_page_has_no_cursor(self):
+        """A short page means the listing is exhausted."""
+        conn = MagicMock()
+        conn.fetch = AsyncMock(return_value=_keyset_rows(2))
+
+        page, next_cursor = await fetch_keyset_page(conn, "SELECT * FROM logs WHERE 1=1", [], 2)
+
+        assert len(page) == 2
+        assert next_cursor is None
+
+    @pytest.mark.asyncio
+    async def test_stream_fetches_in_chunks(self, conn):
+        """Streaming pulls chunk_size rows per round-trip from a server-side cursor."""
+        rows = _keyset_rows(5)
+        portal = MagicMock()
+        portal.fetch = AsyncMock(side_effect=[rows[:2], rows[2:4], rows[4:]])
+        conn.cursor = AsyncMock(return_value=portal)
+
+        chunks = [
+            chunk
+            async for chunk in stream_keyset_rows(
+                conn, "SELECT * FROM logs WHERE 1=1", [], chunk_size=2
+            )
+        ]
+
+        assert chunks == [rows[:2], rows[2:4], rows[4:]]
+        assert conn.cursor.await_args.args[0].endswith("ORDER BY created_at DESC, id DESC")
+        assert portal.fetch.await_count == 3
@@ -0,0 +1,91 @@
+"""Tests for DatabaseNotificationListener."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.models.db_listener import DatabaseNotificationListener
+
+
+@pytest.fixture
+def mock_conn():
+    """Mock asyncpg connection."""
+    conn = MagicMock()
+    conn.is_closed = MagicMock(return_value=False)
+    conn.add_listener = AsyncMock()
+    conn.remove_listener = AsyncMock()
+    conn.close = AsyncMock()
+    return conn
+
+
+@pytest.mark.asyncio
+async def test_add_listener_connects_once_and_dispatches(mock_conn):
+    """One connection serves all channels; payloads reach every callback."""
+    listener = DatabaseNotificationListener("postgresql://localhost/test")
+    received_a, received_b = [], []
+
+    with patch(
+        "src.models.db_listener.asyncpg.connect", AsyncMock(return_value=mock_conn)
+    ) as connect:
+        await listener.add_listener("chan_a", received_a.append)
+        await listener.add_listener("chan_a", received_b.append)
+        await listener.add_listener("chan_b", received_b.append)
+
+    connect.assert_awaited_once()
+    assert mock_conn.add_listener.await_count == 2
+    assert listener.is_connected
+
+    listener._dispatch(mock_conn, 1, "chan_a", "42")
+    assert received_a == ["42"]
+    assert received_b == ["42"]
+
+
+@pytest.mark.asyncio
+async def test_callback_errors_are_isolated(mock_conn):
+    """A failing callback does not prevent others from running."""
+    listener = DatabaseNotificationListener("postgresql://localhost/test")
+    received = []
+
+    def broken(payload):
+        raise ValueError("boom")
+
+    with patch("src.models.db_listener.asyncpg.connect", AsyncMock(return_value=mock_conn)):
+        await listener.add_listener("chan", broken)
+        await listener.add_listener("chan", received.append)
+
+    listener._dispatch(mock_conn, 1, "chan", "x")
+    assert received == ["x"]
+
+
+@pytest.mark.asyncio
+async def test_failed_connect_does_not_register(mock_conn):
+    """A callback is not kept when the connection cannot be opened."""
+    listener = DatabaseNotificationListener("postgresql://localhost/test")
+
+    with patch("src.models.db_listener.asyncpg.connect", AsyncMock(side_effect=OSError("refused"))):
+        with pytest.raises(OSError):
+            await listener.add_listener("chan", print)
+
+    assert listener._callbacks == {}
+    assert not listener.is_connected
+
+
+@pytest.mark.asyncio
+async def test_termination_and_close(mock_conn):
+    """Server-side termination marks the listener disconnected; close() clears state."""
+    listener = DatabaseNotificationListener("postgresql://localhost/test")
+
+    with patch("src.models.db_listener.asyncpg.connect", AsyncMock(return_value=mock_conn)):
+        await listener.add_listener("chan", print)
+        generation = listener.generation
+        listener._on_termination(mock_conn)
+        assert not listener.is_connected
+        assert listener.generation is None
+
+        assert await listener.reconnect() is True
+        assert listener.is_connected
+        assert listener.generation is not None and listener.generation != generation
+
+    await listener.close()
+    mock_conn.close.assert_awaited_once()
+    assert listener._callbacks == {}
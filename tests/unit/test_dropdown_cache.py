@@ -0,0 +1,202 @@
+"""Tests for the in-process dropdown cache and the dropdown routes' ETags."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.constants import NotifyChannels
+from src.services import dropdown_cache as dropdown_cache_module
+from src.services.dropdown_cache import DropdownCache, DropdownIndex
+
+DROPDOWN_DATA = {
+    "Istanbul": {"Schengen": ["Tourism", "Business"], "National": ["Work"]},
+    "Ankara": {"Schengen": ["Tourism"]},
+    "Broken": "not-a-dict",
+}
+
+
+def _cached(dropdown_data=DROPDOWN_DATA, last_synced_at="2026-10-10T00:00:00+00:00"):
+    """Row as returned by DropdownCacheRepository.get_dropdown_data()."""
+    return {
+        "dropdown_data": dropdown_data,
+        "last_synced_at": last_synced_at,
+        "sync_status": "completed",
+        "error_message": None,
+    }
+
+
+@pytest.fixture
+def db():
+    """Database mock that accepts LISTEN subscriptions."""
+    database = MagicMock()
+    database.listen = AsyncMock()
+    database.unlisten = AsyncMock()
+    database.ensure_listening = AsyncMock(return_value=True)
+    database.notifications_active = True
+    return database
+
+
+@pytest.fixture
+def repo():
+    """Dropdown cache repository mock."""
+    repository = MagicMock()
+    repository.get_dropdown_data = AsyncMock(return_value=_cached())
+    repository.get_last_synced_at = AsyncMock(return_value="2026-10-10T00:00:00+00:00")
+    return repository
+
+
+def test_index_maps_cascade():
+    """Index maps centre -> categories -> subcategories and skips malformed branches."""
+    index = DropdownIndex.build("fra", "2026-10-10T00:00:00+00:00", DROPDOWN_DATA)
+
+    assert index.centres == ["Istanbul", "Ankara", "Broken"]
+    assert index.categories == {"Istanbul": ["Schengen", "National"], "Ankara": ["Schengen"]}
+    assert index.subcategories[("Istanbul", "Schengen")] == ["Tourism", "Business"]
+    assert index.etag.startswith('"') and index.etag.endswith('"')
+
+
+def test_etag_follows_content_not_sync_time():
+    """A re-sync with identical data keeps the ETag; changed data gets a new one."""
+    first = DropdownIndex.build("fra", "2026-10-10T00:00:00+00:00", DROPDOWN_DATA)
+    resynced = DropdownIndex.build("fra", "2026-10-17T00:00:00+00:00", dict(DROPDOWN_DATA))
+    changed = DropdownIndex.build("fra", "2026-10-17T00:00:00+00:00", {"Izmir": {}})
+
+    assert resynced.etag == first.etag
+    assert changed.etag != first.etag
+
+
+@pytest.mark.asyncio
+async def test_cascade_parses_blob_once(db, repo):
+    """Repeated lookups for a country are served from memory while listening."""
+    cache = DropdownCache(db, repo)
+
+    first = await cache.get("fra")
+    second = await cache.get("fra")
+
+    db.listen.assert_awaited_once_with(NotifyChannels.DROPDOWN_CACHE, cache._on_notification)
+    repo.get_dropdown_data.assert_awaited_once_with("fra")
+    repo.get_last_synced_at.assert_not_awaited()
+    assert first is second
+
+
+@pytest.mark.asyncio
+async def test_notification_drops_country(db, repo):
+    """A notification naming a country forces the next lookup to reload it."""
+    cache = DropdownCache(db, repo)
+    await cache.get("fra")
+    await cache.get("nld")
+
+    cache._on_notification("fra")
+    repo.get_dropdown_data.return_value = _cached({"Izmir": {}})
+    reloaded = await cache.get("fra")
+    await cache.get("nld")
+
+    assert reloaded.centres == ["Izmir"]
+    assert repo.get_dropdown_data.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_version_check_without_notifications(db, repo):
+    """Without LISTEN, entries are reused only while last_synced_at is unchanged."""
+    db.listen.side_effect = ConnectionError("no listener")
+    cache = DropdownCache(db, repo)
+    await cache.get("fra")
+
+    await cache.get("fra")
+    assert repo.get_dropdown_data.await_count == 1
+    assert repo.get_last_synced_at.await_count == 1
+
+    repo.get_last_synced_at.return_value = "2026-10-17T00:00:00+00:00"
+    await cache.get("fra")
+    assert repo.get_dropdown_data.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_lost_listener_clears_entries(db, repo):
+    """Entries are dropped when notifications may have been missed."""
+    cache = DropdownCache(db, repo)
+    await cache.get("fra")
+
+    db.notifications_active = False
+    await cache.get("fra")
+
+    db.ensure_listening.assert_awaited_once()
+    assert repo.get_dropdown_data.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_load_racing_notification_is_not_cached(db, repo):
+    """Data fetched before a change notification is returned but not kept."""
+    cache = DropdownCache(db, repo)
+
+    async def fetch_then_change(country_code):
+        cache._on_notification(country_code)
+        return _cached()
+
+    repo.get_dropdown_data.side_effect = fetch_then_change
+    assert await cache.get("fra") is not None
+    assert "fra" not in cache._entries
+
+
+@pytest.mark.asyncio
+async def test_missing_country_returns_none(db, repo):
+    """Countries without cached data return None."""
+    repo.get_dropdown_data.return_value = None
+    cache = DropdownCache(db, repo)
+
+    assert await cache.get("xxx") is None
+
+
+class TestDropdownRouteETags:
+    """Conditional GETs on the centre/category/subcategory routes."""
+
+    @pytest.fixture
+    def client(self, db, repo, monkeypatch):
+        """App with the appointments router backed by the mocked cache."""
+        from web.dependencies import get_db
+        from web.routes.appointments import router
+
+        monkeypatch.setattr(dropdown_cache_module, "_dropdown_cache", DropdownCache(db, repo))
+        app = FastAPI()
+        app.include_router(router)
+        app.dependency_overrides[get_db] = lambda: db
+        return TestClient(app)
+
+    @pytest.mark.parametrize(
+        "path, expected",
+        [
+            ("/appointments/countries/fra/centres", ["Istanbul", "Ankara", "Broken"]),
+            ("/appointments/countries/fra/centres/Istanbul/categories", ["Schengen", "National"]),
+            (
+                "/appointments/countries/fra/centres/Istanbul/categories/Schengen/subcategories",
+                ["Tourism", "Business"],
+            ),
+        ],
+    )
+    def test_etag_and_304(self, client, repo, path, expected):
+        """Responses carry the country's ETag; a matching If-None-Match gets 304."""
+        response = client.get(path)
+        etag = response.headers["etag"]
+
+        assert response.status_code == 200
+        assert response.json() == expected
+        assert response.headers["cache-control"] == "no-cache"
+
+        not_modified = client.get(path, headers={"If-None-Match": f'"other", W/{etag}'})
+        assert not_modified.status_code == 304
+        assert not_modified.content == b""
+        assert not_modified.headers["etag"] == etag
+
+        assert client.get(path, headers={"If-None-Match": '"other"'}).status_code == 200
+        repo.get_dropdown_data.assert_awaited_once()
+
+    def test_fallback_centres_have_no_etag(self, client, repo):
+        """Hardcoded fallback centres are returned without an ETag."""
+        repo.get_dropdown_data.return_value = None
+
+        response = client.get("/appointments/countries/xxx/centres")
+
+        assert response.status_code == 200
+        assert "etag" not in response.headers
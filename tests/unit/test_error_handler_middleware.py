@@ -1,10 +1,11 @@
 """Tests for middleware/error_handler module."""
 
+import json
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from fastapi import Request, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import PlainTextResponse
 
 from src.core.exceptions import (
     AuthenticationError,
@@ -16,6 +17,39 @@ from src.core.exceptions import (
 from web.middleware.error_handler import ErrorHandlerMiddleware
 
 
+def _raising(error: Exception):
+    """ASGI app that raises `error` before sending anything."""
+
+    async def app(scope, receive, send):
+        raise error
+
+    return app
+
+
+async def _call(middleware):
+    """Drive the middleware with a GET /test request and collect the response."""
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/test",
+        "query_string": b"",
+        "headers": [],
+        "client": ("127.0.0.1", 1234),
+    }
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    await middleware(scope, receive, send)
+    start = messages[0]
+    body = b"".join(m.get("body", b"") for m in messages[1:])
+    return start["status"], dict(start["headers"]), body
+
+
 class TestErrorHandlerMiddleware:
     """Tests for ErrorHandlerMiddleware."""
 
@@ -33,73 +67,54 @@ class TestErrorHandlerMiddleware:
         return request
 
     @pytest.mark.asyncio
-    async def test_dispatch_success(self, middleware, mock_request):
-        """Test dispatch with successful call_next."""
-        expected_response = MagicMock()
-        call_next = AsyncMock(return_value=expected_response)
-
-        response = await middleware.dispatch(mock_request, call_next)
-        assert response == expected_response
-
-    @pytest.mark.asyncio
-    async def test_handle_vfsbot_error(self, middleware, mock_request):
-        """Test handling VFSBotError."""
-        error = VFSBotError(message="Test error", recoverable=True)
-        call_next = AsyncMock(side_effect=error)
-
-        response = await middleware.dispatch(mock_request, call_next)
-        assert isinstance(response, JSONResponse)
-        assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
-
-    @pytest.mark.asyncio
-    async def test_handle_validation_error(self, middleware, mock_request):
-        """Test handling ValidationError."""
-        error = ValidationError(message="Invalid input", field="username")
-        call_next = AsyncMock(side_effect=error)
-
-        response = await middleware.dispatch(mock_request, call_next)
-        assert isinstance(response, JSONResponse)
-        assert response.status_code == status.HTTP_400_BAD_REQUEST
+    async def test_passes_through_success(self):
+        """Successful responses are forwarded unchanged."""
+        response = PlainTextResponse("ok")
+        status_code, _, body = await _call(ErrorHandlerMiddleware(app=response))
+        assert status_code == status.HTTP_200_OK
+        assert body == b"ok"
 
     @pytest.mark.asyncio
-    async def test_handle_authentication_error(self, middleware, mock_request):
-        """Test handling AuthenticationError."""
-        error = AuthenticationError(message="Unauthorized")
-        call_next = AsyncMock(side_effect=error)
-
-        response = await middleware.dispatch(mock_request, call_next)
-        assert isinstance(response, JSONResponse)
-        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+    @pytest.mark.parametrize(
+        "error, expected_status",
+        [
+            (VFSBotError(message="Test error", recoverable=True), 500),
+            (ValidationError(message="Invalid input", field="username"), 400),
+            (AuthenticationError(message="Unauthorized"), 401),
+            (DatabaseError(message="Connection failed"), 500),
+            (RateLimitError(message="Too many requests", retry_after=60), 429),
+            (RuntimeError("Unexpected error"), 500),
+        ],
+    )
+    async def test_maps_exceptions_to_problem_json(self, error, expected_status):
+        """Exceptions raised before the response starts become RFC 7807 responses."""
+        status_code, headers, body = await _call(ErrorHandlerMiddleware(app=_raising(error)))
+
+        assert status_code == expected_status
+        assert headers[b"content-type"] == b"application/problem+json"
+        assert json.loads(body)["instance"] == "/test"
 
     @pytest.mark.asyncio
-    async def test_handle_database_error(self, middleware, mock_request):
-        """Test handling DatabaseError."""
-        error = DatabaseError(message="Connection failed")
-        call_next = AsyncMock(side_effect=error)
+    async def test_error_after_response_start_is_reraised(self):
+        """A streaming response that fails mid-body cannot be replaced."""
 
-        response = await middleware.dispatch(mock_request, call_next)
-        assert isinstance(response, JSONResponse)
-        assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
-
-    @pytest.mark.asyncio
-    async def test_handle_rate_limit_error(self, middleware, mock_request):
-        """Test handling RateLimitError."""
-        error = RateLimitError(message="Too many requests", retry_after=60)
-        call_next = AsyncMock(side_effect=error)
+        async def app(scope, receive, send):
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            raise RuntimeError("stream broke")
 
-        response = await middleware.dispatch(mock_request, call_next)
-        assert isinstance(response, JSONResponse)
-        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+        with pytest.raises(RuntimeError, match="stream broke"):
+            await _call(ErrorHandlerMiddleware(app=app))
 
     @pytest.mark.asyncio
-    async def test_handle_unexpected_error(self, middleware, mock_request):
-        """Test handling unexpected exceptions."""
-        error = RuntimeError("Unexpected error")
-        call_next = AsyncMock(side_effect=error)
-
-        response = await middleware.dispatch(mock_request, call_next)
-        assert isinstance(response, JSONResponse)
-        assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
+    async def test_non_http_scopes_pass_through(self):
+        """Lifespan and websocket scopes are not wrapped."""
+        inner = AsyncMock()
+        middleware = ErrorHandlerMiddleware(app=inner)
+        scope = {"type": "lifespan"}
+        receive, send = AsyncMock(), AsyncMock()
+
+        await middleware(scope, receive, send)
+        inner.assert_awaited_once_with(scope, receive, send)
 
     def test_handle_vfsbot_error_non_recoverable(self, middleware, mock_request):
         """Test handling non-recoverable VFSBotError."""
@@ -2,7 +2,7 @@
 
 import asyncio
 from datetime import datetime, timedelta, timezone
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -108,7 +108,7 @@ async def test_redis_backend_get_hit():
     import json
 
     mock_redis = MagicMock()
-    mock_redis.get = MagicMock(return_value=json.dumps({"result": "value"}))
+    mock_redis.get = AsyncMock(return_value=json.dumps({"result": "value"}))
     backend = RedisIdempotencyBackend(mock_redis)
 
     result = await backend.get("mykey")
@@ -118,7 +118,7 @@ async def test_redis_backend_get_hit():
 @pytest.mark.asyncio
 async def test_redis_backend_get_miss():
     mock_redis = MagicMock()
-    mock_redis.get = MagicMock(return_value=None)
+    mock_redis.get = AsyncMock(return_value=None)
     backend = RedisIdempotencyBackend(mock_redis)
 
     result = await backend.get("missing")
@@ -128,7 +128,7 @@ async def test_redis_backend_get_miss():
 @pytest.mark.asyncio
 async def test_redis_backend_get_invalid_json():
     mock_redis = MagicMock()
-    mock_redis.get = MagicMock(return_value="not-valid-json{{{")
+    mock_redis.get = AsyncMock(return_value="not-valid-json{{{")
     backend = RedisIdempotencyBackend(mock_redis)
 
     result = await backend.get("bad")
@@ -138,11 +138,11 @@ async def test_redis_backend_get_invalid_json():
 @pytest.mark.asyncio
 async def test_redis_backend_set():
     mock_redis = MagicMock()
-    mock_redis.setex = MagicMock()
+    mock_redis.setex = AsyncMock()
     backend = RedisIdempotencyBackend(mock_redis)
 
     await backend.set("k", {"val": 1}, ttl_seconds=300)
-    mock_redis.setex.assert_called_once()
+    mock_redis.setex.assert_awaited_once()
     call_args = mock_redis.setex.call_args[0]
     assert call_args[0] == "idempotency:k"
     assert call_args[1] == 300
@@ -180,7 +180,7 @@ def test_idempotency_store_auto_detect_no_redis_url(monkeypatch):
 
 def test_idempotency_store_auto_detect_redis_url_fails(monkeypatch):
     monkeypatch.setenv("REDIS_URL", "redis://localhost:6379")
-    with patch("src.core.infra.redis_manager.RedisManager.get_client", return_value=None):
+    with patch("src.core.infra.redis_manager.AsyncRedisManager.get_client", return_value=None):
         store = IdempotencyStore()
     assert isinstance(store._backend, InMemoryIdempotencyBackend)
 
@@ -188,7 +188,9 @@ def test_idempotency_store_auto_detect_redis_url_fails(monkeypatch):
 def test_idempotency_store_auto_detect_redis_success(monkeypatch):
     monkeypatch.setenv("REDIS_URL", "redis://localhost:6379")
     mock_redis = MagicMock()
-    with patch("src.core.infra.redis_manager.RedisManager.get_client", return_value=mock_redis):
+    with patch(
+        "src.core.infra.redis_manager.AsyncRedisManager.get_client", return_value=mock_redis
+    ):
         store = IdempotencyStore()
     assert isinstance(store._backend, RedisIdempotencyBackend)
 
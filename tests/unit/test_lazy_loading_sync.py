@@ -219,3 +219,45 @@ class TestLazyLoadingSync:
         assert (
             not missing
         ), f"Items without TYPE_CHECKING import in src.utils.anti_detection: {missing}"
+
+    def test_bot_all_derived_from_lazy_map(self):
+        """Verify __all__ is auto-derived from _LAZY_MODULE_MAP for src.services.bot."""
+        import src.services.bot
+
+        assert set(src.services.bot.__all__) == set(
+            src.services.bot._LAZY_MODULE_MAP.keys()
+        ), "src.services.bot.__all__ must be auto-derived from _LAZY_MODULE_MAP.keys()"
+
+    def test_core_lazy_map_keys_in_all(self):
+        """Every lazily loaded src.core name is exported and resolves."""
+        import src.core
+
+        extra_in_lazy = set(src.core._LAZY_MODULE_MAP.keys()) - set(src.core.__all__)
+        assert not extra_in_lazy, f"Items in _LAZY_MODULE_MAP but NOT in __all__: {extra_in_lazy}"
+        for name in src.core.__all__:
+            assert getattr(src.core, name) is not None, f"src.core.{name} did not resolve"
+
+    @pytest.mark.parametrize(
+        "init_file, package",
+        [
+            ("src/core/__init__.py", "src.core"),
+            ("src/services/bot/__init__.py", "src.services.bot"),
+        ],
+    )
+    def test_core_and_bot_type_checking_imports_match_lazy_map(self, init_file, package):
+        """TYPE_CHECKING imports should match _LAZY_MODULE_MAP for src.core and src.services.bot."""
+        import importlib
+
+        tree = ast.parse(Path(init_file).read_text())
+        type_checking_names = set()
+        for node in ast.walk(tree):
+            if isinstance(node, ast.If):
+                if isinstance(node.test, ast.Name) and node.test.id == "TYPE_CHECKING":
+                    for stmt in node.body:
+                        if isinstance(stmt, ast.ImportFrom):
+                            for alias in stmt.names:
+                                type_checking_names.add(alias.asname or alias.name)
+
+        module = importlib.import_module(package)
+        missing = set(module._LAZY_MODULE_MAP.keys()) - type_checking_names
+        assert not missing, f"Items without TYPE_CHECKING import in {package}: {missing}"
@@ -0,0 +1,237 @@
+"""Tests for the shared IMAP mailbox watcher against a local IMAP stand-in."""
+
+import socketserver
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from email.message import EmailMessage
+from email.utils import format_datetime
+
+import pytest
+
+from src.services.otp_manager.email_otp_handler import EmailOTPHandler, IMAPConfig
+
+
+def _otp_email(to: str, code: str, age_seconds: int = 0) -> bytes:
+    """Build a raw OTP email addressed to `to`."""
+    msg = EmailMessage()
+    msg["To"] = to
+    msg["Subject"] = "VFS Global"
+    msg["Date"] = format_datetime(datetime.now(timezone.utc) - timedelta(seconds=age_seconds))
+    msg.set_content(f"Your verification code: {code}")
+    return msg.as_bytes()
+
+
+class _FakeIMAPHandler(socketserver.StreamRequestHandler):
+    """Minimal IMAP4rev1 session: LOGIN, SELECT, UID SEARCH/FETCH, IDLE, LOGOUT."""
+
+    def send(self, line: bytes) -> None:
+        with self.write_lock:
+            self.wfile.write(line + b"\r\n")
+
+    def handle(self):
+        server = self.server
+        self.write_lock = threading.Lock()
+        self.send(b"* OK fake IMAP ready")
+
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            tag, _, rest = line.strip().partition(b" ")
+            command, _, args = rest.partition(b" ")
+            command = command.upper()
+
+            if command == b"CAPABILITY":
+                caps = b"IMAP4rev1 IDLE" if server.idle else b"IMAP4rev1"
+                self.send(b"* CAPABILITY " + caps)
+                self.send(tag + b" OK CAPABILITY completed")
+            elif command == b"LOGIN":
+                server.logins += 1
+                self.send(tag + b" OK LOGIN completed")
+            elif command == b"SELECT":
+                self.send(b"* %d EXISTS" % len(server.messages))
+                self.send(b"* OK [UIDVALIDITY %d] UIDs valid" % server.uid_validity)
+                self.send(tag + b" OK [READ-WRITE] SELECT completed")
+            elif command == b"UID":
+                self._uid(tag, args)
+            elif command == b"IDLE":
+                with server.lock:
+                    server.idlers.add(self)
+                self.send(b"+ idling")
+                self.rfile.readline()  # DONE
+                with server.lock:
+                    server.idlers.discard(self)
+                self.send(tag + b" OK IDLE terminated")
+            elif command == b"LOGOUT":
+                self.send(b"* BYE logging out")
+                self.send(tag + b" OK LOGOUT completed")
+                return
+            else:
+                self.send(tag + b" OK " + command + b" completed")
+
+    def _uid(self, tag: bytes, args: bytes) -> None:
+        server = self.server
+        sub, _, uargs = args.partition(b" ")
+        with server.lock:
+            uids = sorted(server.messages)
+            if sub.upper() == b"SEARCH":
+                if uargs.startswith(b"UID "):
+                    low = int(uargs[4:].split(b":")[0].replace(b"*", b"0") or 0)
+                    found = [uid for uid in uids if uid >= low] or uids[-1:]
+                else:
+                    found = [uid for uid in uids if uid not in server.seen]
+                self.send(b"* SEARCH " + b" ".join(b"%d" % uid for uid in found))
+            else:
+                wanted = {int(uid) for uid in uargs.split(b" ")[0].split(b",")}
+                for seq, uid in enumerate(uids, start=1):
+                    if uid in wanted:
+                        body = server.messages[uid]
+                        server.seen.add(uid)
+                        server.fetched.append(uid)
+                        with self.write_lock:
+                            self.wfile.write(
+                                b"* %d FETCH (UID %d RFC822 {%d}\r\n" % (seq, uid, len(body))
+                                + body
+                                + b")\r\n"
+                            )
+        self.send(tag + b" OK UID completed")
+
+
+class FakeIMAPServer(socketserver.ThreadingTCPServer):
+    """Local IMAP stand-in that can push EXISTS to IDLE sessions."""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, idle: bool = True):
+        super().__init__(("127.0.0.1", 0), _FakeIMAPHandler)
+        self.idle = idle
+        self.lock = threading.Lock()
+        self.messages = {}
+        self.seen = set()
+        self.fetched = []
+        self.idlers = set()
+        self.logins = 0
+        self.uid_validity = 1
+        self._next_uid = 1
+
+    def add_message(self, raw: bytes) -> None:
+        """Deliver a message and notify sessions in IDLE."""
+        with self.lock:
+            self.messages[self._next_uid] = raw
+            self._next_uid += 1
+            idlers = list(self.idlers)
+            count = len(self.messages)
+        for session in idlers:
+            session.send(b"* %d EXISTS" % count)
+
+
+@pytest.fixture
+def imap_server(request):
+    """Run a FakeIMAPServer in a background thread."""
+    server = FakeIMAPServer(idle=getattr(request, "param", True))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _handler(server: FakeIMAPServer, poll_interval: float = 30) -> EmailOTPHandler:
+    config = IMAPConfig(host="127.0.0.1", port=server.server_address[1], use_ssl=False)
+    return EmailOTPHandler(
+        email="catchall@vizecep.com",
+        app_password="secret",
+        imap_config=config,
+        poll_interval_seconds=poll_interval,
+    )
+
+
+def _deliver_later(server: FakeIMAPServer, raw: bytes, delay: float = 0.3) -> None:
+    threading.Timer(delay, server.add_message, args=(raw,)).start()
+
+
+class TestMailboxWatcherIdle:
+    """Push delivery over IMAP IDLE."""
+
+    def test_idle_push_wakes_waiter_before_poll_interval(self, imap_server):
+        """With IDLE, a waiter wakes on push rather than after the poll interval."""
+        handler = _handler(imap_server, poll_interval=30)
+        try:
+            _deliver_later(imap_server, _otp_email("bot1@vizecep.com", "123456"))
+            start = time.monotonic()
+            otp = handler.wait_for_otp("bot1@vizecep.com", timeout=10)
+            elapsed = time.monotonic() - start
+
+            assert otp == "123456"
+            assert elapsed < 5
+            assert handler._watcher.supports_idle
+        finally:
+            handler.close()
+
+    def test_concurrent_waiters_share_one_connection(self, imap_server):
+        """Many waiters are served by a single login and each gets its own code."""
+        handler = _handler(imap_server)
+        results = {}
+
+        def wait(index):
+            results[index] = handler.wait_for_otp(f"bot{index}@vizecep.com", timeout=10)
+
+        threads = [threading.Thread(target=wait, args=(i,)) for i in range(10)]
+        try:
+            for thread in threads:
+                thread.start()
+            time.sleep(0.5)
+            for i in range(10):
+                imap_server.add_message(_otp_email(f"bot{i}@vizecep.com", f"{i:06d}"))
+            for thread in threads:
+                thread.join(timeout=15)
+
+            assert results == {i: f"{i:06d}" for i in range(10)}
+            assert imap_server.logins == 1
+        finally:
+            handler.close()
+
+    def test_recent_unseen_message_is_delivered_on_first_sync(self, imap_server):
+        """A code that arrived before the watcher started is still found."""
+        imap_server.add_message(_otp_email("early@vizecep.com", "654321"))
+        handler = _handler(imap_server)
+        try:
+            assert handler.wait_for_otp("early@vizecep.com", timeout=5) == "654321"
+        finally:
+            handler.close()
+
+    def test_stale_and_seen_messages_are_ignored(self, imap_server):
+        """Messages older than max age or already seen are not delivered."""
+        imap_server.add_message(_otp_email("bot1@vizecep.com", "111111", age_seconds=3600))
+        imap_server.add_message(_otp_email("bot2@vizecep.com", "222222"))
+        imap_server.seen.add(2)
+        handler = _handler(imap_server)
+        try:
+            assert handler.wait_for_otp("bot1@vizecep.com", timeout=1) is None
+            assert handler.wait_for_otp("bot2@vizecep.com", timeout=1) is None
+            assert 2 not in imap_server.fetched
+        finally:
+            handler.close()
+
+
+class TestMailboxWatcherPolling:
+    """UID-incremental polling when the server lacks IDLE."""
+
+    @pytest.mark.parametrize("imap_server", [False], indirect=True)
+    def test_polling_fallback_fetches_each_message_once(self, imap_server):
+        """Without IDLE the watcher polls by UID and never refetches a message."""
+        handler = _handler(imap_server, poll_interval=0.2)
+        try:
+            _deliver_later(imap_server, _otp_email("bot1@vizecep.com", "123456"))
+            assert handler.wait_for_otp("bot1@vizecep.com", timeout=5) == "123456"
+
+            _deliver_later(imap_server, _otp_email("bot2@vizecep.com", "654321"))
+            assert handler.wait_for_otp("bot2@vizecep.com", timeout=5) == "654321"
+
+            assert not handler._watcher.supports_idle
+            assert imap_server.fetched == [1, 2]
+            assert imap_server.logins == 1
+        finally:
+            handler.close()
@@ -0,0 +1,178 @@
+"""Tests for the incrementally maintained MissionIndex."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.constants import NotifyChannels
+from src.repositories.appointment_request_repository import AppointmentRequest
+from src.services.session.mission_index import MissionIndex
+
+
+def _request(request_id: int, country_code: str = "FRA", status: str = "pending"):
+    """Build an AppointmentRequest entity."""
+    return AppointmentRequest(
+        id=request_id,
+        country_code=country_code,
+        visa_category="Schengen",
+        visa_subcategory="Tourism",
+        centres=["Istanbul"],
+        preferred_dates=[],
+        person_count=1,
+        status=status,
+        created_at=f"2025-01-01T00:00:{request_id:02d}",
+    )
+
+
+@pytest.fixture
+def db():
+    """Database mock that accepts LISTEN subscriptions."""
+    database = MagicMock()
+    database.listen = AsyncMock()
+    database.unlisten = AsyncMock()
+    database.ensure_listening = AsyncMock(return_value=True)
+    database.notifications_active = True
+    return database
+
+
+@pytest.fixture
+def repo():
+    """Appointment request repository mock."""
+    repository = MagicMock()
+    repository.get_all = AsyncMock(return_value=[_request(1), _request(2, "nld")])
+    repository.get_by_ids = AsyncMock(return_value=[])
+    return repository
+
+
+@pytest.mark.asyncio
+async def test_initial_load_groups_by_country(db, repo):
+    """First snapshot loads everything once and groups by lowercase country code."""
+    index = MissionIndex(db, repo)
+
+    missions = await index.get_missions()
+
+    db.listen.assert_awaited_once_with(NotifyChannels.APPOINTMENT_REQUESTS, index._on_notification)
+    repo.get_all.assert_awaited_once_with(status="pending")
+    assert {code: [r.id for r in reqs] for code, reqs in missions.items()} == {
+        "fra": [1],
+        "nld": [2],
+    }
+
+
+@pytest.mark.asyncio
+async def test_unchanged_snapshot_does_not_query(db, repo):
+    """Without notifications, later snapshots are served from memory."""
+    index = MissionIndex(db, repo)
+    await index.get_missions()
+
+    await index.get_missions()
+    await index.get_missions()
+
+    assert repo.get_all.await_count == 1
+    repo.get_by_ids.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_notifications_apply_incrementally(db, repo):
+    """Notified IDs are re-read; non-pending or deleted requests are removed."""
+    index = MissionIndex(db, repo)
+    await index.get_missions()
+
+    repo.get_by_ids.return_value = [_request(3, "fra"), _request(2, "nld", status="completed")]
+    index._on_notification("3")
+    index._on_notification("2")
+    index._on_notification("1")  # deleted: not returned by get_by_ids
+
+    missions = await index.get_missions()
+
+    repo.get_by_ids.assert_awaited_once_with([1, 2, 3])
+    assert repo.get_all.await_count == 1
+    assert {code: [r.id for r in reqs] for code, reqs in missions.items()} == {"fra": [3]}
+
+
+@pytest.mark.asyncio
+async def test_snapshot_is_newest_first(db, repo):
+    """Requests within a mission keep get_all() ordering (newest first)."""
+    repo.get_all.return_value = [_request(1), _request(5), _request(3)]
+    index = MissionIndex(db, repo)
+
+    missions = await index.get_missions()
+
+    assert [r.id for r in missions["fra"]] == [5, 3, 1]
+
+
+@pytest.mark.asyncio
+async def test_periodic_reconcile(db, repo):
+    """A full reload runs once the reconcile interval elapses."""
+    index = MissionIndex(db, repo, reconcile_interval=0)
+
+    await index.get_missions()
+    await index.get_missions()
+
+    assert repo.get_all.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_falls_back_to_full_reload_without_listener(db, repo):
+    """If LISTEN fails, every snapshot does a full reload."""
+    db.listen = AsyncMock(side_effect=OSError("connection refused"))
+    index = MissionIndex(db, repo)
+
+    await index.get_missions()
+    await index.get_missions()
+
+    assert repo.get_all.await_count == 2
+    assert index.is_listening is False
+
+
+@pytest.mark.asyncio
+async def test_listener_disconnect_forces_reload(db, repo):
+    """Notifications missed while disconnected are recovered by a full reload."""
+    index = MissionIndex(db, repo)
+    await index.get_missions()
+
+    db.notifications_active = False
+    await index.get_missions()
+
+    db.ensure_listening.assert_awaited_once()
+    assert repo.get_all.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_bad_payload_forces_reload(db, repo):
+    """Unparseable payloads trigger a full reload instead of being dropped."""
+    index = MissionIndex(db, repo)
+    await index.get_missions()
+
+    index._on_notification("not-an-id")
+    await index.get_missions()
+
+    assert repo.get_all.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_incremental_refresh_recovers(db, repo):
+    """A failed incremental refresh schedules a full reload."""
+    index = MissionIndex(db, repo)
+    await index.get_missions()
+
+    repo.get_by_ids.side_effect = RuntimeError("db down")
+    index._on_notification("7")
+    with pytest.raises(RuntimeError):
+        await index.get_missions()
+
+    await index.get_missions()
+    assert repo.get_all.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_stop_unsubscribes(db, repo):
+    """stop() removes the notification subscription."""
+    index = MissionIndex(db, repo)
+    await index.get_missions()
+
+    await index.stop()
+
+    db.unlisten.assert_awaited_once_with(
+        NotifyChannels.APPOINTMENT_REQUESTS, index._on_notification
+    )
@@ -1,5 +1,6 @@
 """Tests for OTP Manager."""
 
+import asyncio
 import threading
 import time
 from datetime import datetime, timedelta, timezone
@@ -391,6 +392,64 @@ class TestOTPManagerIntegration:
             mock_listener.stop.assert_called_once()
 
 
+class TestOTPManagerAsyncWait:
+    """Tests for the asyncio-native OTP wait API."""
+
+    @pytest.fixture
+    def manager(self):
+        with patch("src.services.otp_manager.manager.IMAPListener"):
+            yield OTPManager(email="test@example.com", app_password="password")
+
+    @pytest.mark.asyncio
+    async def test_resolved_from_producer_thread(self, manager):
+        """An OTP delivered from another thread wakes the awaiting coroutine."""
+        session_id = manager.register_session(target_email="bot@example.com")
+        threading.Timer(0.05, manager.manual_otp_input, args=(session_id, "123456")).start()
+
+        otp = await manager.wait_for_otp_async(session_id, timeout=5)
+
+        assert otp == "123456"
+        session = manager._session_registry.get_session(session_id)
+        assert session.state == SessionState.OTP_RECEIVED
+        assert session.otp_waiters == []
+
+    @pytest.mark.asyncio
+    async def test_timeout_marks_expired(self, manager):
+        """Timeout returns None, expires the session and drops the waiter."""
+        session_id = manager.register_session(target_email="bot@example.com")
+
+        assert await manager.wait_for_otp_async(session_id, timeout=0.05) is None
+
+        session = manager._session_registry.get_session(session_id)
+        assert session.state == SessionState.EXPIRED
+        assert session.otp_waiters == []
+        # A late OTP after timeout must not raise
+        assert manager.manual_otp_input(session_id, "123456") is True
+
+    @pytest.mark.asyncio
+    async def test_already_received(self, manager):
+        """An OTP received before waiting is returned immediately."""
+        session_id = manager.register_session(phone_number="+905551234567")
+        manager.process_sms_webhook("+905551234567", "Your code is 654321")
+
+        assert await manager.wait_for_otp_async(session_id, timeout=0.01) == "654321"
+
+    @pytest.mark.asyncio
+    async def test_unregister_releases_waiter(self, manager):
+        """Unregistering a session wakes its waiter instead of waiting for timeout."""
+        session_id = manager.register_session(target_email="bot@example.com")
+        asyncio.get_running_loop().call_later(0.05, manager.unregister_session, session_id)
+
+        start = time.monotonic()
+        assert await manager.wait_for_otp_async(session_id, timeout=5) is None
+        assert time.monotonic() - start < 1
+
+    @pytest.mark.asyncio
+    async def test_unknown_session(self, manager):
+        """Unknown sessions return None without waiting."""
+        assert await manager.wait_for_otp_async("missing", timeout=5) is None
+
+
 class TestConcurrentSessions:
     """Tests for concurrent session handling."""
 
@@ -484,6 +543,8 @@ class TestIMAPListener:
         mock_mail.login.return_value = ("OK", [b"Logged in"])
         mock_mail.select.return_value = ("OK", [b"1"])
         mock_mail.search.return_value = ("OK", [b""])
+        mock_mail.response.return_value = ("UIDVALIDITY", [b"1"])
+        mock_mail.uid.return_value = ("OK", [b""])
 
         registry = SessionRegistry()
         processor = EmailProcessor(OTPPatternMatcher())
@@ -506,6 +567,125 @@ class TestIMAPListener:
         assert listener._running is False
 
 
+def _raw_email(to: str, body: str) -> bytes:
+    """Build a raw RFC822 message."""
+    return (
+        f"To: {to}\r\nSubject: Verification\r\n"
+        f"Date: Wed, 29 Jan 2026 10:00:00 +0000\r\n\r\n{body}\r\n"
+    ).encode()
+
+
+class FakeUIDMailbox:
+    """Scripted stand-in for imaplib UID SEARCH / UID FETCH responses."""
+
+    def __init__(self, messages, uid_validity=1, unseen=()):
+        self.messages = dict(messages)
+        self.uid_validity = uid_validity
+        self.unseen = set(unseen)
+        self.fetches = []
+
+    def response(self, code):
+        return code, [str(self.uid_validity).encode()]
+
+    def uid(self, command, *args):
+        uids = sorted(self.messages)
+        if command == "SEARCH":
+            criteria = args[0]
+            if criteria == "UID *":
+                found = uids[-1:]
+            elif criteria.startswith("UID "):
+                low = int(criteria[4:].split(":")[0])
+                found = [uid for uid in uids if uid >= low] or uids[-1:]
+            else:
+                found = [uid for uid in uids if uid in self.unseen]
+            return "OK", [" ".join(str(uid) for uid in found).encode()]
+
+        uid_set, items = args
+        wanted = [int(uid) for uid in uid_set.split(",")]
+        self.fetches.append((wanted, items))
+        data = []
+        for uid in wanted:
+            raw = self.messages[uid]
+            if "HEADER.FIELDS" in items:
+                raw = raw.split(b"\r\n\r\n")[0] + b"\r\n\r\n"
+            data.append((f"{uid} (UID {uid} BODY[] {{{len(raw)}}}".encode(), raw))
+            data.append(b")")
+        return "OK", data
+
+
+class TestIMAPListenerPipeline:
+    """UID-incremental, header-first fetch pipeline."""
+
+    def _listener(self, registry):
+        return IMAPListener(
+            email="catchall@example.com",
+            app_password="password",
+            imap_config=IMAPConfig(),
+            email_processor=EmailProcessor(OTPPatternMatcher()),
+            session_registry=registry,
+        )
+
+    def test_bodies_fetched_only_for_registered_recipients(self):
+        """Headers are fetched in one batch; only matched messages are downloaded."""
+        registry = SessionRegistry()
+        session_id = registry.register(target_email="bot2@example.com")
+        listener = self._listener(registry)
+        mailbox = FakeUIDMailbox({1: _raw_email("old@example.com", "code 000000")})
+        listener._sync_uid_state(mailbox)
+
+        mailbox.messages.update(
+            {uid: _raw_email(f"bot{uid}@example.com", f"code {uid}23456") for uid in (2, 3, 4)}
+        )
+        listener._poll_emails(mailbox)
+
+        assert mailbox.fetches[0][0] == [2, 3, 4]
+        assert "BODY.PEEK[HEADER.FIELDS" in mailbox.fetches[0][1]
+        assert mailbox.fetches[1] == ([2], "(RFC822)")
+        assert registry.get_session(session_id).otp_code == "223456"
+        assert listener.get_health()["last_uid"] == 4
+
+    def test_poll_without_new_uids_fetches_nothing(self):
+        """Polls only search above the last seen UID and skip FETCH when idle."""
+        registry = SessionRegistry()
+        listener = self._listener(registry)
+        mailbox = FakeUIDMailbox({7: _raw_email("a@example.com", "hi")})
+        listener._sync_uid_state(mailbox)
+
+        listener._poll_emails(mailbox)
+        listener._poll_emails(mailbox)
+
+        assert mailbox.fetches == []
+        assert listener.get_health()["last_uid"] == 7
+
+    def test_seed_processes_recent_unseen_once(self):
+        """On first sync, recent unseen messages are matched; reconnects resume by UID."""
+        registry = SessionRegistry()
+        session_id = registry.register(target_email="bot1@example.com")
+        listener = self._listener(registry)
+        mailbox = FakeUIDMailbox({1: _raw_email("bot1@example.com", "code 123456")}, unseen={1})
+
+        listener._sync_uid_state(mailbox)
+        listener._sync_uid_state(mailbox)  # reconnect, same UIDVALIDITY
+
+        assert registry.get_session(session_id).otp_code == "123456"
+        assert [uids for uids, _ in mailbox.fetches] == [[1], [1]]
+
+    def test_uidvalidity_change_resets_tracking(self):
+        """A new UIDVALIDITY discards the old UID high-water mark."""
+        registry = SessionRegistry()
+        listener = self._listener(registry)
+        mailbox = FakeUIDMailbox({50: _raw_email("a@example.com", "hi")})
+        listener._sync_uid_state(mailbox)
+
+        mailbox.messages = {1: _raw_email("a@example.com", "hi")}
+        mailbox.uid_validity = 2
+        listener._sync_uid_state(mailbox)
+
+        health = listener.get_health()
+        assert health["uid_validity"] == 2
+        assert health["last_uid"] == 1
+
+
 @pytest.mark.unit
 class TestOTPManagerUnit:
     """Unit tests for OTPManager components."""
@@ -352,6 +352,38 @@ class TestFastAPILifespan:
                     async with lifespan(mock_app):
                         pass
 
+    @pytest.mark.asyncio
+    async def test_lifespan_runs_token_blacklist_cleanup_task(self):
+        """Test that the blacklist cleanup/resync task runs until shutdown."""
+        from src.core.auth.token_blacklist import PersistentTokenBlacklist
+        from web.app import lifespan
+
+        blacklist = PersistentTokenBlacklist(db=Mock())
+        blacklist.load_from_database = AsyncMock(return_value=0)
+        blacklist.close = AsyncMock()
+        started = asyncio.Event()
+
+        async def cleanup_loop(interval: int = 300) -> None:
+            started.set()
+            await asyncio.sleep(3600)
+
+        blacklist.start_cleanup_task = cleanup_loop
+
+        with patch("web.app.DatabaseFactory.ensure_connected", new_callable=AsyncMock):
+            with patch("web.app.DatabaseFactory.close_instance", new_callable=AsyncMock):
+                with patch("web.app.init_token_blacklist"):
+                    with patch("web.app.get_token_blacklist", return_value=blacklist):
+                        async with lifespan(Mock()):
+                            await asyncio.wait_for(started.wait(), timeout=1)
+                            task = next(
+                                t
+                                for t in asyncio.all_tasks()
+                                if t.get_name() == "token_blacklist_cleanup"
+                            )
+
+        assert task.cancelled()
+        blacklist.close.assert_awaited_once()
+
 
 class TestEmergencyCleanup:
     """Test emergency cleanup on second signal."""
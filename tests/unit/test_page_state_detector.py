@@ -7,11 +7,14 @@ import pytest
 
 from src.services.bot.page_state_detector import (
     _ACTIONABLE_STATES,
+    _DETECTION_RULES,
     _PRIORITY_STATES,
+    _PROBE_PLAN,
     _RECOVERY_STATES,
     PageState,
     PageStateDetector,
     PageStateResult,
+    _compile_probe_rule,
 )
 
 
@@ -1065,3 +1068,96 @@ async def test_confidence_capped_at_one(detector, mock_page):
 
     # Confidence should never exceed 1.0
     assert result.confidence <= 1.0
+
+
+# ──────────────────────────────────────────────────────────────
+# Batched DOM probe
+# ──────────────────────────────────────────────────────────────
+
+
+def test_compile_probe_rule_modes():
+    """CSS rules compile to probe entries; Playwright-only rules do not."""
+    assert _compile_probe_rule('input[name="otp"]', True) == ('input[name="otp"]', "first_visible")
+    assert _compile_probe_rule("select#centres", False) == ("select#centres", "exists")
+    assert _compile_probe_rule(".a:visible, .b:visible", True) == (".a, .b", "any_visible")
+    assert _compile_probe_rule("text=/welcome/i", True) is None
+    assert _compile_probe_rule('button:has-text("Confirm")', True) is None
+    assert _compile_probe_rule(".a:visible, .b", True) is None
+
+
+def test_probe_plan_covers_css_rules():
+    """Every rule is either probed or explicitly left to the per-rule path."""
+    assert len(_PROBE_PLAN) == len(_DETECTION_RULES)
+    probed = [entry for entry in _PROBE_PLAN if entry is not None]
+    assert probed, "expected CSS-expressible rules to be batched"
+    for entry, (selector, *_rest) in zip(_PROBE_PLAN, _DETECTION_RULES):
+        if entry is None:
+            assert "text=" in selector or ":has-text(" in selector
+
+
+@pytest.mark.asyncio
+async def test_batched_detect_uses_single_evaluate(detector, mock_page):
+    """CSS rules are answered by one page.evaluate(); locators only for the rest."""
+    probe_entries = [entry for entry in _PROBE_PLAN if entry is not None]
+    hits = [entry[0].startswith("select#centres") for entry in probe_entries]
+    mock_page.evaluate = AsyncMock(return_value=hits)
+
+    def mock_locator_func(selector):
+        mock_loc = AsyncMock()
+        mock_loc.count = AsyncMock(return_value=0)
+        mock_loc.first = AsyncMock()
+        mock_loc.first.is_visible = AsyncMock(return_value=False)
+        return mock_loc
+
+    mock_page.locator = MagicMock(side_effect=mock_locator_func)
+
+    result = await detector.detect(mock_page)
+
+    assert result.state == PageState.APPOINTMENT_PAGE
+    mock_page.evaluate.assert_awaited_once()
+    located = {call.args[0] for call in mock_page.locator.call_args_list}
+    expected_fallback = {
+        rule[0] for rule, entry in zip(_DETECTION_RULES, _PROBE_PLAN) if entry is None
+    }
+    assert located == expected_fallback
+
+
+@pytest.mark.asyncio
+async def test_batched_detect_falls_back_when_probe_fails(detector, mock_page):
+    """A failed probe re-checks CSS rules through locators."""
+    mock_page.evaluate = AsyncMock(side_effect=Exception("Execution context was destroyed"))
+
+    def mock_locator_func(selector):
+        mock_loc = AsyncMock()
+        mock_loc.count = AsyncMock(return_value=1 if "select#centres" in selector else 0)
+        mock_loc.first = AsyncMock()
+        mock_loc.first.is_visible = AsyncMock(return_value=False)
+        return mock_loc
+
+    mock_page.locator = MagicMock(side_effect=mock_locator_func)
+
+    result = await detector.detect(mock_page)
+
+    assert result.state == PageState.APPOINTMENT_PAGE
+    assert mock_page.locator.call_count == len(_DETECTION_RULES)
+
+
+@pytest.mark.asyncio
+async def test_per_rule_mode_skips_evaluate(detector_config, mock_page):
+    """batch_dom_probe=False keeps the original one-locator-per-rule behaviour."""
+    detector = PageStateDetector(detector_config, batch_dom_probe=False)
+    mock_page.evaluate = AsyncMock()
+
+    def mock_locator_func(selector):
+        mock_loc = AsyncMock()
+        mock_loc.count = AsyncMock(return_value=0)
+        mock_loc.first = AsyncMock()
+        mock_loc.first.is_visible = AsyncMock(return_value=False)
+        return mock_loc
+
+    mock_page.locator = MagicMock(side_effect=mock_locator_func)
+
+    await detector.detect(mock_page)
+
+    mock_page.evaluate.assert_not_awaited()
+    assert mock_page.locator.call_count == len(_DETECTION_RULES)
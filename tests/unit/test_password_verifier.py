@@ -0,0 +1,117 @@
+"""Tests for the bounded bcrypt verification pool."""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi import HTTPException, Response
+from passlib.context import CryptContext
+
+from src.constants import Security
+from src.core.auth import PasswordVerifier, hash_password, verify_and_update_password
+from src.core.exceptions import PasswordVerifierBusyError
+
+
+@pytest.fixture
+def verifier():
+    """Verifier with a small pool, shut down after the test."""
+    pool = PasswordVerifier(max_workers=2, max_queue=1)
+    yield pool
+    pool.shutdown()
+
+
+def test_verify_and_update_flags_low_cost_hash():
+    weak_hash = CryptContext(schemes=["bcrypt"]).hash("Secret-Pass-123", rounds=4)
+
+    verified, new_hash = verify_and_update_password("Secret-Pass-123", weak_hash)
+
+    assert verified is True
+    assert new_hash is not None
+    assert new_hash.startswith(f"$2b${Security.PASSWORD_HASH_ROUNDS:02d}$")
+
+
+def test_verify_and_update_keeps_current_hash():
+    verified, new_hash = verify_and_update_password(
+        "Secret-Pass-123", hash_password("Secret-Pass-123")
+    )
+    assert verified is True
+    assert new_hash is None
+
+
+@pytest.mark.asyncio
+async def test_verifier_verify_and_update(verifier):
+    weak_hash = CryptContext(schemes=["bcrypt"]).hash("Secret-Pass-123", rounds=4)
+
+    verified, new_hash = await verifier.verify_and_update("Secret-Pass-123", weak_hash)
+
+    assert verified is True
+    assert new_hash is not None and new_hash != weak_hash
+
+
+@pytest.mark.asyncio
+async def test_verify_runs_off_event_loop(verifier):
+    hashed = hash_password("Secret-Pass-123")
+    ticks = 0
+
+    async def heartbeat():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.005)
+
+    beat = asyncio.create_task(heartbeat())
+    results = await asyncio.gather(
+        verifier.verify("Secret-Pass-123", hashed), verifier.verify("wrong", hashed)
+    )
+    beat.cancel()
+
+    assert results == [True, False]
+    # The loop kept ticking while bcrypt ran in the pool
+    assert ticks > 5
+    assert verifier.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_saturated_pool_fails_fast():
+    pool = PasswordVerifier(max_workers=1, max_queue=1)
+
+    def slow_verify(plain, hashed):
+        time.sleep(0.2)
+        return True
+
+    with patch("src.core.auth.password_verifier.verify_password", slow_verify):
+        first = asyncio.create_task(pool.verify("a", "h"))
+        second = asyncio.create_task(pool.verify("b", "h"))
+        await asyncio.sleep(0)
+
+        with pytest.raises(PasswordVerifierBusyError) as exc_info:
+            await pool.verify("c", "h")
+
+        assert await first and await second
+    pool.shutdown()
+
+    assert exc_info.value._get_http_status() == 503
+    assert pool.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_login_returns_503_when_pool_saturated(monkeypatch):
+    from web.models.auth import LoginRequest
+    from web.routes.auth import login
+
+    monkeypatch.setenv("ADMIN_USERNAME", "admin")
+    monkeypatch.setenv("ADMIN_PASSWORD", hash_password("Secret-Pass-123"))
+    busy = MagicMock()
+    busy.verify = AsyncMock(side_effect=PasswordVerifierBusyError(retry_after=2))
+
+    with patch("src.core.auth.get_password_verifier", return_value=busy):
+        with pytest.raises(HTTPException) as exc_info:
+            await login(
+                MagicMock(),
+                Response(),
+                LoginRequest(username="admin", password="Secret-Pass-123"),
+            )
+
+    assert exc_info.value.status_code == 503
+    assert exc_info.value.headers == {"Retry-After": "2"}
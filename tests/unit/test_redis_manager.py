@@ -1,18 +1,22 @@
 """Unit tests for src/core/infra/redis_manager.py."""
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from src.core.infra.redis_manager import RedisManager
+from src.core.infra.redis_manager import AsyncRedisManager, RedisManager
 
 
 @pytest.fixture(autouse=True)
 def reset_redis_manager():
-    """Reset RedisManager singleton state before and after each test."""
+    """Reset RedisManager and AsyncRedisManager singleton state before and after each test."""
     RedisManager.reset()
+    AsyncRedisManager._instance = None
+    AsyncRedisManager._initialized = False
     yield
     RedisManager.reset()
+    AsyncRedisManager._instance = None
+    AsyncRedisManager._initialized = False
 
 
 # ── Singleton behavior ────────────────────────────────────────────────────────
@@ -196,3 +200,64 @@ def test_reset_handles_close_error_gracefully(monkeypatch):
     # Should not raise
     RedisManager.reset()
     assert RedisManager._initialized is False
+
+
+# ── AsyncRedisManager ─────────────────────────────────────────────────────────
+
+
+def test_async_get_client_returns_none_when_no_redis_url(monkeypatch):
+    monkeypatch.delenv("REDIS_URL", raising=False)
+    assert AsyncRedisManager.get_client() is None
+
+
+def test_async_get_client_returns_none_when_sync_ping_fails(monkeypatch):
+    monkeypatch.setenv("REDIS_URL", "redis://localhost:6379")
+    with (
+        patch.object(RedisManager, "get_client", return_value=None),
+        patch("redis.asyncio.from_url") as mock_from_url,
+    ):
+        assert AsyncRedisManager.get_client() is None
+    mock_from_url.assert_not_called()
+
+
+def test_async_get_client_creates_pooled_singleton(monkeypatch):
+    monkeypatch.setenv("REDIS_URL", "redis://localhost:6379")
+    async_client = MagicMock()
+    with (
+        patch.object(RedisManager, "get_client", return_value=MagicMock()),
+        patch("redis.asyncio.from_url", return_value=async_client) as mock_from_url,
+    ):
+        c1 = AsyncRedisManager.get_client()
+        c2 = AsyncRedisManager.get_client()
+
+    assert c1 is c2 is async_client
+    assert mock_from_url.call_count == 1
+    call_kwargs = mock_from_url.call_args[1]
+    assert call_kwargs["max_connections"] == AsyncRedisManager.MAX_CONNECTIONS
+    assert call_kwargs["decode_responses"] is True
+
+
+@pytest.mark.asyncio
+async def test_async_health_check(monkeypatch):
+    async_client = MagicMock()
+    async_client.ping = AsyncMock(return_value=True)
+    with patch.object(AsyncRedisManager, "get_client", return_value=async_client):
+        assert await AsyncRedisManager.health_check() is True
+
+    async_client.ping = AsyncMock(side_effect=Exception("connection reset"))
+    with patch.object(AsyncRedisManager, "get_client", return_value=async_client):
+        assert await AsyncRedisManager.health_check() is False
+
+
+@pytest.mark.asyncio
+async def test_async_close_closes_pool_and_resets(monkeypatch):
+    async_client = MagicMock()
+    async_client.aclose = AsyncMock()
+    AsyncRedisManager._instance = async_client
+    AsyncRedisManager._initialized = True
+
+    await AsyncRedisManager.close()
+
+    async_client.aclose.assert_awaited_once()
+    assert AsyncRedisManager._instance is None
+    assert AsyncRedisManager._initialized is False
@@ -1,5 +1,6 @@
 """Tests for adaptive selector learning system."""
 
+import asyncio
 import json
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -261,3 +262,120 @@ def test_multiple_fallback_tracking(learner):
     assert metrics["fallback_stats"]["fallback_0"]["success_count"] == 1
     assert metrics["fallback_stats"]["fallback_1"]["success_count"] == 1
     assert metrics["fallback_stats"]["fallback_2"]["fail_count"] == 1
+
+
+def test_write_behind_defers_disk_write(temp_metrics_file):
+    """In write-behind mode record_* only updates memory until flushed."""
+    learner = SelectorLearner(str(temp_metrics_file), write_behind=True)
+
+    learner.record_success("login.email_input", 0)
+
+    assert not temp_metrics_file.exists()
+    assert learner.is_dirty
+
+    learner.flush()
+
+    assert not learner.is_dirty
+    saved = json.loads(temp_metrics_file.read_text())
+    assert saved["login.email_input"]["primary_success_count"] == 1
+
+
+def test_save_is_atomic_and_leaves_no_temp_files(temp_metrics_file):
+    """Saves go through a temp file that is renamed into place."""
+    learner = SelectorLearner(str(temp_metrics_file))
+
+    learner.record_success("login.email_input", 0)
+
+    assert temp_metrics_file.exists()
+    assert list(temp_metrics_file.parent.glob("*.tmp")) == []
+
+
+@pytest.mark.asyncio
+async def test_write_behind_flushes_after_threshold(temp_metrics_file):
+    """The background flusher writes once the change threshold is reached."""
+    learner = SelectorLearner(
+        str(temp_metrics_file), write_behind=True, flush_interval=60, flush_threshold=3
+    )
+
+    for _ in range(3):
+        learner.record_failure("login.email_input", 1)
+
+    for _ in range(50):
+        if temp_metrics_file.exists():
+            break
+        await asyncio.sleep(0.01)
+
+    saved = json.loads(temp_metrics_file.read_text())
+    assert saved["login.email_input"]["fallback_stats"]["fallback_0"]["fail_count"] == 3
+    await learner.close()
+
+
+@pytest.mark.asyncio
+async def test_write_behind_flushes_on_interval(temp_metrics_file):
+    """Dirty metrics below the threshold are written after the flush interval."""
+    learner = SelectorLearner(
+        str(temp_metrics_file), write_behind=True, flush_interval=0.05, flush_threshold=1000
+    )
+
+    learner.record_success("login.email_input", 0)
+    await asyncio.sleep(0.2)
+
+    assert temp_metrics_file.exists()
+    assert not learner.is_dirty
+    await learner.close()
+
+
+@pytest.mark.asyncio
+async def test_close_flushes_once(temp_metrics_file):
+    """close() stops the flusher and persists remaining changes."""
+    learner = SelectorLearner(
+        str(temp_metrics_file), write_behind=True, flush_interval=60, flush_threshold=1000
+    )
+    learner.record_success("login.email_input", 0)
+    learner.record_success("login.email_input", 0)
+
+    with patch.object(learner, "_write_atomic", wraps=learner._write_atomic) as write:
+        await learner.close()
+
+    assert write.call_count == 1
+    assert learner._flush_task is None
+    saved = json.loads(temp_metrics_file.read_text())
+    assert saved["login.email_input"]["primary_success_count"] == 2
+
+
+@pytest.mark.asyncio
+async def test_flush_async_matches_sync_format(temp_metrics_file):
+    """Background flushes write the same indented JSON as synchronous saves."""
+    learner = SelectorLearner(str(temp_metrics_file), write_behind=True, flush_interval=60)
+    learner.record_success("login.email_input", 0)
+
+    await learner.close()
+
+    assert temp_metrics_file.read_text() == json.dumps(learner.metrics, indent=2)
+
+
+def test_flusher_restarts_on_new_event_loop(temp_metrics_file):
+    """A flusher left on a closed loop is replaced on the next running loop."""
+    learner = SelectorLearner(
+        str(temp_metrics_file), write_behind=True, flush_interval=60, flush_threshold=2
+    )
+
+    async def record() -> None:
+        learner.record_failure("login.email_input", 1)
+
+    first_loop = asyncio.new_event_loop()
+    first_loop.run_until_complete(record())
+    first_loop.close()
+
+    async def record_and_wait() -> None:
+        await record()
+        for _ in range(50):
+            if temp_metrics_file.exists():
+                break
+            await asyncio.sleep(0.01)
+        await learner.close()
+
+    asyncio.run(record_and_wait())
+
+    saved = json.loads(temp_metrics_file.read_text())
+    assert saved["login.email_input"]["fallback_stats"]["fallback_0"]["fail_count"] == 2
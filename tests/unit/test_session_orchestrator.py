@@ -221,3 +221,134 @@ async def test_process_mission_browser_cleanup_on_error():
 
     # Account must still be released despite the error
     account_pool.release_account.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_process_mission_leases_context_from_browser_pool():
+    """With a browser pool, missions lease a context instead of launching a browser."""
+    from unittest.mock import patch
+
+    db = MagicMock()
+    account_pool = MagicMock()
+    booking_workflow = MagicMock()
+    browser_manager = MockBrowserManager(config={"bot": {"headless": True}})
+
+    lease = MagicMock()
+    lease.close = AsyncMock()
+    lease_page = AsyncMock()
+    lease.new_page = AsyncMock(return_value=lease_page)
+    browser_pool = MagicMock()
+    browser_pool.lease = AsyncMock(return_value=lease)
+    browser_pool.close_all = AsyncMock()
+
+    with (
+        patch("src.services.session.session_orchestrator.AppointmentRequestRepository"),
+        patch("src.services.session.session_orchestrator.AccountPoolRepository"),
+    ):
+        orchestrator = SessionOrchestrator(
+            db=db,
+            account_pool=account_pool,
+            booking_workflow=booking_workflow,
+            browser_manager=browser_manager,
+            mission_index=MagicMock(stop=AsyncMock()),
+            browser_pool=browser_pool,
+        )
+
+        mock_account = MagicMock()
+        mock_account.id = 1
+        mock_account.email = "test@example.com"
+        account_pool.acquire_account = AsyncMock(return_value=mock_account)
+        account_pool.release_account = AsyncMock()
+        booking_workflow.process_mission = AsyncMock(side_effect=Exception("Test error"))
+        orchestrator.account_pool_repo.log_usage = AsyncMock()
+
+        with patch.object(orchestrator, "_create_mission_browser") as create_browser:
+            result = await orchestrator._process_mission("fra", [MagicMock(id=1)])
+        await orchestrator.close()
+
+    assert result["status"] == "error"
+    create_browser.assert_not_called()
+    assert booking_workflow.process_mission.call_args[1]["page"] is lease_page
+
+    # Page closed and lease returned to the pool even though the mission failed
+    lease_page.close.assert_called_once()
+    lease.close.assert_called_once()
+    browser_pool.close_all.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_run_session_claims_accounts_in_one_batch():
+    """Missions that start right away share one batch acquire; the rest acquire their own."""
+    from unittest.mock import patch
+
+    account_pool = MagicMock()
+    claimed = [MagicMock(id=1), MagicMock(id=2)]
+    account_pool.acquire_accounts = AsyncMock(return_value=claimed)
+
+    with (
+        patch("src.services.session.session_orchestrator.AppointmentRequestRepository"),
+        patch("src.services.session.session_orchestrator.AccountPoolRepository"),
+    ):
+        orchestrator = SessionOrchestrator(
+            db=MagicMock(),
+            account_pool=account_pool,
+            booking_workflow=MagicMock(),
+            browser_manager=MockBrowserManager(),
+            max_concurrent_missions=2,
+        )
+
+    missions = {"fra": [MagicMock()], "nld": [MagicMock()], "ita": [MagicMock()]}
+    with (
+        patch.object(orchestrator, "get_active_missions", AsyncMock(return_value=missions)),
+        patch.object(
+            orchestrator, "_process_mission", AsyncMock(return_value={"status": "completed"})
+        ) as process_mission,
+    ):
+        summary = await orchestrator.run_session()
+    await orchestrator.usage_log.stop()
+
+    account_pool.acquire_accounts.assert_awaited_once_with(2)
+    accounts = {call.args[0]: call.args[2] for call in process_mission.await_args_list}
+    assert accounts == {"fra": claimed[0], "nld": claimed[1], "ita": None}
+    assert summary["missions_processed"] == 3
+
+
+@pytest.mark.asyncio
+async def test_run_session_returns_unstarted_claims_on_cancel():
+    """Accounts claimed for missions that never started go back to the pool."""
+    import asyncio
+    from unittest.mock import patch
+
+    account_pool = MagicMock()
+    claimed = [MagicMock(id=1), MagicMock(id=2)]
+    account_pool.acquire_accounts = AsyncMock(return_value=claimed)
+    account_pool.return_unused_accounts = AsyncMock(return_value=2)
+
+    with (
+        patch("src.services.session.session_orchestrator.AppointmentRequestRepository"),
+        patch("src.services.session.session_orchestrator.AccountPoolRepository"),
+    ):
+        orchestrator = SessionOrchestrator(
+            db=MagicMock(),
+            account_pool=account_pool,
+            booking_workflow=MagicMock(),
+            browser_manager=MockBrowserManager(),
+            max_concurrent_missions=2,
+        )
+    # No concurrency slot ever frees up, so no mission starts
+    orchestrator._semaphore = asyncio.Semaphore(0)
+
+    missions = {"fra": [MagicMock()], "nld": [MagicMock()]}
+    with (
+        patch.object(orchestrator, "get_active_missions", AsyncMock(return_value=missions)),
+        patch.object(orchestrator, "_process_mission", AsyncMock()) as process_mission,
+    ):
+        session = asyncio.create_task(orchestrator.run_session())
+        await asyncio.sleep(0.05)
+        session.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await session
+    await orchestrator.usage_log.stop()
+
+    process_mission.assert_not_awaited()
+    account_pool.return_unused_accounts.assert_awaited_once_with(claimed)
@@ -1,21 +1,41 @@
 """Tests for slot_analyzer module."""
 
 import json
-from datetime import datetime, timedelta
-from pathlib import Path
+from datetime import datetime, timedelta, timezone
 
 import pytest
 
 from src.services.slot_analyzer import SlotPatternAnalyzer
 
 
+def _slot(found_at: datetime, centre: str = "Amsterdam", country: str = "nld") -> dict:
+    """Build a slot record as record_slot_found_async() stores it."""
+    return {
+        "country": country,
+        "centre": centre,
+        "category": "Tourism",
+        "slot_date": "2024-01-15",
+        "slot_time": "10:00",
+        "found_at": found_at.isoformat(),
+        "found_hour": found_at.hour,
+        "found_weekday": found_at.strftime("%A"),
+        "duration_seconds": None,
+    }
+
+
+def _store(analyzer: SlotPatternAnalyzer, records: list) -> None:
+    """Append records to the analyzer's log."""
+    with analyzer._io_lock:
+        analyzer._append_records(records)
+
+
 class TestSlotPatternAnalyzer:
     """Tests for SlotPatternAnalyzer class."""
 
     @pytest.fixture
     def temp_data_file(self, tmp_path):
         """Create a temporary data file."""
-        return tmp_path / "slot_patterns.json"
+        return tmp_path / "slot_patterns.jsonl"
 
     def test_init_creates_directory(self, temp_data_file):
         """Test that initialization creates the data directory."""
@@ -24,37 +44,47 @@ class TestSlotPatternAnalyzer:
         assert analyzer is not None
         assert temp_data_file.parent.exists()
 
-    def test_init_loads_existing_data(self, temp_data_file):
-        """Test that initialization loads existing data."""
-        # Create existing data
-        existing_data = {
-            "slots": [
+    def test_init_empty_when_file_not_exists(self, temp_data_file):
+        """Test initialization when file doesn't exist."""
+        analyzer = SlotPatternAnalyzer(str(temp_data_file))
+
+        assert analyzer._buckets == {}
+        assert analyzer._pending == []
+
+    def test_init_migrates_legacy_json_file(self, temp_data_file):
+        """Test that records from the old whole-file JSON store are imported once."""
+        legacy_file = temp_data_file.with_suffix(".json")
+        recent = datetime.now(timezone.utc) - timedelta(days=1)
+        legacy_file.write_text(
+            json.dumps(
                 {
-                    "country": "nld",
-                    "centre": "Amsterdam",
-                    "category": "Tourism",
-                    "slot_date": "2024-01-15",
-                    "slot_time": "10:00",
-                    "found_at": "2024-01-10T08:00:00",
-                    "found_hour": 8,
-                    "found_weekday": "Wednesday",
-                    "duration_seconds": None,
+                    "slots": [_slot(recent), _slot(recent.replace(tzinfo=None), "Rotterdam")],
+                    "stats": {},
                 }
-            ],
-            "stats": {},
-        }
-        temp_data_file.write_text(json.dumps(existing_data))
+            )
+        )
 
         analyzer = SlotPatternAnalyzer(str(temp_data_file))
 
-        assert len(analyzer._patterns["slots"]) == 1
-        assert analyzer._patterns["slots"][0]["country"] == "nld"
+        assert not legacy_file.exists()
+        assert legacy_file.with_name("slot_patterns.json.migrated").exists()
+        assert len(temp_data_file.read_text().splitlines()) == 2
+        assert analyzer.analyze_patterns(days=7)["total_slots_found"] == 2
 
-    def test_init_empty_when_file_not_exists(self, temp_data_file):
-        """Test initialization when file doesn't exist."""
+    def test_failed_legacy_rename_imports_nothing(self, temp_data_file, monkeypatch):
+        """Test that the legacy file is only imported once it has been renamed."""
+        legacy_file = temp_data_file.with_suffix(".json")
+        recent = datetime.now(timezone.utc) - timedelta(days=1)
+        legacy_file.write_text(json.dumps({"slots": [_slot(recent)], "stats": {}}))
+
+        def fail_rename(self, target):
+            raise OSError("read-only file system")
+
+        monkeypatch.setattr(type(legacy_file), "rename", fail_rename)
         analyzer = SlotPatternAnalyzer(str(temp_data_file))
 
-        assert analyzer._patterns == {"slots": [], "stats": {}}
+        assert legacy_file.exists()
+        assert analyzer.analyze_patterns(days=7).get("total_slots_found", 0) == 0
 
     @pytest.mark.asyncio
     async def test_record_slot_found(self, temp_data_file):
@@ -70,8 +100,8 @@ class TestSlotPatternAnalyzer:
             duration_seconds=120,
         )
 
-        assert len(analyzer._patterns["slots"]) == 1
-        slot = analyzer._patterns["slots"][0]
+        assert len(analyzer._pending) == 1
+        slot = analyzer._pending[0]
         assert slot["country"] == "nld"
         assert slot["centre"] == "Amsterdam"
         assert slot["category"] == "Tourism"
@@ -81,10 +111,12 @@ class TestSlotPatternAnalyzer:
         assert "found_at" in slot
         assert "found_hour" in slot
         assert "found_weekday" in slot
+        # Unsaved records are already visible to analytics
+        assert analyzer.analyze_patterns(days=1)["total_slots_found"] == 1
 
     @pytest.mark.asyncio
     async def test_record_slot_found_saves_to_file(self, temp_data_file):
-        """Test that recording a slot saves to file."""
+        """Test that recording a slot appends it to the log."""
         analyzer = SlotPatternAnalyzer(str(temp_data_file))
 
         await analyzer.record_slot_found_async(
@@ -94,11 +126,29 @@ class TestSlotPatternAnalyzer:
         # Flush to ensure data is written to file
         await analyzer.flush()
 
-        # Verify file was created and contains data
         assert temp_data_file.exists()
-        with open(temp_data_file, "r") as f:
-            data = json.load(f)
-        assert len(data["slots"]) == 1
+        lines = temp_data_file.read_text().splitlines()
+        assert len(lines) == 1
+        assert json.loads(lines[0])["centre"] == "Amsterdam"
+        assert analyzer._pending == []
+        assert analyzer.snapshot_file.exists()
+
+    @pytest.mark.asyncio
+    async def test_batch_appends_without_rewriting(self, temp_data_file):
+        """Test that a full batch is appended and earlier lines are left untouched."""
+        from src.services.slot_analyzer import _BATCH_SIZE
+
+        analyzer = SlotPatternAnalyzer(str(temp_data_file))
+        _store(analyzer, [_slot(datetime.now(timezone.utc))])
+        first_line = temp_data_file.read_text().splitlines()[0]
+
+        for _ in range(_BATCH_SIZE):
+            await analyzer.record_slot_found_async("nld", "Rotterdam", "Tourism", "d", "t")
+
+        lines = temp_data_file.read_text().splitlines()
+        assert len(lines) == _BATCH_SIZE + 1
+        assert lines[0] == first_line
+        assert analyzer._pending == []
 
     def test_analyze_patterns_no_data(self, temp_data_file):
         """Test analyze_patterns when there's no data."""
@@ -112,69 +162,27 @@ class TestSlotPatternAnalyzer:
     def test_analyze_patterns_with_data(self, temp_data_file):
         """Test analyze_patterns with sample data."""
         analyzer = SlotPatternAnalyzer(str(temp_data_file))
-
-        # Add some sample slots
-        now = datetime.now()
-        for i in range(10):
-            found_at = now - timedelta(days=i)
-            analyzer._patterns["slots"].append(
-                {
-                    "country": "nld",
-                    "centre": "Amsterdam",
-                    "category": "Tourism",
-                    "slot_date": "2024-01-15",
-                    "slot_time": "10:00",
-                    "found_at": found_at.isoformat(),
-                    "found_hour": 9,
-                    "found_weekday": "Monday",
-                    "duration_seconds": None,
-                }
-            )
+        now = datetime.now(timezone.utc).replace(hour=9)
+        _store(analyzer, [_slot(now - timedelta(days=i)) for i in range(1, 11)])
+        _store(analyzer, [_slot(now - timedelta(days=1), "Rotterdam")])
 
         analysis = analyzer.analyze_patterns(days=30)
 
         assert analysis["period_days"] == 30
-        assert analysis["total_slots_found"] == 10
-        assert "best_hours" in analysis
-        assert "best_days" in analysis
-        assert "best_centres" in analysis
-        assert "avg_slots_per_day" in analysis
+        assert analysis["total_slots_found"] == 11
+        assert analysis["best_hours"] == [{"hour": "9:00", "count": 11}]
+        assert sum(day["count"] for day in analysis["best_days"]) <= 11
+        assert analysis["best_centres"] == [
+            {"centre": "Amsterdam", "count": 10},
+            {"centre": "Rotterdam", "count": 1},
+        ]
+        assert analysis["avg_slots_per_day"] == round(11 / 30, 2)
 
     def test_analyze_patterns_filters_old_data(self, temp_data_file):
         """Test that analyze_patterns filters out old data."""
         analyzer = SlotPatternAnalyzer(str(temp_data_file))
-
-        # Add old slot (40 days ago)
-        old_date = datetime.now() - timedelta(days=40)
-        analyzer._patterns["slots"].append(
-            {
-                "country": "nld",
-                "centre": "Amsterdam",
-                "category": "Tourism",
-                "slot_date": "2024-01-15",
-                "slot_time": "10:00",
-                "found_at": old_date.isoformat(),
-                "found_hour": 9,
-                "found_weekday": "Monday",
-                "duration_seconds": None,
-            }
-        )
-
-        # Add recent slot
-        recent_date = datetime.now() - timedelta(days=1)
-        analyzer._patterns["slots"].append(
-            {
-                "country": "nld",
-                "centre": "Amsterdam",
-                "category": "Tourism",
-                "slot_date": "2024-01-15",
-                "slot_time": "10:00",
-                "found_at": recent_date.isoformat(),
-                "found_hour": 10,
-                "found_weekday": "Tuesday",
-                "duration_seconds": None,
-            }
-        )
+        now = datetime.now(timezone.utc)
+        _store(analyzer, [_slot(now - timedelta(days=40)), _slot(now - timedelta(days=1))])
 
         analysis = analyzer.analyze_patterns(days=30)
 
@@ -192,24 +200,8 @@ class TestSlotPatternAnalyzer:
     def test_generate_weekly_report_with_data(self, temp_data_file):
         """Test generating weekly report with data."""
         analyzer = SlotPatternAnalyzer(str(temp_data_file))
-
-        # Add sample data
-        now = datetime.now()
-        for i in range(5):
-            found_at = now - timedelta(days=i)
-            analyzer._patterns["slots"].append(
-                {
-                    "country": "nld",
-                    "centre": "Amsterdam",
-                    "category": "Tourism",
-                    "slot_date": "2024-01-15",
-                    "slot_time": "10:00",
-                    "found_at": found_at.isoformat(),
-                    "found_hour": 9,
-                    "found_weekday": "Monday",
-                    "duration_seconds": None,
-                }
-            )
+        now = datetime.now(timezone.utc)
+        _store(analyzer, [_slot(now - timedelta(days=i, hours=1)) for i in range(5)])
 
         report = analyzer.generate_weekly_report()
 
@@ -220,100 +212,65 @@ class TestSlotPatternAnalyzer:
         assert "En Aktif Merkezler" in report
 
 
-class TestSlotRetention:
-    """Tests for slot pattern retention enforcement."""
+class TestSlotPatternStore:
+    """Tests for the append-only log and incremental bucket counters."""
 
     @pytest.fixture
     def temp_data_file(self, tmp_path):
         """Create a temporary data file."""
-        return tmp_path / "slot_patterns.json"
-
-    def test_enforce_retention_trims_excess_slots(self, temp_data_file):
-        """Test that retention enforcement trims excess slots."""
-        from src.services.slot_analyzer import _MAX_SLOT_RECORDS
+        return tmp_path / "slot_patterns.jsonl"
 
+    def test_history_is_not_capped(self, temp_data_file):
+        """Test that more than the old 10k-record limit is kept and counted."""
         analyzer = SlotPatternAnalyzer(str(temp_data_file))
+        now = datetime.now(timezone.utc)
+        _store(analyzer, [_slot(now - timedelta(minutes=i)) for i in range(12_000)])
 
-        # Add more than max records
-        now = datetime.now()
-        for i in range(_MAX_SLOT_RECORDS + 100):
-            analyzer._patterns["slots"].append(
-                {
-                    "country": "nld",
-                    "centre": "Amsterdam",
-                    "category": "Tourism",
-                    "slot_date": "2024-01-15",
-                    "slot_time": "10:00",
-                    "found_at": (now - timedelta(days=i)).isoformat(),
-                    "found_hour": 9,
-                    "found_weekday": "Monday",
-                }
-            )
+        assert len(temp_data_file.read_text().splitlines()) == 12_000
+        assert analyzer.analyze_patterns(days=30)["total_slots_found"] == 12_000
 
-        # Save data - should trigger retention
-        analyzer._save_data_sync()
+    def test_reload_replays_only_log_tail(self, temp_data_file):
+        """Test that loading uses the snapshot and counts only records after it."""
+        analyzer = SlotPatternAnalyzer(str(temp_data_file))
+        now = datetime.now(timezone.utc)
+        _store(analyzer, [_slot(now - timedelta(hours=i)) for i in range(1, 4)])
+        with analyzer._io_lock:
+            analyzer._save_snapshot()
+        _store(analyzer, [_slot(now - timedelta(hours=5), "Rotterdam")])
 
-        # Verify retention was enforced
-        assert len(analyzer._patterns["slots"]) == _MAX_SLOT_RECORDS
+        reloaded = SlotPatternAnalyzer(str(temp_data_file))
 
-    def test_retention_keeps_most_recent(self, temp_data_file):
-        """Test that retention keeps the most recent records."""
-        from src.services.slot_analyzer import _MAX_SLOT_RECORDS
+        assert reloaded._log_offset == temp_data_file.stat().st_size
+        assert reloaded._since_snapshot == 1
+        assert reloaded._buckets == analyzer._buckets
 
-        analyzer = SlotPatternAnalyzer(str(temp_data_file))
+    def test_reader_picks_up_records_from_writer(self, temp_data_file):
+        """Test that a second instance sees records appended after it loaded."""
+        writer = SlotPatternAnalyzer(str(temp_data_file))
+        reader = SlotPatternAnalyzer(str(temp_data_file))
+        assert "message" in reader.analyze_patterns(days=7)
 
-        # Add records with identifiable timestamps
-        now = datetime.now()
-        for i in range(_MAX_SLOT_RECORDS + 10):
-            analyzer._patterns["slots"].append(
-                {
-                    "country": "nld",
-                    "centre": f"Centre_{i}",  # Unique identifier
-                    "category": "Tourism",
-                    "slot_date": "2024-01-15",
-                    "slot_time": "10:00",
-                    "found_at": (now - timedelta(days=_MAX_SLOT_RECORDS + 10 - i)).isoformat(),
-                    "found_hour": 9,
-                    "found_weekday": "Monday",
-                }
-            )
+        _store(writer, [_slot(datetime.now(timezone.utc) - timedelta(hours=2))])
 
-        # Save and enforce retention
-        analyzer._save_data_sync()
+        assert reader.analyze_patterns(days=7)["total_slots_found"] == 1
 
-        # First 10 oldest should be removed
-        remaining_centres = [slot["centre"] for slot in analyzer._patterns["slots"]]
-        assert "Centre_0" not in remaining_centres
-        assert "Centre_9" not in remaining_centres
-        assert "Centre_10" in remaining_centres
-        assert f"Centre_{_MAX_SLOT_RECORDS + 9}" in remaining_centres
+    def test_partial_trailing_line_is_deferred(self, temp_data_file):
+        """Test that a half-written last line is counted only once complete."""
+        line = json.dumps(_slot(datetime.now(timezone.utc) - timedelta(hours=1)))
+        temp_data_file.write_text(line[:20])
 
-    def test_retention_on_load(self, temp_data_file):
-        """Test that retention is enforced when loading data."""
-        from src.services.slot_analyzer import _MAX_SLOT_RECORDS
+        analyzer = SlotPatternAnalyzer(str(temp_data_file))
+        assert analyzer._log_offset == 0
 
-        # Create file with excess records
-        now = datetime.now()
-        data = {
-            "slots": [
-                {
-                    "country": "nld",
-                    "centre": "Amsterdam",
-                    "category": "Tourism",
-                    "slot_date": "2024-01-15",
-                    "slot_time": "10:00",
-                    "found_at": (now - timedelta(days=i)).isoformat(),
-                    "found_hour": 9,
-                    "found_weekday": "Monday",
-                }
-                for i in range(_MAX_SLOT_RECORDS + 50)
-            ],
-            "stats": {},
-        }
-        temp_data_file.write_text(json.dumps(data))
+        temp_data_file.write_text(line + "\n")
+        assert analyzer.analyze_patterns(days=1)["total_slots_found"] == 1
 
-        # Load data - should trigger retention
+    def test_corrupt_snapshot_rebuilds_from_log(self, temp_data_file):
+        """Test that an unreadable snapshot falls back to replaying the whole log."""
         analyzer = SlotPatternAnalyzer(str(temp_data_file))
+        _store(analyzer, [_slot(datetime.now(timezone.utc) - timedelta(hours=1))])
+        analyzer.snapshot_file.write_text("{not json")
+
+        reloaded = SlotPatternAnalyzer(str(temp_data_file))
 
-        # Verify retention was enforced
-        assert len(analyzer._patterns["slots"]) == _MAX_SLOT_RECORDS
+        assert reloaded.analyze_patterns(days=1)["total_slots_found"] == 1
@@ -0,0 +1,213 @@
+"""Tests for the heap-backed token blacklist and its notification-driven cache."""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.constants import NotifyChannels
+from src.core.auth.token_blacklist import PersistentTokenBlacklist, TokenBlacklist
+
+
+def _in(seconds: float) -> datetime:
+    """Datetime `seconds` from now (negative for the past)."""
+    return datetime.now(timezone.utc) + timedelta(seconds=seconds)
+
+
+@pytest.fixture
+def db():
+    """Database mock with a working LISTEN connection."""
+    database = MagicMock()
+    database.listen = AsyncMock()
+    database.unlisten = AsyncMock()
+    database.ensure_listening = AsyncMock(return_value=True)
+    database.notifications_active = True
+    database.notification_generation = 1
+    return database
+
+
+@pytest.fixture
+def repo():
+    """Patch TokenBlacklistRepository used by the persistent blacklist."""
+    with patch("src.core.auth.token_blacklist.TokenBlacklistRepository") as repo_cls:
+        repository = MagicMock()
+        repository.get_active = AsyncMock(return_value=[("revoked", _in(3600))])
+        repository.is_blacklisted = AsyncMock(return_value=False)
+        repository.add = AsyncMock()
+        repo_cls.return_value = repository
+        yield repository
+
+
+class TestTokenBlacklist:
+    """In-memory blacklist behaviour."""
+
+    def test_expired_tokens_are_not_blacklisted(self):
+        """Expired entries are dropped lazily from the heap front."""
+        blacklist = TokenBlacklist()
+        blacklist.add("old", _in(-1))
+        blacklist.add("live", _in(3600))
+
+        assert not blacklist.is_blacklisted("old")
+        assert blacklist.is_blacklisted("live")
+        assert blacklist.size() == 1
+
+    def test_readding_updates_expiry(self):
+        """A stale heap entry does not evict a token re-added with a later expiry."""
+        blacklist = TokenBlacklist()
+        blacklist.add("jti", _in(-1))
+        blacklist._blacklist["jti"] = _in(3600)  # simulate re-add racing cleanup
+        blacklist.add("jti", _in(3600))
+
+        blacklist.add("other", _in(60))
+        assert blacklist.is_blacklisted("jti")
+
+    def test_max_size_evicts_soonest_expiring(self):
+        """Over capacity, the token closest to expiry is dropped first."""
+        blacklist = TokenBlacklist(max_size=2)
+        blacklist.add("late", _in(300))
+        blacklist.add("soon", _in(60))
+        blacklist.add("later", _in(600))
+
+        assert not blacklist.is_blacklisted("soon")
+        assert blacklist.is_blacklisted("late")
+        assert blacklist.is_blacklisted("later")
+
+    def test_discard(self):
+        """discard() removes a token and leaves the heap consistent."""
+        blacklist = TokenBlacklist()
+        blacklist.add("jti", _in(60))
+        blacklist.discard("jti")
+
+        assert not blacklist.is_blacklisted("jti")
+        blacklist.add("next", _in(30))
+        assert blacklist.size() == 1
+
+
+class TestPersistentTokenBlacklist:
+    """Warm-loaded, notification-driven blacklist."""
+
+    @pytest.mark.asyncio
+    async def test_miss_queries_database_before_warm_load(self, db, repo):
+        """Without a warm load, a miss is confirmed against the database."""
+        blacklist = PersistentTokenBlacklist(db=db)
+
+        assert await blacklist.is_blacklisted_async("unknown") is False
+        repo.is_blacklisted.assert_awaited_once_with("unknown")
+
+    @pytest.mark.asyncio
+    async def test_miss_skips_database_after_warm_load(self, db, repo):
+        """After load_from_database() with LISTEN active, lookups do no I/O."""
+        blacklist = PersistentTokenBlacklist(db=db)
+        assert await blacklist.load_from_database() == 1
+
+        assert await blacklist.is_blacklisted_async("revoked") is True
+        assert await blacklist.is_blacklisted_async("unknown") is False
+        db.listen.assert_awaited_once_with(
+            NotifyChannels.TOKEN_BLACKLIST, blacklist._on_notification
+        )
+        repo.is_blacklisted.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_database_when_listener_down(self, db, repo):
+        """While notifications are unavailable, misses hit the database again."""
+        blacklist = PersistentTokenBlacklist(db=db)
+        await blacklist.load_from_database()
+
+        db.notifications_active = False
+        db.notification_generation = None
+        await blacklist.is_blacklisted_async("unknown")
+
+        repo.is_blacklisted.assert_awaited_once_with("unknown")
+
+    @pytest.mark.asyncio
+    async def test_listen_failure_keeps_database_checks(self, db, repo):
+        """If LISTEN cannot be set up, the blacklist is never authoritative."""
+        db.listen = AsyncMock(side_effect=OSError("refused"))
+        blacklist = PersistentTokenBlacklist(db=db)
+        await blacklist.load_from_database()
+
+        assert not blacklist.is_authoritative
+        await blacklist.is_blacklisted_async("unknown")
+        repo.is_blacklisted.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_notifications_apply_cross_worker_changes(self, db, repo):
+        """Revocations and removals from other workers update memory."""
+        blacklist = PersistentTokenBlacklist(db=db)
+        await blacklist.load_from_database()
+
+        exp = int(_in(3600).timestamp())
+        blacklist._on_notification(f"other-worker {exp}.5")
+        blacklist._on_notification("revoked")
+        blacklist._on_notification("bad 1e400")
+
+        assert await blacklist.is_blacklisted_async("other-worker") is True
+        assert await blacklist.is_blacklisted_async("revoked") is False
+        repo.is_blacklisted.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_eviction_ends_authoritative_lookups(self, db, repo):
+        """A revoked token evicted for capacity is still found in the database."""
+        blacklist = PersistentTokenBlacklist(db=db, max_size=1)
+        await blacklist.load_from_database()
+        assert blacklist.is_authoritative
+
+        blacklist.add("newer", _in(7200))
+
+        assert not blacklist.is_authoritative
+        repo.is_blacklisted.return_value = True
+        assert await blacklist.is_blacklisted_async("revoked") is True
+        repo.is_blacklisted.assert_awaited_once_with("revoked")
+
+    @pytest.mark.asyncio
+    async def test_resync_reloads_after_reconnect(self, db, repo):
+        """A dropped LISTEN connection is reopened and the set reloaded."""
+        blacklist = PersistentTokenBlacklist(db=db)
+        await blacklist.load_from_database()
+
+        db.notifications_active = False
+        db.notification_generation = None
+
+        def reconnect():
+            db.notifications_active = True
+            db.notification_generation = 2
+            return True
+
+        db.ensure_listening.side_effect = reconnect
+        await blacklist._resync_if_disconnected()
+
+        db.ensure_listening.assert_awaited_once()
+        assert repo.get_active.await_count == 2
+        assert blacklist.is_authoritative
+
+    @pytest.mark.asyncio
+    async def test_reconnect_by_another_consumer_forces_reload(self, db, repo):
+        """A LISTEN connection re-opened elsewhere is not trusted until the set is reloaded."""
+        blacklist = PersistentTokenBlacklist(db=db)
+        await blacklist.load_from_database()
+
+        # Dropped and re-opened by e.g. the dropdown cache before the blacklist noticed
+        db.notification_generation = 2
+
+        assert not blacklist.is_authoritative
+        await blacklist.is_blacklisted_async("unknown")
+        repo.is_blacklisted.assert_awaited_once_with("unknown")
+
+        await blacklist._resync_if_disconnected()
+
+        db.ensure_listening.assert_not_awaited()
+        assert repo.get_active.await_count == 2
+        assert blacklist.is_authoritative
+
+    @pytest.mark.asyncio
+    async def test_close_unsubscribes(self, db, repo):
+        """close() removes the notification subscription."""
+        blacklist = PersistentTokenBlacklist(db=db)
+        await blacklist.load_from_database()
+
+        await blacklist.close()
+
+        db.unlisten.assert_awaited_once_with(
+            NotifyChannels.TOKEN_BLACKLIST, blacklist._on_notification
+        )
+        assert not blacklist.is_authoritative
@@ -13,6 +13,7 @@ from src.core.auth.token_blacklist import PersistentTokenBlacklist
 from src.core.config.settings import get_settings
 from src.core.infra.startup_validator import log_security_warnings
 from src.models.db_factory import DatabaseFactory
+from src.utils.audit_logger import get_audit_logger
 from web.api_versioning import setup_versioned_routes
 from web.app_config import (
     configure_middleware,
@@ -33,13 +34,18 @@ async def lifespan(app: FastAPI):
 
     Handles:
     - Database connection on startup
+    - Token blacklist warm load and cleanup/resync task
     - Database cleanup on shutdown
     - OTP service cleanup on shutdown
     - Dropdown sync scheduler startup and shutdown
+    - Dropdown cache notification cleanup on shutdown
+    - Audit log pipeline startup and drain on shutdown
+    - Async Redis pool cleanup on shutdown
     """
     # Startup
     logger.info("FastAPI application starting up...")
     dropdown_scheduler = None
+    blacklist_cleanup_task: Optional[asyncio.Task] = None
     try:
         # Ensure database is connected
         db = await DatabaseFactory.ensure_connected()
@@ -56,10 +62,21 @@ async def lifespan(app: FastAPI):
             if isinstance(blacklist, PersistentTokenBlacklist):
                 count = await blacklist.load_from_database()
                 logger.info(f"Loaded {count} blacklisted tokens from database")
+                # Purges expired tokens and reloads after a lost LISTEN connection
+                blacklist_cleanup_task = asyncio.create_task(
+                    blacklist.start_cleanup_task(), name="token_blacklist_cleanup"
+                )
         except Exception as e:
             logger.warning(f"Failed to load blacklisted tokens from database: {e}")
             logger.info("Application will continue with empty blacklist")
 
+        # Batch audit events through a single background writer (drained on shutdown)
+        # Non-critical: without it, audit events are written one by one
+        try:
+            await get_audit_logger(db).start()
+        except Exception as e:
+            logger.warning(f"Failed to start audit log pipeline: {e}")
+
         # Start dropdown sync scheduler
         # Non-critical: Allow app to start even if scheduler fails
         try:
@@ -88,6 +105,28 @@ async def lifespan(app: FastAPI):
         except Exception as e:
             logger.error(f"Error stopping dropdown sync scheduler: {e}")
 
+    # Stop token blacklist revocation notifications
+    try:
+        blacklist = get_token_blacklist()
+        if isinstance(blacklist, PersistentTokenBlacklist):
+            await blacklist.close()
+        if blacklist_cleanup_task is not None and not blacklist_cleanup_task.done():
+            blacklist_cleanup_task.cancel()
+            try:
+                await blacklist_cleanup_task
+            except asyncio.CancelledError:
+                pass
+    except Exception as e:
+        logger.error(f"Error closing token blacklist: {e}")
+
+    # Stop dropdown cache change notifications
+    try:
+        from src.services.dropdown_cache import close_dropdown_cache
+
+        await close_dropdown_cache()
+    except Exception as e:
+        logger.error(f"Error closing dropdown cache: {e}")
+
     # Stop OTP cleanup scheduler
     try:
         from src.services.otp_manager.otp_webhook import get_otp_service
@@ -100,6 +139,20 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"Error cleaning up OTP service: {e}")
 
+    # Drain queued audit events while the database is still open
+    try:
+        await get_audit_logger().stop()
+    except Exception as e:
+        logger.error(f"Error draining audit log pipeline: {e}")
+
+    # Close the async Redis pool (dedup, idempotency, auth rate limiting)
+    try:
+        from src.core.infra.redis_manager import AsyncRedisManager
+
+        await AsyncRedisManager.close()
+    except Exception as e:
+        logger.error(f"Error closing async Redis client: {e}")
+
     # Close database with timeout protection
     try:
         await asyncio.wait_for(DatabaseFactory.close_instance(), timeout=10)
@@ -201,6 +201,7 @@ def configure_middleware(app: FastAPI, allowed_origins: list, is_dev: bool) -> N
             "X-Total-Count",
             "X-Page",
             "X-Per-Page",
+            "X-Next-Cursor",
         ],
         max_age=3600,  # Cache preflight requests for 1 hour
     )
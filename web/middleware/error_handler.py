@@ -1,12 +1,11 @@
 """Global error handling middleware for VFS-Bot web application."""
 
 import traceback
-from typing import Callable, cast
 
-from fastapi import Request, Response, status
+from fastapi import Request, status
 from fastapi.responses import JSONResponse
 from loguru import logger
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from src.core.exceptions import (
     AuthenticationError,
@@ -17,45 +16,70 @@ from src.core.exceptions import (
 )
 
 
-class ErrorHandlerMiddleware(BaseHTTPMiddleware):
+class ErrorHandlerMiddleware:
     """
     Global error handling middleware with consistent JSON responses.
 
     Catches all unhandled exceptions and returns structured JSON error responses.
+
+    Implemented as pure ASGI middleware so requests are not copied through
+    an extra task and memory stream, and streaming responses pass through
+    unchanged. An exception raised after the response has started cannot be
+    turned into a JSON response and is re-raised to the server.
     """
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
+
+        async def send_tracking_start(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_tracking_start)
+        except Exception as e:
+            if response_started:
+                raise
+            response = self.handle_exception(e, Request(scope))
+            await response(scope, receive, send)
+
+    def handle_exception(self, error: Exception, request: Request) -> JSONResponse:
         """
-        Process request and handle any exceptions.
+        Map an exception to its RFC 7807 JSON response.
 
         Args:
-            request: FastAPI request
-            call_next: Next middleware/handler in chain
+            error: Exception raised by the application
+            request: Request that raised it
 
         Returns:
-            Response object
+            JSON error response
         """
-        try:
-            response = await call_next(request)
-            return cast(Response, response)
-        except ValidationError as e:
+        if isinstance(error, ValidationError):
             # Handle validation errors (400)
-            return self._handle_validation_error(e, request)
-        except AuthenticationError as e:
+            return self._handle_validation_error(error, request)
+        if isinstance(error, AuthenticationError):
             # Handle authentication errors (401)
-            return self._handle_auth_error(e, request)
-        except DatabaseError as e:
+            return self._handle_auth_error(error, request)
+        if isinstance(error, DatabaseError):
             # Handle database errors (500)
-            return self._handle_database_error(e, request)
-        except RateLimitError as e:
+            return self._handle_database_error(error, request)
+        if isinstance(error, RateLimitError):
             # Handle rate limit errors (429)
-            return self._handle_rate_limit_error(e, request)
-        except VFSBotError as e:
+            return self._handle_rate_limit_error(error, request)
+        if isinstance(error, VFSBotError):
             # Handle known VFSBot exceptions
-            return self._handle_vfsbot_error(e, request)
-        except Exception as e:
-            # Handle unexpected errors (500)
-            return self._handle_unexpected_error(e, request)
+            return self._handle_vfsbot_error(error, request)
+        # Handle unexpected errors (500)
+        return self._handle_unexpected_error(error, request)
 
     def _handle_vfsbot_error(self, error: VFSBotError, request: Request) -> JSONResponse:
         """Handle VFSBot-specific errors with RFC 7807 format."""
@@ -1,54 +1,71 @@
 """Security headers middleware for VFS-Bot web application."""
 
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from src.core.environment import Environment
 
+# Content Security Policy
+# 'self' for default; 'unsafe-inline' for style-src needed by React/Tailwind
+# connect-src includes wss:/ws: for WebSocket endpoint (/ws)
+CONTENT_SECURITY_POLICY = (
+    "default-src 'self'; "
+    "script-src 'self'; "
+    "style-src 'self' 'unsafe-inline'; "
+    "img-src 'self' data:; "
+    "font-src 'self'; "
+    "connect-src 'self' wss: ws:; "
+    "frame-ancestors 'none'; "
+    "base-uri 'self'; "
+    "form-action 'self'"
+)
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
+# HSTS — force HTTPS for 1 year, include subdomains
+# No 'preload' — single-user app doesn't need Google preload list submission
+STRICT_TRANSPORT_SECURITY = "max-age=31536000; includeSubDomains"
+
+_SECURITY_HEADERS = (
+    # Clickjacking protection
+    ("X-Frame-Options", "DENY"),
+    # Prevent MIME-type sniffing
+    ("X-Content-Type-Options", "nosniff"),
+    # Referrer policy
+    ("Referrer-Policy", "strict-origin-when-cross-origin"),
+    ("Content-Security-Policy", CONTENT_SECURITY_POLICY),
+    # Prevent Adobe Flash/Acrobat cross-domain policy loading
+    ("X-Permitted-Cross-Domain-Policies", "none"),
+)
+
+
+class SecurityHeadersMiddleware:
     """Add security headers to all responses.
 
     Headers follow OWASP 2025 recommendations.
     Adapted for single-user deployment.
+
+    Implemented as pure ASGI middleware: headers are set on the
+    ``http.response.start`` message, so response bodies (including
+    streaming responses) pass through untouched.
     """
 
-    async def dispatch(self, request: Request, call_next):
-        response = await call_next(request)
+    def __init__(self, app: ASGIApp):
+        self.app = app
 
-        # Clickjacking protection
-        response.headers["X-Frame-Options"] = "DENY"
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-        # Prevent MIME-type sniffing
-        response.headers["X-Content-Type-Options"] = "nosniff"
+        # Only in production to avoid breaking local dev with self-signed certs
+        hsts = Environment.is_production()
 
-        # Referrer policy
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                for name, value in _SECURITY_HEADERS:
+                    headers[name] = value
+                if hsts:
+                    headers["Strict-Transport-Security"] = STRICT_TRANSPORT_SECURITY
+            await send(message)
 
-        # HSTS — force HTTPS for 1 year, include subdomains
-        # No 'preload' — single-user app doesn't need Google preload list submission
-        # Only in production to avoid breaking local dev with self-signed certs
-        if Environment.is_production():
-            response.headers["Strict-Transport-Security"] = (
-                "max-age=31536000; includeSubDomains"
-            )
-
-        # Content Security Policy
-        # 'self' for default; 'unsafe-inline' for style-src needed by React/Tailwind
-        # connect-src includes wss:/ws: for WebSocket endpoint (/ws)
-        response.headers["Content-Security-Policy"] = (
-            "default-src 'self'; "
-            "script-src 'self'; "
-            "style-src 'self' 'unsafe-inline'; "
-            "img-src 'self' data:; "
-            "font-src 'self'; "
-            "connect-src 'self' wss: ws:; "
-            "frame-ancestors 'none'; "
-            "base-uri 'self'; "
-            "form-action 'self'"
-        )
-
-        # Prevent Adobe Flash/Acrobat cross-domain policy loading
-        response.headers["X-Permitted-Cross-Domain-Policies"] = "none"
-
-        return response
+        await self.app(scope, receive, send_with_headers)
@@ -28,3 +28,4 @@ class AuditStatsResponse(BaseModel):
     by_action: Dict[str, int] = Field(description="Count by action type")
     success_rate: float = Field(description="Success rate (0.0 to 1.0)")
     recent_failures: int = Field(description="Number of failures in last 24h")
+    range: str = Field(default="all", description="Time range the counts cover")
@@ -6,13 +6,16 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 import yaml
-from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from loguru import logger
 
+from src.constants import Pagination
 from src.core.enums import AppointmentRequestStatus
 from src.core.exceptions import ValidationError
 from src.repositories import AppointmentRequestRepository
-from src.repositories.dropdown_cache_repository import DropdownCacheRepository
+from src.repositories.appointment_request_repository import AppointmentRequest
+from src.services.dropdown_cache import DropdownIndex, get_dropdown_cache
+from src.utils.db_helpers import decode_cursor
 from web.dependencies import (
     get_appointment_request_repository,
     get_db,
@@ -23,6 +26,7 @@ from web.models.appointments import (
     AppointmentRequestResponse,
 )
 from web.models.common import CountryResponse, WebhookUrlsResponse
+from web.streaming import ndjson_response, wants_ndjson
 
 router = APIRouter(prefix="/appointments", tags=["appointments"])
 
@@ -80,6 +84,48 @@ def reload_countries_data() -> None:
 COUNTRIES_DATA = _load_countries_from_yaml()
 
 
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Check an If-None-Match header against an ETag (weak comparison, RFC 9110).
+
+    Args:
+        if_none_match: If-None-Match request header value
+        etag: Current strong ETag, quoted
+
+    Returns:
+        True if the client's cached copy is current
+    """
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+def _dropdown_response(
+    request: Request, response: Response, index: DropdownIndex, items: List[str]
+) -> Any:
+    """
+    Return dropdown items with the country's ETag, or 304 if the client has them.
+
+    Args:
+        request: Incoming request
+        response: Response whose headers are sent with the items
+        index: Dropdown index the items came from
+        items: Dropdown values to return
+
+    Returns:
+        The items, or an empty 304 response
+    """
+    headers = {"ETag": index.etag, "Cache-Control": "no-cache"}
+    if _etag_matches(request.headers.get("if-none-match"), index.etag):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return items
+
+
 @router.get("/countries", response_model=List[CountryResponse])
 async def get_countries():
     """
@@ -103,6 +149,8 @@ async def reload_countries(
 @router.get("/countries/{country_code}/centres")
 async def get_country_centres(
     country_code: str,
+    request: Request,
+    response: Response,
     db=Depends(get_db),
 ):
     """
@@ -110,10 +158,12 @@ async def get_country_centres(
 
     Args:
         country_code: Country code (e.g., 'nld', 'aut')
+        request: Incoming request (for If-None-Match)
+        response: Outgoing response (for ETag)
         db: Database instance
 
     Returns:
-        List of centre names
+        List of centre names, or 304 if the client's copy is current
 
     Note:
         Returns centres from cached dropdown data if available.
@@ -121,12 +171,11 @@ async def get_country_centres(
     """
     try:
         # Try to get centres from cache
-        dropdown_cache_repo = DropdownCacheRepository(db)
-        centres = await dropdown_cache_repo.get_centres(country_code)
+        index = await get_dropdown_cache(db).get(country_code)
 
-        if centres:
-            logger.debug(f"Returning {len(centres)} cached centres for {country_code}")
-            return centres
+        if index is not None and index.centres:
+            logger.debug(f"Returning {len(index.centres)} cached centres for {country_code}")
+            return _dropdown_response(request, response, index, index.centres)
 
         # Fallback to hardcoded centres if cache is empty
         logger.warning(f"No cached centres for {country_code}, returning fallback centres")
@@ -142,6 +191,8 @@ async def get_country_centres(
 async def get_centre_categories(
     country_code: str,
     centre_name: str,
+    request: Request,
+    response: Response,
     db=Depends(get_db),
 ):
     """
@@ -150,19 +201,23 @@ async def get_centre_categories(
     Args:
         country_code: Country code (e.g., 'fra', 'nld')
         centre_name: Centre name (e.g., 'Istanbul', 'Ankara')
+        request: Incoming request (for If-None-Match)
+        response: Outgoing response (for ETag)
         db: Database instance
 
     Returns:
-        List of category names
+        List of category names, or 304 if the client's copy is current
     """
     try:
-        dropdown_cache_repo = DropdownCacheRepository(db)
-        categories = await dropdown_cache_repo.get_categories(country_code, centre_name)
+        index = await get_dropdown_cache(db).get(country_code)
+        categories = index.categories.get(centre_name, []) if index else []
 
         if not categories:
             logger.warning(f"No cached categories for {country_code}/{centre_name}")
 
-        return categories
+        if index is None:
+            return categories
+        return _dropdown_response(request, response, index, categories)
     except Exception as e:
         logger.error(f"Error fetching categories for {country_code}/{centre_name}: {e}")
         return []
@@ -175,6 +230,8 @@ async def get_category_subcategories(
     country_code: str,
     centre_name: str,
     category_name: str,
+    request: Request,
+    response: Response,
     db=Depends(get_db),
 ):
     """
@@ -184,23 +241,25 @@ async def get_category_subcategories(
         country_code: Country code (e.g., 'fra', 'nld')
         centre_name: Centre name (e.g., 'Istanbul', 'Ankara')
         category_name: Category name
+        request: Incoming request (for If-None-Match)
+        response: Outgoing response (for ETag)
         db: Database instance
 
     Returns:
-        List of subcategory names
+        List of subcategory names, or 304 if the client's copy is current
     """
     try:
-        dropdown_cache_repo = DropdownCacheRepository(db)
-        subcategories = await dropdown_cache_repo.get_subcategories(
-            country_code, centre_name, category_name
-        )
+        index = await get_dropdown_cache(db).get(country_code)
+        subcategories = index.subcategories.get((centre_name, category_name), []) if index else []
 
         if not subcategories:
             logger.warning(
                 f"No cached subcategories for {country_code}/{centre_name}/{category_name}"
             )
 
-        return subcategories
+        if index is None:
+            return subcategories
+        return _dropdown_response(request, response, index, subcategories)
     except Exception as e:
         logger.error(
             f"Error fetching subcategories for "
@@ -266,53 +325,91 @@ async def create_appointment_request(
         raise HTTPException(status_code=500, detail="Failed to create appointment request")
 
 
+def _timestamp_str(value: Any) -> str:
+    """Render a TIMESTAMPTZ column (datetime from asyncpg) as an ISO 8601 string."""
+    return value.isoformat() if isinstance(value, datetime) else str(value)
+
+
+def _to_request_response(req: AppointmentRequest) -> AppointmentRequestResponse:
+    """
+    Convert an appointment request entity to its response model.
+
+    Args:
+        req: Appointment request entity with persons
+
+    Returns:
+        AppointmentRequestResponse without internal person fields
+    """
+    # Remove internal fields from persons
+    persons = [
+        {k: v for k, v in person.items() if k != "request_id" and k != "created_at"}
+        for person in req.persons
+    ]
+
+    return AppointmentRequestResponse(
+        id=req.id,
+        country_code=req.country_code,
+        visa_category=req.visa_category,
+        visa_subcategory=req.visa_subcategory,
+        centres=req.centres,
+        preferred_dates=req.preferred_dates,
+        person_count=req.person_count,
+        status=req.status,
+        created_at=_timestamp_str(req.created_at),
+        completed_at=_timestamp_str(req.completed_at) if req.completed_at else None,
+        booked_date=req.booked_date,
+        persons=persons,
+    )
+
+
 @router.get("/appointment-requests", response_model=List[AppointmentRequestResponse])
 async def get_appointment_requests(
+    request: Request,
+    response: Response,
     status: Optional[str] = None,
+    limit: int = Query(default=Pagination.DEFAULT_LIMIT, ge=1, le=Pagination.MAX_LIMIT),
+    cursor: Optional[str] = None,
     token_data: Dict[str, Any] = Depends(verify_jwt_token),
     appt_req_repo: AppointmentRequestRepository = Depends(get_appointment_request_repository),
 ):
     """
-    Get all appointment requests.
+    Get appointment requests, newest first.
+
+    Results are keyset-paginated: when more requests exist, the X-Next-Cursor
+    response header carries the cursor for the next page. With
+    ``Accept: application/x-ndjson`` every matching request (from the cursor
+    on) is streamed as newline-delimited JSON instead; limit is ignored.
 
     Args:
+        request: Incoming request (checked for an NDJSON Accept header)
+        response: Response used to set the X-Next-Cursor header
         status: Optional status filter
+        limit: Page size
+        cursor: Cursor from the previous page's X-Next-Cursor header
         token_data: Verified token data
         appt_req_repo: AppointmentRequestRepository instance
 
     Returns:
-        List of appointment requests
+        List of appointment requests, or an NDJSON stream
     """
     try:
-        requests = await appt_req_repo.get_all(status=status)
-
-        # Convert to response model
-        response_requests = []
-        for req in requests:
-            # Remove internal fields from persons
-            persons = [
-                {k: v for k, v in person.items() if k != "request_id" and k != "created_at"}
-                for person in req["persons"]
-            ]
-
-            response_requests.append(
-                AppointmentRequestResponse(
-                    id=req["id"],
-                    country_code=req["country_code"],
-                    visa_category=req["visa_category"],
-                    visa_subcategory=req["visa_subcategory"],
-                    centres=req["centres"],
-                    preferred_dates=req["preferred_dates"],
-                    person_count=req["person_count"],
-                    status=req["status"],
-                    created_at=req["created_at"],
-                    completed_at=req.get("completed_at"),
-                    booked_date=req.get("booked_date"),
-                    persons=persons,
-                )
+        if cursor:
+            decode_cursor(cursor)
+
+        if wants_ndjson(request):
+            return ndjson_response(
+                appt_req_repo.stream(cursor=cursor, status=status), _to_request_response
             )
 
-        return response_requests
+        requests, next_cursor = await appt_req_repo.get_page(
+            limit=limit, cursor=cursor, status=status
+        )
+        if next_cursor:
+            response.headers[Pagination.NEXT_CURSOR_HEADER] = next_cursor
+
+        return [_to_request_response(req) for req in requests]
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Failed to get appointment requests: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail="Failed to get appointment requests")
@@ -1,42 +1,70 @@
 """Audit log routes for VFS-Bot web application."""
 
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from loguru import logger
 
+from src.constants import Pagination
 from src.repositories.audit_log_repository import AuditLogRepository
+from src.utils.db_helpers import decode_cursor
 from web.dependencies import get_audit_log_repository, verify_jwt_token
 from web.models.audit import AuditLogResponse, AuditStatsResponse
+from web.streaming import ndjson_response, wants_ndjson
 
 router = APIRouter(prefix="/audit", tags=["audit"])
 
 
 @router.get("/logs", response_model=List[AuditLogResponse])
 async def list_audit_logs(
+    request: Request,
+    response: Response,
     limit: int = Query(
-        default=100, ge=1, le=1000, description="Maximum number of logs to retrieve"
+        default=Pagination.DEFAULT_LIMIT,
+        ge=1,
+        le=Pagination.MAX_LIMIT,
+        description="Maximum number of logs to retrieve",
+    ),
+    cursor: Optional[str] = Query(
+        default=None, description="Cursor from the X-Next-Cursor header of the previous page"
     ),
     action: Optional[str] = Query(default=None, description="Filter by action type"),
     user_id: Optional[int] = Query(default=None, description="Filter by user ID"),
     success: Optional[bool] = Query(default=None, description="Filter by success status"),
     current_user: Dict[str, Any] = Depends(verify_jwt_token),
     audit_repo: AuditLogRepository = Depends(get_audit_log_repository),
-) -> List[AuditLogResponse]:
+) -> Union[List[AuditLogResponse], StreamingResponse]:
     """
-    Get audit log entries with optional filters.
+    Get audit log entries with optional filters, newest first.
+
+    Results are keyset-paginated: when more entries exist, the X-Next-Cursor
+    response header carries the cursor for the next page. Clients sending
+    ``Accept: application/x-ndjson`` instead receive every matching entry
+    (from the cursor on) as a newline-delimited JSON stream; limit is ignored.
 
     Requires authentication.
     """
     try:
-        logs = await audit_repo.get_all(limit=limit, action=action, user_id=user_id)
+        if cursor:
+            decode_cursor(cursor)
 
-        # Filter by success if specified
-        if success is not None:
-            logs = [log for log in logs if log.get("success") == success]
+        if wants_ndjson(request):
+            entries = audit_repo.stream(
+                cursor=cursor, action=action, user_id=user_id, success=success
+            )
+            return ndjson_response(entries, lambda log: AuditLogResponse(**log))
+
+        logs, next_cursor = await audit_repo.get_page(
+            limit=limit, cursor=cursor, action=action, user_id=user_id, success=success
+        )
+        if next_cursor:
+            response.headers[Pagination.NEXT_CURSOR_HEADER] = next_cursor
 
         return [AuditLogResponse(**log) for log in logs]
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Failed to retrieve audit logs: {e}")
         raise HTTPException(status_code=500, detail="Failed to retrieve audit logs")
@@ -67,50 +95,56 @@ async def get_audit_log(
         raise HTTPException(status_code=500, detail="Failed to retrieve audit log")
 
 
+_RANGE_UNITS = {"h": "hours", "d": "days"}
+
+
+def _range_start(range_spec: str) -> Optional[datetime]:
+    """
+    Convert a stats range such as "24h" or "7d" into its start time.
+
+    Args:
+        range_spec: "all" or a count followed by "h" (hours) or "d" (days)
+
+    Returns:
+        Start of the range in UTC, or None for "all"
+    """
+    if range_spec == "all":
+        return None
+    delta = timedelta(**{_RANGE_UNITS[range_spec[-1]]: int(range_spec[:-1])})
+    return datetime.now(timezone.utc) - delta
+
+
 @router.get("/stats", response_model=AuditStatsResponse)
 async def get_audit_stats(
+    range_spec: str = Query(
+        default="all",
+        alias="range",
+        pattern=r"^(all|[1-9]\d{0,3}[hd])$",
+        description='Time range, e.g. "24h", "7d" or "all"',
+    ),
     current_user: Dict[str, Any] = Depends(verify_jwt_token),
     audit_repo: AuditLogRepository = Depends(get_audit_log_repository),
 ) -> AuditStatsResponse:
     """
     Get audit log statistics.
 
+    Aggregated in the database from the hourly rollup, so the cost does not
+    grow with the size of the audit log.
+
     Requires authentication.
     """
     try:
-        # Get all logs (with reasonable limit for stats calculation)
-        all_logs = await audit_repo.get_all(limit=10000)
-
-        total = len(all_logs)
-
-        # Count by action type
-        by_action: Dict[str, int] = {}
-        success_count = 0
-
-        # Calculate 24h threshold
-        now = datetime.now(timezone.utc)
-        threshold_24h = (now - timedelta(hours=24)).isoformat()
-        recent_failures = 0
-
-        for log in all_logs:
-            action = log.get("action", "unknown")
-            by_action[action] = by_action.get(action, 0) + 1
-
-            if log.get("success", True):
-                success_count += 1
-
-            # Check for recent failures
-            if not log.get("success", True) and log.get("timestamp", "") >= threshold_24h:
-                recent_failures += 1
+        stats = await audit_repo.get_stats(since=_range_start(range_spec))
 
-        # Calculate success rate
-        success_rate = success_count / total if total > 0 else 1.0
+        total = stats["total"]
+        success_rate = stats["successes"] / total if total > 0 else 1.0
 
         return AuditStatsResponse(
             total=total,
-            by_action=by_action,
+            by_action=stats["by_action"],
             success_rate=success_rate,
-            recent_failures=recent_failures,
+            recent_failures=stats["recent_failures"],
+            range=range_spec,
         )
     except Exception as e:
         logger.error(f"Failed to retrieve audit statistics: {e}")
@@ -117,8 +117,9 @@ async def login(request: Request, response: Response, credentials: LoginRequest)
     Raises:
         HTTPException: If credentials are invalid or environment not configured
     """
-    from src.core.auth import verify_password
+    from src.core.auth import get_password_verifier, pwd_context
     from src.core.config.settings import get_settings
+    from src.core.exceptions import PasswordVerifierBusyError
 
     # Get credentials from environment - fail if not set
     admin_username = os.getenv("ADMIN_USERNAME")
@@ -140,7 +141,26 @@ async def login(request: Request, response: Response, credentials: LoginRequest)
             "print(CryptContext(schemes=['bcrypt']).hash('your-password'))\"",
         )
 
-    if credentials.username != admin_username or not verify_password(credentials.password, admin_password):
+    # bcrypt runs in a bounded thread pool; a saturated pool fails fast with 503
+    verified = False
+    if credentials.username == admin_username:
+        try:
+            verified = await get_password_verifier().verify(credentials.password, admin_password)
+        except PasswordVerifierBusyError as e:
+            raise HTTPException(
+                status_code=503,
+                detail=e.message,
+                headers={"Retry-After": str(e.retry_after)},
+            )
+        # ADMIN_PASSWORD lives in the environment, so an outdated hash cannot be
+        # rewritten here (verify_and_update() is for stores that can persist it)
+        if verified and pwd_context.needs_update(admin_password):
+            logger.warning(
+                "ADMIN_PASSWORD hash uses an outdated bcrypt cost; "
+                "regenerate it to pick up the current PASSWORD_HASH_ROUNDS"
+            )
+
+    if not verified:
         raise HTTPException(
             status_code=401,
             detail="Incorrect username or password",
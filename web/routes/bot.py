@@ -1,5 +1,6 @@
 """Bot control routes for VFS-Bot web application."""
 
+import asyncio
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List
@@ -482,6 +483,8 @@ async def get_slot_analytics(
     auth_data: dict = Depends(verify_jwt_token),
 ) -> Dict[str, Any]:
     """Get slot pattern analytics for dashboard visualization."""
-    from src.services.slot_analyzer import SlotPatternAnalyzer
-    analyzer = SlotPatternAnalyzer()
-    return analyzer.analyze_patterns(days=days)
+    from src.services.slot_analyzer import get_slot_analyzer
+
+    # Loading the analyzer and reading its records is blocking file I/O
+    analyzer = await asyncio.to_thread(get_slot_analyzer)
+    return await asyncio.to_thread(analyzer.analyze_patterns, days=days)
@@ -0,0 +1,54 @@
+"""NDJSON streaming helpers for list endpoints."""
+
+from typing import AsyncIterator, Callable, TypeVar
+
+from fastapi import Request
+from fastapi.responses import StreamingResponse
+from loguru import logger
+from pydantic import BaseModel
+
+T = TypeVar("T")
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+def wants_ndjson(request: Request) -> bool:
+    """
+    Check whether the client asked for a newline-delimited JSON stream.
+
+    Args:
+        request: Incoming request
+
+    Returns:
+        True if the Accept header lists application/x-ndjson
+    """
+    return NDJSON_MEDIA_TYPE in request.headers.get("accept", "")
+
+
+def ndjson_response(
+    items: AsyncIterator[T], serialize: Callable[[T], BaseModel]
+) -> StreamingResponse:
+    """
+    Stream items as one JSON document per line.
+
+    Items are serialized as they arrive, so memory stays flat regardless of
+    how many rows the underlying server-side cursor yields.
+
+    Args:
+        items: Async iterator of repository items
+        serialize: Converts an item to its response model
+
+    Returns:
+        Streaming response with media type application/x-ndjson
+    """
+
+    async def lines() -> AsyncIterator[bytes]:
+        try:
+            async for item in items:
+                yield serialize(item).model_dump_json().encode() + b"\n"
+        except Exception as e:
+            # Headers are already sent; the client sees a truncated stream
+            logger.error(f"NDJSON stream aborted: {e}")
+            raise
+
+    return StreamingResponse(lines(), media_type=NDJSON_MEDIA_TYPE)
@@ -1,20 +1,42 @@
 """WebSocket connection manager with rate limiting."""
 
 import asyncio
+import json
 import os
 import time
-from typing import Dict, Set
+from typing import Dict, Optional, Set
 
 from fastapi import WebSocket, WebSocketDisconnect
 from loguru import logger
 
+from src.utils.prometheus_metrics import MetricsHelper
+
+
+class _ClientChannel:
+    """Bounded outbound queue of pre-encoded messages and the task draining it."""
+
+    def __init__(self, websocket: WebSocket, queue_size: int):
+        self.websocket = websocket
+        self.queue: "asyncio.Queue[str]" = asyncio.Queue(maxsize=queue_size)
+        self.sender: Optional["asyncio.Task[None]"] = None
+
 
 class ConnectionManager:
-    """Thread-safe WebSocket connection manager with connection limits and rate limiting."""
+    """Thread-safe WebSocket connection manager with connection limits and rate limiting.
+
+    Broadcasts are fanned out through a bounded queue per client, each drained
+    by its own sender task, so a slow or stalled client never delays the
+    others. A client whose queue overflows is disconnected (it reconnects and
+    receives a fresh status snapshot) or, with the "drop" policy, misses the
+    message; both are counted.
+    """
 
     MAX_CONNECTIONS = int(os.getenv("MAX_WEBSOCKET_CONNECTIONS", "1000"))
     MESSAGES_PER_SECOND = 10  # Token bucket rate
     BURST_SIZE = 20  # Maximum burst capacity
+    SEND_QUEUE_SIZE = 100  # Pending broadcasts per client before it counts as slow
+    SLOW_CONSUMER_POLICY = os.getenv("WEBSOCKET_SLOW_CONSUMER_POLICY", "disconnect")  # or "drop"
+    CLOSE_TIMEOUT_SECONDS = 1.0  # A stalled client may never ack the close frame
 
     def __init__(self):
         """Initialize connection manager."""
@@ -22,6 +44,15 @@ class ConnectionManager:
         self._lock = asyncio.Lock()
         # Rate limiting: token bucket for each connection
         self._rate_limits: Dict[WebSocket, Dict[str, float]] = {}
+        # Broadcast fan-out: outbound queue + sender task for each connection
+        self._channels: Dict[WebSocket, _ClientChannel] = {}
+        self._close_tasks: Set["asyncio.Task[None]"] = set()
+        self._metrics: Dict[str, int] = {
+            "broadcasts": 0,
+            "messages_dropped": 0,
+            "slow_consumers_disconnected": 0,
+            "send_errors": 0,
+        }
 
     def _check_rate_limit(self, websocket: WebSocket) -> bool:
         """
@@ -82,6 +113,7 @@ class ConnectionManager:
                 "tokens": self.BURST_SIZE,
                 "last_update": time.monotonic(),
             }
+            self._channels[websocket] = _ClientChannel(websocket, self.SEND_QUEUE_SIZE)
             logger.debug(f"WebSocket connected. Active connections: {len(self._connections)}")
             return True
 
@@ -93,11 +125,72 @@ class ConnectionManager:
             websocket: WebSocket connection
         """
         async with self._lock:
-            self._connections.discard(websocket)
-            # Clean up rate limit data
-            self._rate_limits.pop(websocket, None)
+            self._remove(websocket)
             logger.debug(f"WebSocket disconnected. Active connections: {len(self._connections)}")
 
+    def _remove(self, websocket: WebSocket) -> None:
+        """
+        Forget a connection and stop its sender task.
+
+        Args:
+            websocket: WebSocket connection
+        """
+        self._connections.discard(websocket)
+        # Clean up rate limit data
+        self._rate_limits.pop(websocket, None)
+        channel = self._channels.pop(websocket, None)
+        if channel and channel.sender and channel.sender is not asyncio.current_task():
+            channel.sender.cancel()
+
+    async def _sender(self, channel: _ClientChannel) -> None:
+        """
+        Drain one client's outbound queue until the connection fails.
+
+        Args:
+            channel: Client channel to drain
+        """
+        try:
+            while True:
+                payload = await channel.queue.get()
+                try:
+                    await channel.websocket.send_text(payload)
+                finally:
+                    channel.queue.task_done()
+        except (WebSocketDisconnect, RuntimeError, ConnectionError) as e:
+            logger.debug(f"WebSocket connection closed during broadcast: {e}")
+        except Exception as e:
+            logger.error(f"Unexpected error broadcasting to WebSocket client: {e}")
+
+        self._metrics["send_errors"] += 1
+        self._remove(channel.websocket)
+
+    def _evict_slow_consumer(self, websocket: WebSocket) -> None:
+        """
+        Disconnect a client whose outbound queue overflowed.
+
+        Args:
+            websocket: WebSocket connection
+        """
+        self._remove(websocket)
+        self._metrics["slow_consumers_disconnected"] += 1
+        MetricsHelper.record_websocket_slow_consumer()
+        logger.warning(
+            f"Disconnecting slow WebSocket client ({self.SEND_QUEUE_SIZE} broadcasts pending)"
+        )
+
+        async def close() -> None:
+            try:
+                await asyncio.wait_for(
+                    websocket.close(code=1013, reason="Client too slow"),
+                    timeout=self.CLOSE_TIMEOUT_SECONDS,
+                )
+            except Exception as e:
+                logger.debug(f"Closing slow WebSocket client failed: {e}")
+
+        task = asyncio.create_task(close())
+        self._close_tasks.add(task)
+        task.add_done_callback(self._close_tasks.discard)
+
     async def send_message(self, websocket: WebSocket, message: dict) -> bool:
         """
         Send message to a WebSocket client with rate limiting.
@@ -124,27 +217,36 @@ class ConnectionManager:
         """
         Broadcast message to all connected clients.
 
+        The message is JSON-encoded once and queued for every client; sending
+        happens in the per-client sender tasks, so this never waits on a
+        client's socket.
+
         Args:
             message: Message dictionary to broadcast
         """
-        async with self._lock:
-            connections = self._connections.copy()
-
-        disconnected = []
-        for connection in connections:
+        # Same encoding as WebSocket.send_json(), done once instead of per client.
+        # Broadcast doesn't check rate limit to ensure important updates reach all clients
+        payload = json.dumps(message, separators=(",", ":"), ensure_ascii=False)
+        self._metrics["broadcasts"] += 1
+
+        for channel in list(self._channels.values()):
+            if channel.sender is None:
+                # Started on first broadcast so idle connections cost no task
+                channel.sender = asyncio.create_task(self._sender(channel))
             try:
-                # Note: Broadcast doesn't check rate limit to ensure
-                # important updates reach all clients
-                await connection.send_json(message)
-            except (WebSocketDisconnect, RuntimeError, ConnectionError) as e:
-                logger.debug(f"WebSocket connection closed during broadcast: {e}")
-                disconnected.append(connection)
-            except Exception as e:
-                logger.error(f"Unexpected error broadcasting to WebSocket client: {e}")
-                disconnected.append(connection)
-
-        if disconnected:
-            async with self._lock:
-                for conn in disconnected:
-                    self._connections.discard(conn)
-                    self._rate_limits.pop(conn, None)
+                channel.queue.put_nowait(payload)
+            except asyncio.QueueFull:
+                self._metrics["messages_dropped"] += 1
+                MetricsHelper.record_websocket_message_dropped()
+                if self.SLOW_CONSUMER_POLICY != "drop":
+                    self._evict_slow_consumer(channel.websocket)
+
+    def get_metrics(self) -> Dict[str, int]:
+        """
+        Get broadcast fan-out counters.
+
+        Returns:
+            Dictionary with connection count, broadcasts, dropped messages,
+            slow consumers disconnected and send errors
+        """
+        return {"connections": len(self._connections), **self._metrics}